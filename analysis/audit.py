@@ -0,0 +1,307 @@
+"""LLM 요청/응답 감사 저장소.
+
+인사이트가 이상해 보일 때 어떤 프롬프트가 그 결과를 만들었는지 보려고 요청/응답 쌍을 남긴다.
+- 본문: 정규화 JSON의 sha256을 키로 `{LOCAL_STORAGE_ROOT}/llm_audit/{hash[:2]}/{hash}.json.gz`에
+  gzip으로 한 번만 기록 (재시도/재분석처럼 같은 payload는 blob 하나를 공유)
+- 색인: `llm_audit_records` (trace_id, 종목, 단계, 모델, 요청/응답 해시와 압축 크기)
+- 보존: 참조되는 blob 합계가 `LLM_AUDIT_MAX_BYTES`를 넘으면 오래된 기록부터 지우고,
+  더 이상 참조되지 않는 blob을 삭제해 상한의 90%까지 줄인다. 정리와 기록이 같은 blob을 두고 겹쳐도
+  잃지 않도록 정리는 blob을 치운 뒤 참조를 다시 확인해 되돌리고, 기록은 색인 커밋 뒤 blob이 없으면 다시 쓴다
+- 기록은 `BackgroundAuditWriter`의 전용 스레드가 큐에서 꺼내 처리하므로 분석 경로는 큐에 넣기만 한다
+  (큐가 가득 차면 버리고 `llm.audit_dropped` 경고)
+
+조회: `python -m analysis.audit show <trace_id>` 또는 `show --insight-id <id>` (인사이트에 저장된 trace_id)
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import gzip
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, List, Optional, Set, Tuple
+
+from sqlalchemy import func, or_, select, union
+from sqlalchemy.orm import Session
+
+from ingestion.db.models import Base, LlmAuditRecord, ProcessedInsight
+from ingestion.db.session import get_engine, session_scope
+from ingestion.settings import get_settings
+from llm.audit import AuditEntry
+from llm.settings import get_analysis_settings
+
+logger = logging.getLogger(__name__)
+
+AUDIT_DIR = "llm_audit"
+# 보존 정리 시 상한의 이 비율까지 줄인다 (매 기록마다 정리가 돌지 않도록)
+_LOW_WATER_RATIO = 0.9
+# 보존 검사 주기(기록 수)와 한 번에 지우는 기록 수
+_RETENTION_EVERY = 50
+_PRUNE_BATCH = 200
+# 프로세스 종료 시 남은 기록을 기다리는 시간(초)
+_EXIT_FLUSH_SECONDS = 2.0
+
+
+def _canonical(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class AuditStore:
+    """압축 blob 파일 + 색인 테이블."""
+
+    def __init__(self, root: Path, *, max_bytes: int) -> None:
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        self._writes = 0
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.json.gz"
+
+    def _put_blob(self, obj: Any) -> Tuple[str, int]:
+        data = _canonical(obj)
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(digest)
+        if path.exists():
+            return digest, path.stat().st_size
+        path.parent.mkdir(parents=True, exist_ok=True)
+        compressed = gzip.compress(data, mtime=0)
+        tmp = path.with_name(f".{digest}.{uuid.uuid4().hex}.tmp")
+        tmp.write_bytes(compressed)
+        os.replace(tmp, path)
+        return digest, len(compressed)
+
+    def write(self, entry: AuditEntry) -> LlmAuditRecord:
+        request_hash, request_bytes = self._put_blob(entry.request)
+        response_hash, response_bytes = self._put_blob(entry.response)
+        record = LlmAuditRecord(
+            trace_id=entry.trace_id,
+            ticker=entry.ticker,
+            stage=entry.stage,
+            model=entry.model,
+            request_hash=request_hash,
+            request_bytes=request_bytes,
+            response_hash=response_hash,
+            response_bytes=response_bytes,
+            created_at=entry.created_at,
+        )
+        with session_scope() as session:
+            session.add(record)
+        # 보존 정리가 커밋 직전에 같은 blob을 치웠을 수 있으므로 다시 확인한다 (내용 주소라 다시 써도 같다)
+        for obj, digest in ((entry.request, request_hash), (entry.response, response_hash)):
+            if not self.blob_path(digest).exists():
+                self._put_blob(obj)
+        self._writes += 1
+        if self._writes % _RETENTION_EVERY == 1:
+            self.enforce_retention()
+        return record
+
+    def load(self, digest: str) -> Optional[Any]:
+        """blob 내용 (보존 정리로 지워졌으면 None)."""
+        try:
+            return json.loads(gzip.decompress(self.blob_path(digest).read_bytes()))
+        except FileNotFoundError:
+            return None
+
+    def stored_bytes(self, session: Session) -> int:
+        """색인이 참조하는 서로 다른 blob의 압축 크기 합계."""
+        blobs = union(
+            select(LlmAuditRecord.request_hash.label("digest"), LlmAuditRecord.request_bytes.label("size")),
+            select(LlmAuditRecord.response_hash.label("digest"), LlmAuditRecord.response_bytes.label("size")),
+        ).subquery()
+        return int(session.scalar(select(func.coalesce(func.sum(blobs.c.size), 0))) or 0)
+
+    def _referenced(self, session: Session, digest: str) -> bool:
+        stmt = select(LlmAuditRecord.id).where(
+            or_(LlmAuditRecord.request_hash == digest, LlmAuditRecord.response_hash == digest)
+        )
+        return session.scalar(stmt.limit(1)) is not None
+
+    def _still_referenced(self, digests: Set[str]) -> Set[str]:
+        with session_scope() as session:
+            return {digest for digest in digests if self._referenced(session, digest)}
+
+    def _remove_blobs(self, digests: Set[str]) -> None:
+        """고아 blob을 지운다. 먼저 옆으로 치운 뒤 참조를 다시 확인해, 그 사이 새로 참조된 blob은 되돌린다."""
+        moved = {}
+        for digest in digests:
+            path = self.blob_path(digest)
+            trash = path.with_name(f".{digest}.{uuid.uuid4().hex}.del")
+            try:
+                os.replace(path, trash)
+            except FileNotFoundError:
+                continue
+            moved[digest] = trash
+        revived = self._still_referenced(set(moved))
+        for digest, trash in moved.items():
+            if digest in revived:
+                os.replace(trash, self.blob_path(digest))
+            else:
+                trash.unlink(missing_ok=True)
+
+    def enforce_retention(self) -> int:
+        """상한을 넘었으면 오래된 기록부터 지우고 고아 blob을 삭제한다. 지운 기록 수를 반환."""
+        pruned = 0
+        orphans: Set[str] = set()
+        with session_scope() as session:
+            total = self.stored_bytes(session)
+            if total <= self.max_bytes:
+                return 0
+            target = int(self.max_bytes * _LOW_WATER_RATIO)
+            while total > target:
+                oldest = list(
+                    session.scalars(
+                        select(LlmAuditRecord)
+                        .order_by(LlmAuditRecord.created_at, LlmAuditRecord.id)
+                        .limit(_PRUNE_BATCH)
+                    )
+                )
+                if not oldest:
+                    break
+                for record in oldest:
+                    session.delete(record)
+                    session.flush()
+                    pruned += 1
+                    # 다른 기록이 함께 쓰지 않는 blob만 실제로 공간을 돌려준다
+                    blobs = {record.request_hash: record.request_bytes, record.response_hash: record.response_bytes}
+                    for digest, size in blobs.items():
+                        if digest not in orphans and not self._referenced(session, digest):
+                            orphans.add(digest)
+                            total -= int(size)
+                    if total <= target:
+                        break
+        # 색인 삭제가 커밋된 뒤에 파일을 지운다
+        self._remove_blobs(orphans)
+        logger.info("llm.audit_pruned", extra={"records": pruned, "blobs": len(orphans), "stored_bytes": total})
+        return pruned
+
+
+def find_records(
+    session: Session, *, trace_id: Optional[str] = None, ticker: Optional[str] = None, limit: int = 20
+) -> List[LlmAuditRecord]:
+    """trace_id 또는 종목의 감사 기록 (최신순)."""
+    stmt = select(LlmAuditRecord).order_by(LlmAuditRecord.created_at.desc()).limit(limit)
+    if trace_id is not None:
+        stmt = stmt.where(LlmAuditRecord.trace_id == trace_id)
+    if ticker is not None:
+        stmt = stmt.where(LlmAuditRecord.ticker == ticker.upper())
+    return list(session.scalars(stmt))
+
+
+class BackgroundAuditWriter:
+    """`AuditSink` 구현: 큐에 넣고 즉시 반환, 전용 데몬 스레드가 `AuditStore.write`를 호출한다."""
+
+    def __init__(self, store: AuditStore, *, max_queue: int = 1000) -> None:
+        self.store = store
+        self._max_queue = int(max_queue)
+        self._lock = threading.Lock()
+        self._queue: Optional["queue.Queue[AuditEntry]"] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self.dropped = 0
+
+    def _ensure_started(self) -> "queue.Queue[AuditEntry]":
+        with self._lock:
+            # prefork 워커는 부모 프로세스의 스레드를 물려받지 못하므로 프로세스마다 새로 띄운다
+            if self._queue is None or self._pid != os.getpid() or not (self._thread and self._thread.is_alive()):
+                self._queue = queue.Queue(maxsize=self._max_queue)
+                self._pid = os.getpid()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._queue,), name="llm-audit-writer", daemon=True
+                )
+                self._thread.start()
+            return self._queue
+
+    def submit(self, entry: AuditEntry) -> None:
+        try:
+            self._ensure_started().put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+            logger.warning("llm.audit_dropped", extra={"trace_id": entry.trace_id, "dropped": self.dropped})
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """대기 중인 기록이 모두 처리될 때까지 기다린다 (시간 초과 시 False)."""
+        q = self._queue
+        if q is None:
+            return True
+        with q.all_tasks_done:
+            while q.unfinished_tasks:
+                if not q.all_tasks_done.wait(timeout):
+                    return False
+        return True
+
+    def _run(self, q: "queue.Queue[AuditEntry]") -> None:
+        while True:
+            entry = q.get()
+            try:
+                self.store.write(entry)
+            except Exception as exc:  # 감사 기록 실패가 분석을 막지 않도록 로그만 남긴다
+                logger.warning("llm.audit_write_failed", extra={"trace_id": entry.trace_id, "error": str(exc)})
+            finally:
+                q.task_done()
+
+
+@lru_cache()
+def get_audit_writer() -> Optional[BackgroundAuditWriter]:
+    """`LLM_AUDIT_ENABLED`이면 프로세스 공용 writer, 아니면 None."""
+    settings = get_analysis_settings()
+    if not settings.llm_audit_enabled:
+        return None
+    Base.metadata.create_all(bind=get_engine())
+    store = AuditStore(Path(get_settings().local_storage_root) / AUDIT_DIR, max_bytes=int(settings.llm_audit_max_bytes))
+    writer = BackgroundAuditWriter(store, max_queue=int(settings.llm_audit_queue_size))
+    atexit.register(writer.flush, _EXIT_FLUSH_SECONDS)
+    return writer
+
+
+def reset_audit_writer_cache() -> None:
+    get_audit_writer.cache_clear()  # type: ignore[attr-defined]
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="LLM 요청/응답 감사 기록 조회")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_list = sub.add_parser("list", help="최근 기록 목록")
+    p_list.add_argument("--ticker", default=None)
+    p_list.add_argument("--limit", type=int, default=20)
+    p_show = sub.add_parser("show", help="trace_id의 요청/응답 출력")
+    p_show.add_argument("trace_id", nargs="?")
+    p_show.add_argument("--insight-id", default=None, help="인사이트 ID로 trace_id를 찾아 출력")
+    args = parser.parse_args(argv)
+    if args.command == "show" and (args.trace_id is None) == (args.insight_id is None):
+        parser.error("trace_id와 --insight-id 중 하나를 지정하세요.")
+
+    store = AuditStore(
+        Path(get_settings().local_storage_root) / AUDIT_DIR,
+        max_bytes=int(get_analysis_settings().llm_audit_max_bytes),
+    )
+    Base.metadata.create_all(bind=get_engine())
+    with session_scope() as session:
+        if args.command == "list":
+            for r in find_records(session, ticker=args.ticker, limit=args.limit):
+                print(f"{r.created_at.isoformat()} {r.trace_id} {r.ticker or '-'} {r.stage} {r.model}")
+            return 0
+        trace_id = args.trace_id
+        if args.insight_id is not None:
+            insight = session.get(ProcessedInsight, uuid.UUID(args.insight_id))
+            if insight is None or insight.trace_id is None:
+                print(f"[audit] 인사이트 {args.insight_id}의 trace_id가 없습니다.")
+                return 1
+            trace_id = insight.trace_id
+        records = find_records(session, trace_id=trace_id, limit=1000)
+        for r in reversed(records):
+            print(f"== {r.created_at.isoformat()} {r.stage} {r.model} ({r.ticker or '-'})")
+            pair = {"request": store.load(r.request_hash), "response": store.load(r.response_hash)}
+            print(json.dumps(pair, ensure_ascii=False, indent=2))
+    return 0 if records else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
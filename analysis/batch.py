@@ -0,0 +1,330 @@
+"""Offline batch analysis (JSONL request/result files).
+
+대화형 지연이 필요 없는 일일 리포트용 모드.
+1) prepare: 종목별 분석 요청 payload를 `requests.jsonl`(custom_id 포함)과 `manifest.json`으로 기록
+2) submit: `BatchProvider`로 요청 파일 제출 → 결과 파일(`results.jsonl`) 수신
+3) ingest: 결과를 검증해 `save_insight`로 일괄 저장, 실패/누락 항목은 온라인 경로로 재분석
+   (이미 같은 입력 다이제스트로 저장된 종목은 건너뛰므로 다시 돌려도 중복 저장/과금이 없다)
+
+Usage:
+  uv run -- python -m analysis.batch prepare --dir var/batch/2025-11-20 AAPL MSFT TSLA
+  uv run -- python -m analysis.batch submit --dir var/batch/2025-11-20
+  uv run -- python -m analysis.batch ingest --dir var/batch/2025-11-20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol
+
+from sqlalchemy.orm import Session
+
+from analysis.models.domain import AnalysisInput, AnalysisResult
+from analysis.repositories.articles import body_prefix_chars
+from analysis.repositories.insights import get_latest_insight, save_insight
+from analysis.tasks.analyze import (
+    build_analysis_input,
+    input_digest_for,
+    select_recent_articles,
+    source_refs_for,
+)
+from ingestion.db.models import Base, JobStage
+from ingestion.db.session import get_engine, session_scope
+from ingestion.repositories.articles import JobRunRecorder
+from ingestion.utils.logging import get_logger
+from llm.client.openai_client import LLMError, OpenAIClient, ProviderFn
+
+REQUESTS_FILE = "requests.jsonl"
+MANIFEST_FILE = "manifest.json"
+RESULTS_FILE = "results.jsonl"
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+
+class BatchProvider(Protocol):
+    """요청 JSONL을 제출하고 결과 JSONL을 돌려주는 배치 백엔드."""
+
+    def submit(self, requests_path: Path) -> str: ...
+
+    def wait(self, batch_id: str, results_path: Path) -> Path: ...
+
+
+class LocalFileBatchProvider:
+    """로컬 파일 기반 배치 백엔드 (테스트/개발용).
+
+    제출 시 각 요청 body를 `responder`로 즉시 처리하고, 결과는 OpenAI Batch 결과 형식
+    (`custom_id`, `response.status_code`, `response.body`, `error`)으로 기록한다.
+    """
+
+    def __init__(self, responder: ProviderFn) -> None:
+        self._responder = responder
+        self._pending: Dict[str, List[dict]] = {}
+
+    def submit(self, requests_path: Path) -> str:
+        batch_id = f"local-{uuid.uuid4().hex[:12]}"
+        lines: List[dict] = []
+        for request in _read_jsonl(requests_path):
+            try:
+                body = self._responder(request["body"])
+                lines.append(
+                    {
+                        "custom_id": request["custom_id"],
+                        "response": {"status_code": 200, "body": body},
+                        "error": None,
+                    }
+                )
+            except Exception as exc:
+                lines.append({"custom_id": request["custom_id"], "response": None, "error": {"message": str(exc)}})
+        self._pending[batch_id] = lines
+        return batch_id
+
+    def wait(self, batch_id: str, results_path: Path) -> Path:
+        _write_jsonl(results_path, self._pending.pop(batch_id))
+        return results_path
+
+
+class OpenAIBatchProvider:  # pragma: no cover - 네트워크 사용
+    """OpenAI Batch API 백엔드 (files.create → batches.create → 완료 대기 → 결과 다운로드).
+
+    온라인 분석과 같은 공용 SDK 클라이언트(`OPENAI_BASE_URL` 포함)와 `RetryPolicy`를 쓴다.
+    """
+
+    def __init__(self, client: OpenAIClient, *, poll_seconds: float = 30.0, completion_window: str = "24h") -> None:
+        self._client = client.sdk_client()
+        self._retry = client.retry_policy()
+        self._poll_seconds = poll_seconds
+        self._completion_window = completion_window
+
+    def _call(self, fn: Callable[[], Any]) -> Any:
+        return self._retry.call(lambda _remaining, _attempts_left: fn())
+
+    def submit(self, requests_path: Path) -> str:
+        def _upload() -> Any:
+            with requests_path.open("rb") as fh:
+                return self._client.files.create(file=fh, purpose="batch")
+
+        uploaded = self._call(_upload)
+        batch = self._call(
+            lambda: self._client.batches.create(
+                input_file_id=uploaded.id,
+                endpoint=BATCH_ENDPOINT,
+                completion_window=self._completion_window,
+            )
+        )
+        return batch.id
+
+    def wait(self, batch_id: str, results_path: Path) -> Path:
+        while True:
+            batch = self._call(lambda: self._client.batches.retrieve(batch_id))
+            if batch.status in {"completed", "failed", "expired", "cancelled"}:
+                break
+            time.sleep(self._poll_seconds)
+        # 결과가 없는 항목은 ingest 단계에서 누락으로 처리되어 온라인 경로로 넘어간다.
+        content = (
+            self._call(lambda: self._client.files.content(batch.output_file_id)).text if batch.output_file_id else ""
+        )
+        results_path.write_text(content, encoding="utf-8")
+        return results_path
+
+
+@dataclass
+class BatchIngestReport:
+    saved: int = 0
+    fallback_saved: int = 0
+    skipped: int = 0
+    failed: List[str] = field(default_factory=list)
+
+
+def _read_jsonl(path: Path) -> Iterable[dict]:
+    with path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _write_jsonl(path: Path, rows: Iterable[dict]) -> None:
+    with path.open("w", encoding="utf-8") as fh:
+        for row in rows:
+            fh.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def prepare_batch(
+    session: Session,
+    tickers: Iterable[str],
+    out_dir: Path,
+    *,
+    client: OpenAIClient,
+    max_chars: int | None = None,
+    force: bool = False,
+) -> Dict[str, dict]:
+    """분석이 필요한 종목의 요청을 JSONL로 기록하고 manifest(custom_id → 입력 메타)를 반환한다.
+
+    직전 인사이트와 입력 다이제스트가 같은 종목은 건너뛴다.
+    """
+    settings = client.settings
+    max_chars = max_chars or 5000
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest: Dict[str, dict] = {}
+    requests: List[dict] = []
+    for ticker in tickers:
+        ticker = ticker.upper()
+        rows = select_recent_articles(
+            session,
+            ticker,
+            limit=int(settings.analysis_candidate_articles),
+            body_chars=body_prefix_chars(settings, max_chars=max_chars),
+        )
+        if not rows:
+            continue
+        digest = input_digest_for(rows, settings, max_chars=max_chars)
+        latest = get_latest_insight(session, ticker)
+        if not force and latest is not None and latest.input_digest == digest:
+            continue
+        inp = build_analysis_input(ticker, rows, settings, max_chars=max_chars, previous=latest)
+        custom_id = f"{ticker}-{digest[:16]}"
+        requests.append(
+            {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": client.build_payload(inp),
+            }
+        )
+        manifest[custom_id] = {
+            "ticker": ticker,
+            "input_digest": digest,
+            "source_refs": source_refs_for(rows),
+            "input": inp.model_dump(mode="json"),
+        }
+    _write_jsonl(out_dir / REQUESTS_FILE, requests)
+    (out_dir / MANIFEST_FILE).write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    return manifest
+
+
+def submit_batch(out_dir: Path, provider: BatchProvider) -> Path:
+    batch_id = provider.submit(out_dir / REQUESTS_FILE)
+    return provider.wait(batch_id, out_dir / RESULTS_FILE)
+
+
+def ingest_batch_results(
+    session: Session,
+    out_dir: Path,
+    *,
+    client: OpenAIClient,
+    online_fallback: bool = True,
+) -> BatchIngestReport:
+    """결과 파일을 검증/저장한다. 오류·누락·검증 실패 항목은 온라인 `analyze`로 재시도한다.
+
+    직전 인사이트가 manifest와 같은 입력 다이제스트면 이미 반영된 항목으로 보고 건너뛴다.
+    배치 응답은 검증 전에 배치 단가로 장부에 기록한다 (검증에 실패한 응답도 과금된다).
+    """
+    logger = get_logger(__name__)
+    manifest: Dict[str, dict] = json.loads((out_dir / MANIFEST_FILE).read_text(encoding="utf-8"))
+    results: Dict[str, dict] = {}
+    results_path = out_dir / RESULTS_FILE
+    if results_path.exists():
+        results = {row["custom_id"]: row for row in _read_jsonl(results_path)}
+
+    report = BatchIngestReport()
+    batch_client = client.for_batch()
+    for custom_id, meta in manifest.items():
+        latest = get_latest_insight(session, meta["ticker"])
+        if latest is not None and latest.input_digest == meta["input_digest"]:
+            logger.info("analyze.batch.already_ingested", extra={"custom_id": custom_id})
+            report.skipped += 1
+            continue
+        inp = AnalysisInput.model_validate(meta["input"])
+        result: Optional[AnalysisResult] = None
+        row = results.get(custom_id)
+        response = (row or {}).get("response") or {}
+        if row is not None and not row.get("error") and response.get("status_code") == 200:
+            body = response.get("body") or {}
+            model = body.get("model") or client.settings.analysis_model
+            batch_client.record_spend(model, batch_client.usage_cost(model, body.get("usage")))
+            try:
+                result = batch_client.parse_response(inp, body)
+            except (LLMError, ValueError) as exc:
+                logger.warning(
+                    "analyze.batch.invalid_result", extra={"custom_id": custom_id, "error": str(exc)}
+                )
+        if result is not None:
+            save_insight(session, result, source_refs=meta["source_refs"], input_digest=meta["input_digest"])
+            report.saved += 1
+            continue
+        if not online_fallback:
+            report.failed.append(custom_id)
+            continue
+        try:
+            result = client.analyze(inp)
+        except LLMError as exc:
+            logger.warning("analyze.batch.fallback_failed", extra={"custom_id": custom_id, "error": str(exc)})
+            report.failed.append(custom_id)
+            continue
+        save_insight(session, result, source_refs=meta["source_refs"], input_digest=meta["input_digest"])
+        report.fallback_saved += 1
+    session.flush()
+    logger.info(
+        "analyze.batch.ingested",
+        extra={
+            "saved": report.saved,
+            "fallback_saved": report.fallback_saved,
+            "skipped": report.skipped,
+            "failed": len(report.failed),
+        },
+    )
+    return report
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="오프라인 배치 분석 (JSONL)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_prepare = sub.add_parser("prepare", help="요청 JSONL/manifest 생성")
+    p_prepare.add_argument("--dir", required=True, type=Path)
+    p_prepare.add_argument("--max-chars", type=int, default=None)
+    p_prepare.add_argument("--force", action="store_true", help="입력 변화가 없어도 요청 생성")
+    p_prepare.add_argument("tickers", nargs="+")
+    p_submit = sub.add_parser("submit", help="OpenAI Batch API로 제출하고 결과 대기")
+    p_submit.add_argument("--dir", required=True, type=Path)
+    p_submit.add_argument("--poll-seconds", type=float, default=30.0)
+    p_ingest = sub.add_parser("ingest", help="결과 JSONL 저장 (실패 항목은 온라인 재분석)")
+    p_ingest.add_argument("--dir", required=True, type=Path)
+    p_ingest.add_argument("--no-fallback", action="store_true")
+    args = parser.parse_args(argv)
+
+    client = OpenAIClient.from_env()
+    if args.command == "submit":
+        provider = OpenAIBatchProvider(client, poll_seconds=args.poll_seconds)
+        print(f"[batch] 결과: {submit_batch(args.dir, provider)}")
+        return 0
+
+    Base.metadata.create_all(bind=get_engine())
+    with session_scope() as session:
+        if args.command == "prepare":
+            manifest = prepare_batch(
+                session, args.tickers, args.dir, client=client, max_chars=args.max_chars, force=args.force
+            )
+            print(f"[batch] 요청 {len(manifest)}건 → {args.dir / REQUESTS_FILE}")
+            return 0
+        with JobRunRecorder(
+            session,
+            stage=JobStage.ANALYZE,
+            ticker=None,
+            source="openai_batch",
+            task_name="ingest_batch_results",
+            trace_id=str(uuid.uuid4()),
+        ):
+            report = ingest_batch_results(session, args.dir, client=client, online_fallback=not args.no_fallback)
+        print(
+            f"[batch] 저장 {report.saved}건, 온라인 재분석 {report.fallback_saved}건, "
+            f"이미 반영 {report.skipped}건, 실패 {len(report.failed)}건"
+        )
+        return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,201 @@
+"""임베딩 기반 의미 중복 제거 (MMR 선택).
+
+URL/제목 지문으로 걸러도 같은 사건을 다시 쓴 기사가 최근 N건을 채우는 경우가 많다.
+프롬프트 구성 전에
+1) 최근 후보(`ANALYSIS_DIVERSITY_POOL`건, 기본 슬롯 수보다 더 과거까지)를 임베딩
+   (기사 지문 × 임베딩 모델 키로 벡터 캐시; Redis 또는 프로세스 메모리)
+2) maximal marginal relevance로 탐욕 선택:
+   score = λ·관련도(최신순 감쇠) − (1−λ)·max cos(이미 고른 기사)
+3) 이미 고른 기사와 코사인 유사도가 `duplicate_threshold` 이상이면 같은 기사로 보고 제외
+해서 슬롯을 서로 다른 기사로 채운다. 임베더는 주입 가능하다(테스트는 오프라인 임베더).
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence
+
+from analysis.repositories.articles import ArticleLike
+from llm.redis_client import RedisConnector
+from llm.settings import AnalysisSettings, get_analysis_settings
+
+Embedder = Callable[[List[str]], List[List[float]]]
+
+# 임베딩 입력 길이 (제목 + 본문 앞부분이면 같은 기사 판별에 충분)
+_EMBED_BODY_CHARS = 1000
+_CACHE_TTL_SECONDS = 14 * 86_400
+
+
+class EmbeddingCache(Protocol):
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]: ...
+
+    def set_many(self, vectors: Dict[str, List[float]]) -> None: ...
+
+
+class InMemoryEmbeddingCache:
+    """프로세스 로컬 LRU 캐시."""
+
+    def __init__(self, max_items: int = 10_000) -> None:
+        self._items: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._max_items = max_items
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        out: Dict[str, List[float]] = {}
+        with self._lock:
+            for key in keys:
+                if key in self._items:
+                    self._items.move_to_end(key)
+                    out[key] = self._items[key]
+        return out
+
+    def set_many(self, vectors: Dict[str, List[float]]) -> None:
+        with self._lock:
+            for key, vector in vectors.items():
+                self._items[key] = vector
+                self._items.move_to_end(key)
+            while len(self._items) > self._max_items:
+                self._items.popitem(last=False)
+
+
+class RedisEmbeddingCache:
+    """Redis 캐시 (float32 바이트로 저장, TTL 적용). 워커 간 공유된다."""
+
+    def __init__(self, client: Any, *, prefix: str = "analysis:emb", ttl_seconds: int = _CACHE_TTL_SECONDS) -> None:
+        self._client = client
+        self._prefix = prefix
+        self._ttl = ttl_seconds
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        if not keys:
+            return {}
+        raw = self._client.mget([f"{self._prefix}:{k}" for k in keys])
+        out: Dict[str, List[float]] = {}
+        for key, value in zip(keys, raw):
+            if value:
+                out[key] = list(struct.unpack(f"<{len(value) // 4}f", value))
+        return out
+
+    def set_many(self, vectors: Dict[str, List[float]]) -> None:
+        if not vectors:
+            return
+        pipe = self._client.pipeline(transaction=False)
+        for key, vector in vectors.items():
+            pipe.setex(f"{self._prefix}:{key}", self._ttl, struct.pack(f"<{len(vector)}f", *vector))
+        pipe.execute()
+
+
+@dataclass(frozen=True)
+class DiversityPolicy:
+    k: int = 5
+    # 1에 가까울수록 최신성, 0에 가까울수록 다양성 우선
+    mmr_lambda: float = 0.7
+    duplicate_threshold: float = 0.9
+
+    @classmethod
+    def from_settings(cls, settings: AnalysisSettings) -> "DiversityPolicy":
+        return cls(
+            k=int(settings.analysis_candidate_articles),
+            mmr_lambda=float(settings.analysis_diversity_lambda),
+            duplicate_threshold=float(settings.analysis_diversity_duplicate_threshold),
+        )
+
+
+def _cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    na = math.sqrt(sum(x * x for x in a))
+    nb = math.sqrt(sum(y * y for y in b))
+    return dot / (na * nb) if na and nb else 0.0
+
+
+def mmr_select(vectors: Sequence[Sequence[float]], policy: DiversityPolicy) -> List[int]:
+    """최신순으로 정렬된 후보 벡터에서 MMR로 최대 k개를 골라 인덱스를 (선택 순서대로) 반환한다."""
+    n = len(vectors)
+    if n == 0:
+        return []
+    # 관련도: 최신 기사 1.0 → 가장 오래된 기사 1/n (질의 없이 최신성을 관련도로 사용)
+    relevance = [1.0 - i / n for i in range(n)]
+    max_sim = [0.0] * n
+    remaining = set(range(n))
+    selected: List[int] = []
+    while remaining and len(selected) < policy.k:
+        best = max(
+            remaining,
+            key=lambda i: (policy.mmr_lambda * relevance[i] - (1.0 - policy.mmr_lambda) * max_sim[i], -i),
+        )
+        remaining.discard(best)
+        selected.append(best)
+        for i in list(remaining):
+            max_sim[i] = max(max_sim[i], _cosine(vectors[best], vectors[i]))
+            if max_sim[i] >= policy.duplicate_threshold:
+                remaining.discard(i)
+    return selected
+
+
+def _article_text(row: ArticleLike) -> str:
+    return f"{row.title}\n{(row.body or '')[:_EMBED_BODY_CHARS]}"
+
+
+def embed_articles(
+    rows: Sequence[ArticleLike],
+    embedder: Embedder,
+    *,
+    cache: Optional[EmbeddingCache] = None,
+    model: str = "",
+) -> List[List[float]]:
+    """기사 벡터 (캐시에 없는 기사만 한 번의 배치로 임베딩)."""
+    keys = [f"{model}:{row.fingerprint}" for row in rows]
+    cached = cache.get_many(keys) if cache is not None else {}
+    missing = [i for i, key in enumerate(keys) if key not in cached]
+    if missing:
+        fresh = embedder([_article_text(rows[i]) for i in missing])
+        if len(fresh) != len(missing):
+            raise ValueError("임베딩 결과 수가 입력 수와 다릅니다.")
+        new = {keys[i]: list(vector) for i, vector in zip(missing, fresh)}
+        if cache is not None:
+            cache.set_many(new)
+        cached = {**cached, **new}
+    return [cached[key] for key in keys]
+
+
+def select_diverse_articles(
+    rows: Sequence[ArticleLike],
+    embedder: Embedder,
+    policy: DiversityPolicy,
+    *,
+    cache: Optional[EmbeddingCache] = None,
+    model: str = "",
+) -> List[ArticleLike]:
+    """최신순 후보에서 서로 다른 기사 최대 k개를 골라 원래(최신순) 순서로 반환한다."""
+    if len(rows) <= 1:
+        return list(rows)[: policy.k]
+    vectors = embed_articles(rows, embedder, cache=cache, model=model)
+    return [rows[i] for i in sorted(mmr_select(vectors, policy))]
+
+
+_REDIS = RedisConnector("analysis.embedding_cache")
+
+
+@lru_cache()
+def _local_cache() -> InMemoryEmbeddingCache:
+    return InMemoryEmbeddingCache()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """`ANALYSIS_EMBEDDING_CACHE_REDIS_URL`이 설정되어 있고 연결되면 Redis 캐시, 아니면 메모리 캐시.
+
+    연결 실패는 잠시만 기억하므로 Redis가 돌아오면 다시 워커 간 공유 캐시를 쓴다.
+    """
+    url = get_analysis_settings().analysis_embedding_cache_redis_url
+    client = _REDIS.get(url) if url else None
+    return RedisEmbeddingCache(client) if client is not None else _local_cache()
+
+
+def reset_embedding_cache() -> None:
+    _REDIS.reset()
+    _local_cache.cache_clear()  # type: ignore[attr-defined]
@@ -0,0 +1,117 @@
+"""Extractive pre-summarisation (TF-IDF + TextRank 스타일 중심성).
+
+LLM 프롬프트에 넣기 전에 기사 본문을 핵심 문장으로 압축해 입력 토큰을 줄인다.
+외부 의존성 없이 문장 단위 TF-IDF 벡터의 코사인 유사도로 중심성을 계산하고,
+원문 순서를 유지한 채 상위 문장을 고른다.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Sequence
+
+from analysis.models.domain import InputArticle
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?。！？])\s+|\n+")
+_WORD = re.compile(r"[0-9a-zA-Z가-힣]+")
+_STOPWORDS = frozenset(
+    "a an the and or but of to in on for with at by from as is are was were be been it its this that "
+    "these those has have had will would can could said says".split()
+)
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s.strip() for s in _SENTENCE_SPLIT.split(text) if s and s.strip()]
+
+
+def _tokens(text: str) -> List[str]:
+    return [w.lower() for w in _WORD.findall(text) if len(w) > 1 and w.lower() not in _STOPWORDS]
+
+
+def _tfidf(sentences: Sequence[List[str]]) -> List[Dict[str, float]]:
+    n = len(sentences)
+    df: Counter[str] = Counter()
+    for toks in sentences:
+        df.update(set(toks))
+    vectors: List[Dict[str, float]] = []
+    for toks in sentences:
+        tf = Counter(toks)
+        vec = {t: (c / len(toks)) * (math.log((1 + n) / (1 + df[t])) + 1.0) for t, c in tf.items()} if toks else {}
+        norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
+        vectors.append({t: v / norm for t, v in vec.items()})
+    return vectors
+
+
+def _cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(v * b.get(t, 0.0) for t, v in a.items())
+
+
+def _textrank(vectors: Sequence[Dict[str, float]], *, damping: float = 0.85, iterations: int = 30) -> List[float]:
+    n = len(vectors)
+    weights = [[_cosine(vectors[i], vectors[j]) if i != j else 0.0 for j in range(n)] for i in range(n)]
+    out_sums = [sum(row) or 1.0 for row in weights]
+    scores = [1.0 / n] * n
+    for _ in range(iterations):
+        scores = [
+            (1 - damping) / n + damping * sum(weights[j][i] / out_sums[j] * scores[j] for j in range(n))
+            for i in range(n)
+        ]
+    return scores
+
+
+def summarize(text: str, *, ratio: float = 0.5, min_sentences: int = 2) -> str:
+    """본문을 원문 길이의 약 `ratio` 이내 핵심 문장으로 압축한다 (원문 문장 순서 유지)."""
+    sentences = split_sentences(text)
+    if len(sentences) <= min_sentences:
+        return text.strip()
+    tokens = [_tokens(s) for s in sentences]
+    scores = _textrank(_tfidf(tokens))
+    # 리드 문장은 기사 요지를 담는 경우가 많아 가산점
+    scores[0] *= 1.2
+    budget = max(1, int(len(text) * ratio))
+    chosen: List[int] = []
+    used = 0
+    for idx in sorted(range(len(sentences)), key=lambda i: scores[i], reverse=True):
+        length = len(sentences[idx]) + 1
+        if len(chosen) >= min_sentences and used + length > budget:
+            continue
+        chosen.append(idx)
+        used += length
+    return " ".join(sentences[i] for i in sorted(chosen))
+
+
+def term_coverage(original: str, summary: str, *, top_n: int = 20) -> float:
+    """원문의 상위 빈도 용어(불용어 제외) 가중치 중 요약에 남은 비율 (0~1)."""
+    counts = Counter(_tokens(original))
+    if not counts:
+        return 1.0
+    top = counts.most_common(top_n)
+    kept = set(_tokens(summary))
+    total = sum(c for _, c in top)
+    return sum(c for t, c in top if t in kept) / total
+
+
+def compress_articles(items: Sequence[InputArticle], *, ratio: float, min_chars: int = 400) -> List[InputArticle]:
+    """`min_chars`보다 긴 본문만 추출 요약으로 압축한 기사 목록을 반환한다."""
+    out: List[InputArticle] = []
+    for it in items:
+        if len(it.body) <= min_chars:
+            out.append(it)
+            continue
+        out.append(it.model_copy(update={"body": summarize(it.body, ratio=ratio)}))
+    return out
+
+
+def compression_stats(originals: Sequence[str], compressed: Sequence[str]) -> Dict[str, float]:
+    """압축률(압축 후/원문 글자 수)과 평균 용어 보존율."""
+    original_chars = sum(len(t) for t in originals)
+    compressed_chars = sum(len(t) for t in compressed)
+    coverages = [term_coverage(o, c) for o, c in zip(originals, compressed)]
+    return {
+        "compression_ratio": round(compressed_chars / original_chars, 3) if original_chars else 1.0,
+        "term_coverage": round(sum(coverages) / len(coverages), 3) if coverages else 1.0,
+    }
@@ -0,0 +1,161 @@
+"""Map-reduce analysis for high-volume tickers.
+
+최근 기사가 많을 때 상위 5건만 보고 나머지를 버리는 대신
+- map: 유사 기사끼리 묶은 클러스터를 저렴한 모델로 병렬 요약(호출당/단계 전체 비용 상한, 동시성 제한)
+- reduce: 부분 요약들을 하나의 AnalysisResult로 병합(별도 비용 상한)
+으로 기사량에 비례해 커버리지를 늘린다.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from analysis.models.domain import AnalysisInput, AnalysisResult, InputArticle
+from ingestion.utils.logging import get_logger
+from llm.client.openai_client import LLMError, OpenAIClient, PermanentLLMError
+
+_WORD = re.compile(r"[0-9a-zA-Z가-힣]+")
+
+
+@dataclass(frozen=True)
+class MapReduceOutcome:
+    result: AnalysisResult
+    clusters: int
+    mapped: int
+    dropped: int
+
+
+def _title_terms(article: InputArticle) -> set[str]:
+    return {w.lower() for w in _WORD.findall(article.title) if len(w) > 2}
+
+
+def cluster_articles(
+    items: Sequence[InputArticle], *, max_size: int, min_similarity: float = 0.3
+) -> List[List[InputArticle]]:
+    """제목 어휘 자카드 유사도로 탐욕적 클러스터링 (클러스터당 최대 `max_size`건, 입력 순서 유지).
+
+    유사 기사가 없는 작은 클러스터들은 호출 수를 줄이기 위해 순서대로 합쳐 채운다.
+    """
+    clusters: List[List[InputArticle]] = []
+    signatures: List[set[str]] = []
+    for article in items:
+        terms = _title_terms(article)
+        best, best_sim = -1, 0.0
+        for idx, sig in enumerate(signatures):
+            if len(clusters[idx]) >= max_size or not terms or not sig:
+                continue
+            sim = len(terms & sig) / len(terms | sig)
+            if sim > best_sim:
+                best, best_sim = idx, sim
+        if best >= 0 and best_sim >= min_similarity:
+            clusters[best].append(article)
+            signatures[best] |= terms
+        else:
+            clusters.append([article])
+            signatures.append(set(terms))
+
+    packed: List[List[InputArticle]] = []
+    for cluster in clusters:
+        if packed and len(packed[-1]) + len(cluster) <= max_size:
+            packed[-1].extend(cluster)
+        else:
+            packed.append(list(cluster))
+    return packed
+
+
+def _partial_as_article(index: int, cluster: Sequence[InputArticle], partial: AnalysisResult) -> InputArticle:
+    anomalies = "; ".join(f"{a.label}({a.score:.2f}): {a.description}" for a in partial.anomalies) or "없음"
+    body = (
+        f"요약: {partial.summary_text}\n"
+        f"키워드: {', '.join(partial.keywords)}\n"
+        f"감성 점수: {partial.sentiment_score:.2f}\n"
+        f"이상 이벤트: {anomalies}\n"
+        f"기사 수: {len(cluster)}"
+    )
+    headline = " / ".join(a.title for a in cluster[:3])
+    return InputArticle(
+        title=f"[부분 요약 {index}] {headline}"[:512],
+        body=body,
+        url=cluster[0].url,
+        published_at=max((a.published_at for a in cluster if a.published_at), default=None),
+    )
+
+
+def run_map_reduce(
+    client: OpenAIClient,
+    inp: AnalysisInput,
+) -> MapReduceOutcome:
+    """`inp.items` 전체를 map-reduce로 분석한다. 토큰/비용은 map+reduce 합계로 기록된다."""
+    logger = get_logger(__name__)
+    settings = client.settings
+    map_client = client.with_overrides(
+        analysis_model=settings.analysis_map_model,
+        analysis_max_tokens=int(settings.analysis_map_max_tokens),
+        analysis_cost_limit_usd=float(settings.analysis_map_cost_limit_usd),
+        # map 입력은 이미 작은 클러스터이므로 패커 대신 문자 기준 자르기 사용
+        analysis_prompt_token_budget=None,
+    ).with_stage("map")
+    reduce_client = client.with_overrides(
+        analysis_cost_limit_usd=float(settings.analysis_reduce_cost_limit_usd)
+    ).with_stage("reduce")
+
+    clusters = cluster_articles(inp.items, max_size=int(settings.analysis_map_cluster_size))
+    map_inputs = [
+        AnalysisInput(ticker=inp.ticker, locale=inp.locale, items=cluster, max_chars=inp.max_chars)
+        for cluster in clusters
+    ]
+    # 단계 비용 상한: 사전 추정치 합이 넘치면 가장 오래된(뒤쪽) 클러스터부터 제외
+    stage_cap = float(settings.analysis_map_stage_cost_limit_usd)
+    estimates = [map_client.estimate_cost(m) for m in map_inputs]
+    keep = len(map_inputs)
+    while keep > 1 and sum(estimates[:keep]) > stage_cap:
+        keep -= 1
+    dropped = len(map_inputs) - keep
+    clusters, map_inputs = clusters[:keep], map_inputs[:keep]
+
+    partial_results = map_client.analyze_many(
+        map_inputs,
+        max_concurrency=int(settings.analysis_map_concurrency),
+        return_exceptions=True,
+    )
+    partials: List[tuple[Sequence[InputArticle], AnalysisResult]] = []
+    for cluster, res in zip(clusters, partial_results):
+        if isinstance(res, LLMError):
+            logger.warning("analyze.map_failed", extra={"ticker": inp.ticker, "error": str(res)})
+            continue
+        partials.append((cluster, res))
+    if not partials:
+        raise PermanentLLMError("map 단계 결과가 없습니다.")
+
+    reduce_inp = AnalysisInput(
+        ticker=inp.ticker,
+        locale=inp.locale,
+        items=[_partial_as_article(i, cluster, res) for i, (cluster, res) in enumerate(partials, start=1)],
+        max_chars=inp.max_chars,
+        previous_summary=inp.previous_summary,
+        previous_keywords=list(inp.previous_keywords),
+    )
+    reduced = reduce_client.analyze(reduce_inp)
+    result = reduced.model_copy(
+        update={
+            "llm_tokens_prompt": reduced.llm_tokens_prompt + sum(r.llm_tokens_prompt for _, r in partials),
+            "llm_tokens_completion": reduced.llm_tokens_completion
+            + sum(r.llm_tokens_completion for _, r in partials),
+            "llm_tokens_cached": reduced.llm_tokens_cached + sum(r.llm_tokens_cached for _, r in partials),
+            "llm_cost": reduced.llm_cost + sum(r.llm_cost for _, r in partials),
+        }
+    )
+    logger.info(
+        "analyze.mapreduce",
+        extra={
+            "ticker": inp.ticker,
+            "articles": len(inp.items),
+            "clusters": len(clusters) + dropped,
+            "mapped": len(partials),
+            "dropped": dropped,
+            "cost": result.llm_cost,
+        },
+    )
+    return MapReduceOutcome(result=result, clusters=len(clusters) + dropped, mapped=len(partials), dropped=dropped)
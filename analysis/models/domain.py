@@ -36,6 +36,11 @@ class AnalysisInput(BaseModel):
     locale: str = Field("ko_KR", description="프롬프트 로케일")
     items: List[InputArticle] = Field(default_factory=list, description="분석 대상 기사 목록")
     max_chars: int = Field(5000, ge=500, le=100_000, description="LLM 입력으로 사용할 최대 문자 수(요약/청크 기준)")
+    previous_summary: Optional[str] = Field(default=None, description="직전 인사이트 요약(신규성 점수 기준)")
+    previous_keywords: List[str] = Field(default_factory=list, description="직전 인사이트 키워드")
+    previous_sentiment: Optional[float] = Field(default=None, description="직전 인사이트 감성 점수")
+    previous_anomalies: List[dict] = Field(default_factory=list, description="직전 인사이트 이상 이벤트")
+    delta: bool = Field(False, description="True면 items는 직전 인사이트 이후 신규 기사만 포함(증분 분석)")
 
     @field_validator("ticker")
     @classmethod
@@ -77,12 +82,14 @@ class AnalysisResult(BaseModel):
     keywords: List[str] = Field(default_factory=list, description="핵심 키워드")
     sentiment_score: float = Field(..., ge=-1.0, le=1.0)
     anomalies: List[AnomalyItem] = Field(default_factory=list)
+    confidence: Optional[float] = Field(default=None, ge=0.0, le=1.0, description="모델 자체 확신도(0~1)")
     generated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     # LLM 메타
     llm_model: str
     llm_tokens_prompt: int = Field(..., ge=0)
     llm_tokens_completion: int = Field(..., ge=0)
+    llm_tokens_cached: int = Field(0, ge=0, description="prompt 토큰 중 provider 프롬프트 캐시 적중분")
     llm_cost: float = Field(..., ge=0.0)
 
     @field_validator("ticker")
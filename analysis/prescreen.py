@@ -0,0 +1,192 @@
+"""LLM 호출 전 로컬 사전 선별 (신호가 약한 날은 호출 생략).
+
+중립적이고 이상 징후 없는 날의 분석은 대부분 draft로 끝난다. LLM을 부르기 전에 후보 기사를
+1) 금융 감성 어휘집(영/한)으로 어조 점수 (-1~1, 적중 수가 적으면 0 쪽으로 수축)
+2) 이벤트 키워드 탐지기(실적, 가이던스, 인수합병, 소송/조사, 파산 등)의 최대 가중치
+3) 직전 인사이트(요약 + 키워드) 대비 용어 신규성
+로 점수화해 signal = max(어조 강도, 이벤트 강도) × (0.2 + 0.8·신규성)을 계산한다.
+signal이 임계값 미만이면 LLM을 건너뛰거나(skip) 템플릿 인사이트를 만든다(template).
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Literal, Optional, Sequence
+
+from analysis.models.domain import AnalysisResult
+from analysis.prompts.packer import content_terms, term_novelty
+from analysis.repositories.articles import ArticleLike
+from ingestion.db.models import ProcessedInsight
+
+PrescreenAction = Literal["llm", "skip", "template"]
+
+# 어조 점수가 이 정도면 어조만으로 최대 강도 (|tone| 0.5 → 1.0)
+_TONE_SCALE = 2.0
+# 적중 수가 적을 때 어조를 0 쪽으로 끌어당기는 가상 중립 적중 수
+_TONE_PRIOR = 2
+_TEMPLATE_MODEL = "prescreen"
+_KEYWORD_COUNT = 5
+
+_POSITIVE_EN = (
+    "beat beats surge surging soar soaring jump rally rallies record outperform upgrade growth profit profitable "
+    "strong stronger strength exceed gain rebound boost optimistic bullish upbeat expand expansion breakthrough "
+    "approval approve win award accelerate"
+).split()
+_NEGATIVE_EN = (
+    "miss plunge plunging tumble slump fall fell drop decline loss losses weak weaker weakness downgrade cut "
+    "lawsuit sue probe investigation fraud recall layoff bankrupt bankruptcy default warn warning bearish concern "
+    "delay halt fine penalty shortfall underperform slowdown downturn resign"
+).split()
+_POSITIVE_KO = "상승 급등 호실적 최대 흑자 성장 상향 개선 수주 호조 돌파 승인".split()
+_NEGATIVE_KO = "하락 급락 적자 부진 하향 손실 소송 조사 리콜 감원 파산 악화 우려 제재 과징금".split()
+
+
+def _lexicon_re(english: Sequence[str], korean: Sequence[str]) -> "re.Pattern[str]":
+    # 영어는 단어 경계 + 간단한 굴절 접미사, 한국어는 교착어라 부분 문자열로 센다
+    en = "|".join(sorted(map(re.escape, english), key=len, reverse=True))
+    ko = "|".join(sorted(map(re.escape, korean), key=len, reverse=True))
+    return re.compile(rf"\b(?:{en})(?:s|es|ed|d)?\b|{ko}")
+
+
+_POSITIVE_RE = _lexicon_re(_POSITIVE_EN, _POSITIVE_KO)
+_NEGATIVE_RE = _lexicon_re(_NEGATIVE_EN, _NEGATIVE_KO)
+
+# (이벤트, 가중치, 패턴) — 가중치는 가격에 영향을 줄 가능성
+_EVENTS = [
+    ("bankruptcy", 1.0, r"\bbankrupt\w*|\bchapter 11\b|\binsolven\w*|\bdefaults?\b|파산|부도"),
+    ("m_and_a", 0.9, r"\bacqui(?:re|res|red|sition)\b|\bmerger\b|\btakeover\b|\bbuyout\b|인수|합병"),
+    ("guidance", 0.8, r"\bguidance\b|\boutlook\b|\bforecasts?\b|가이던스|전망치"),
+    ("legal", 0.7, r"\blawsuits?\b|\bsued?\b|\bprobes?\b|\binvestigation\b|\bantitrust\b|\bsubpoena\w*|소송|과징금|제재"),
+    ("recall", 0.7, r"\brecall\w*|리콜"),
+    ("earnings", 0.6, r"\bearnings\b|\bquarterly results\b|\beps\b|\bq[1-4] (?:results|revenue|sales)\b|실적"),
+    ("layoffs", 0.6, r"\blayoffs?\b|\bjob cuts\b|\brestructuring\b|감원|구조조정"),
+    ("leadership", 0.6, r"\b(?:ceo|cfo)\b.{0,40}\b(?:resign\w*|steps? down|appoint\w*|named|ousted)\b|대표이사|사임"),
+    ("regulatory", 0.6, r"\b(?:fda|sec|ftc)\b.{0,40}\b(?:approv\w*|reject\w*|clear\w*|charge\w*)\b|허가"),
+    ("offering", 0.6, r"\b(?:stock|share|secondary) (?:offering|sale)\b|\bdilution\b|유상증자"),
+    ("rating", 0.5, r"\bupgrade[sd]?\b|\bdowngrade[sd]?\b|\bprice target\b|목표주가|투자의견"),
+    ("capital_return", 0.4, r"\bbuybacks?\b|\brepurchase\w*|\bdividends?\b|자사주|배당"),
+]
+_EVENT_PATTERNS = [(label, weight, re.compile(pattern)) for label, weight, pattern in _EVENTS]
+_EVENT_WEIGHTS = {label: weight for label, weight, _ in _EVENTS}
+
+_KEYWORD_STOPWORDS = frozenset(
+    "the and for with from that this its are was were has have had will would can could said says after over "
+    "into amid about than more new inc corp company shares stock stocks".split()
+)
+
+
+@dataclass(frozen=True)
+class PrescreenScore:
+    # 어휘 감성 (-1~1)
+    tone: float
+    # 이벤트 → 탐지된 기사 수
+    events: Dict[str, int]
+    # 직전 인사이트 대비 평균 신규성 (0~1, 직전 결과가 없으면 1)
+    novelty: float
+    signal: float
+    articles: int
+    positive_hits: int = 0
+    negative_hits: int = 0
+
+
+@dataclass(frozen=True)
+class PrescreenDecision:
+    action: PrescreenAction
+    score: PrescreenScore
+    threshold: float
+    keywords: List[str] = field(default_factory=list)
+
+    @property
+    def calls_llm(self) -> bool:
+        return self.action == "llm"
+
+    def log_extra(self) -> dict:
+        return {
+            "action": self.action,
+            "signal": round(self.score.signal, 4),
+            "threshold": self.threshold,
+            "tone": round(self.score.tone, 4),
+            "events": dict(self.score.events),
+            "novelty": round(self.score.novelty, 4),
+            "articles": self.score.articles,
+        }
+
+
+def _article_text(row: ArticleLike) -> str:
+    return f"{row.title}\n{row.body or ''}".lower()
+
+
+def previous_text(previous: Optional[ProcessedInsight]) -> str:
+    """신규성 비교 기준 텍스트 (직전 요약 + 키워드)."""
+    if previous is None:
+        return ""
+    return " ".join([previous.summary_text or "", *(previous.keywords or [])])
+
+
+def score_articles(rows: Sequence[ArticleLike], *, previous: str = "") -> PrescreenScore:
+    """후보 기사를 어휘 감성/이벤트/신규성으로 점수화한다."""
+    positive = negative = 0
+    events: Counter[str] = Counter()
+    previous_terms = content_terms(previous)
+    novelties: List[float] = []
+    for row in rows:
+        text = _article_text(row)
+        positive += len(_POSITIVE_RE.findall(text))
+        negative += len(_NEGATIVE_RE.findall(text))
+        events.update(label for label, _, pattern in _EVENT_PATTERNS if pattern.search(text))
+        novelties.append(term_novelty(content_terms(text), previous_terms))
+    tone = (positive - negative) / (positive + negative + _TONE_PRIOR)
+    novelty = sum(novelties) / len(novelties) if novelties else 0.0
+    event_strength = max((_EVENT_WEIGHTS[label] for label in events), default=0.0)
+    strength = max(min(1.0, abs(tone) * _TONE_SCALE), event_strength)
+    return PrescreenScore(
+        tone=tone,
+        events=dict(events),
+        novelty=novelty,
+        signal=strength * (0.2 + 0.8 * novelty),
+        articles=len(rows),
+        positive_hits=positive,
+        negative_hits=negative,
+    )
+
+
+def title_keywords(rows: Sequence[ArticleLike], *, limit: int = _KEYWORD_COUNT) -> List[str]:
+    """제목에 가장 자주 나온 용어 (템플릿 인사이트 키워드)."""
+    counts: Counter[str] = Counter()
+    for row in rows:
+        counts.update(t for t in content_terms(row.title) if len(t) > 2 and t not in _KEYWORD_STOPWORDS)
+    return [term for term, _ in counts.most_common(limit)]
+
+
+def prescreen(
+    rows: Sequence[ArticleLike],
+    *,
+    threshold: float,
+    action: Literal["skip", "template"] = "skip",
+    previous: Optional[ProcessedInsight] = None,
+) -> PrescreenDecision:
+    """signal이 임계값 이상이면 "llm", 미만이면 `action`을 돌려준다."""
+    score = score_articles(rows, previous=previous_text(previous))
+    chosen: PrescreenAction = "llm" if score.signal >= threshold else action
+    return PrescreenDecision(action=chosen, score=score, threshold=threshold, keywords=title_keywords(rows))
+
+
+def template_result(ticker: str, decision: PrescreenDecision) -> AnalysisResult:
+    """LLM 없이 만드는 저비용 인사이트 (신호 없음 요약, 어휘 감성, 이상 징후 없음)."""
+    score = decision.score
+    summary = f"{ticker.upper()}: 최근 기사 {score.articles}건에서 뚜렷한 신호가 감지되지 않았습니다."
+    if decision.keywords:
+        summary += f" 주요 키워드: {', '.join(decision.keywords[:3])}."
+    return AnalysisResult(
+        ticker=ticker,
+        summary_text=summary,
+        keywords=decision.keywords,
+        sentiment_score=max(-1.0, min(1.0, round(score.tone, 3))),
+        anomalies=[],
+        llm_model=_TEMPLATE_MODEL,
+        llm_tokens_prompt=0,
+        llm_tokens_completion=0,
+        llm_cost=0.0,
+    )
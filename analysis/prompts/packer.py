@@ -0,0 +1,187 @@
+"""관련도 순 토큰 예산 패커.
+
+`_trim_articles`(문자 수 기준, 최신순 탐욕 채우기) 대신
+1) 기사별 점수 = 신선도 × 신규성(직전 인사이트 대비) × 출처 품질
+2) 상위 K개에 토큰 예산을 공정 분배(필요량이 적은 기사의 잔여분은 나머지에 재분배)
+3) 할당량 안에서 문장 경계로 절단
+으로 프롬프트 토큰당 커버리지를 높인다. 토큰 계산기는 주입 가능하다.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+from urllib.parse import urlparse
+
+from analysis.models.domain import InputArticle
+
+
+TokenCounter = Callable[[str], int]
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?。！？])\s+|\n+")
+_WORD = re.compile(r"[0-9a-zA-Z가-힣]+")
+
+# 항목 서식("N. Title: ...\nBody: \n...\n")에 드는 고정 토큰
+_ENTRY_OVERHEAD_TOKENS = 6
+
+
+def estimate_tokens(text: str) -> int:
+    """길이 기반 보수적 토큰 추정 (약 4자당 1토큰)."""
+    return max(1, math.ceil(len(text) / 4)) if text else 0
+
+
+@dataclass(frozen=True)
+class PackedArticle:
+    title: str
+    excerpt: str
+    score: float
+    tokens: int
+
+
+def content_terms(text: str) -> set[str]:
+    """소문자 단어 집합 (한 글자 단어 제외; 신규성 비교용)."""
+    return {w.lower() for w in _WORD.findall(text) if len(w) > 1}
+
+
+def _freshness(published_at: Optional[datetime], now: datetime, half_life_hours: float) -> float:
+    if published_at is None:
+        return 0.5
+    if published_at.tzinfo is None:
+        published_at = published_at.replace(tzinfo=timezone.utc)
+    age_hours = max(0.0, (now - published_at).total_seconds() / 3600.0)
+    return 0.5 ** (age_hours / half_life_hours)
+
+
+def term_novelty(article_terms: set[str], previous_terms: set[str]) -> float:
+    """직전 텍스트에 없던 단어 비율 (0~1, 비교 대상이 없으면 1)."""
+    if not previous_terms or not article_terms:
+        return 1.0
+    overlap = len(article_terms & previous_terms) / len(article_terms)
+    return 1.0 - overlap
+
+
+def _source_quality(url: str, weights: Mapping[str, float], default: float) -> float:
+    host = (urlparse(url).hostname or "").lower()
+    while host:
+        if host in weights:
+            return float(weights[host])
+        _, _, host = host.partition(".")
+    return default
+
+
+def score_articles(
+    items: Sequence[InputArticle],
+    *,
+    previous_text: str = "",
+    source_weights: Mapping[str, float] | None = None,
+    default_source_weight: float = 0.5,
+    half_life_hours: float = 24.0,
+    now: Optional[datetime] = None,
+) -> List[float]:
+    now = now or datetime.now(timezone.utc)
+    weights = source_weights or {}
+    previous_terms = content_terms(previous_text)
+    scores: List[float] = []
+    for it in items:
+        fresh = _freshness(it.published_at, now, half_life_hours)
+        novel = term_novelty(content_terms(f"{it.title} {it.body}"), previous_terms)
+        quality = _source_quality(str(it.url), weights, default_source_weight)
+        # 곱 대신 0이 되지 않도록 하한을 두어 한 요소가 전체를 지우지 않게 한다.
+        scores.append((0.2 + 0.8 * fresh) * (0.2 + 0.8 * novel) * (0.2 + 0.8 * quality))
+    return scores
+
+
+def fair_allocation(needs: Sequence[int], budget: int) -> List[int]:
+    """max-min 공정 분배: 필요량이 균등 몫보다 작으면 전부 주고 남는 몫을 나머지에 재분배."""
+    alloc = [0] * len(needs)
+    remaining = max(0, budget)
+    pending = sorted(range(len(needs)), key=lambda i: needs[i])
+    while pending and remaining > 0:
+        share = remaining // len(pending)
+        idx = pending[0]
+        if needs[idx] <= share:
+            alloc[idx] = needs[idx]
+            remaining -= needs[idx]
+            pending.pop(0)
+            continue
+        for i in pending:
+            alloc[i] = share
+        remaining -= share * len(pending)
+        # 나눗셈 나머지는 점수 순서(입력 순서)대로 1토큰씩
+        for i in sorted(pending)[:remaining]:
+            alloc[i] += 1
+        break
+    return alloc
+
+
+def truncate_to_tokens(text: str, max_tokens: int, counter: TokenCounter) -> str:
+    """문장 경계를 유지하며 `max_tokens` 이내로 자른다. 첫 문장도 넘치면 글자 단위로 자른다."""
+    if max_tokens <= 0:
+        return ""
+    if counter(text) <= max_tokens:
+        return text
+    out: List[str] = []
+    for sentence in _SENTENCE_SPLIT.split(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        candidate = " ".join(out + [sentence])
+        if counter(candidate) > max_tokens:
+            break
+        out.append(sentence)
+    if out:
+        return " ".join(out)
+    # 문장 하나가 예산을 넘는 경우: 이분 탐색으로 최대 접두사
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if counter(text[:mid]) <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo].rstrip()
+
+
+def pack_articles(
+    items: Sequence[InputArticle],
+    *,
+    budget_tokens: int,
+    top_k: int = 5,
+    counter: TokenCounter = estimate_tokens,
+    previous_text: str = "",
+    source_weights: Mapping[str, float] | None = None,
+    now: Optional[datetime] = None,
+) -> List[PackedArticle]:
+    """점수 상위 `top_k` 기사를 `budget_tokens` 안에 공정하게 채워 점수 순으로 반환한다."""
+    scores = score_articles(items, previous_text=previous_text, source_weights=source_weights, now=now)
+    ranked = sorted(range(len(items)), key=lambda i: scores[i], reverse=True)[: max(1, top_k)]
+
+    headers: Dict[int, int] = {
+        i: counter(f"Title: {items[i].title.strip()}") + _ENTRY_OVERHEAD_TOKENS for i in ranked
+    }
+    # 제목조차 들어가지 않는 기사는 점수 낮은 순으로 제외
+    while ranked and sum(headers[i] for i in ranked) > budget_tokens:
+        ranked.pop()
+    body_budget = budget_tokens - sum(headers[i] for i in ranked)
+    needs = [counter(items[i].body.strip()) for i in ranked]
+    alloc = fair_allocation(needs, body_budget)
+
+    packed: List[PackedArticle] = []
+    for i, tokens in zip(ranked, alloc):
+        excerpt = truncate_to_tokens(items[i].body.strip(), tokens, counter)
+        packed.append(
+            PackedArticle(
+                title=items[i].title.strip(),
+                excerpt=excerpt,
+                score=scores[i],
+                tokens=headers[i] + (counter(excerpt) if excerpt else 0),
+            )
+        )
+    return packed
+
+
+def previous_insight_text(summary: Optional[str], keywords: Iterable[str] = ()) -> str:
+    return " ".join([summary or "", *keywords]).strip()
@@ -6,22 +6,59 @@ LLM에게 구조화(JSON) 출력을 요청하는 시스템/유저 메시지를 
 
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
 
 from analysis.models.domain import AnalysisInput, InputArticle
+from analysis.prompts.packer import TokenCounter, estimate_tokens, pack_articles, previous_insight_text
 
 
+# 프롬프트(시스템 지시/스키마/기사 포맷)를 바꾸면 올려서 이전 분석 결과 재사용을 무효화한다.
+PROMPT_VERSION = "2025-11-23.1"
+
 JSON_SCHEMA_SNIPPET = (
     "{"
     '"summary_text": string (<=1200 chars, newline allowed), '
     '"keywords": array<string> (3-10 unique, lowercase, no punctuation), '
     '"sentiment_score": number (-1.0..1.0), '
-    '"anomalies": array<object> where object = {"label": string (<=64), "description": string (<=512), "score": number (0.0..1.0)}'
+    '"anomalies": array<object> where object = {"label": string (<=64), "description": string (<=512), "score": number (0.0..1.0)}, '
+    '"confidence": number (0.0..1.0, how well the articles support this analysis)'
     "}"
 )
 
 
+def compute_input_digest(
+    fingerprints: Iterable[str],
+    *,
+    model: str,
+    locale: str,
+    max_chars: int,
+    token_budget: Optional[int] = None,
+    options: Optional[Mapping[str, Any]] = None,
+    prompt_version: str = PROMPT_VERSION,
+) -> str:
+    """분석 입력을 식별하는 안정적인 SHA-256 다이제스트.
+
+    기사 순서는 프롬프트 내용에 영향을 주므로 정렬하지 않고 그대로 반영한다.
+    `options`에는 프롬프트에 들어갈 기사 선택/압축을 바꾸는 설정(키 순서 무관)을 넘긴다.
+    """
+    h = hashlib.sha256()
+    parts = [prompt_version, model, locale, str(max_chars)]
+    if token_budget is not None:
+        parts.append(f"tokens={token_budget}")
+    if options:
+        parts.append(json.dumps(options, sort_keys=True, separators=(",", ":")))
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\x1f")
+    for fp in fingerprints:
+        h.update(fp.encode("utf-8"))
+        h.update(b"\x1e")
+    return h.hexdigest()
+
+
 def _trim_articles(items: List[InputArticle], max_chars: int) -> List[Tuple[str, str]]:
     """Return list of (title, body_excerpt) trimmed to fit total <= max_chars.
 
@@ -45,51 +82,190 @@ def _trim_articles(items: List[InputArticle], max_chars: int) -> List[Tuple[str,
     return result
 
 
-def build_analysis_messages(inp: AnalysisInput, *, tone: str = "neutral") -> List[dict]:
-    """Build chat messages instructing the model to produce structured JSON.
-
-    - System: role, locale, tone, safety rules, JSON schema
-    - User: ticker and trimmed articles
-    """
-    locale = inp.locale
-    system = (
-        "역할: 당신은 금융 도메인에 특화된 리서치 애널리스트 보조입니다.\n"
-        "목표: 제공된 기사들을 기반으로 특정 종목의 하루치 주요 동향을\n"
-        "- 사실 기반 요약(summary)\n"
-        "- 핵심 키워드(keywords)\n"
-        "- 종합 감성 점수(sentiment_score)\n"
-        "- 이상 이벤트 목록(anomalies)\n"
-        "로 구조화하여 산출합니다.\n\n"
-        "출력 형식: JSON ONLY (추가 설명/코드블록/머리말 금지). 스키마: "
-        f"{JSON_SCHEMA_SNIPPET}.\n\n"
-        "규칙:\n"
-        "1) 사실만 기술하고, 출처 기사에 없는 수치/사실은 생성하지 않습니다.\n"
-        "2) 불확실하거나 정보가 부족하면 해당 항목을 비워두지 말고\n"
-        "   사실 부족을 명시적으로 설명합니다(예: anomalies는 빈 배열).\n"
-        "3) summary_text는 투자 자문 문구를 피하고, 과도한 확신/미확인 루머 금지.\n"
-        "4) keywords: 3~10개, 소문자, 공백 기준 토큰, 중복/불용부호 제거.\n"
-        "5) sentiment_score: -1.0(매우 부정) ~ 1.0(매우 긍정), 0은 중립.\n"
-        "6) anomalies: 비정상 패턴(깜짝 실적, 대규모 인수, 규제/소송, 경영 교체,\n"
-        "   급등락 신호 등)을 간결히 기술하고, score는 신뢰/강도(0~1).\n"
-        "7) 언어/톤: locale과 tone을 따릅니다.\n"
-        f"8) locale={locale}, tone={tone}.\n"
+def _select_articles(
+    inp: AnalysisInput,
+    *,
+    token_budget: Optional[int],
+    top_k: int,
+    token_counter: Optional[TokenCounter],
+    source_weights: Optional[Mapping[str, float]],
+) -> List[Tuple[str, str]]:
+    if token_budget is None:
+        return _trim_articles(inp.items, inp.max_chars)
+    packed = pack_articles(
+        inp.items,
+        budget_tokens=token_budget,
+        top_k=top_k,
+        counter=token_counter or estimate_tokens,
+        previous_text=previous_insight_text(inp.previous_summary, inp.previous_keywords),
+        source_weights=source_weights,
     )
+    return [(p.title, p.excerpt) for p in packed]
 
-    trimmed = _trim_articles(inp.items, inp.max_chars)
-    lines: List[str] = [
-        f"[Ticker] {inp.ticker}",
-        f"[Locale] {locale}",
-        "[Instructions] 기사 목록을 읽고 위 규칙에 따라 JSON만 출력하세요.",
-        "[Articles]",
-    ]
+
+# 시스템 프롬프트는 모든 호출에서 바이트 단위로 같은 정적 접두어로 둔다 (provider 프롬프트 캐시 적중).
+# 호출마다 달라지는 값(ticker/locale/tone/기사)은 전부 user 메시지로 보낸다.
+_SYSTEM_PROMPT = (
+    "역할: 당신은 금융 도메인에 특화된 리서치 애널리스트 보조입니다.\n"
+    "목표: 제공된 기사들을 기반으로 특정 종목의 하루치 주요 동향을\n"
+    "- 사실 기반 요약(summary)\n"
+    "- 핵심 키워드(keywords)\n"
+    "- 종합 감성 점수(sentiment_score)\n"
+    "- 이상 이벤트 목록(anomalies)\n"
+    "로 구조화하여 산출합니다.\n\n"
+    "출력 형식: JSON ONLY (추가 설명/코드블록/머리말 금지). 스키마: "
+    f"{JSON_SCHEMA_SNIPPET}.\n\n"
+    "규칙:\n"
+    "1) 사실만 기술하고, 출처 기사에 없는 수치/사실은 생성하지 않습니다.\n"
+    "2) 불확실하거나 정보가 부족하면 해당 항목을 비워두지 말고\n"
+    "   사실 부족을 명시적으로 설명합니다(예: anomalies는 빈 배열).\n"
+    "3) summary_text는 투자 자문 문구를 피하고, 과도한 확신/미확인 루머 금지.\n"
+    "4) keywords: 3~10개, 소문자, 공백 기준 토큰, 중복/불용부호 제거.\n"
+    "5) sentiment_score: -1.0(매우 부정) ~ 1.0(매우 긍정), 0은 중립.\n"
+    "6) anomalies: 비정상 패턴(깜짝 실적, 대규모 인수, 규제/소송, 경영 교체,\n"
+    "   급등락 신호 등)을 간결히 기술하고, score는 신뢰/강도(0~1).\n"
+    "7) 언어/톤: 사용자 메시지의 [Locale]과 [Tone]을 따릅니다.\n\n"
+    "입력: 사용자 메시지는 [Ticker], [Locale], [Tone] 머리말 뒤에 [Articles] 기사 목록이 옵니다.\n"
+    "기사 목록을 읽고 위 규칙에 따라 JSON만 출력하세요.\n"
+)
+
+
+def _user_header(inp: AnalysisInput, tone: str) -> List[str]:
+    return [f"[Ticker] {inp.ticker}", f"[Locale] {inp.locale}", f"[Tone] {tone}"]
+
+
+def _article_lines(trimmed: List[Tuple[str, str]]) -> List[str]:
+    lines: List[str] = []
     for idx, (title, body) in enumerate(trimmed, start=1):
         lines.append(f"{idx}. Title: {title}")
         lines.append("Body: ")
         lines.append(body)
         lines.append("")
-    user = "\n".join(lines)
+    return lines
+
 
+def build_analysis_messages(
+    inp: AnalysisInput,
+    *,
+    tone: str = "neutral",
+    token_budget: Optional[int] = None,
+    top_k: int = 5,
+    token_counter: Optional[TokenCounter] = None,
+    source_weights: Optional[Mapping[str, float]] = None,
+) -> List[dict]:
+    """Build chat messages instructing the model to produce structured JSON.
+
+    - System: static role, safety rules and JSON schema (identical for every call so the
+      provider can serve it from its prompt cache)
+    - User: ticker, locale, tone and articles; trimmed by `max_chars` or, when `token_budget`
+      is set, relevance-ranked and packed into the token budget
+    """
+    trimmed = _select_articles(
+        inp,
+        token_budget=token_budget,
+        top_k=top_k,
+        token_counter=token_counter,
+        source_weights=source_weights,
+    )
+    lines = [*_user_header(inp, tone), "[Articles]", *_article_lines(trimmed)]
+    return [
+        {"role": "system", "content": _SYSTEM_PROMPT},
+        {"role": "user", "content": "\n".join(lines)},
+    ]
+
+
+_DELTA_RULES = (
+    "\n증분 업데이트 규칙:\n"
+    "A) [Previous Insight]는 직전 분석 결과이며, [New Articles]는 그 이후 수집된 기사입니다.\n"
+    "B) 새 기사로 확인된 사실만 반영해 이전 결과를 갱신한 전체 결과(JSON)를 출력합니다.\n"
+    "C) 새 기사와 모순되는 이전 내용은 제거/수정하고, 여전히 유효한 내용은 유지합니다.\n"
+    "D) sentiment_score는 이전 값과 새 기사를 종합해 다시 산정합니다.\n"
+)
+# 기본 시스템 프롬프트를 그대로 접두어로 써서 전체/증분 호출이 캐시 접두어를 공유한다
+_DELTA_SYSTEM_PROMPT = _SYSTEM_PROMPT + _DELTA_RULES
+
+
+def build_delta_messages(
+    inp: AnalysisInput,
+    *,
+    tone: str = "neutral",
+    token_budget: Optional[int] = None,
+    top_k: int = 5,
+    token_counter: Optional[TokenCounter] = None,
+    source_weights: Optional[Mapping[str, float]] = None,
+) -> List[dict]:
+    """Build messages that update the previous insight with only the new articles.
+
+    `inp.items` must contain just the articles collected since the previous insight.
+    """
+    trimmed = _select_articles(
+        inp,
+        token_budget=token_budget,
+        top_k=top_k,
+        token_counter=token_counter,
+        source_weights=source_weights,
+    )
+    previous = {
+        "summary_text": inp.previous_summary or "",
+        "keywords": list(inp.previous_keywords),
+        "sentiment_score": inp.previous_sentiment if inp.previous_sentiment is not None else 0.0,
+        "anomalies": list(inp.previous_anomalies),
+    }
+    lines = [
+        *_user_header(inp, tone),
+        "[Previous Insight]",
+        json.dumps(previous, ensure_ascii=False),
+        "[New Articles]",
+        *_article_lines(trimmed),
+    ]
+    return [
+        {"role": "system", "content": _DELTA_SYSTEM_PROMPT},
+        {"role": "user", "content": "\n".join(lines)},
+    ]
+
+
+_GROUPED_RULES = (
+    "\n여러 종목 묶음 규칙:\n"
+    "A) 사용자 메시지는 [Group] 종목 목록 뒤에 종목마다 [Ticker], [Articles] 블록이 이어집니다.\n"
+    "B) 각 종목은 자기 블록의 기사만으로 독립적으로 분석하고, 다른 종목의 기사를 섞지 않습니다.\n"
+    'C) 출력은 {"results": array<object>} JSON 하나이며, 원소는 "ticker": string 필드와 위 스키마\n'
+    "   필드를 가진 객체로 [Group] 순서대로 종목마다 정확히 하나씩 둡니다.\n"
+)
+# 기본 시스템 프롬프트를 접두어로 공유해 단일/묶음 호출이 같은 캐시 접두어를 쓴다
+_GROUPED_SYSTEM_PROMPT = _SYSTEM_PROMPT + _GROUPED_RULES
+
+
+def build_grouped_messages(
+    inputs: List[AnalysisInput],
+    *,
+    tone: str = "neutral",
+    token_budget: Optional[int] = None,
+    top_k: int = 5,
+    token_counter: Optional[TokenCounter] = None,
+    source_weights: Optional[Mapping[str, float]] = None,
+) -> List[dict]:
+    """Build one request that analyses several low-volume tickers together.
+
+    The system prompt and schema are paid once; each ticker gets its own `[Ticker]`/`[Articles]`
+    block, trimmed or packed exactly as in `build_analysis_messages`. All inputs must share a locale.
+    """
+    if not inputs:
+        raise ValueError("묶음 분석 입력이 비어 있습니다.")
+    lines = [
+        f"[Group] {', '.join(inp.ticker for inp in inputs)}",
+        f"[Locale] {inputs[0].locale}",
+        f"[Tone] {tone}",
+    ]
+    for inp in inputs:
+        trimmed = _select_articles(
+            inp,
+            token_budget=token_budget,
+            top_k=top_k,
+            token_counter=token_counter,
+            source_weights=source_weights,
+        )
+        lines.extend([f"[Ticker] {inp.ticker}", "[Articles]", *_article_lines(trimmed)])
     return [
-        {"role": "system", "content": system},
-        {"role": "user", "content": user},
+        {"role": "system", "content": _GROUPED_SYSTEM_PROMPT},
+        {"role": "user", "content": "\n".join(lines)},
     ]
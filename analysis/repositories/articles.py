@@ -0,0 +1,96 @@
+"""Projection-based article loading for analysis.
+
+`RawArticle` 엔티티 전체(본문 원문, 원시 감성 필드 등)를 불러와 identity map에 쌓는 대신
+분석에 필요한 컬럼만 SELECT하고, 본문은 SQL `substr`로 프롬프트에 들어갈 수 있는 길이까지만 가져온다.
+행은 `yield_per`로 조금씩 받아 바로 `ArticleRow`로 바꾸므로, 본문이 아무리 길어도 태스크 메모리는
+(기사 수 × 접두어 길이)로 고정된다. `substr`/`length`는 SQLite와 PostgreSQL 모두 지원한다.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, List, Optional, Union
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from ingestion.db.models import RawArticle
+from llm.settings import AnalysisSettings
+
+# 토큰 예산을 문자 수로 환산할 때의 보수적 비율 (packer.estimate_tokens와 같은 4자/토큰)
+_CHARS_PER_TOKEN = 4
+# 한 번에 받아올 행 수
+_FETCH_BATCH = 50
+
+
+@dataclass(frozen=True, slots=True)
+class ArticleRow:
+    """분석 입력용 기사 행 (`body`는 접두어, `body_length`는 원문 길이)."""
+
+    title: str
+    body: str
+    url: str
+    fingerprint: str
+    collected_at: datetime
+    published_at: Optional[datetime]
+    language: Optional[str]
+    body_length: int
+
+    @property
+    def truncated(self) -> bool:
+        return self.body_length > len(self.body)
+
+
+# 분석 보조 모듈(다양성 선택/사전 선별)은 두 형태를 모두 받는다
+ArticleLike = Union[RawArticle, ArticleRow]
+
+
+def body_prefix_chars(settings: AnalysisSettings, *, max_chars: int) -> int:
+    """프롬프트에 실릴 수 있는 본문 최대 길이.
+
+    `_trim_articles`는 기사당 `max_chars`를 넘기지 않지만, 토큰 예산 패커는 예산만큼,
+    추출 요약은 압축 전 원문을 보므로 그만큼 넓혀 잡는다.
+    """
+    chars = int(max_chars)
+    if settings.analysis_prompt_token_budget:
+        chars = max(chars, int(settings.analysis_prompt_token_budget) * _CHARS_PER_TOKEN)
+    if settings.analysis_extractive_ratio:
+        chars = math.ceil(chars / float(settings.analysis_extractive_ratio))
+    return chars
+
+
+def iter_article_rows(session: Session, ticker: str, *, limit: int, body_chars: int) -> Iterator[ArticleRow]:
+    """최신순 기사 행을 스트리밍한다 (본문은 앞 `body_chars`자만)."""
+    stmt = (
+        select(
+            RawArticle.title,
+            func.substr(RawArticle.body, 1, int(body_chars)).label("body"),
+            RawArticle.url,
+            RawArticle.fingerprint,
+            RawArticle.collected_at,
+            RawArticle.published_at,
+            RawArticle.language,
+            func.length(RawArticle.body).label("body_length"),
+        )
+        .where(RawArticle.ticker == ticker.upper())
+        .order_by(RawArticle.collected_at.desc())
+        .limit(limit)
+        .execution_options(yield_per=_FETCH_BATCH)
+    )
+    for row in session.execute(stmt):
+        yield ArticleRow(
+            title=row.title,
+            body=row.body or "",
+            url=row.url,
+            fingerprint=row.fingerprint,
+            collected_at=row.collected_at,
+            published_at=row.published_at,
+            language=row.language,
+            body_length=int(row.body_length or 0),
+        )
+
+
+def select_article_rows(session: Session, ticker: str, *, limit: int, body_chars: int) -> List[ArticleRow]:
+    return list(iter_article_rows(session, ticker, limit=limit, body_chars=body_chars))
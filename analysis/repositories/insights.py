@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Iterable, Optional
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from analysis.models.domain import AnalysisResult
@@ -15,6 +16,11 @@ def save_insight(
     result: AnalysisResult,
     *,
     source_refs: Optional[Iterable[dict]] = None,
+    input_digest: Optional[str] = None,
+    analysis_mode: str = "full",
+    delta_depth: int = 0,
+    llm_route: Optional[dict] = None,
+    trace_id: Optional[str] = None,
 ) -> ProcessedInsight:
     entity = ProcessedInsight(
         ticker=result.ticker,
@@ -26,9 +32,24 @@ def save_insight(
         llm_model=result.llm_model,
         llm_tokens_prompt=int(result.llm_tokens_prompt),
         llm_tokens_completion=int(result.llm_tokens_completion),
+        llm_tokens_cached=int(result.llm_tokens_cached),
         llm_cost=float(result.llm_cost),
+        input_digest=input_digest,
+        analysis_mode=analysis_mode,
+        delta_depth=int(delta_depth),
+        llm_route=llm_route,
+        trace_id=trace_id,
     )
     session.add(entity)
     session.flush()
     return entity
 
+
+def get_latest_insight(session: Session, ticker: str) -> Optional[ProcessedInsight]:
+    stmt = (
+        select(ProcessedInsight)
+        .where(ProcessedInsight.ticker == ticker.upper())
+        .order_by(ProcessedInsight.generated_at.desc(), ProcessedInsight.created_at.desc())
+        .limit(1)
+    )
+    return session.execute(stmt).scalars().first()
@@ -0,0 +1,284 @@
+"""Analysis scheduling by subscriber demand and staleness.
+
+수집량 모니터는 기사가 들어오는 종목을 분석하지만, 누가 그 종목을 읽는지는 보지 않는다.
+스케줄러는 주기마다 종목별 수요를 모아 점수순으로 상위 N개만 분석을 디스패치한다.
+- 구독: `stock_subscription`의 Active 구독 수 (구독이 없는 종목은 분석하지 않음)
+- 적체: 마지막 ProcessedInsight 이후 수집된(아직 분석되지 않은) 기사 수 (0이면 제외)
+- 신선도: 마지막 인사이트 이후 경과 시간 (`ANALYSIS_SCHEDULE_STALE_HOURS`에서 포화)
+- 긴급: 직전 인사이트가 긴급 알림 기준(`publish.notifier`)을 넘은 종목은 항상 먼저
+일/시간 LLM 예산(`llm.ledger`)의 잔여분을 넘지 않는 만큼만 디스패치하고 나머지는 다음 주기로 미룬다.
+적체가 `ANALYSIS_GROUP_MAX_ARTICLES` 이하인 (긴급이 아닌) 종목은 `ANALYSIS_GROUP_MAX_TICKERS`개씩 묶어
+`analyze_ticker_group` 한 번으로 보낸다.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from analysis.repositories.insights import get_latest_insight
+from api.database import get_session
+from api.db_models import StockSubscription
+from ingestion.db.models import Base, ProcessedInsight, RawArticle
+from ingestion.db.session import get_engine, session_scope
+from ingestion.settings import get_settings
+from ingestion.utils.logging import get_logger
+from llm.ledger import BudgetPolicy, SpendLedger, get_spend_ledger
+from llm.pricing import get_price_table
+from llm.settings import AnalysisSettings, get_analysis_settings
+from publish.notifier import URGENT_ANOMALY_THRESHOLD, URGENT_SENTIMENT_THRESHOLD
+
+# 테스트 등에서 주입하는 디스패처 (ticker, priority) / (tickers, priority); None이면 Celery로 분석 태스크를 보낸다
+DISPATCHER: Callable[[str, int], None] | None = None
+GROUP_DISPATCHER: Callable[[List[str], int], None] | None = None
+
+ANALYZE_TASK_NAME = "analysis.tasks.analyze.analyze_articles_for_ticker"
+ANALYZE_GROUP_TASK_NAME = "analysis.tasks.analyze.analyze_ticker_group"
+
+# 점수 가중치: 구독/적체는 로그 스케일(소수 종목이 독식하지 않도록), 신선도는 0~1
+_W_SUBSCRIBERS = 1.0
+_W_BACKLOG = 0.5
+_W_STALENESS = 1.0
+# 긴급 종목은 다른 어떤 조합보다 앞서도록
+_URGENT_BONUS = 100.0
+# 비용 추정에 쓰는 최근 인사이트 수
+_COST_SAMPLE = 50
+
+
+@dataclass(frozen=True)
+class TickerDemand:
+    ticker: str
+    subscribers: int
+    unanalysed: int
+    # 마지막 인사이트 이후 경과 시간(시간); 인사이트가 없으면 None
+    hours_since_insight: Optional[float]
+    urgent: bool = False
+
+    def score(self, *, stale_hours: float) -> float:
+        staleness = (
+            1.0 if self.hours_since_insight is None else min(self.hours_since_insight / stale_hours, 1.0)
+        )
+        return (
+            _W_SUBSCRIBERS * math.log1p(self.subscribers)
+            + _W_BACKLOG * math.log1p(self.unanalysed)
+            + _W_STALENESS * staleness
+            + (_URGENT_BONUS if self.urgent else 0.0)
+        )
+
+
+@dataclass(frozen=True)
+class SchedulePlan:
+    dispatch: List[TickerDemand]
+    # 예산이 모자라 이번 주기에 미룬 종목 (점수순)
+    deferred: List[TickerDemand]
+    considered: int
+    estimated_cost_usd: float
+    remaining_budget_usd: float
+
+    def log_extra(self) -> dict:
+        return {
+            "considered": self.considered,
+            "dispatch": [d.ticker for d in self.dispatch],
+            "urgent": [d.ticker for d in self.dispatch if d.urgent],
+            "deferred": [d.ticker for d in self.deferred],
+            "estimated_cost_usd": round(self.estimated_cost_usd, 6),
+            "remaining_budget_usd": None if math.isinf(self.remaining_budget_usd) else round(self.remaining_budget_usd, 6),
+        }
+
+
+def _utc(at: datetime) -> datetime:
+    return at.replace(tzinfo=timezone.utc) if at.tzinfo is None else at.astimezone(timezone.utc)
+
+
+def active_subscriber_counts(api_session: Session) -> Dict[str, int]:
+    """종목별 Active 구독 수."""
+    stmt = (
+        select(StockSubscription.ticker, func.count())
+        .where(StockSubscription.status == "Active")
+        .group_by(StockSubscription.ticker)
+    )
+    return {ticker.upper(): int(count) for ticker, count in api_session.execute(stmt).all()}
+
+
+def unanalysed_article_counts(
+    session: Session, tickers: Sequence[str], *, since: datetime
+) -> Dict[str, int]:
+    """종목별로 마지막 인사이트 이후(없으면 `since` 이후) 수집된 기사 수."""
+    if not tickers:
+        return {}
+    latest = (
+        select(ProcessedInsight.ticker, func.max(ProcessedInsight.generated_at).label("last_at"))
+        .where(ProcessedInsight.ticker.in_(tickers))
+        .group_by(ProcessedInsight.ticker)
+        .subquery()
+    )
+    stmt = (
+        select(RawArticle.ticker, func.count())
+        .outerjoin(latest, latest.c.ticker == RawArticle.ticker)
+        .where(
+            RawArticle.ticker.in_(tickers),
+            RawArticle.collected_at >= since,
+            or_(latest.c.last_at.is_(None), RawArticle.collected_at > latest.c.last_at),
+        )
+        .group_by(RawArticle.ticker)
+    )
+    return {ticker: int(count) for ticker, count in session.execute(stmt).all()}
+
+
+def _is_urgent(insight: ProcessedInsight) -> bool:
+    top_anomaly = max((float(a.get("score", 0.0)) for a in insight.anomalies or [] if isinstance(a, dict)), default=0.0)
+    return top_anomaly >= URGENT_ANOMALY_THRESHOLD or float(insight.sentiment_score) <= URGENT_SENTIMENT_THRESHOLD
+
+
+def collect_demand(
+    session: Session,
+    api_session: Session,
+    settings: AnalysisSettings,
+    *,
+    now: Optional[datetime] = None,
+) -> List[TickerDemand]:
+    """구독 수가 `ANALYSIS_SCHEDULE_MIN_SUBSCRIBERS` 이상이고 미분석 기사가 있는 종목의 수요."""
+    now = _utc(now or datetime.now(timezone.utc))
+    subscribers = {
+        t: n for t, n in active_subscriber_counts(api_session).items()
+        if n >= int(settings.analysis_schedule_min_subscribers)
+    }
+    since = now - timedelta(hours=float(settings.analysis_schedule_lookback_hours))
+    backlog = unanalysed_article_counts(session, sorted(subscribers), since=since)
+    demands: List[TickerDemand] = []
+    for ticker, unanalysed in backlog.items():
+        if unanalysed <= 0:
+            continue
+        latest = get_latest_insight(session, ticker)
+        hours = None if latest is None else max((now - _utc(latest.generated_at)).total_seconds() / 3600.0, 0.0)
+        demands.append(
+            TickerDemand(
+                ticker=ticker,
+                subscribers=subscribers[ticker],
+                unanalysed=unanalysed,
+                hours_since_insight=hours,
+                urgent=latest is not None and _is_urgent(latest),
+            )
+        )
+    return demands
+
+
+def estimate_run_cost(session: Session, settings: AnalysisSettings) -> float:
+    """분석 1회 예상 비용: 최근 인사이트 평균 비용, 이력이 없으면 단가표 기준 상한 추정."""
+    recent = (
+        select(ProcessedInsight.llm_cost)
+        .where(ProcessedInsight.llm_cost > 0)
+        .order_by(ProcessedInsight.generated_at.desc())
+        .limit(_COST_SAMPLE)
+        .subquery()
+    )
+    average = session.scalar(select(func.avg(recent.c.llm_cost)))
+    if average:
+        return float(average)
+    prompt_tokens = int(settings.analysis_prompt_token_budget or 1000)
+    return get_price_table(settings).cost(settings.analysis_model, prompt_tokens, int(settings.analysis_max_tokens))
+
+
+def remaining_budget(ledger: SpendLedger, settings: AnalysisSettings, *, now: Optional[datetime] = None) -> float:
+    """일/시간 예산 중 더 빠듯한 쪽의 잔여액 (예산 미설정 시 무한대)."""
+    policy = BudgetPolicy.from_settings(settings)
+    remaining = math.inf
+    if policy.daily_limit_usd is not None:
+        remaining = min(remaining, float(policy.daily_limit_usd) - ledger.day_total(now))
+    if policy.hourly_limit_usd is not None:
+        remaining = min(remaining, float(policy.hourly_limit_usd) - ledger.hour_total(now))
+    return remaining
+
+
+def plan_dispatch(
+    demands: Sequence[TickerDemand],
+    *,
+    top_n: int,
+    stale_hours: float,
+    cost_per_run: float,
+    budget_usd: float = math.inf,
+) -> SchedulePlan:
+    """점수순 상위 `top_n`개 중 예상 비용 합이 `budget_usd` 안에 드는 만큼 고른다."""
+    ranked = sorted(demands, key=lambda d: (-d.score(stale_hours=stale_hours), d.ticker))[:top_n]
+    affordable = len(ranked) if cost_per_run <= 0 else max(0, min(len(ranked), math.floor(budget_usd / cost_per_run)))
+    return SchedulePlan(
+        dispatch=ranked[:affordable],
+        deferred=ranked[affordable:],
+        considered=len(demands),
+        estimated_cost_usd=cost_per_run * affordable,
+        remaining_budget_usd=budget_usd,
+    )
+
+
+def group_thin_tickers(
+    demands: Sequence[TickerDemand], *, max_articles: int, max_tickers: int
+) -> Tuple[List[List[TickerDemand]], List[TickerDemand]]:
+    """(묶음들, 단독 종목들)로 나눈다.
+
+    긴급이 아니고 적체가 `max_articles` 이하인 종목만 순서대로 `max_tickers`개씩 묶는다.
+    한 종목만 남은 묶음은 단독으로 보낸다 (묶음 호출의 이점이 없으므로).
+    """
+    thin = [d for d in demands if not d.urgent and d.unanalysed <= max_articles]
+    singles = [d for d in demands if d.urgent or d.unanalysed > max_articles]
+    groups = [thin[i : i + max_tickers] for i in range(0, len(thin), max_tickers)]
+    if groups and len(groups[-1]) == 1:
+        singles.extend(groups.pop())
+        singles.sort(key=lambda d: demands.index(d))
+    return groups, singles
+
+
+def _dispatch(ticker: str, priority: int) -> None:
+    if DISPATCHER is not None:
+        DISPATCHER(ticker, priority)
+        return
+    from celery import current_app
+
+    current_app.send_task(ANALYZE_TASK_NAME, args=(ticker,), queue="analysis.analyze", priority=priority)
+
+
+def _dispatch_group(tickers: List[str], priority: int) -> None:
+    if GROUP_DISPATCHER is not None:
+        GROUP_DISPATCHER(tickers, priority)
+        return
+    from celery import current_app
+
+    current_app.send_task(ANALYZE_GROUP_TASK_NAME, args=(tickers,), queue="analysis.analyze", priority=priority)
+
+
+def schedule_analysis(*, now: Optional[datetime] = None) -> List[str]:
+    """한 주기 스케줄링: 수요를 모아 예산 안에서 상위 종목의 분석을 디스패치하고 종목 목록을 반환한다."""
+    settings = get_analysis_settings()
+    ingestion_settings = get_settings()
+    logger = get_logger(__name__)
+    Base.metadata.create_all(bind=get_engine())
+
+    with session_scope() as session, get_session() as api_session:
+        demands = collect_demand(session, api_session, settings, now=now)
+        cost_per_run = estimate_run_cost(session, settings) if demands else 0.0
+    plan = plan_dispatch(
+        demands,
+        top_n=int(settings.analysis_schedule_top_n),
+        stale_hours=float(settings.analysis_schedule_stale_hours),
+        cost_per_run=cost_per_run,
+        budget_usd=remaining_budget(get_spend_ledger(), settings, now=now),
+    )
+    groups, singles = group_thin_tickers(
+        plan.dispatch,
+        max_articles=int(settings.analysis_group_max_articles),
+        max_tickers=int(settings.analysis_group_max_tickers),
+    )
+    # 단독(긴급 포함)은 점수순으로, 묶음은 그 뒤에 정기 우선순위로
+    for demand in singles:
+        priority = (
+            ingestion_settings.analysis_urgent_priority if demand.urgent else ingestion_settings.analysis_routine_priority
+        )
+        _dispatch(demand.ticker, int(priority))
+    for group in groups:
+        _dispatch_group([d.ticker for d in group], int(ingestion_settings.analysis_routine_priority))
+    logger.info("analyze.schedule", extra={**plan.log_extra(), "groups": [[d.ticker for d in g] for g in groups]})
+    return [d.ticker for d in plan.dispatch]
@@ -2,22 +2,34 @@
 
 from __future__ import annotations
 
+import math
 import uuid
-from typing import Callable, List, Optional
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
 
 from celery import shared_task
-from sqlalchemy import select
 
+from llm.client.cascade import ModelCascade
 from llm.client.openai_client import (
+    LLMError,
     OpenAIClient,
     PermanentLLMError,
     ProviderFn,
+    StreamAbortedError,
     TransientLLMError,
 )
-from analysis.models.domain import AnalysisInput, InputArticle
-from analysis.repositories.insights import save_insight
-from llm.settings import get_analysis_settings
-from ingestion.db.models import Base, RawArticle, JobStage
+from analysis.audit import get_audit_writer
+from analysis.diversity import DiversityPolicy, Embedder, get_embedding_cache, select_diverse_articles
+from analysis.extractive import compress_articles, compression_stats
+from analysis.mapreduce import run_map_reduce
+from analysis.models.domain import AnalysisInput, AnalysisResult, InputArticle
+from analysis.prescreen import PrescreenDecision, prescreen, template_result
+from analysis.prompts.templates import compute_input_digest
+from analysis.repositories.articles import ArticleRow, body_prefix_chars, select_article_rows
+from analysis.repositories.insights import get_latest_insight, save_insight
+from llm.embeddings import EmbeddingError, EmbeddingSettings, embed_texts
+from llm.settings import AnalysisSettings, get_analysis_settings
+from ingestion.db.models import Base, ProcessedInsight, JobStage, JobStatus
 from ingestion.db.session import get_engine, session_scope
 from ingestion.repositories.articles import JobRunRecorder
 from ingestion.utils.logging import get_logger
@@ -25,6 +37,8 @@ from ingestion.utils.logging import get_logger
 
 # Provider factory injection point for tests (returns provider fn or None for real OpenAI)
 PROVIDER_FACTORY: Callable[[], Optional[ProviderFn]] | None = None
+# Embedder factory injection point for tests (returns embedder or None for OpenAI embeddings)
+EMBEDDER_FACTORY: Callable[[], Optional[Embedder]] | None = None
 
 
 def _ensure_schema() -> None:
@@ -32,24 +46,231 @@ def _ensure_schema() -> None:
     Base.metadata.create_all(bind=engine)
 
 
-def _select_recent_articles(session, ticker: str, limit: int = 5) -> List[RawArticle]:
-    stmt = (
-        select(RawArticle)
-        .where(RawArticle.ticker == ticker.upper())
-        .order_by(RawArticle.collected_at.desc())
-        .limit(limit)
+def select_recent_articles(session, ticker: str, limit: int = 5, *, body_chars: int = 5000) -> List[ArticleRow]:
+    """최신 기사 `limit`건을 필요한 컬럼만, 본문은 앞 `body_chars`자만 불러온다."""
+    return select_article_rows(session, ticker, limit=limit, body_chars=body_chars)
+
+
+def select_analysis_articles(
+    window: List[ArticleRow], settings: AnalysisSettings, logger, extra: dict
+) -> List[ArticleRow]:
+    """최신순 후보에서 분석에 넣을 기사를 고른다.
+
+    다양성 선택이 켜져 있으면 임베딩 + MMR로 서로 다른 기사를 고르고,
+    임베딩에 실패하면 최신 N건으로 폴백한다.
+    """
+    candidates = int(settings.analysis_candidate_articles)
+    if not settings.analysis_diversity_enabled or len(window) <= 1:
+        return window[:candidates]
+    embedder = (EMBEDDER_FACTORY() if EMBEDDER_FACTORY else None) or (lambda texts: embed_texts(texts))
+    try:
+        rows = select_diverse_articles(
+            window[: int(settings.analysis_diversity_pool)],
+            embedder,
+            DiversityPolicy.from_settings(settings),
+            cache=get_embedding_cache(),
+            model=EmbeddingSettings.from_env().model,
+        )
+    except (EmbeddingError, ValueError) as exc:
+        logger.warning("analyze.diversity_failed", extra={**extra, "error": str(exc)})
+        return window[:candidates]
+    logger.info(
+        "analyze.diversity_selected",
+        extra={**extra, "pool": min(len(window), int(settings.analysis_diversity_pool)), "selected": len(rows)},
+    )
+    return rows
+
+
+def prescreen_articles(
+    rows: List[ArticleRow], previous: Optional[ProcessedInsight], settings: AnalysisSettings
+) -> Optional[PrescreenDecision]:
+    """`ANALYSIS_PRESCREEN_THRESHOLD`가 설정되어 있으면 로컬 사전 선별 결과, 아니면 None."""
+    threshold = settings.analysis_prescreen_threshold
+    if threshold is None:
+        return None
+    return prescreen(rows, threshold=float(threshold), action=settings.analysis_prescreen_action, previous=previous)
+
+
+def input_digest_for(rows: List[ArticleRow], settings: AnalysisSettings, *, max_chars: int) -> str:
+    return compute_input_digest(
+        (r.fingerprint for r in rows),
+        # 캐스케이드 사용 시 모델 구성 전체가 결과에 영향을 준다
+        model=">".join(settings.analysis_cascade_models)
+        if len(settings.analysis_cascade_models) > 1
+        else settings.analysis_model,
+        locale=settings.default_locale,
+        max_chars=max_chars,
+        token_budget=settings.analysis_prompt_token_budget,
+        options=_prompt_options(settings),
+    )
+
+
+def _prompt_options(settings: AnalysisSettings) -> Dict[str, object]:
+    """다이제스트에 넣을 프롬프트 영향 설정. 꺼진 기능의 설정은 넣지 않아 기존 다이제스트를 유지한다."""
+    options: Dict[str, object] = {}
+    if settings.analysis_extractive_ratio:
+        options["extractive"] = [
+            float(settings.analysis_extractive_ratio),
+            int(settings.analysis_extractive_min_chars),
+        ]
+    if settings.analysis_prompt_token_budget is not None:
+        options["packer_top_k"] = int(settings.analysis_packer_top_k)
+        if settings.analysis_source_weights:
+            options["source_weights"] = dict(settings.analysis_source_weights)
+    if settings.analysis_diversity_enabled:
+        options["diversity"] = [
+            float(settings.analysis_diversity_lambda),
+            float(settings.analysis_diversity_duplicate_threshold),
+            int(settings.analysis_diversity_pool),
+        ]
+    return options
+
+
+def build_analysis_input(
+    ticker: str,
+    rows: List[ArticleRow],
+    settings: AnalysisSettings,
+    *,
+    max_chars: int,
+    previous: Optional[ProcessedInsight] = None,
+    delta: bool = False,
+) -> AnalysisInput:
+    items = [
+        InputArticle(title=r.title, body=r.body, url=r.url, language=r.language, published_at=r.published_at)
+        for r in rows
+    ]
+    if settings.analysis_extractive_ratio:
+        items = compress_articles(
+            items,
+            ratio=float(settings.analysis_extractive_ratio),
+            min_chars=int(settings.analysis_extractive_min_chars),
+        )
+    return AnalysisInput(
+        ticker=ticker,
+        locale=settings.default_locale,
+        items=items,
+        max_chars=max_chars,
+        previous_summary=previous.summary_text if previous is not None else None,
+        previous_keywords=list(previous.keywords or []) if previous is not None else [],
+        previous_sentiment=previous.sentiment_score if previous is not None else None,
+        previous_anomalies=list(previous.anomalies or []) if previous is not None else [],
+        delta=delta,
     )
-    return list(session.execute(stmt).scalars().all())
 
 
-def analyze_core(ticker: str, *, max_chars: int | None = None) -> int:
+def source_refs_for(rows: List[ArticleRow]) -> List[dict]:
+    return [{"url": r.url, "collected_at": r.collected_at.isoformat()} for r in rows]
+
+
+def select_delta_articles(
+    rows: List[ArticleRow], previous: Optional[ProcessedInsight], settings: AnalysisSettings
+) -> Optional[List[ArticleRow]]:
+    """증분 분석에 쓸 신규 기사(직전 인사이트의 source_refs에 없는 기사)를 반환한다.
+
+    증분이 부적절하면(비활성, 직전 결과 없음, 최대 연속 횟수 도달, 신규 기사 없음/전부 신규) None.
+    """
+    if not settings.analysis_delta_enabled or previous is None:
+        return None
+    if int(previous.delta_depth or 0) >= int(settings.analysis_delta_max_depth):
+        return None
+    seen = {ref.get("url") for ref in previous.source_refs or []}
+    if not seen:
+        return None
+    fresh = [r for r in rows if r.url not in seen]
+    if not fresh or len(fresh) == len(rows):
+        return None
+    return fresh
+
+
+def _delta_drifted(result: AnalysisResult, previous: ProcessedInsight, settings: AnalysisSettings) -> bool:
+    return abs(result.sentiment_score - previous.sentiment_score) > float(settings.analysis_delta_drift_threshold)
+
+
+def _with_spent(result: AnalysisResult, discarded: AnalysisResult) -> AnalysisResult:
+    """버린 호출(드리프트로 폐기한 델타 결과)의 토큰/비용을 최종 결과에 더한다."""
+    return result.model_copy(
+        update={
+            "llm_tokens_prompt": result.llm_tokens_prompt + discarded.llm_tokens_prompt,
+            "llm_tokens_completion": result.llm_tokens_completion + discarded.llm_tokens_completion,
+            "llm_tokens_cached": result.llm_tokens_cached + discarded.llm_tokens_cached,
+            "llm_cost": result.llm_cost + discarded.llm_cost,
+        }
+    )
+
+
+def _call_llm(
+    client: OpenAIClient, inp: AnalysisInput, logger, extra: dict
+) -> tuple[AnalysisResult, Optional[dict]]:
+    """단일 호출 또는 (설정 시) 모델 캐스케이드로 분석. (결과, llm_route) 반환."""
+    try:
+        cascade = ModelCascade.from_client(client)
+        if cascade is None and client.streams_analysis:
+            streamed = client.analyze_streaming(inp)
+            if streamed.aborted:
+                logger.info(
+                    "analyze.stream_aborted",
+                    extra={
+                        **extra,
+                        "reasons": [e.reason for e in streamed.aborted],
+                        "saved_completion_tokens": streamed.saved_completion_tokens,
+                    },
+                )
+            return streamed.result, None
+        if cascade is None:
+            return client.analyze(inp), None
+        outcome = cascade.analyze(inp)
+        if outcome.escalated:
+            logger.info(
+                "analyze.cascade_escalated",
+                extra={**extra, "route": [(a.model, a.escalation) for a in outcome.attempts]},
+            )
+        return outcome.result, outcome.route()
+    except StreamAbortedError as exc:
+        logger.warning(
+            "analyze.permanent_error",
+            extra={**extra, "error": str(exc), "saved_completion_tokens": exc.saved_completion_tokens},
+        )
+        raise
+    except PermanentLLMError as exc:
+        logger.warning("analyze.permanent_error", extra={**extra, "error": str(exc)})
+        raise
+    except TransientLLMError as exc:
+        logger.warning("analyze.transient_error", extra={**extra, "error": str(exc)})
+        raise
+    except Exception:
+        logger.exception("analyze.unexpected_error", extra=extra)
+        raise
+
+
+def analyze_core(
+    ticker: str,
+    *,
+    max_chars: int | None = None,
+    trace_id: str | None = None,
+    force: bool = False,
+) -> int:
     """Analyze recent articles for ticker and persist a single insight.
 
+    If the latest insight was produced from the same input digest (articles, prompt
+    version, model), the LLM call is skipped and the JobRun is marked CACHED unless
+    `force` is set.
+
+    With delta mode enabled, the previous insight is updated from only the newly
+    collected articles; every `ANALYSIS_DELTA_MAX_DEPTH` deltas, or when the update
+    drifts too far from the previous sentiment, a full rebuild is done instead.
+
+    When more than `ANALYSIS_MAPREDUCE_THRESHOLD` recent articles exist, clusters are
+    summarised in parallel with a cheaper model and merged (map-reduce).
+
+    With `ANALYSIS_PRESCREEN_THRESHOLD` set, a local lexicon/event/novelty score is
+    computed first; below the threshold the LLM is skipped (JobRun CACHED) or a
+    templated insight is saved (`analysis_mode=template`).
+
     Returns the number of insights saved (0 or 1).
     """
     _ensure_schema()
     logger = get_logger(__name__)
-    trace_id = str(uuid.uuid4())
+    trace_id = trace_id or str(uuid.uuid4())
     settings = get_analysis_settings()
     with session_scope() as session, JobRunRecorder(
         session,
@@ -58,41 +279,102 @@ def analyze_core(ticker: str, *, max_chars: int | None = None) -> int:
         source="openai",
         task_name="analyze_articles_for_ticker",
         trace_id=trace_id,
-    ):
-        rows = _select_recent_articles(session, ticker)
+    ) as job:
+        candidates = int(settings.analysis_candidate_articles)
+        threshold = int(settings.analysis_mapreduce_threshold)
+        max_articles = int(settings.analysis_mapreduce_max_articles)
+        limit = max(candidates, max_articles) if threshold else candidates
+        if settings.analysis_diversity_enabled:
+            limit = max(limit, int(settings.analysis_diversity_pool))
+        max_chars = max_chars or 5000
+        window = select_recent_articles(
+            session, ticker, limit=limit, body_chars=body_prefix_chars(settings, max_chars=max_chars)
+        )
+        use_mapreduce = bool(threshold) and len(window) > threshold
+        if use_mapreduce:
+            rows = window[: max(candidates, max_articles)]
+        else:
+            rows = select_analysis_articles(window, settings, logger, {"trace_id": trace_id, "ticker": ticker})
         if not rows:
             logger.info("analyze.no_articles", extra={"trace_id": trace_id, "ticker": ticker})
             return 0
+        digest = input_digest_for(rows, settings, max_chars=max_chars)
+        latest = get_latest_insight(session, ticker)
+        if not force and latest is not None and latest.input_digest == digest:
+            job.status = JobStatus.CACHED
+            logger.info(
+                "analyze.cached",
+                extra={"trace_id": trace_id, "ticker": ticker, "insight_id": str(latest.id), "digest": digest},
+            )
+            return 0
+        extra = {"trace_id": trace_id, "ticker": ticker}
+        decision = None if force or use_mapreduce else prescreen_articles(rows, latest, settings)
+        if decision is not None:
+            logger.info("analyze.prescreen", extra={**extra, **decision.log_extra()})
+            if decision.action == "skip":
+                job.status = JobStatus.CACHED
+                return 0
         logger.info(
             "analyze.start",
             extra={"trace_id": trace_id, "ticker": ticker, "articles": len(rows)},
         )
-        items = [
-            InputArticle(title=r.title, body=r.body, url=r.url, language=r.language, published_at=r.published_at)
-            for r in rows
-        ]
-        inp = AnalysisInput(
-            ticker=ticker,
-            locale=settings.default_locale,
-            items=items,
-            max_chars=max_chars or 5000,
-        )
-        extra = {"trace_id": trace_id, "ticker": ticker}
         provider = PROVIDER_FACTORY() if PROVIDER_FACTORY else None
-        client = OpenAIClient.from_env(provider=provider)
-        try:
-            result = client.analyze(inp)
-        except PermanentLLMError as exc:
-            logger.warning("analyze.permanent_error", extra={**extra, "error": str(exc)})
-            raise
-        except TransientLLMError as exc:
-            logger.warning("analyze.transient_error", extra={**extra, "error": str(exc)})
-            raise
-        except Exception:
-            logger.exception("analyze.unexpected_error", extra=extra)
-            raise
-        source_refs = [{"url": r.url, "collected_at": r.collected_at.isoformat()} for r in rows]
-        save_insight(session, result, source_refs=source_refs)
+        client = OpenAIClient.from_env(provider=provider).with_audit(
+            get_audit_writer(), trace_id=trace_id, ticker=ticker
+        )
+
+        result: Optional[AnalysisResult] = None
+        discarded: Optional[AnalysisResult] = None
+        route: Optional[dict] = None
+        used_inp: Optional[AnalysisInput] = None
+        mode, depth, used = "full", 0, rows
+        if decision is not None and decision.action == "template":
+            result, mode = template_result(ticker, decision), "template"
+            used_inp = build_analysis_input(ticker, rows, settings, max_chars=max_chars, previous=latest)
+        delta_rows = (
+            None if force or use_mapreduce or result is not None else select_delta_articles(rows, latest, settings)
+        )
+        if delta_rows is not None and latest is not None:
+            delta_inp = build_analysis_input(
+                ticker, delta_rows, settings, max_chars=max_chars, previous=latest, delta=True
+            )
+            result, route = _call_llm(client.with_stage("delta"), delta_inp, logger, {**extra, "mode": "delta"})
+            if _delta_drifted(result, latest, settings):
+                logger.info(
+                    "analyze.delta_drift",
+                    extra={
+                        **extra,
+                        "previous_sentiment": latest.sentiment_score,
+                        "delta_sentiment": result.sentiment_score,
+                    },
+                )
+                # 델타 호출도 과금되었으므로 재분석 결과에 합산한다
+                discarded, result, route = result, None, None
+            else:
+                mode, depth, used, used_inp = "delta", int(latest.delta_depth or 0) + 1, delta_rows, delta_inp
+        if result is None:
+            inp = used_inp = build_analysis_input(ticker, rows, settings, max_chars=max_chars, previous=latest)
+            if use_mapreduce:
+                try:
+                    result = run_map_reduce(client, inp).result
+                except LLMError as exc:
+                    logger.warning("analyze.mapreduce_error", extra={**extra, "error": str(exc)})
+                    raise
+                mode = "mapred"
+            else:
+                result, route = _call_llm(client, inp, logger, extra)
+        if discarded is not None:
+            result = _with_spent(result, discarded)
+        save_insight(
+            session,
+            result,
+            source_refs=source_refs_for(rows),
+            input_digest=digest,
+            analysis_mode=mode,
+            delta_depth=depth,
+            llm_route=route,
+            trace_id=trace_id,
+        )
         logger.info(
             "analyze.saved",
             extra={
@@ -101,21 +383,175 @@ def analyze_core(ticker: str, *, max_chars: int | None = None) -> int:
                 "model": result.llm_model,
                 "tokens_prompt": result.llm_tokens_prompt,
                 "tokens_completion": result.llm_tokens_completion,
+                "tokens_cached": result.llm_tokens_cached,
                 "cost": result.llm_cost,
-                "articles": len(rows),
+                "articles": len(used),
+                "mode": mode,
+                "delta_depth": depth,
+                **compression_stats([r.body.strip() for r in used], [it.body for it in used_inp.items]),
             },
         )
         return 1
 
 
+@dataclass(frozen=True)
+class _GroupMember:
+    ticker: str
+    rows: List[ArticleRow]
+    digest: str
+    inp: AnalysisInput
+
+
+def analyze_group_core(
+    tickers: Iterable[str],
+    *,
+    max_chars: int | None = None,
+    trace_id: str | None = None,
+    force: bool = False,
+) -> int:
+    """Analyze several thin-coverage tickers with one LLM call per group.
+
+    Tickers with at most `ANALYSIS_GROUP_MAX_ARTICLES` recent articles are packed up to
+    `ANALYSIS_GROUP_MAX_TICKERS` per request; each per-ticker result is validated and saved
+    as its own insight (`analysis_mode=grouped`) with tokens/cost apportioned by input share.
+    Busier tickers, tickers the pre-screen would skip or template, and tickers whose grouped
+    result failed (whole call or just their entry) fall back to `analyze_core`.
+
+    Returns the number of insights saved.
+    """
+    _ensure_schema()
+    logger = get_logger(__name__)
+    trace_id = trace_id or str(uuid.uuid4())
+    settings = get_analysis_settings()
+    max_chars = max_chars or 5000
+    singles: List[str] = []
+    fallback: List[str] = []
+    saved = 0
+    with session_scope() as session, JobRunRecorder(
+        session,
+        stage=JobStage.ANALYZE,
+        ticker=None,
+        source="openai",
+        task_name="analyze_ticker_group",
+        trace_id=trace_id,
+    ) as job:
+        members: List[_GroupMember] = []
+        for ticker in dict.fromkeys(t.upper() for t in tickers):
+            extra = {"trace_id": trace_id, "ticker": ticker}
+            window = select_recent_articles(
+                session,
+                ticker,
+                limit=int(settings.analysis_group_max_articles) + 1,
+                body_chars=body_prefix_chars(settings, max_chars=max_chars),
+            )
+            if not window:
+                logger.info("analyze.no_articles", extra=extra)
+                continue
+            if len(window) > int(settings.analysis_group_max_articles):
+                singles.append(ticker)
+                continue
+            digest = input_digest_for(window, settings, max_chars=max_chars)
+            latest = get_latest_insight(session, ticker)
+            if not force and latest is not None and latest.input_digest == digest:
+                logger.info(
+                    "analyze.cached",
+                    extra={**extra, "insight_id": str(latest.id), "digest": digest},
+                )
+                continue
+            decision = None if force else prescreen_articles(window, latest, settings)
+            if decision is not None and decision.action != "llm":
+                singles.append(ticker)
+                continue
+            inp = build_analysis_input(ticker, window, settings, max_chars=max_chars, previous=latest)
+            members.append(_GroupMember(ticker=ticker, rows=window, digest=digest, inp=inp))
+
+        size = int(settings.analysis_group_max_tickers)
+        groups = [members[i : i + size] for i in range(0, len(members), size)]
+        if groups and len(groups[-1]) == 1:
+            singles.append(groups.pop().pop().ticker)
+        if not groups:
+            job.status = JobStatus.CACHED
+        provider = PROVIDER_FACTORY() if PROVIDER_FACTORY else None
+        client = OpenAIClient.from_env(provider=provider).with_stage("group") if groups else None
+        for group in groups:
+            tickers_in_group = [m.ticker for m in group]
+            logger.info(
+                "analyze.group_start",
+                extra={"trace_id": trace_id, "tickers": tickers_in_group, "articles": sum(len(m.rows) for m in group)},
+            )
+            try:
+                results = client.with_audit(
+                    get_audit_writer(), trace_id=trace_id, tickers=tickers_in_group
+                ).analyze_grouped([m.inp for m in group])
+            except LLMError as exc:
+                logger.warning(
+                    "analyze.group_failed", extra={"trace_id": trace_id, "tickers": tickers_in_group, "error": str(exc)}
+                )
+                fallback.extend(tickers_in_group)
+                continue
+            for member, result in zip(group, results):
+                extra = {"trace_id": trace_id, "ticker": member.ticker}
+                if isinstance(result, LLMError):
+                    logger.warning("analyze.group_member_failed", extra={**extra, "error": str(result)})
+                    fallback.append(member.ticker)
+                    continue
+                save_insight(
+                    session,
+                    result,
+                    source_refs=source_refs_for(member.rows),
+                    input_digest=member.digest,
+                    analysis_mode="grouped",
+                    trace_id=trace_id,
+                )
+                saved += 1
+                logger.info(
+                    "analyze.saved",
+                    extra={
+                        **extra,
+                        "model": result.llm_model,
+                        "tokens_prompt": result.llm_tokens_prompt,
+                        "tokens_completion": result.llm_tokens_completion,
+                        "tokens_cached": result.llm_tokens_cached,
+                        "cost": result.llm_cost,
+                        "articles": len(member.rows),
+                        "mode": "grouped",
+                        "group_size": len(group),
+                    },
+                )
+
+    # 단독 분석은 종목별 JobRun/트랜잭션으로 (한 종목의 실패가 다른 종목을 막지 않도록)
+    for ticker in singles + fallback:
+        try:
+            saved += analyze_core(ticker, max_chars=max_chars, trace_id=trace_id, force=force)
+        except LLMError:
+            # analyze_core가 오류 로그와 FAILED JobRun을 남긴다
+            continue
+    return saved
+
+
 @shared_task(
+    bind=True,
+    name="analysis.tasks.analyze.analyze_ticker_group",
+    queue="analysis.analyze",
+)
+def analyze_ticker_group(self, tickers: List[str]) -> int:  # pragma: no cover - thin wrapper
+    return analyze_group_core(tickers, trace_id=self.request.id)
+
+
+@shared_task(
+    bind=True,
     name="analysis.tasks.analyze.analyze_articles_for_ticker",
     queue="analysis.analyze",
-    autoretry_for=(TransientLLMError,),
-    retry_backoff=True,
-    retry_jitter=True,
-    retry_kwargs={"max_retries": 3},
+    max_retries=3,
 )
-def analyze_articles_for_ticker(ticker: str) -> int:  # pragma: no cover - thin wrapper
-    return analyze_core(ticker)
+def analyze_articles_for_ticker(self, ticker: str) -> int:  # pragma: no cover - thin wrapper
+    # 일시 오류 재시도는 OpenAIClient의 RetryPolicy(기한 내 백오프)가 담당한다. 태스크 재시도까지
+    # 겹치면 호출 수가 곱해지므로, 예산 연기나 provider Retry-After처럼 "기다려야 하는" 경우만
+    # 그 시간만큼 재예약하고 나머지는 실패(DLQ)로 남긴다.
+    try:
+        return analyze_core(ticker, trace_id=self.request.id)
+    except TransientLLMError as exc:
+        if exc.retry_after_seconds is None:
+            raise
+        raise self.retry(exc=exc, countdown=max(1, math.ceil(exc.retry_after_seconds)))
 
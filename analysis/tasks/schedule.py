@@ -0,0 +1,18 @@
+"""Celery task for the demand-driven analysis scheduler."""
+
+from __future__ import annotations
+
+from typing import List
+
+from celery import shared_task
+
+from analysis.scheduler import schedule_analysis
+
+
+@shared_task(
+    name="analysis.tasks.schedule.schedule_analysis",
+    queue="ingestion.default",
+)
+def schedule_analysis_task() -> List[str]:  # pragma: no cover - thin Celery wrapper
+    """Dispatch analyses for the highest-demand tickers within the LLM budget."""
+    return schedule_analysis()
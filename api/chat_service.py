@@ -15,7 +15,13 @@ from api import db_models
 from api.redis_cache import RedisSessionCache
 from api.repositories import add_chat_message, list_chat_messages
 from ingestion.services.chroma_client import ChromaClient, default_chroma_client, ChromaError
-from llm.client.openai_client import OpenAIClient, PermanentLLMError, TransientLLMError
+from llm.client.openai_client import (
+    BudgetDeferredError,
+    BudgetExceededError,
+    OpenAIClient,
+    PermanentLLMError,
+    TransientLLMError,
+)
 from llm.embeddings import embed_texts
 
 
@@ -93,6 +99,7 @@ class ChatService:
         self, context: List[dict], trace_id: str
     ) -> AsyncIterator[str]:
         attempts = 0
+        yielded = False
         while attempts <= self.STREAM_RETRY_LIMIT:
             attempts += 1
             try:
@@ -105,8 +112,21 @@ class ChatService:
                     retry_max_attempts=0,
                 )
                 async for chunk in self._consume_stream(stream_iter):
+                    yielded = True
                     yield chunk
                 return
+            except (BudgetDeferredError, BudgetExceededError) as exc:
+                # 예산 윈도가 끝나기 전엔 재시도해도 같은 결과이므로 바로 종료
+                # (거절은 PermanentLLMError이므로 요청당 비용 상한보다 먼저 잡는다)
+                self.logger.warning(
+                    "chat.budget_exhausted",
+                    extra={"trace_id": trace_id, "error": str(exc)},
+                )
+                raise ChatServiceError(
+                    "budget_exhausted",
+                    "AI 응답 사용 한도에 도달했습니다. 잠시 후 다시 시도해주세요.",
+                    trace_id,
+                ) from exc
             except PermanentLLMError as exc:
                 self.logger.warning(
                     "chat.cost_limit",
@@ -122,7 +142,8 @@ class ChatService:
                     "chat.transient_error",
                     extra={"trace_id": trace_id, "error": str(exc), "attempt": attempts},
                 )
-                if attempts <= self.STREAM_RETRY_LIMIT:
+                # 이미 보낸 조각이 있으면 다시 스트리밍하지 않는다 (같은 글이 중복되므로)
+                if attempts <= self.STREAM_RETRY_LIMIT and not yielded:
                     continue
                 raise ChatServiceError(
                     "llm_unavailable",
@@ -30,7 +30,7 @@ app = FastAPI(title="StockTeacher Web API", version="0.1.0")
 init_db()
 
 # Initialize chat service
-openai_client = OpenAIClient.from_env()
+openai_client = OpenAIClient.from_env(stage="chat")
 redis_cache = RedisSessionCache()
 chat_service_module.chat_service = ChatService(
     openai_client,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Literal
 from zoneinfo import ZoneInfo
 
@@ -107,6 +107,42 @@ class ReportStatusUpdate(BaseModel):
     status: ReportStatus
 
 
+class LlmStageSpend(BaseModel):
+    stage: str
+    total_usd: float
+    models: dict[str, float] = Field(default_factory=dict)
+
+
+class LlmSpendReport(BaseModel):
+    day: date
+    total_usd: float
+    stages: list[LlmStageSpend] = Field(default_factory=list)
+    daily_budget_usd: float | None = None
+    hourly_budget_usd: float | None = None
+    current_hour_usd: float | None = None
+
+
+class LlmUsageReconciliation(BaseModel):
+    stage: str
+    model: str
+    calls: int
+    estimated_prompt_tokens: int
+    prompt_tokens: int
+    prompt_error_ratio: float | None = None
+    prompt_abs_error_ratio: float | None = None
+    completion_tokens: int
+    completion_fill_ratio: float | None = None
+    cached_tokens: int
+    estimated_cost_usd: float
+    cost_usd: float
+    cost_headroom_ratio: float | None = None
+
+
+class LlmUsageReconciliationReport(BaseModel):
+    day: date
+    rows: list[LlmUsageReconciliation] = Field(default_factory=list)
+
+
 class NotificationPolicyBase(BaseModel):
     timezone: str
     window: NotificationWindow
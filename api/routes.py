@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date as date_type, datetime, timezone
 import os
 from typing import Annotated
 
@@ -14,6 +14,10 @@ from .models import (
     ChatMessage,
     ChatMessageRequest,
     ChatSession,
+    LlmSpendReport,
+    LlmStageSpend,
+    LlmUsageReconciliation,
+    LlmUsageReconciliationReport,
     NotificationPolicy,
     NotificationPolicyUpsert,
     ReportDetail,
@@ -44,6 +48,9 @@ from .repositories import (
 from api.vector_search import SearchFilters, get_vector_search_service
 from api import db_models
 from ingestion.services.chroma_client import ChromaError
+from llm.ledger import SpendLedger, get_spend_ledger
+from llm.reconcile import UsageReconciler, get_usage_reconciler, reconciliation_report
+from llm.settings import get_analysis_settings
 
 router = APIRouter(prefix="/api")
 
@@ -299,6 +306,36 @@ async def list_notification_timezones_route() -> list[str]:
     return NOTIFICATION_TIMEZONE_PRESETS
 
 
+@router.get("/llm/spend", response_model=LlmSpendReport)
+async def llm_spend_route(
+    ledger: Annotated[SpendLedger, Depends(get_spend_ledger)],
+    day: date_type | None = Query(default=None, description="UTC day (YYYY-MM-DD); defaults to today"),
+) -> LlmSpendReport:
+    today = datetime.now(timezone.utc).date()
+    day = day or today
+    stages = [
+        LlmStageSpend(stage=stage, total_usd=round(sum(models.values()), 6), models=models)
+        for stage, models in sorted(ledger.breakdown(day).items())
+    ]
+    report = LlmSpendReport(day=day, total_usd=round(sum(s.total_usd for s in stages), 6), stages=stages)
+    if day == today:
+        settings = get_analysis_settings()
+        report.daily_budget_usd = settings.llm_daily_budget_usd
+        report.hourly_budget_usd = settings.llm_hourly_budget_usd
+        report.current_hour_usd = round(ledger.hour_total(), 6)
+    return report
+
+
+@router.get("/llm/usage-reconciliation", response_model=LlmUsageReconciliationReport)
+async def llm_usage_reconciliation_route(
+    reconciler: Annotated[UsageReconciler, Depends(get_usage_reconciler)],
+    day: date_type | None = Query(default=None, description="UTC day (YYYY-MM-DD); defaults to today"),
+) -> LlmUsageReconciliationReport:
+    day = day or datetime.now(timezone.utc).date()
+    rows = [LlmUsageReconciliation(**vars(row)) for row in reconciliation_report(reconciler, day)]
+    return LlmUsageReconciliationReport(day=day, rows=rows)
+
+
 def _ensure_subscription_owner(
     session: Session, subscription_id: str, user_id: str
 ) -> None:
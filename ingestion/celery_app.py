@@ -8,12 +8,35 @@ from typing import Any, Dict
 
 from celery import Celery
 from celery.schedules import schedule as celery_schedule
+from kombu import Exchange, Queue
 
 from .settings import CollectionSchedule, Settings, get_settings
 from .utils.logging import configure_logging
 
 _CELERY_APP: Celery | None = None
 
+# 라우팅이 없는 태스크와 가벼운 제어 태스크(스케줄러)용 큐 (느린 분석 큐 뒤에서 밀리지 않도록)
+DEFAULT_QUEUE = "ingestion.default"
+
+# 태스크 → 파이프라인 단계 큐 라우팅
+TASK_QUEUES: Dict[str, str] = {
+    "ingestion.tasks.collect.collect_articles_for_ticker": "ingestion.collect",
+    "analysis.tasks.analyze.analyze_articles_for_ticker": "analysis.analyze",
+    "analysis.tasks.analyze.analyze_ticker_group": "analysis.analyze",
+    "analysis.tasks.schedule.schedule_analysis": DEFAULT_QUEUE,
+    "ingestion.tasks.embed.embed_reports": "analysis.embed",
+    "ingestion.tasks.deliver.materialize_reports": "deliver.materialize",
+}
+
+# 워커 기동 시 로드할 태스크 모듈 (단계별 전용 워커가 라우팅된 태스크를 알 수 있도록)
+TASK_MODULES = (
+    "ingestion.tasks.collect",
+    "ingestion.tasks.embed",
+    "ingestion.tasks.deliver",
+    "analysis.tasks.analyze",
+    "analysis.tasks.schedule",
+)
+
 
 def create_celery_app(settings: Settings | None = None) -> Celery:
     """설정을 기반으로 Celery 인스턴스를 생성한다."""
@@ -22,9 +45,9 @@ def create_celery_app(settings: Settings | None = None) -> Celery:
 
     app = Celery("ingestion", broker=config.redis_url, backend=config.redis_url)
     app.conf.update(
-        task_default_queue="ingestion.default",
+        task_default_queue=DEFAULT_QUEUE,
         task_default_exchange="ingestion",
-        task_default_routing_key="ingestion.default",
+        task_default_routing_key=DEFAULT_QUEUE,
         task_soft_time_limit=config.celery_task_soft_time_limit,
         worker_concurrency=config.celery_worker_concurrency,
         beat_schedule=_build_beat_schedule(config),
@@ -32,6 +55,12 @@ def create_celery_app(settings: Settings | None = None) -> Celery:
         enable_utc=True,
         worker_send_task_events=True,
         task_send_sent_event=True,
+        imports=TASK_MODULES,
+        task_queues=_build_task_queues(config),
+        task_routes=_build_task_routes(config),
+        task_annotations=_build_task_annotations(config),
+        # Redis 브로커 우선순위: 0(최우선)~9, 큐를 우선순위 단계별로 분리
+        broker_transport_options={"priority_steps": list(range(10)), "sep": ":", "queue_order_strategy": "priority"},
     )
 
     app.autodiscover_tasks(["ingestion.tasks"])
@@ -60,9 +89,47 @@ def _build_beat_schedule(settings: Settings) -> Dict[str, Dict[str, Any]]:
             "args": (item.ticker, item.source),
             "options": {"queue": "ingestion.collect"},
         }
+    if settings.analysis_schedule_interval_minutes:
+        schedule["analysis.schedule"] = {
+            "task": "analysis.tasks.schedule.schedule_analysis",
+            "schedule": celery_schedule(timedelta(minutes=settings.analysis_schedule_interval_minutes)),
+            "options": {"queue": TASK_QUEUES["analysis.tasks.schedule.schedule_analysis"]},
+        }
     return schedule
 
 
+def _build_task_queues(settings: Settings) -> list[Queue]:
+    exchange = Exchange("ingestion", type="direct")
+    queues = [
+        Queue(name, exchange, routing_key=name, max_priority=profile.max_priority or None)
+        for name, profile in settings.celery_queue_profiles.items()
+    ]
+    if DEFAULT_QUEUE not in settings.celery_queue_profiles:
+        queues.insert(0, Queue(DEFAULT_QUEUE, exchange, routing_key=DEFAULT_QUEUE))
+    return queues
+
+
+def _build_task_routes(settings: Settings) -> Dict[str, Dict[str, Any]]:
+    routes: Dict[str, Dict[str, Any]] = {}
+    for task_name, queue in TASK_QUEUES.items():
+        route: Dict[str, Any] = {"queue": queue, "routing_key": queue}
+        profile = settings.celery_queue_profiles.get(queue)
+        if profile is not None and profile.default_priority is not None:
+            route["priority"] = profile.default_priority
+        routes[task_name] = route
+    return routes
+
+
+def _build_task_annotations(settings: Settings) -> Dict[str, Dict[str, Any]]:
+    annotations: Dict[str, Dict[str, Any]] = {}
+    for task_name, queue in TASK_QUEUES.items():
+        profile = settings.celery_queue_profiles.get(queue)
+        if profile is None:
+            continue
+        annotations[task_name] = {"acks_late": profile.acks_late, "ignore_result": profile.ignore_result}
+    return annotations
+
+
 def _build_schedule_name(item: CollectionSchedule, index: int) -> str:
     return f"collect.{item.source}.{item.ticker.lower()}.{index}"
 
@@ -84,3 +151,21 @@ def _install_signal_handlers(app: Celery) -> None:
     @signals.worker_shutdown.connect  # type: ignore[attr-defined]
     def _on_worker_shutdown(sender=None, **kwargs):  # noqa: ANN001
         logger.info("Celery worker shutdown detected", extra={"sender": sender})
+
+    # 중첩 함수이므로 강한 참조로 연결하고, 앱을 여러 번 만들어도 한 번만 등록되게 한다.
+    @signals.task_failure.connect(weak=False, dispatch_uid="ingestion.dlq.task_failure")  # type: ignore[attr-defined]
+    def _on_task_failure(  # noqa: ANN001
+        sender=None, task_id=None, exception=None, args=None, kwargs=None, **_extra
+    ):
+        # autoretry 중 발생한 Retry는 task_retry로 빠지므로 여기에는 최종 실패만 도달한다.
+        from .dlq import record_task_failure
+
+        request = getattr(sender, "request", None)
+        record_task_failure(
+            getattr(sender, "name", "unknown"),
+            task_id=task_id,
+            args=args,
+            kwargs=kwargs,
+            exception=exception,
+            retries=int(getattr(request, "retries", 0) or 0),
+        )
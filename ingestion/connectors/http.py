@@ -0,0 +1,40 @@
+"""Shared, pooled HTTP client for connectors.
+
+커넥터마다 `httpx.get`을 호출하면 요청마다 새 연결(TLS 핸드셰이크 포함)이 생긴다.
+워커 프로세스당 하나의 `httpx.Client`를 공유해 keep-alive 연결을 재사용한다.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import httpx
+
+from ingestion.settings import get_settings
+
+_CLIENT: httpx.Client | None = None
+_LOCK = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """프로세스 단위로 공유되는 커넥션 풀 클라이언트를 반환한다."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        with _LOCK:
+            if _CLIENT is None or _CLIENT.is_closed:
+                cfg = get_settings()
+                limits = httpx.Limits(
+                    max_connections=int(cfg.http_max_connections),
+                    max_keepalive_connections=int(cfg.http_max_keepalive_connections),
+                )
+                _CLIENT = httpx.Client(limits=limits, follow_redirects=True)
+    return _CLIENT
+
+
+def close_http_client() -> None:
+    """공유 클라이언트를 닫는다 (워커 종료/테스트 용도)."""
+    global _CLIENT
+    with _LOCK:
+        if _CLIENT is not None:
+            _CLIENT.close()
+        _CLIENT = None
@@ -2,31 +2,49 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import math
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional
 
 import httpx
 
-from ingestion.settings import get_settings
+from ingestion.settings import Settings, get_settings
 
 from .base import BaseConnector, PermanentError, TransientError
+from .http import get_http_client
 
 
 ProviderFn = Callable[[str, Optional[datetime]], List[Dict[str, Any]]]
 
 
+def _parse_published(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str) and value:
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
 class NewsAPIConnector(BaseConnector):
     """Connector for NewsAPI-like sources.
 
     - provider 주입 시: 오프라인 모드(기존 동작)
-    - provider 미주입 시: 실제 HTTP 호출
+    - provider 미주입 시: 실제 HTTP 호출 (공용 커넥션 풀 사용)
+      1페이지가 `totalResults`를 알려주면 2..N 페이지를 동시에 조회한다.
     """
 
     source = "news_api"
     source_type = "news"
 
-    def __init__(self, provider: Optional[ProviderFn] = None):
+    def __init__(self, provider: Optional[ProviderFn] = None, *, client: Optional[httpx.Client] = None):
         self._provider = provider
+        self._client = client
 
     def _fetch_raw(self, ticker: str, since: Optional[datetime]):
         if self._provider is not None:
@@ -36,44 +54,116 @@ class NewsAPIConnector(BaseConnector):
         if not cfg.news_api_key:
             raise PermanentError("NEWS_API_KEY가 설정되지 않았습니다.")
 
+        watermark = _parse_published(since) if since is not None else None
+        first = self._get_page(cfg, ticker, 1)
+        items = first.get("articles") or []
+        if not items:
+            return []
+        articles: List[Dict[str, Any]] = list(items)
+        if self._reaches_watermark(cfg, items, watermark):
+            return self._prepare(articles)
+
+        max_pages = int(cfg.news_api_max_pages)
+        total = first.get("totalResults")
+        if isinstance(total, int):
+            last_page = min(max_pages, math.ceil(total / int(cfg.news_api_page_size)))
+            articles.extend(self._fetch_pages_concurrently(cfg, ticker, range(2, last_page + 1), watermark))
+        else:
+            # totalResults 미제공: 빈 페이지가 나올 때까지 순차 조회
+            for page in range(2, max_pages + 1):
+                items = self._get_page(cfg, ticker, page).get("articles") or []
+                if not items or self._past_watermark(items, watermark):
+                    break
+                articles.extend(items)
+                if self._reaches_watermark(cfg, items, watermark):
+                    break
+        return self._prepare(articles)
+
+    def _fetch_pages_concurrently(
+        self,
+        cfg: Settings,
+        ticker: str,
+        pages: range,
+        watermark: Optional[datetime],
+    ) -> List[Dict[str, Any]]:
+        if len(pages) == 0:
+            return []
+        articles: List[Dict[str, Any]] = []
+        workers = min(int(cfg.news_api_page_concurrency), len(pages))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="newsapi-page") as pool:
+            futures: List[Future] = [pool.submit(self._get_page, cfg, ticker, page) for page in pages]
+            # 페이지 순서대로 결과를 소비하며, 워터마크에 도달하면 남은 요청을 취소한다.
+            for index, future in enumerate(futures):
+                try:
+                    items = future.result().get("articles") or []
+                except Exception:
+                    self._cancel(futures[index + 1 :])
+                    raise
+                if not items or self._past_watermark(items, watermark):
+                    self._cancel(futures[index + 1 :])
+                    break
+                articles.extend(items)
+                if self._reaches_watermark(cfg, items, watermark):
+                    self._cancel(futures[index + 1 :])
+                    break
+        return articles
+
+    @staticmethod
+    def _cancel(futures: List[Future]) -> None:
+        for future in futures:
+            future.cancel()
+
+    @staticmethod
+    def _past_watermark(items: List[Dict[str, Any]], watermark: Optional[datetime]) -> bool:
+        """페이지 전체가 워터마크보다 오래되었는지 여부."""
+        if watermark is None:
+            return False
+        published = [_parse_published(it.get("publishedAt")) for it in items]
+        return all(p is not None and p < watermark for p in published)
+
+    @classmethod
+    def _reaches_watermark(cls, cfg: Settings, items: List[Dict[str, Any]], watermark: Optional[datetime]) -> bool:
+        """이후 페이지가 모두 워터마크 이전임이 확실한지 여부 (publishedAt 정렬일 때만 판단)."""
+        if watermark is None or cfg.news_api_sort_by != "publishedAt":
+            return cls._past_watermark(items, watermark)
+        return any(
+            p is not None and p < watermark for p in (_parse_published(it.get("publishedAt")) for it in items)
+        )
+
+    @staticmethod
+    def _prepare(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # normalize field names for BaseConnector
+        for it in items:
+            it.setdefault("body", it.get("description"))
+            it.setdefault("publishedAt", it.get("publishedAt"))
+            # language is optional; NewsAPI may not include per-article language
+        return items
+
+    def _get_page(self, cfg: Settings, ticker: str, page: int) -> Dict[str, Any]:
+        assert cfg.news_api_key is not None
+        client = self._client or get_http_client()
         headers = {"X-Api-Key": cfg.news_api_key.get_secret_value()}
         params = {
             "q": ticker,
             "language": cfg.news_api_lang,
             "pageSize": int(cfg.news_api_page_size),
             "sortBy": cfg.news_api_sort_by,
-            "page": 1,
+            "page": page,
         }
-
-        articles: List[Dict[str, Any]] = []
-        max_pages = 2
-        for page in range(1, max_pages + 1):
-            params["page"] = page
-            try:
-                resp = httpx.get(
-                    cfg.news_api_endpoint,
-                    headers=headers,
-                    params=params,
-                    timeout=float(cfg.news_api_timeout_seconds),
-                )
-            except httpx.TimeoutException as exc:  # pragma: no cover - rare
-                raise TransientError("NewsAPI 타임아웃") from exc
-            except httpx.HTTPError as exc:  # pragma: no cover - rare
-                raise TransientError("NewsAPI 호출 오류") from exc
-
-            if resp.status_code in (429,) or resp.status_code >= 500:
-                raise TransientError(f"NewsAPI 일시 오류: {resp.status_code}")
-            if resp.status_code >= 400:
-                raise PermanentError(f"NewsAPI 오류: {resp.status_code}")
-
-            data = resp.json()
-            items = data.get("articles") or []
-            if not items:
-                break
-            # normalize field names for BaseConnector
-            for it in items:
-                it.setdefault("body", it.get("description"))
-                it.setdefault("publishedAt", it.get("publishedAt"))
-                # language is optional; NewsAPI may not include per-article language
-            articles.extend(items)
-        return articles
+        try:
+            resp = client.get(
+                cfg.news_api_endpoint,
+                headers=headers,
+                params=params,
+                timeout=float(cfg.news_api_timeout_seconds),
+            )
+        except httpx.TimeoutException as exc:  # pragma: no cover - rare
+            raise TransientError("NewsAPI 타임아웃") from exc
+        except httpx.HTTPError as exc:  # pragma: no cover - rare
+            raise TransientError("NewsAPI 호출 오류") from exc
+
+        if resp.status_code in (429,) or resp.status_code >= 500:
+            raise TransientError(f"NewsAPI 일시 오류: {resp.status_code}")
+        if resp.status_code >= 400:
+            raise PermanentError(f"NewsAPI 오류: {resp.status_code}")
+        return resp.json()
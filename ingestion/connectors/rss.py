@@ -0,0 +1,215 @@
+"""RSS/Atom feed connector with incremental XML parsing.
+
+- 응답 본문을 스트리밍으로 읽으면서 `iterparse`로 항목 단위 파싱 → 피드 크기와 무관하게 메모리 일정
+- 워터마크(`since`)보다 오래된 항목을 만나면 나머지 본문을 읽지 않고 중단(피드는 최신순 가정)
+- ETag/Last-Modified 기반 조건부 GET으로 변경 없는 피드는 304로 건너뜀
+- 공용 커넥션 풀(`get_http_client`)을 사용해 워커당 수백 개 피드를 폴링
+"""
+
+from __future__ import annotations
+
+import html
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+
+import httpx
+
+from ingestion.settings import get_settings
+
+from .base import BaseConnector, PermanentError, TransientError
+from .http import get_http_client
+
+
+FeedMap = Mapping[str, Sequence[str]]
+Validators = Tuple[Optional[str], Optional[str]]  # (ETag, Last-Modified)
+
+_ITEM_TAGS = {"item", "entry"}
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# 피드 URL → 조건부 GET 검증자. 워커 프로세스 단위로 공유한다.
+_VALIDATORS: Dict[str, Validators] = {}
+
+
+class _ByteStreamReader:
+    """바이트 청크 이터레이터를 `iterparse`가 읽을 수 있는 file-like 객체로 감싼다."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1] if "}" in tag else tag
+
+
+def _clean_text(value: Optional[str]) -> str:
+    if not value:
+        return ""
+    text = html.unescape(_TAG_RE.sub(" ", value))
+    return _WS_RE.sub(" ", text).strip()
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    raw = value.strip()
+    try:
+        parsed: Optional[datetime] = parsedate_to_datetime(raw)  # RSS (RFC 822)
+    except (TypeError, ValueError, IndexError):
+        parsed = None
+    if parsed is None:
+        try:
+            parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))  # Atom (RFC 3339)
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _entry_link(elem: ET.Element) -> str:
+    fallback = ""
+    for child in elem:
+        if _local(child.tag) != "link":
+            continue
+        href = child.get("href")
+        if href is None:  # RSS: <link>url</link>
+            return (child.text or "").strip()
+        if child.get("rel", "alternate") == "alternate":
+            return href.strip()
+        fallback = fallback or href.strip()
+    return fallback
+
+
+def _item_to_dict(elem: ET.Element, language: Optional[str]) -> Dict[str, Any]:
+    fields: Dict[str, str] = {}
+    for child in elem:
+        name = _local(child.tag)
+        if name not in fields and child.text:
+            fields[name] = child.text
+    body = fields.get("description") or fields.get("summary") or fields.get("encoded") or fields.get("content")
+    published = fields.get("pubDate") or fields.get("published") or fields.get("updated") or fields.get("date")
+    return {
+        "title": _clean_text(fields.get("title")),
+        "body": _clean_text(body),
+        "url": _entry_link(elem),
+        "published_at": _parse_date(published),
+        "language": elem.get("{http://www.w3.org/XML/1998/namespace}lang") or language,
+    }
+
+
+def iter_feed_items(chunks: Iterable[bytes], *, since: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+    """피드 바이트 스트림에서 항목 dict를 하나씩 생성한다.
+
+    처리한 항목 요소는 즉시 트리에서 제거해 메모리 사용량을 일정하게 유지한다.
+    `since`보다 오래된 항목을 만나면 이후 스트림을 더 읽지 않고 종료한다.
+    """
+    watermark = _as_utc(since) if since is not None else None
+    language: Optional[str] = None
+    stack: List[ET.Element] = []
+    try:
+        for event, elem in ET.iterparse(_ByteStreamReader(chunks), events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                if language is None and _local(elem.tag) == "feed":
+                    language = elem.get("{http://www.w3.org/XML/1998/namespace}lang")
+                continue
+            stack.pop()
+            name = _local(elem.tag)
+            if name == "language" and stack and _local(stack[-1].tag) == "channel":
+                language = (elem.text or "").strip() or language
+            if name not in _ITEM_TAGS:
+                continue
+            item = _item_to_dict(elem, language)
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+            published = item["published_at"]
+            if watermark is not None and published is not None and published < watermark:
+                return
+            if item["title"] and item["url"]:
+                yield item
+    except ET.ParseError as exc:
+        raise PermanentError(f"피드 XML 파싱 실패: {exc}") from exc
+
+
+class RSSConnector(BaseConnector):
+    """RSS 2.0 / Atom 1.0 피드 커넥터.
+
+    - feeds 주입 시: 해당 매핑 사용(테스트/오프라인)
+    - feeds 미주입 시: `RSS_FEEDS` 설정 사용
+    """
+
+    source = "rss"
+    source_type = "news"
+
+    def __init__(
+        self,
+        feeds: Optional[FeedMap] = None,
+        *,
+        client: Optional[httpx.Client] = None,
+        validators: Optional[MutableMapping[str, Validators]] = None,
+    ) -> None:
+        self._feeds = {k.strip().upper(): list(v) for k, v in feeds.items()} if feeds is not None else None
+        self._client = client
+        self._validators = validators if validators is not None else _VALIDATORS
+
+    def _feed_urls(self, ticker: str) -> List[str]:
+        feeds = self._feeds if self._feeds is not None else get_settings().rss_feeds
+        return list(feeds.get(ticker.upper(), []))
+
+    def _fetch_raw(self, ticker: str, since: Optional[datetime]) -> List[Dict[str, Any]]:
+        articles: List[Dict[str, Any]] = []
+        for url in self._feed_urls(ticker):
+            articles.extend(self._fetch_feed(url, since))
+        return articles
+
+    def _fetch_feed(self, url: str, since: Optional[datetime]) -> List[Dict[str, Any]]:
+        client = self._client or get_http_client()
+        headers: Dict[str, str] = {}
+        etag, last_modified = self._validators.get(url, (None, None))
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        # 주입된 클라이언트는 자체 타임아웃 설정을 따른다.
+        extra: Dict[str, Any] = {}
+        if self._client is None:
+            extra["timeout"] = float(get_settings().rss_timeout_seconds)
+        try:
+            with client.stream("GET", url, headers=headers, **extra) as resp:
+                if resp.status_code == 304:
+                    return []
+                if resp.status_code in (429,) or resp.status_code >= 500:
+                    raise TransientError(f"RSS 일시 오류: {resp.status_code} {url}")
+                if resp.status_code >= 400:
+                    raise PermanentError(f"RSS 오류: {resp.status_code} {url}")
+                items = list(iter_feed_items(resp.iter_bytes(), since=since))
+                # 파싱이 끝난 뒤에만 검증자를 갱신해 실패한 응답이 캐시되지 않게 한다.
+                self._validators[url] = (resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+                return items
+        except httpx.TimeoutException as exc:
+            raise TransientError(f"RSS 타임아웃: {url}") from exc
+        except httpx.HTTPError as exc:
+            raise TransientError(f"RSS 호출 오류: {url}") from exc
@@ -1,10 +1,12 @@
 """Database utilities for the ingestion service."""
 
-from .models import Base, JobRun, JobStage, JobStatus, RawArticle  # noqa: F401
+from .models import Base, DeadLetter, DeadLetterStatus, JobRun, JobStage, JobStatus, RawArticle  # noqa: F401
 from .session import get_engine, get_sessionmaker, session_scope  # noqa: F401
 
 __all__ = [
     "Base",
+    "DeadLetter",
+    "DeadLetterStatus",
     "JobRun",
     "JobStage",
     "JobStatus",
@@ -0,0 +1,45 @@
+"""create dead_letters table
+
+Revision ID: 20251119_0007
+Revises: 20251118_0006
+Create Date: 2025-11-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20251119_0007"
+down_revision = "20251118_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dead_letters",
+        sa.Column("id", sa.Uuid(), primary_key=True, nullable=False),
+        sa.Column("task_name", sa.String(length=200), nullable=False),
+        sa.Column("ticker", sa.String(length=16), nullable=True),
+        sa.Column("args", sa.JSON(), nullable=False),
+        sa.Column("kwargs", sa.JSON(), nullable=False),
+        sa.Column("trace_id", sa.String(length=64), nullable=True),
+        sa.Column("exception_class", sa.String(length=200), nullable=False),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("attempts", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False, server_default="pending"),
+        sa.Column("replay_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_replayed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+    )
+    op.create_index("ix_dead_letters_status_task", "dead_letters", ["status", "task_name"], unique=False)
+    op.create_index("ix_dead_letters_trace", "dead_letters", ["trace_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_dead_letters_trace", table_name="dead_letters")
+    op.drop_index("ix_dead_letters_status_task", table_name="dead_letters")
+    op.drop_table("dead_letters")
@@ -0,0 +1,27 @@
+"""add processed_insights.input_digest
+
+Revision ID: 20251120_0008
+Revises: 20251119_0007
+Create Date: 2025-11-20
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20251120_0008"
+down_revision = "20251119_0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("processed_insights") as batch:
+        batch.add_column(sa.Column("input_digest", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("processed_insights") as batch:
+        batch.drop_column("input_digest")
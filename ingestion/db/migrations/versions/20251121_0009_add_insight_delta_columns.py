@@ -0,0 +1,31 @@
+"""add processed_insights.analysis_mode / delta_depth
+
+Revision ID: 20251121_0009
+Revises: 20251120_0008
+Create Date: 2025-11-21
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20251121_0009"
+down_revision = "20251120_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("processed_insights") as batch:
+        batch.add_column(
+            sa.Column("analysis_mode", sa.String(length=8), nullable=False, server_default="full")
+        )
+        batch.add_column(sa.Column("delta_depth", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("processed_insights") as batch:
+        batch.drop_column("delta_depth")
+        batch.drop_column("analysis_mode")
@@ -0,0 +1,27 @@
+"""add processed_insights.llm_route
+
+Revision ID: 20251122_0010
+Revises: 20251121_0009
+Create Date: 2025-11-22
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20251122_0010"
+down_revision = "20251121_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("processed_insights") as batch:
+        batch.add_column(sa.Column("llm_route", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("processed_insights") as batch:
+        batch.drop_column("llm_route")
@@ -0,0 +1,27 @@
+"""add processed_insights.llm_tokens_cached
+
+Revision ID: 20251123_0011
+Revises: 20251122_0010
+Create Date: 2025-11-23
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20251123_0011"
+down_revision = "20251122_0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("processed_insights") as batch:
+        batch.add_column(sa.Column("llm_tokens_cached", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("processed_insights") as batch:
+        batch.drop_column("llm_tokens_cached")
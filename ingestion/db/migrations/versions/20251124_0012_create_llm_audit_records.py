@@ -0,0 +1,45 @@
+"""create llm_audit_records table
+
+Revision ID: 20251124_0012
+Revises: 20251123_0011
+Create Date: 2025-11-24
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20251124_0012"
+down_revision = "20251123_0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_audit_records",
+        sa.Column("id", sa.Uuid(), primary_key=True, nullable=False),
+        sa.Column("trace_id", sa.String(length=64), nullable=False),
+        sa.Column("ticker", sa.String(length=16), nullable=True),
+        sa.Column("stage", sa.String(length=32), nullable=False),
+        sa.Column("model", sa.String(length=64), nullable=False),
+        sa.Column("request_hash", sa.String(length=64), nullable=False),
+        sa.Column("request_bytes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("response_hash", sa.String(length=64), nullable=False),
+        sa.Column("response_bytes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+    )
+    op.create_index("ix_llm_audit_records_trace", "llm_audit_records", ["trace_id"], unique=False)
+    op.create_index("ix_llm_audit_records_created", "llm_audit_records", ["created_at"], unique=False)
+    op.create_index("ix_llm_audit_records_request_hash", "llm_audit_records", ["request_hash"], unique=False)
+    op.create_index("ix_llm_audit_records_response_hash", "llm_audit_records", ["response_hash"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_llm_audit_records_response_hash", table_name="llm_audit_records")
+    op.drop_index("ix_llm_audit_records_request_hash", table_name="llm_audit_records")
+    op.drop_index("ix_llm_audit_records_created", table_name="llm_audit_records")
+    op.drop_index("ix_llm_audit_records_trace", table_name="llm_audit_records")
+    op.drop_table("llm_audit_records")
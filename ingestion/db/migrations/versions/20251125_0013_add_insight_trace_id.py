@@ -0,0 +1,27 @@
+"""add processed_insights.trace_id
+
+Revision ID: 20251125_0013
+Revises: 20251124_0012
+Create Date: 2025-11-25
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20251125_0013"
+down_revision = "20251124_0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("processed_insights") as batch:
+        batch.add_column(sa.Column("trace_id", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("processed_insights") as batch:
+        batch.drop_column("trace_id")
@@ -54,6 +54,13 @@ class JobStatus(str, Enum):
     SUCCEEDED = "succeeded"
     FAILED = "failed"
     RETRY = "retry"
+    CACHED = "cached"
+
+
+class DeadLetterStatus(str, Enum):
+    PENDING = "pending"
+    REPLAYED = "replayed"
+    DISCARDED = "discarded"
 
 
 class RawArticle(TimestampMixin, Base):
@@ -125,6 +132,37 @@ class JobRun(TimestampMixin, Base):
     trace_id: Mapped[str | None] = mapped_column(String(64))
 
 
+class DeadLetter(TimestampMixin, Base):
+    """영구 실패한 파이프라인 태스크 (재처리 대기열)."""
+
+    __tablename__ = "dead_letters"
+    __table_args__ = (
+        Index("ix_dead_letters_status_task", "status", "task_name"),
+        Index("ix_dead_letters_trace", "trace_id"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    task_name: Mapped[str] = mapped_column(String(200), nullable=False)
+    ticker: Mapped[str | None] = mapped_column(String(16))
+    args: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    kwargs: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    trace_id: Mapped[str | None] = mapped_column(String(64))
+    exception_class: Mapped[str] = mapped_column(String(200), nullable=False)
+    error_message: Mapped[str | None] = mapped_column(Text)
+    attempts: Mapped[list[dict]] = mapped_column(JSON, nullable=False, default=list)
+    status: Mapped[DeadLetterStatus] = mapped_column(
+        SAEnum(DeadLetterStatus, name="dead_letter_status", native_enum=False, length=16),
+        nullable=False,
+        default=DeadLetterStatus.PENDING,
+    )
+    replay_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_replayed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+
 class ProcessedInsight(TimestampMixin, Base):
     """LLM로 생성된 분석 결과를 저장."""
 
@@ -154,4 +192,49 @@ class ProcessedInsight(TimestampMixin, Base):
     llm_model: Mapped[str] = mapped_column(String(64), nullable=False)
     llm_tokens_prompt: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     llm_tokens_completion: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # llm_tokens_prompt 중 provider 프롬프트 캐시 적중분 (캐시 단가로 과금)
+    llm_tokens_cached: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     llm_cost: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    # 입력 기사 fingerprint + 프롬프트 버전 + 모델의 다이제스트 (동일 입력 재분석 방지)
+    input_digest: Mapped[str | None] = mapped_column(String(64))
+    # full: 기사 전체 재요약 / delta: 직전 인사이트 + 신규 기사로 갱신 (연속 delta 횟수)
+    # mapred: 대량 기사 클러스터별 요약 후 병합 / template: 사전 선별 신호 미달로 LLM 없이 만든 요약
+    # grouped: 기사가 적은 여러 종목을 한 요청으로 분석 (토큰/비용은 입력 비중으로 배분)
+    analysis_mode: Mapped[str] = mapped_column(String(8), nullable=False, default="full", server_default="full")
+    delta_depth: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    # 모델 캐스케이드 경로: 시도한 모델별 토큰/비용과 승급 사유 (캐스케이드 미사용 시 NULL)
+    llm_route: Mapped[dict | None] = mapped_column(JSON)
+    # 생성한 JobRun의 trace_id (llm_audit_records 조회 키)
+    trace_id: Mapped[str | None] = mapped_column(String(64))
+
+
+class LlmAuditRecord(Base):
+    """LLM 요청/응답 감사 색인 (본문은 LOCAL_STORAGE_ROOT의 압축 blob, 내용 해시로 중복 제거)."""
+
+    __tablename__ = "llm_audit_records"
+    __table_args__ = (
+        Index("ix_llm_audit_records_trace", "trace_id"),
+        Index("ix_llm_audit_records_created", "created_at"),
+        Index("ix_llm_audit_records_request_hash", "request_hash"),
+        Index("ix_llm_audit_records_response_hash", "response_hash"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    trace_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    ticker: Mapped[str | None] = mapped_column(String(16))
+    stage: Mapped[str] = mapped_column(String(32), nullable=False)
+    model: Mapped[str] = mapped_column(String(64), nullable=False)
+    # 압축 전 정규화 JSON의 sha256 / 압축 blob 크기(바이트)
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    request_bytes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    response_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    response_bytes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -0,0 +1,139 @@
+"""Dead-letter queue hook and CLI.
+
+- Celery `task_failure` 시그널(재시도 소진/재시도 불가 실패)에서 `record_task_failure`를 호출해 적재
+- CLI로 조회/재발행/폐기
+
+Usage:
+  uv run -- python -m ingestion.dlq list [--task NAME] [--status pending] [--limit 50]
+  uv run -- python -m ingestion.dlq replay [--task NAME] [--id ID ...] [--limit N] [--rate 20]
+  uv run -- python -m ingestion.dlq discard --id ID [--id ID ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from typing import Any, Dict, List, Optional, Sequence
+
+from ingestion.db.models import Base, DeadLetterStatus
+from ingestion.db.session import get_engine, session_scope
+from ingestion.repositories.dead_letters import (
+    Dispatcher,
+    discard_dead_letters,
+    list_dead_letters,
+    record_dead_letter,
+    replay_dead_letters,
+)
+from ingestion.utils.logging import get_logger
+
+
+def record_task_failure(
+    task_name: str,
+    *,
+    task_id: Optional[str],
+    args: Sequence[Any] | None,
+    kwargs: Dict[str, Any] | None,
+    exception: BaseException,
+    retries: int = 0,
+) -> None:
+    """영구 실패한 태스크를 dead-letter 저장소에 기록한다 (실패해도 예외를 전파하지 않음)."""
+    logger = get_logger(__name__)
+    try:
+        Base.metadata.create_all(bind=get_engine())
+        with session_scope() as session:
+            entry = record_dead_letter(
+                session,
+                task_name=task_name,
+                args=args,
+                kwargs=kwargs,
+                exception=exception,
+                trace_id=task_id,
+                retries=retries,
+            )
+            logger.warning(
+                "dlq.recorded",
+                extra={
+                    "trace_id": task_id,
+                    "task_name": task_name,
+                    "dead_letter_id": str(entry.id),
+                    "exception_class": entry.exception_class,
+                    "attempts": len(entry.attempts),
+                },
+            )
+    except Exception:  # pragma: no cover - DLQ 기록 실패가 워커를 중단시키지 않도록
+        logger.exception("dlq.record_failed", extra={"trace_id": task_id, "task_name": task_name})
+
+
+def _celery_dispatcher() -> Dispatcher:
+    from ingestion.celery_app import get_celery_app
+
+    app = get_celery_app()
+
+    def _send(task_name: str, args: List[Any], kwargs: Dict[str, Any]) -> None:
+        app.send_task(task_name, args=args, kwargs=kwargs)
+
+    return _send
+
+
+def main(argv: List[str] | None = None, *, dispatcher: Optional[Dispatcher] = None) -> int:
+    parser = argparse.ArgumentParser(description="Dead-letter queue 조회/재처리")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_list = sub.add_parser("list", help="dead-letter 항목 조회")
+    p_list.add_argument("--task", help="태스크 이름 필터")
+    p_list.add_argument("--status", default="pending", choices=[s.value for s in DeadLetterStatus] + ["all"])
+    p_list.add_argument("--limit", type=int, default=50)
+
+    p_replay = sub.add_parser("replay", help="PENDING 항목 재발행")
+    p_replay.add_argument("--task", help="태스크 이름 필터")
+    p_replay.add_argument("--id", action="append", dest="ids", help="특정 항목 ID (반복 지정 가능)")
+    p_replay.add_argument("--limit", type=int, default=None)
+    p_replay.add_argument("--rate", type=float, default=20.0, help="초당 재발행 수 (기본 20)")
+
+    p_discard = sub.add_parser("discard", help="항목 폐기")
+    p_discard.add_argument("--id", action="append", dest="ids", required=True)
+
+    args = parser.parse_args(argv)
+    Base.metadata.create_all(bind=get_engine())
+
+    with session_scope() as session:
+        if args.command == "list":
+            status = None if args.status == "all" else DeadLetterStatus(args.status)
+            for entry in list_dead_letters(session, status=status, task_name=args.task, limit=args.limit):
+                print(
+                    json.dumps(
+                        {
+                            "id": str(entry.id),
+                            "task_name": entry.task_name,
+                            "ticker": entry.ticker,
+                            "args": entry.args,
+                            "kwargs": entry.kwargs,
+                            "trace_id": entry.trace_id,
+                            "exception_class": entry.exception_class,
+                            "error_message": entry.error_message,
+                            "attempts": entry.attempts,
+                            "status": entry.status.value,
+                            "replay_count": entry.replay_count,
+                        },
+                        ensure_ascii=False,
+                    )
+                )
+            return 0
+        if args.command == "replay":
+            count = replay_dead_letters(
+                session,
+                dispatcher or _celery_dispatcher(),
+                task_name=args.task,
+                ids=args.ids,
+                limit=args.limit,
+                rate_per_second=args.rate,
+            )
+            print(f"[dlq] 재발행: {count}건")
+            return 0
+        count = discard_dead_letters(session, args.ids)
+        print(f"[dlq] 폐기: {count}건")
+        return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
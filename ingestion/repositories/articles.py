@@ -69,7 +69,9 @@ class JobRunRecorder:
 
     def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
         if exc is None:
-            self._job.status = JobStatus.SUCCEEDED
+            # 본문에서 CACHED 등 다른 종료 상태를 지정했다면 유지한다.
+            if self._job.status == JobStatus.RUNNING:
+                self._job.status = JobStatus.SUCCEEDED
         else:
             self._job.status = JobStatus.FAILED
             self._job.error_message = str(exc)[:512]
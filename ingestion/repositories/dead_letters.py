@@ -0,0 +1,146 @@
+"""Dead-letter store for permanently failed pipeline tasks."""
+
+from __future__ import annotations
+
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ingestion.db.models import DeadLetter, DeadLetterStatus, JobRun
+
+# (task_name, args, kwargs) -> None
+Dispatcher = Callable[[str, List[Any], Dict[str, Any]], None]
+
+
+def _attempt_history(session: Session, trace_id: Optional[str]) -> List[dict]:
+    """동일 trace_id(Celery task id)로 기록된 JobRun을 시도 이력으로 변환한다."""
+    if not trace_id:
+        return []
+    stmt = select(JobRun).where(JobRun.trace_id == trace_id).order_by(JobRun.started_at)
+    history: List[dict] = []
+    for attempt, run in enumerate(session.execute(stmt).scalars(), start=1):
+        history.append(
+            {
+                "attempt": attempt,
+                "status": run.status.value,
+                "started_at": run.started_at.isoformat() if run.started_at else None,
+                "finished_at": run.finished_at.isoformat() if run.finished_at else None,
+                "error_message": run.error_message,
+            }
+        )
+    return history
+
+
+def record_dead_letter(
+    session: Session,
+    *,
+    task_name: str,
+    args: Sequence[Any] | None,
+    kwargs: Dict[str, Any] | None,
+    exception: BaseException,
+    trace_id: Optional[str] = None,
+    retries: int = 0,
+) -> DeadLetter:
+    args_list = list(args or [])
+    history = _attempt_history(session, trace_id)
+    if not history:
+        history = [
+            {
+                "attempt": retries + 1,
+                "status": "failed",
+                "finished_at": datetime.now(timezone.utc).isoformat(),
+                "error_message": str(exception)[:512],
+            }
+        ]
+    ticker = args_list[0] if args_list and isinstance(args_list[0], str) else (kwargs or {}).get("ticker")
+    entry = DeadLetter(
+        task_name=task_name,
+        ticker=ticker.upper()[:16] if isinstance(ticker, str) else None,
+        args=args_list,
+        kwargs=dict(kwargs or {}),
+        trace_id=trace_id,
+        exception_class=f"{type(exception).__module__}.{type(exception).__qualname__}",
+        error_message=str(exception),
+        attempts=history,
+        status=DeadLetterStatus.PENDING,
+    )
+    session.add(entry)
+    session.flush()
+    return entry
+
+
+def list_dead_letters(
+    session: Session,
+    *,
+    status: DeadLetterStatus | None = DeadLetterStatus.PENDING,
+    task_name: Optional[str] = None,
+    limit: Optional[int] = 100,
+) -> List[DeadLetter]:
+    stmt = select(DeadLetter).order_by(DeadLetter.created_at, DeadLetter.id)
+    if status is not None:
+        stmt = stmt.where(DeadLetter.status == status)
+    if task_name:
+        stmt = stmt.where(DeadLetter.task_name == task_name)
+    if limit:
+        stmt = stmt.limit(limit)
+    return list(session.execute(stmt).scalars())
+
+
+def replay_dead_letters(
+    session: Session,
+    dispatcher: Dispatcher,
+    *,
+    task_name: Optional[str] = None,
+    ids: Optional[Iterable[str]] = None,
+    limit: Optional[int] = None,
+    rate_per_second: float = 20.0,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> int:
+    """PENDING 항목을 원래 태스크로 재발행한다.
+
+    `rate_per_second`로 발행 속도를 제한해 장애 복구 직후 업스트림에 폭주하지 않도록 하고,
+    항목마다 발행 직후 커밋해, 중간에 발행이 실패하거나 중단되더라도 이미 재발행한 항목은 다시 보내지 않는다.
+    """
+    stmt = (
+        select(DeadLetter)
+        .where(DeadLetter.status == DeadLetterStatus.PENDING)
+        .order_by(DeadLetter.created_at, DeadLetter.id)
+    )
+    if task_name:
+        stmt = stmt.where(DeadLetter.task_name == task_name)
+    if ids is not None:
+        stmt = stmt.where(DeadLetter.id.in_([uuid.UUID(str(i)) for i in ids]))
+    if limit:
+        stmt = stmt.limit(limit)
+
+    interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+    next_at = clock()
+    replayed = 0
+    for entry in list(session.execute(stmt).scalars()):
+        if interval:
+            wait = next_at - clock()
+            if wait > 0:
+                sleep(wait)
+            next_at = max(next_at, clock()) + interval
+        dispatcher(entry.task_name, list(entry.args or []), dict(entry.kwargs or {}))
+        entry.status = DeadLetterStatus.REPLAYED
+        entry.replay_count += 1
+        entry.last_replayed_at = datetime.now(timezone.utc)
+        session.commit()
+        replayed += 1
+    return replayed
+
+
+def discard_dead_letters(session: Session, ids: Iterable[str]) -> int:
+    stmt = select(DeadLetter).where(DeadLetter.id.in_([uuid.UUID(str(i)) for i in ids]))
+    count = 0
+    for entry in session.execute(stmt).scalars():
+        entry.status = DeadLetterStatus.DISCARDED
+        count += 1
+    session.flush()
+    return count
@@ -0,0 +1,210 @@
+"""Streaming per-ticker article volume monitor (EWMA / z-score).
+
+수집 결과(신규 저장 건수)를 종목별로 관측해 평소 대비 급증 여부를 판정한다.
+- 급증: 즉시 높은 우선순위로 분석 디스패치("urgent")
+- 평시: `quiet_interval_seconds`마다, 그 사이 신규 기사가 있을 때만 정기 분석("routine")
+
+상태는 Redis 해시(`RedisVolumeStore`)에 두며, 로컬/테스트에서는 인메모리 저장소로 대체한다.
+여러 수집 워커가 같은 종목을 동시에 관측하므로 상태 갱신은 저장소의 `update`로 원자적으로 한다
+(Redis는 WATCH/MULTI 낙관적 트랜잭션). 디스패치가 실패하면 `release`로 예약을 되돌린다.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional, Protocol, TypeVar
+
+T = TypeVar("T")
+
+
+URGENT = "urgent"
+ROUTINE = "routine"
+
+
+@dataclass
+class VolumeState:
+    mean: float = 0.0
+    var: float = 0.0
+    samples: int = 0
+    pending: int = 0
+    last_dispatched_at: float = 0.0
+
+
+@dataclass(frozen=True)
+class VolumeSignal:
+    ticker: str
+    count: int
+    mean: float
+    std: float
+    zscore: float
+    spike: bool
+    dispatch: Optional[str]
+    # 디스패치가 가져간 대기 기사 수와 직전 디스패치 시각 (`release`로 되돌릴 때 사용)
+    claimed: int = 0
+    previous_dispatched_at: float = 0.0
+    dispatched_at: float = 0.0
+
+
+class VolumeStore(Protocol):
+    def load(self, ticker: str) -> Optional[VolumeState]: ...  # noqa: D401
+
+    def update(self, ticker: str, mutate: Callable[[VolumeState], T]) -> T:
+        """상태를 읽어 `mutate`로 바꾸고 저장하는 과정을 원자적으로 수행한다.
+
+        충돌 시 `mutate`가 다시 호출될 수 있으므로 부수 효과가 없어야 한다.
+        """
+        ...
+
+
+class InMemoryVolumeStore:
+    """프로세스 로컬 상태 저장소 (Redis 미사용 시 폴백)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._states: Dict[str, VolumeState] = {}
+
+    def load(self, ticker: str) -> Optional[VolumeState]:
+        state = self._states.get(ticker)
+        return VolumeState(**asdict(state)) if state is not None else None
+
+    def update(self, ticker: str, mutate: Callable[[VolumeState], T]) -> T:
+        with self._lock:
+            state = self.load(ticker) or VolumeState()
+            result = mutate(state)
+            self._states[ticker] = state
+            return result
+
+
+class RedisVolumeStore:
+    """Redis 해시(`<prefix>:<TICKER>`)에 EWMA 상태를 저장한다."""
+
+    def __init__(self, client: Any, *, prefix: str = "volume", max_conflicts: int = 10) -> None:
+        self._client = client
+        self._prefix = prefix
+        self._max_conflicts = max_conflicts
+
+    def _format(self, ticker: str) -> str:
+        return f"{self._prefix}:{ticker}"
+
+    def load(self, ticker: str) -> Optional[VolumeState]:
+        return _decode_state(self._client.hgetall(self._format(ticker)))
+
+    def update(self, ticker: str, mutate: Callable[[VolumeState], T]) -> T:
+        """WATCH로 읽고 MULTI/EXEC로 저장한다. 그 사이 다른 워커가 바꿨으면 다시 읽어 재적용."""
+        name = self._format(ticker)
+        for _ in range(self._max_conflicts):
+            with self._client.pipeline() as pipe:
+                try:
+                    pipe.watch(name)
+                    state = _decode_state(pipe.hgetall(name)) or VolumeState()
+                    result = mutate(state)
+                    pipe.multi()
+                    pipe.hset(name, mapping={k: str(v) for k, v in asdict(state).items()})
+                    pipe.execute()
+                    return result
+                except Exception as exc:
+                    # redis-py를 import하지 않고 WatchError(낙관적 잠금 충돌)만 재시도
+                    if type(exc).__name__ != "WatchError":
+                        raise
+        raise RuntimeError(f"수집량 상태 갱신 충돌 {self._max_conflicts}회 초과: {name}")
+
+
+def _decode_state(raw: Dict[Any, Any]) -> Optional[VolumeState]:
+    if not raw:
+        return None
+    data = {
+        (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+        for k, v in raw.items()
+    }
+    return VolumeState(
+        mean=float(data.get("mean", 0.0)),
+        var=float(data.get("var", 0.0)),
+        samples=int(data.get("samples", 0)),
+        pending=int(data.get("pending", 0)),
+        last_dispatched_at=float(data.get("last_dispatched_at", 0.0)),
+    )
+
+
+class VolumeMonitor:
+    """EWMA 평균/분산으로 종목별 수집량 급증을 감지한다."""
+
+    def __init__(
+        self,
+        store: VolumeStore,
+        *,
+        alpha: float = 0.3,
+        z_threshold: float = 3.0,
+        min_count: int = 3,
+        warmup_samples: int = 5,
+        quiet_interval_seconds: float = 6 * 3600,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._store = store
+        self._alpha = alpha
+        self._z_threshold = z_threshold
+        self._min_count = min_count
+        self._warmup = warmup_samples
+        self._quiet_interval = quiet_interval_seconds
+        self._clock = clock
+
+    def observe(self, ticker: str, count: int) -> VolumeSignal:
+        """관측을 반영하고, 디스패치가 필요하면 대기 기사를 예약(pending=0)한 상태로 저장한다."""
+        key = ticker.upper()
+        now = self._clock()
+        return self._store.update(key, lambda state: self._apply(key, state, count, now))
+
+    def release(self, signal: VolumeSignal) -> None:
+        """디스패치에 실패한 관측의 예약을 되돌린다 (다음 관측에서 다시 디스패치되도록)."""
+        if signal.dispatch is None:
+            return
+
+        def _undo(state: VolumeState) -> None:
+            state.pending += signal.claimed
+            # 그 사이 다른 워커가 디스패치했으면 그 시각을 유지한다
+            if state.last_dispatched_at == signal.dispatched_at:
+                state.last_dispatched_at = signal.previous_dispatched_at
+
+        self._store.update(signal.ticker, _undo)
+
+    def _apply(self, key: str, state: VolumeState, count: int, now: float) -> VolumeSignal:
+        # z-score는 이번 관측을 반영하기 전 분포 기준으로 계산한다.
+        std = math.sqrt(max(state.var, 0.0))
+        zscore = (count - state.mean) / std if std > 0 else (math.inf if count > state.mean else 0.0)
+        spike = state.samples >= self._warmup and count >= self._min_count and zscore >= self._z_threshold
+
+        diff = count - state.mean
+        incr = self._alpha * diff
+        if state.samples == 0:
+            state.mean = float(count)
+        else:
+            state.mean += incr
+            state.var = (1.0 - self._alpha) * (state.var + diff * incr)
+        state.samples += 1
+        state.pending += count
+
+        dispatch: Optional[str] = None
+        if spike:
+            dispatch = URGENT
+        elif state.pending > 0 and now - state.last_dispatched_at >= self._quiet_interval:
+            dispatch = ROUTINE
+        claimed, previous = 0, state.last_dispatched_at
+        if dispatch is not None:
+            claimed = state.pending
+            state.pending = 0
+            state.last_dispatched_at = now
+
+        return VolumeSignal(
+            ticker=key,
+            count=count,
+            mean=state.mean,
+            std=math.sqrt(max(state.var, 0.0)),
+            zscore=zscore,
+            spike=spike,
+            dispatch=dispatch,
+            claimed=claimed,
+            previous_dispatched_at=previous,
+            dispatched_at=state.last_dispatched_at,
+        )
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import json
 from functools import lru_cache
-from typing import Any, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple
 
 from pydantic import (
     BaseModel,
     Field,
+    NonNegativeInt,
+    PositiveFloat,
     PositiveInt,
     SecretStr,
     ValidationError,
@@ -42,6 +44,31 @@ class CollectionSchedule(BaseModel):
         return source
 
 
+class QueueProfile(BaseModel):
+    """Per-queue Celery worker/task profile."""
+
+    concurrency: PositiveInt = Field(2, description="전용 워커 풀 동시 실행 수.")
+    prefetch_multiplier: PositiveInt = Field(1, description="워커 prefetch 배수 (긴 태스크는 1 권장).")
+    acks_late: bool = Field(True, description="태스크 완료 후 ack 여부 (워커 장애 시 재전달).")
+    ignore_result: bool = Field(True, description="결과 백엔드 저장 생략 여부.")
+    max_priority: int = Field(0, ge=0, le=9, description="큐 우선순위 단계 수 (0이면 우선순위 미사용).")
+    default_priority: Optional[int] = Field(None, ge=0, le=9, description="라우팅 시 기본 우선순위.")
+    pool: Literal["prefork", "threads", "gevent", "eventlet", "solo"] = Field(
+        "prefork",
+        description="워커 풀 구현 (I/O 바운드 단계는 threads/gevent).",
+    )
+
+
+DEFAULT_QUEUE_PROFILES: Dict[str, Dict[str, Any]] = {
+    # 기본 큐: 라우팅이 없는 태스크와 스케줄러처럼 가벼운 제어 태스크
+    "ingestion.default": {"concurrency": 1, "prefetch_multiplier": 1, "pool": "threads"},
+    "ingestion.collect": {"concurrency": 8, "prefetch_multiplier": 4, "pool": "threads"},
+    "analysis.analyze": {"concurrency": 4, "prefetch_multiplier": 1, "pool": "threads", "max_priority": 9},
+    "analysis.embed": {"concurrency": 2, "prefetch_multiplier": 1, "pool": "threads"},
+    "deliver.materialize": {"concurrency": 2, "prefetch_multiplier": 1, "pool": "prefork"},
+}
+
+
 class Settings(BaseSettings):
     """Ingestion용 환경 설정."""
 
@@ -64,8 +91,30 @@ class Settings(BaseSettings):
     news_api_timeout_seconds: PositiveInt = Field(5, alias="NEWS_API_TIMEOUT_SECONDS", description="News API 타임아웃(초)")
     news_api_max_retries: PositiveInt = Field(2, alias="NEWS_API_MAX_RETRIES", description="News API 최대 재시도")
     news_api_page_size: PositiveInt = Field(20, alias="NEWS_API_PAGE_SIZE", description="News API 페이지 크기(≤100)")
+    news_api_max_pages: PositiveInt = Field(2, alias="NEWS_API_MAX_PAGES", description="News API 최대 조회 페이지 수")
+    news_api_page_concurrency: PositiveInt = Field(
+        4,
+        alias="NEWS_API_PAGE_CONCURRENCY",
+        description="2페이지 이후 동시 조회 수",
+    )
     news_api_lang: str = Field("ko", alias="NEWS_API_LANG", description="News API 언어 필터")
     news_api_sort_by: str = Field("publishedAt", alias="NEWS_API_SORT_BY", description="정렬 기준")
+    rss_feeds: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        alias="RSS_FEEDS",
+        description="티커별 RSS/Atom 피드 URL 목록(JSON 객체).",
+    )
+    rss_timeout_seconds: PositiveInt = Field(10, alias="RSS_TIMEOUT_SECONDS", description="RSS 피드 요청 타임아웃(초)")
+    http_max_connections: PositiveInt = Field(
+        100,
+        alias="HTTP_MAX_CONNECTIONS",
+        description="커넥터 공용 HTTP 커넥션 풀 최대 연결 수.",
+    )
+    http_max_keepalive_connections: PositiveInt = Field(
+        20,
+        alias="HTTP_MAX_KEEPALIVE_CONNECTIONS",
+        description="커넥터 공용 HTTP 커넥션 풀 keep-alive 연결 수.",
+    )
     postgres_dsn: str = Field(..., alias="POSTGRES_DSN", description="PostgreSQL 연결 문자열.")
     local_storage_root: str = Field(
         "./var/storage",
@@ -81,6 +130,43 @@ class Settings(BaseSettings):
         description="JSON 배열 혹은 객체 리스트 형태의 수집 스케줄.",
     )
     dedup_redis_ttl_seconds: PositiveInt = Field(86_400, alias="DEDUP_REDIS_TTL_SECONDS", description="중복 캐시 TTL.")
+    volume_monitor_enabled: bool = Field(
+        False,
+        alias="VOLUME_MONITOR_ENABLED",
+        description="수집량 급증 감지 및 분석 자동 트리거 사용 여부.",
+    )
+    volume_ewma_alpha: PositiveFloat = Field(0.3, alias="VOLUME_EWMA_ALPHA", description="수집량 EWMA 평활 계수(0~1].")
+    volume_spike_zscore: PositiveFloat = Field(3.0, alias="VOLUME_SPIKE_ZSCORE", description="급증 판정 z-score 임계값.")
+    volume_spike_min_count: PositiveInt = Field(
+        3,
+        alias="VOLUME_SPIKE_MIN_COUNT",
+        description="급증으로 판정할 최소 신규 기사 수.",
+    )
+    volume_warmup_samples: PositiveInt = Field(
+        5,
+        alias="VOLUME_WARMUP_SAMPLES",
+        description="급증 판정 전 필요한 최소 관측 횟수.",
+    )
+    analysis_quiet_interval_minutes: PositiveInt = Field(
+        360,
+        alias="ANALYSIS_QUIET_INTERVAL_MINUTES",
+        description="급증이 없는 종목의 정기 분석 주기(분).",
+    )
+    analysis_schedule_interval_minutes: Optional[PositiveInt] = Field(
+        None,
+        alias="ANALYSIS_SCHEDULE_INTERVAL_MINUTES",
+        description="구독 수요 기반 분석 스케줄러 실행 주기(분). 미설정 시 비활성.",
+    )
+    analysis_urgent_priority: NonNegativeInt = Field(
+        0,
+        alias="ANALYSIS_URGENT_PRIORITY",
+        description="급증 시 분석 태스크 우선순위 (Redis 브로커: 작을수록 우선).",
+    )
+    analysis_routine_priority: NonNegativeInt = Field(
+        6,
+        alias="ANALYSIS_ROUTINE_PRIORITY",
+        description="정기 분석 태스크 우선순위.",
+    )
     celery_worker_concurrency: PositiveInt = Field(
         4,
         alias="CELERY_WORKER_CONCURRENCY",
@@ -91,6 +177,11 @@ class Settings(BaseSettings):
         alias="CELERY_TASK_SOFT_TIME_LIMIT",
         description="Celery 태스크 소프트 타임아웃 (초).",
     )
+    celery_queue_profiles: Dict[str, QueueProfile] = Field(
+        default_factory=lambda: {k: QueueProfile(**v) for k, v in DEFAULT_QUEUE_PROFILES.items()},
+        alias="CELERY_QUEUE_PROFILES",
+        description="큐별 워커/태스크 프로파일(JSON 객체, 기본값에 큐 단위로 병합).",
+    )
 
     @field_validator("collection_schedules", mode="before")
     @classmethod
@@ -107,6 +198,45 @@ class Settings(BaseSettings):
             return value
         raise ValueError("COLLECTION_SCHEDULES는 리스트 형태여야 합니다.")
 
+    @field_validator("celery_queue_profiles", mode="before")
+    @classmethod
+    def _merge_queue_profiles(cls, value: Any) -> Dict[str, Any]:
+        if value in (None, "", {}):
+            value = {}
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError as exc:
+                raise ValueError("CELERY_QUEUE_PROFILES는 JSON 객체여야 합니다.") from exc
+        if not isinstance(value, dict):
+            raise ValueError("CELERY_QUEUE_PROFILES는 {큐: 프로파일} 형태여야 합니다.")
+        merged: Dict[str, Any] = {k: dict(v) for k, v in DEFAULT_QUEUE_PROFILES.items()}
+        for queue, override in value.items():
+            if isinstance(override, QueueProfile):
+                override = override.model_dump()
+            merged[queue] = {**merged.get(queue, {}), **dict(override)}
+        return merged
+
+    @field_validator("rss_feeds", mode="before")
+    @classmethod
+    def _parse_rss_feeds(cls, value: Any) -> Dict[str, Any]:
+        if value in (None, "", {}):
+            return {}
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError as exc:
+                raise ValueError("RSS_FEEDS는 JSON 객체여야 합니다.") from exc
+        if not isinstance(value, dict):
+            raise ValueError("RSS_FEEDS는 {티커: [URL, ...]} 형태여야 합니다.")
+        feeds: Dict[str, Any] = {}
+        for ticker, urls in value.items():
+            key = str(ticker).strip().upper()
+            if not key:
+                raise ValueError("RSS_FEEDS의 티커는 공백일 수 없습니다.")
+            feeds[key] = [urls] if isinstance(urls, str) else urls
+        return feeds
+
     @field_validator("collection_schedules")
     @classmethod
     def _validate_unique_schedule(cls, value: List[CollectionSchedule]) -> List[CollectionSchedule]:
@@ -133,6 +263,20 @@ class Settings(BaseSettings):
             raise ValueError("POSTGRES_DSN은 유효한 DSN 문자열이어야 합니다.")
         return value
 
+    @field_validator("volume_ewma_alpha")
+    @classmethod
+    def _validate_ewma_alpha(cls, v: float) -> float:
+        if v > 1.0:
+            raise ValueError("VOLUME_EWMA_ALPHA는 0보다 크고 1 이하여야 합니다.")
+        return v
+
+    @field_validator("analysis_urgent_priority", "analysis_routine_priority")
+    @classmethod
+    def _validate_priority(cls, v: int) -> int:
+        if v > 9:
+            raise ValueError("태스크 우선순위는 0~9 범위여야 합니다.")
+        return v
+
     @field_validator("news_api_page_size")
     @classmethod
     def _validate_page_size(cls, v: int) -> int:
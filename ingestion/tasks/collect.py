@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Callable, Iterable, List
+from typing import Any, Callable, Iterable, List
 import uuid
 
 from celery import shared_task
@@ -17,13 +17,28 @@ from ingestion.repositories.articles import (
     save_articles,
 )
 from ingestion.services.deduplicator import InMemoryKeyStore, RedisKeyStore
+from ingestion.services.volume_monitor import (
+    URGENT,
+    InMemoryVolumeStore,
+    RedisVolumeStore,
+    VolumeMonitor,
+)
 from ingestion.settings import get_settings
 from ingestion.utils.logging import get_logger
+from llm.redis_client import RedisConnector
 
 
 # Connector factory is kept pluggable for tests; it must return an object with .fetch(ticker).
 CONNECTOR_FACTORY: Callable[[str], object] | None = None
 
+# Analysis dispatcher injection point for tests: (ticker, priority) -> None.
+ANALYSIS_DISPATCHER: Callable[[str, int], None] | None = None
+
+ANALYZE_TASK_NAME = "analysis.tasks.analyze.analyze_articles_for_ticker"
+
+# Redis를 쓸 수 없을 때 프로세스 내에서 유지되는 수집량 상태
+_LOCAL_VOLUME_STORE = InMemoryVolumeStore()
+
 
 def _get_connector(source: str):
     if CONNECTOR_FACTORY is None:
@@ -57,11 +72,11 @@ def _persist_new_articles(session, source: str, ticker: str, items: List[RawArti
     return saved
 
 
-def collect_core(ticker: str, source: str) -> int:
+def collect_core(ticker: str, source: str, *, trace_id: str | None = None) -> int:
     """Core logic to collect and persist articles; test-friendly."""
     _ensure_schema()
     connector = _get_connector(source)
-    trace_id = str(uuid.uuid4())
+    trace_id = trace_id or str(uuid.uuid4())
     logger = get_logger(__name__)
     logger.info(
         "collect.start",
@@ -86,29 +101,94 @@ def collect_core(ticker: str, source: str) -> int:
                 "saved": saved,
             },
         )
-        return saved
+    if get_settings().volume_monitor_enabled:
+        _observe_volume(ticker, saved, logger, trace_id)
+    return saved
 
 
-def _build_keystore(logger) -> InMemoryKeyStore | RedisKeyStore:
+def _observe_volume(ticker: str, saved: int, logger, trace_id: str) -> None:
+    """수집량을 관측하고 급증/정기 주기에 따라 분석 태스크를 디스패치한다."""
     settings = get_settings()
+    client = _redis_client(settings.redis_url)
+    store = RedisVolumeStore(client) if client is not None else _LOCAL_VOLUME_STORE
+    monitor = VolumeMonitor(
+        store,
+        alpha=float(settings.volume_ewma_alpha),
+        z_threshold=float(settings.volume_spike_zscore),
+        min_count=int(settings.volume_spike_min_count),
+        warmup_samples=int(settings.volume_warmup_samples),
+        quiet_interval_seconds=int(settings.analysis_quiet_interval_minutes) * 60,
+    )
     try:
-        import redis as redislib  # type: ignore
-
-        client = redislib.Redis.from_url(settings.redis_url, socket_connect_timeout=0.2)
-        # 연결 확인; 실패 시 폴백
+        signal = monitor.observe(ticker, saved)
+    except Exception:  # pragma: no cover - 모니터링 실패가 수집을 실패시키지 않도록
+        logger.exception("collect.volume_monitor_failed", extra={"trace_id": trace_id, "ticker": ticker})
+        return
+    logger.info(
+        "collect.volume",
+        extra={
+            "trace_id": trace_id,
+            "ticker": signal.ticker,
+            "count": signal.count,
+            "ewma_mean": round(signal.mean, 3),
+            "zscore": signal.zscore,
+            "spike": signal.spike,
+            "dispatch": signal.dispatch,
+        },
+    )
+    if signal.dispatch is None:
+        return
+    priority = (
+        int(settings.analysis_urgent_priority)
+        if signal.dispatch == URGENT
+        else int(settings.analysis_routine_priority)
+    )
+    # 관측 시 대기 기사를 예약해 두었으므로, 디스패치가 실패하면 예약을 되돌려 다음 수집에서 다시 보낸다
+    try:
+        _dispatch_analysis(signal.ticker, priority)
+    except Exception:
+        logger.exception(
+            "collect.dispatch_failed",
+            extra={"trace_id": trace_id, "ticker": signal.ticker, "dispatch": signal.dispatch},
+        )
         try:
-            client.ping()
-        except Exception:
-            logger.info("dedupe.keystore.memory", extra={"reason": "redis_ping_failed"})
-            return InMemoryKeyStore()
-        ks = RedisKeyStore(client, prefix="dedup", default_ttl_seconds=int(settings.dedup_redis_ttl_seconds))
-        logger.info("dedupe.keystore.redis", extra={"redis_url": settings.redis_url})
-        return ks
-    except Exception:  # pragma: no cover - best-effort fallback when redis-py is absent/unavailable
-        logger.info("dedupe.keystore.memory", extra={"reason": "redis_lib_unavailable"})
+            monitor.release(signal)
+        except Exception:  # pragma: no cover - 상태 저장소 장애; 다음 정기 주기에 다시 디스패치된다
+            logger.exception("collect.volume_monitor_failed", extra={"trace_id": trace_id, "ticker": ticker})
+
+
+def _dispatch_analysis(ticker: str, priority: int) -> None:
+    if ANALYSIS_DISPATCHER is not None:
+        ANALYSIS_DISPATCHER(ticker, priority)
+        return
+    from celery import current_app
+
+    current_app.send_task(ANALYZE_TASK_NAME, args=(ticker,), queue="analysis.analyze", priority=priority)
+
+
+_REDIS = RedisConnector("ingestion.collect")
+
+
+def _redis_client(url: str) -> Any | None:
+    """프로세스 공용 Redis 클라이언트. 라이브러리 부재/연결 실패 시 None (실패는 잠시 뒤 다시 연결 시도)."""
+    return _REDIS.get(url)
+
+
+def reset_redis_client_cache() -> None:
+    _REDIS.reset()
+
+
+def _build_keystore(logger) -> InMemoryKeyStore | RedisKeyStore:
+    settings = get_settings()
+    client = _redis_client(settings.redis_url)
+    if client is None:
+        logger.info("dedupe.keystore.memory", extra={"reason": "redis_unavailable"})
         return InMemoryKeyStore()
+    logger.info("dedupe.keystore.redis", extra={"redis_url": settings.redis_url})
+    return RedisKeyStore(client, prefix="dedup", default_ttl_seconds=int(settings.dedup_redis_ttl_seconds))
 
 
-@shared_task(name="ingestion.tasks.collect.collect_articles_for_ticker")
-def collect_articles_for_ticker(ticker: str, source: str) -> int:  # pragma: no cover - wrapper
-    return collect_core(ticker, source)
+@shared_task(bind=True, name="ingestion.tasks.collect.collect_articles_for_ticker")
+def collect_articles_for_ticker(self, ticker: str, source: str) -> int:  # pragma: no cover - wrapper
+    # Celery task id를 trace_id로 사용해 재시도/DLQ 기록과 JobRun을 연결한다.
+    return collect_core(ticker, source, trace_id=self.request.id)
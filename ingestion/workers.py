@@ -0,0 +1,101 @@
+"""Stage-specific Celery worker pool launcher.
+
+큐 프로파일(`CELERY_QUEUE_PROFILES`)마다 전용 워커 프로세스를 띄워
+느린 LLM 분석이 수집 큐를 굶기지 않도록 단계별로 격리한다.
+
+Usage:
+  uv run -- python -m ingestion.workers                      # 모든 단계
+  uv run -- python -m ingestion.workers -q analysis.analyze  # 특정 단계만
+  uv run -- python -m ingestion.workers --dry-run            # 명령만 출력
+"""
+
+from __future__ import annotations
+
+import argparse
+import shlex
+import signal
+import subprocess
+import sys
+from typing import Dict, Iterable, List, Optional
+
+from .settings import QueueProfile, Settings, get_settings
+
+CELERY_APP_PATH = "ingestion.celery_app:get_celery_app"
+
+
+def build_worker_command(
+    queue: str,
+    profile: QueueProfile,
+    *,
+    app: str = CELERY_APP_PATH,
+    loglevel: str = "info",
+) -> List[str]:
+    """단일 큐 전용 워커 실행 명령을 구성한다."""
+    return [
+        "celery",
+        "-A",
+        app,
+        "worker",
+        "-Q",
+        queue,
+        "-n",
+        f"{queue}@%h",
+        "-P",
+        profile.pool,
+        "-c",
+        str(profile.concurrency),
+        "--prefetch-multiplier",
+        str(profile.prefetch_multiplier),
+        "-l",
+        loglevel,
+    ]
+
+
+def build_worker_commands(
+    settings: Settings,
+    queues: Optional[Iterable[str]] = None,
+    *,
+    loglevel: str = "info",
+) -> Dict[str, List[str]]:
+    profiles = settings.celery_queue_profiles
+    selected = list(queues) if queues else list(profiles.keys())
+    unknown = [q for q in selected if q not in profiles]
+    if unknown:
+        raise ValueError(f"프로파일이 없는 큐입니다: {', '.join(unknown)}")
+    return {q: build_worker_command(q, profiles[q], loglevel=loglevel) for q in selected}
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="단계별 Celery 워커 풀 실행")
+    parser.add_argument("-q", "--queue", action="append", dest="queues", help="실행할 큐 (반복 지정 가능)")
+    parser.add_argument("-l", "--loglevel", default="info", help="워커 로그 레벨 (기본: info)")
+    parser.add_argument("--dry-run", action="store_true", help="실행하지 않고 명령만 출력")
+    args = parser.parse_args(argv)
+
+    commands = build_worker_commands(get_settings(), args.queues, loglevel=args.loglevel)
+    if args.dry_run:
+        for cmd in commands.values():
+            print(shlex.join(cmd))
+        return 0
+
+    procs = {queue: subprocess.Popen(cmd) for queue, cmd in commands.items()}
+
+    def _terminate(signum, _frame):  # noqa: ANN001
+        for proc in procs.values():
+            if proc.poll() is None:
+                proc.send_signal(signum)
+
+    signal.signal(signal.SIGTERM, _terminate)
+    signal.signal(signal.SIGINT, _terminate)
+
+    exit_code = 0
+    for queue, proc in procs.items():
+        code = proc.wait()
+        if code != 0:
+            print(f"[workers] {queue} 워커 비정상 종료: {code}", file=sys.stderr)
+            exit_code = code
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,9 @@
 """LLM module - OpenAI client and settings."""
 
 from llm.client.openai_client import (
+    BudgetDeferredError,
+    BudgetExceededError,
+    InvalidResponseError,
     LLMError,
     OpenAIClient,
     PermanentLLMError,
@@ -11,6 +14,9 @@ from llm.client.openai_client import (
 from llm.settings import AnalysisSettings, get_analysis_settings
 
 __all__ = [
+    "BudgetDeferredError",
+    "BudgetExceededError",
+    "InvalidResponseError",
     "LLMError",
     "OpenAIClient",
     "PermanentLLMError",
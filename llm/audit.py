@@ -0,0 +1,29 @@
+"""LLM 요청/응답 감사(audit) 싱크 계약.
+
+클라이언트는 응답을 받을 때마다 `AuditEntry`를 싱크에 넘기기만 한다. 싱크는 즉시 반환해야 하며
+(큐에 넣고 끝), 압축/중복 제거/색인 저장은 백그라운드에서 한다 (`analysis.audit`).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Protocol
+
+
+@dataclass(frozen=True)
+class AuditEntry:
+    trace_id: str
+    stage: str
+    model: str
+    # provider에 보낸 payload (messages/model/max_tokens 등)와 provider 공통 응답 dict
+    request: Dict[str, Any]
+    response: Dict[str, Any]
+    ticker: Optional[str] = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class AuditSink(Protocol):
+    def submit(self, entry: AuditEntry) -> None:
+        """호출 경로를 막지 않고 기록을 맡긴다 (가득 차면 버려도 된다)."""
+        ...
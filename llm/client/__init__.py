@@ -1,19 +1,29 @@
 """LLM client module."""
 
 from llm.client.openai_client import (
+    BudgetDeferredError,
+    BudgetExceededError,
+    InvalidResponseError,
     LLMError,
     OpenAIClient,
     PermanentLLMError,
     ProviderFn,
+    StreamAbortedError,
     StreamProviderFn,
+    StreamedAnalysis,
     TransientLLMError,
 )
 
 __all__ = [
+    "BudgetDeferredError",
+    "BudgetExceededError",
+    "InvalidResponseError",
     "LLMError",
     "OpenAIClient",
     "PermanentLLMError",
     "ProviderFn",
+    "StreamAbortedError",
     "StreamProviderFn",
+    "StreamedAnalysis",
     "TransientLLMError",
 ]
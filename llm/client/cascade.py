@@ -0,0 +1,130 @@
+"""Cheap-first model cascade.
+
+저렴한 모델로 먼저 분석하고, 결과가
+- 스키마/JSON 검증 실패(InvalidResponseError)
+- 모델 확신도(`confidence`) < `ANALYSIS_CASCADE_MIN_CONFIDENCE`
+- 이상 이벤트 점수 ≥ `ANALYSIS_CASCADE_ANOMALY_THRESHOLD` (중요한 날은 상위 모델로 재확인)
+인 경우에만 다음(더 강한) 모델로 승급한다. 마지막 모델 결과는 그대로 채택한다.
+시도한 모든 호출의 토큰/비용은 최종 결과에 합산되고 경로는 `route()`로 기록한다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from analysis.models.domain import AnalysisInput, AnalysisResult
+from llm.client.openai_client import InvalidResponseError, OpenAIClient
+
+
+@dataclass(frozen=True)
+class CascadeAttempt:
+    model: str
+    escalation: Optional[str]
+    tokens_prompt: int = 0
+    tokens_completion: int = 0
+    tokens_cached: int = 0
+    cost: float = 0.0
+
+
+@dataclass(frozen=True)
+class CascadeOutcome:
+    result: AnalysisResult
+    attempts: List[CascadeAttempt] = field(default_factory=list)
+
+    @property
+    def escalated(self) -> bool:
+        return len(self.attempts) > 1
+
+    def route(self) -> Dict[str, Any]:
+        """ProcessedInsight.llm_route에 저장할 라우팅 결정/모델별 통계."""
+        return {
+            "final_model": self.result.llm_model,
+            "escalated": self.escalated,
+            "attempts": [
+                {
+                    "model": a.model,
+                    "escalation": a.escalation,
+                    "tokens_prompt": a.tokens_prompt,
+                    "tokens_completion": a.tokens_completion,
+                    "tokens_cached": a.tokens_cached,
+                    "cost": a.cost,
+                }
+                for a in self.attempts
+            ],
+        }
+
+
+@dataclass(frozen=True)
+class ModelCascade:
+    client: OpenAIClient
+    models: Sequence[str]
+    min_confidence: float = 0.6
+    anomaly_threshold: float = 0.7
+
+    @classmethod
+    def from_client(cls, client: OpenAIClient) -> Optional["ModelCascade"]:
+        """설정에 캐스케이드 모델이 2개 이상이면 라우터, 아니면 None."""
+        settings = client.settings
+        models = list(settings.analysis_cascade_models)
+        if len(models) < 2:
+            return None
+        return cls(
+            client,
+            models,
+            min_confidence=float(settings.analysis_cascade_min_confidence),
+            anomaly_threshold=float(settings.analysis_cascade_anomaly_threshold),
+        )
+
+    def escalation_reason(self, result: AnalysisResult) -> Optional[str]:
+        if result.confidence is not None and result.confidence < self.min_confidence:
+            return "low_confidence"
+        if any(a.score >= self.anomaly_threshold for a in result.anomalies):
+            return "anomaly"
+        return None
+
+    def analyze(self, inp: AnalysisInput) -> CascadeOutcome:
+        """모델 순서대로 시도한다. 일시 오류/예산 오류 등 검증 외 오류는 그대로 전파한다."""
+        attempts: List[CascadeAttempt] = []
+        for index, model in enumerate(self.models):
+            last = index == len(self.models) - 1
+            client = self.client.with_overrides(analysis_model=model)
+            try:
+                result = client.analyze(inp)
+            except InvalidResponseError as exc:
+                if last:
+                    raise
+                # 무효 응답도 과금되므로 오류에 실린 usage를 시도에 남겨 최종 합계에 포함한다
+                attempts.append(
+                    CascadeAttempt(
+                        model=exc.model or model,
+                        escalation="invalid",
+                        tokens_prompt=exc.tokens.get("prompt_tokens", 0),
+                        tokens_completion=exc.tokens.get("completion_tokens", 0),
+                        tokens_cached=exc.tokens.get("cached_tokens", 0),
+                        cost=exc.cost,
+                    )
+                )
+                continue
+            reason = None if last else self.escalation_reason(result)
+            attempts.append(
+                CascadeAttempt(
+                    model=result.llm_model,
+                    escalation=reason,
+                    tokens_prompt=result.llm_tokens_prompt,
+                    tokens_completion=result.llm_tokens_completion,
+                    tokens_cached=result.llm_tokens_cached,
+                    cost=result.llm_cost,
+                )
+            )
+            if reason is None:
+                break
+        total = result.model_copy(
+            update={
+                "llm_tokens_prompt": sum(a.tokens_prompt for a in attempts),
+                "llm_tokens_completion": sum(a.tokens_completion for a in attempts),
+                "llm_tokens_cached": sum(a.tokens_cached for a in attempts),
+                "llm_cost": sum(a.cost for a in attempts),
+            }
+        )
+        return CascadeOutcome(result=total, attempts=attempts)
@@ -0,0 +1,80 @@
+"""LLM 호출 오류 계층."""
+
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+
+class LLMError(Exception):
+    """LLM 호출 관련 기본 오류."""
+
+
+class TransientLLMError(LLMError):
+    """일시 오류(재시도 대상).
+
+    `retry_after_seconds`가 있으면 provider(Retry-After)나 예산 윈도가 지정한 대기 시간이다.
+    """
+
+    def __init__(self, message: str = "", *, retry_after_seconds: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+class PermanentLLMError(LLMError):
+    """영구 오류(재시도 불가)."""
+
+
+class InvalidResponseError(PermanentLLMError):
+    """응답 JSON 파싱/스키마 검증 실패 (재시도 소진 후).
+
+    무효 응답도 과금되므로, 응답을 받은 경우 그 모델/토큰(`prompt_tokens` 등)/비용을 함께 싣는다.
+    """
+
+    def __init__(
+        self,
+        message: str = "",
+        *,
+        model: Optional[str] = None,
+        tokens: Optional[Dict[str, int]] = None,
+        cost: float = 0.0,
+    ) -> None:
+        super().__init__(message)
+        self.model = model
+        self.tokens = dict(tokens or {})
+        self.cost = float(cost)
+
+
+class StreamAbortedError(InvalidResponseError):
+    """스트리밍 분석 응답이 무효로 확정되어 생성 도중 요청을 끊음.
+
+    `reason`: syntax | schema | length. `completion_tokens`는 끊기 전까지 받은 토큰(추정),
+    `saved_completion_tokens`는 `max_tokens`까지 생성됐을 경우 대비 아낀 토큰(추정).
+    끊기 전까지 받은 부분도 과금되므로 그 모델/토큰/비용을 `InvalidResponseError`와 같이 싣는다.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        reason: str,
+        completion_tokens: int = 0,
+        saved_completion_tokens: int = 0,
+        model: Optional[str] = None,
+        tokens: Optional[Dict[str, int]] = None,
+        cost: float = 0.0,
+    ) -> None:
+        super().__init__(message, model=model, tokens=tokens, cost=cost)
+        self.reason = reason
+        self.completion_tokens = completion_tokens
+        self.saved_completion_tokens = saved_completion_tokens
+
+
+class BudgetExceededError(PermanentLLMError):
+    """일/시간 지출 예산 소진으로 호출 거절."""
+
+
+class BudgetDeferredError(TransientLLMError):
+    """일/시간 지출 예산 소진으로 호출 연기 (`retry_after_seconds` 후 재시도)."""
+
+    def __init__(self, message: str, *, retry_after_seconds: int) -> None:
+        super().__init__(message, retry_after_seconds=retry_after_seconds)
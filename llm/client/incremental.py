@@ -0,0 +1,272 @@
+"""스트리밍 응답용 증분 JSON 파서/검증기.
+
+- `IncrementalJSONParser`: 최상위 JSON 객체를 글자 단위로 검증하며 받는다.
+  문법상 더 이상 유효한 JSON이 될 수 없는 순간(객체가 아닌 시작, 잘못된 토큰,
+  괄호 불일치, 객체 뒤 추가 텍스트) 바로 `IncrementalParseError`를 던지고,
+  값이 완성된 최상위 필드는 `(key, value)`로 돌려준다.
+- `AnalysisStreamParser`: 완성된 필드를 `AnalysisResult` 필드 제약(타입/범위/길이)으로 즉시 검증하고,
+  아직 닫히지 않은 문자열 필드가 `max_length`를 넘으면 끝나기 전에 실패시킨다.
+
+최종 결과는 기존과 같이 `OpenAIClient.parse_response`가 전체 내용을 다시 검증한다.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+from analysis.models.domain import AnalysisResult
+
+_WS = " \t\r\n"
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+_NUMBER_PREFIX_RE = re.compile(r"-?(?:0|[1-9]\d*)?(?:\.\d*)?(?:[eE][+-]?\d*)?\Z")
+_NUMBER_RE = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?\Z")
+_LITERALS = {"t": "true", "f": "false", "n": "null"}
+_ESCAPES = frozenset('"\\/bfnrt')
+_HEX = frozenset("0123456789abcdefABCDEF")
+
+# LLM이 채우는 AnalysisResult 필드 (나머지는 클라이언트가 채움)
+_LLM_FIELDS = frozenset({"summary_text", "keywords", "sentiment_score", "anomalies", "confidence"})
+# parse_response가 `or []`로 받아주는 필드
+_NULLABLE_LISTS = frozenset({"keywords", "anomalies"})
+
+
+class IncrementalParseError(ValueError):
+    """스트리밍 응답이 유효한 분석 결과가 될 수 없음이 확정됨.
+
+    `reason`: syntax(JSON 문법) | schema(필드 검증) | length(필드 길이 상한).
+    """
+
+    def __init__(self, message: str, *, reason: str = "syntax") -> None:
+        super().__init__(message)
+        self.reason = reason
+
+
+class IncrementalJSONParser:
+    """최상위 JSON 객체를 증분으로 검증하며 완성된 최상위 필드를 돌려준다."""
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._pos = 0
+        self._stack: List[str] = []
+        # start | key_or_end | key | colon | value | value_or_end | comma_or_end | end
+        self._expect = "start"
+        self._scalar: Optional[str] = None  # string | number | literal
+        self._scalar_start = 0
+        self._literal = ""
+        self._is_key = False
+        # -1: 백슬래시 직후, n > 0: \u 뒤 남은 16진수 자릿수
+        self._escape = 0
+        # 받는 중인 문자열의 디코딩 후 글자 수
+        self._string_chars = 0
+        self._key: Optional[str] = None
+        self._value_start = 0
+        self.done = False
+
+    @property
+    def open_string(self) -> Optional[Tuple[str, int]]:
+        """값을 받는 중인 최상위 문자열 필드 (key, 지금까지 받은 글자 수)."""
+        if self._scalar != "string" or self._is_key or len(self._stack) != 1 or self._key is None:
+            return None
+        return self._key, self._string_chars
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        self._text += text
+        completed: List[Tuple[str, Any]] = []
+        while self._pos < len(self._text):
+            self._step(self._text[self._pos], self._pos, completed)
+            self._pos += 1
+        return completed
+
+    def finish(self) -> None:
+        if not self.done:
+            raise IncrementalParseError("JSON 객체가 닫히지 않음 (응답 잘림)")
+
+    def _fail(self, message: str) -> None:
+        raise IncrementalParseError(f"{message} (위치 {self._pos})")
+
+    def _step(self, c: str, i: int, completed: List[Tuple[str, Any]]) -> None:
+        if self._scalar == "string":
+            self._string_char(c, i, completed)
+            return
+        if self._scalar == "number":
+            if c in _NUMBER_CHARS:
+                if not _NUMBER_PREFIX_RE.match(self._text[self._scalar_start : i + 1]):
+                    self._fail("잘못된 숫자")
+                return
+            if not _NUMBER_RE.match(self._text[self._scalar_start : i]):
+                self._fail("잘못된 숫자")
+            self._scalar = None
+            self._end_value(i, completed)
+            # 숫자를 끝낸 구분자는 아래 구조 처리로 이어서 해석
+        elif self._scalar == "literal":
+            token = self._text[self._scalar_start : i + 1]
+            if not self._literal.startswith(token):
+                self._fail("잘못된 리터럴")
+            if token == self._literal:
+                self._scalar = None
+                self._end_value(i + 1, completed)
+            return
+
+        if c in _WS:
+            return
+        expect = self._expect
+        if expect == "start":
+            if c != "{":
+                self._fail("JSON 객체로 시작하지 않음")
+            self._stack.append("{")
+            self._expect = "key_or_end"
+        elif expect in ("key_or_end", "key"):
+            if c == '"':
+                self._start_scalar("string", i, is_key=True)
+            elif c == "}" and expect == "key_or_end":
+                self._close_container(i + 1, completed)
+            else:
+                self._fail("객체 키가 와야 함")
+        elif expect == "colon":
+            if c != ":":
+                self._fail("':'가 와야 함")
+            self._expect = "value"
+        elif expect in ("value", "value_or_end"):
+            if c == "]" and expect == "value_or_end":
+                self._close_container(i + 1, completed)
+            else:
+                self._start_value(c, i)
+        elif expect == "comma_or_end":
+            top = self._stack[-1]
+            if c == ",":
+                self._expect = "key" if top == "{" else "value"
+            elif c == ("}" if top == "{" else "]"):
+                self._close_container(i + 1, completed)
+            else:
+                self._fail("',' 또는 닫는 괄호가 와야 함")
+        else:
+            self._fail("JSON 객체 뒤에 추가 텍스트")
+
+    def _string_char(self, c: str, i: int, completed: List[Tuple[str, Any]]) -> None:
+        if self._escape == -1:
+            if c == "u":
+                self._escape = 4
+            elif c in _ESCAPES:
+                self._escape = 0
+                self._string_chars += 1
+            else:
+                self._fail("잘못된 이스케이프")
+        elif self._escape > 0:
+            if c not in _HEX:
+                self._fail("잘못된 유니코드 이스케이프")
+            self._escape -= 1
+            if self._escape == 0:
+                self._string_chars += 1
+        elif c == "\\":
+            self._escape = -1
+        elif c == '"':
+            self._scalar = None
+            if self._is_key:
+                if len(self._stack) == 1:
+                    self._key = json.loads(self._text[self._scalar_start : i + 1])
+                self._expect = "colon"
+            else:
+                self._end_value(i + 1, completed)
+        elif ord(c) < 0x20:
+            self._fail("문자열 안 제어 문자")
+        else:
+            self._string_chars += 1
+
+    def _start_scalar(self, kind: str, i: int, *, is_key: bool = False) -> None:
+        self._scalar = kind
+        self._scalar_start = i
+        self._is_key = is_key
+        self._string_chars = 0
+
+    def _start_value(self, c: str, i: int) -> None:
+        if len(self._stack) == 1:
+            self._value_start = i
+        if c == '"':
+            self._start_scalar("string", i)
+        elif c in "{[":
+            self._stack.append(c)
+            self._expect = "key_or_end" if c == "{" else "value_or_end"
+        elif c == "-" or "0" <= c <= "9":
+            self._start_scalar("number", i)
+        elif c in _LITERALS:
+            self._start_scalar("literal", i)
+            self._literal = _LITERALS[c]
+        else:
+            self._fail("값이 와야 함")
+
+    def _close_container(self, end: int, completed: List[Tuple[str, Any]]) -> None:
+        self._stack.pop()
+        if not self._stack:
+            self.done = True
+            self._expect = "end"
+            return
+        self._end_value(end, completed)
+
+    def _end_value(self, end: int, completed: List[Tuple[str, Any]]) -> None:
+        self._expect = "comma_or_end"
+        if len(self._stack) == 1 and self._key is not None:
+            try:
+                value = json.loads(self._text[self._value_start : end])
+            except ValueError:
+                self._fail("값 파싱 실패")
+            completed.append((self._key, value))
+
+
+@lru_cache(maxsize=None)
+def _field_adapter(name: str) -> Optional[TypeAdapter]:
+    field = AnalysisResult.model_fields.get(name)
+    if field is None or name not in _LLM_FIELDS:
+        return None
+    return TypeAdapter(Annotated[field.annotation, field])
+
+
+def _field_max_length(name: str) -> Optional[int]:
+    field = AnalysisResult.model_fields.get(name)
+    if field is None or name not in _LLM_FIELDS:
+        return None
+    for meta in field.metadata:
+        limit = getattr(meta, "max_length", None)
+        if limit is not None:
+            return int(limit)
+    return None
+
+
+def validate_field(name: str, value: Any) -> None:
+    """완성된 필드 하나를 AnalysisResult 필드 제약으로 검증한다. 모르는 필드는 무시."""
+    adapter = _field_adapter(name)
+    if adapter is None or (value is None and name in _NULLABLE_LISTS):
+        return
+    try:
+        adapter.validate_python(value)
+    except ValidationError as exc:
+        raise IncrementalParseError(f"필드 검증 실패 ({name}): {exc}", reason="schema") from exc
+    if name == "summary_text" and not str(value).strip():
+        raise IncrementalParseError("summary_text는 공백일 수 없습니다.", reason="schema")
+
+
+class AnalysisStreamParser:
+    """분석 응답 스트림을 받아 필드가 완성될 때마다 검증한다."""
+
+    def __init__(self) -> None:
+        self._json = IncrementalJSONParser()
+        self.fields: Dict[str, Any] = {}
+
+    def feed(self, text: str) -> None:
+        for name, value in self._json.feed(text):
+            validate_field(name, value)
+            self.fields[name] = value
+        open_string = self._json.open_string
+        if open_string is not None:
+            name, length = open_string
+            limit = _field_max_length(name)
+            if limit is not None and length > limit:
+                raise IncrementalParseError(f"{name} 길이 상한({limit}) 초과", reason="length")
+
+    def finish(self) -> Dict[str, Any]:
+        self._json.finish()
+        return self.fields
@@ -2,70 +2,168 @@
 
 특징
 - 구조화(JSON) 출력 강제 및 파싱 → AnalysisResult 스키마로 검증
-- 재시도/타임아웃/비용 상한(요청당) 적용
+- 재시도(`RetryPolicy`: provider 오류 분류, 지수 백오프+jitter, 전체 기한)/비용 상한(요청당) 적용
 - Provider 주입으로 테스트 시 네트워크/실제 의존성 제거
+- `analyze_many`: 하나의 async 클라이언트를 공유하며 세마포어로 동시 요청 수 제한
+- 지출 장부(`llm.ledger`): 호출 전 일/시간 예산 판정(강등/연기/거절), 응답마다 단계별 비용 누적
+- `analyze_streaming`(`ANALYSIS_STREAM_PARSE`): 증분 파서로 필드를 검증하며 받고, 무효가 확정되면 즉시 중단
+- usage의 캐시 적중 토큰(`prompt_tokens_details.cached_tokens`)을 캐시 단가로 과금 계산하고 결과에 기록
+- 단가는 `llm.pricing` 레지스트리(설정으로 덮어씀), 호출 전 토큰 추정은 `llm.tokenizer`(`LLM_TOKENIZER`)
+- 응답마다 추정/실제 usage를 `llm.reconcile`에 누적 (추정 오차 대조)
+- `analyze_grouped`: 기사가 적은 여러 종목을 한 요청으로 분석하고 토큰/비용을 종목별 입력 비중으로 배분
+- `with_audit`: 응답마다 요청/응답 쌍을 감사 싱크(`llm.audit`)에 넘김 (저장은 싱크의 백그라운드 writer가 담당)
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 import math
-from typing import Any, Callable, Dict, Iterator, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from pydantic import ValidationError
 
 from analysis.models.domain import AnalysisInput, AnalysisResult
-from analysis.prompts.templates import build_analysis_messages
+from analysis.prompts.templates import build_analysis_messages, build_delta_messages, build_grouped_messages
+from llm.audit import AuditEntry, AuditSink
+from llm.client.errors import (
+    BudgetDeferredError,
+    BudgetExceededError,
+    InvalidResponseError,
+    LLMError,
+    PermanentLLMError,
+    StreamAbortedError,
+    TransientLLMError,
+)
+from llm.client.incremental import AnalysisStreamParser, IncrementalParseError
+from llm.client.retry import RetryPolicy, classify_error
+from llm.ledger import BudgetPolicy, SpendLedger, check_budget, get_spend_ledger
+from llm.pricing import PriceTable, get_price_table
+from llm.reconcile import UsageReconciler, UsageSample, get_usage_reconciler
 from llm.settings import AnalysisSettings, get_analysis_settings
+from llm.tokenizer import Tokenizer, get_tokenizer
 
 
-class LLMError(Exception):
-    """LLM 호출 관련 기본 오류."""
-
-
-class TransientLLMError(LLMError):
-    """일시 오류(재시도 대상)."""
-
+ProviderFn = Callable[[Dict[str, Any]], Dict[str, Any]]
+AsyncProviderFn = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+StreamProviderFn = Callable[[Dict[str, Any]], Iterator[Any]]
 
-class PermanentLLMError(LLMError):
-    """영구 오류(재시도 불가)."""
+logger = logging.getLogger(__name__)
 
+# 프로세스 단위로 재사용하는 동기 SDK 클라이언트 (api_key/base_url별; 커넥션 풀 유지)
+_SDK_CLIENTS: Dict[tuple[str, Optional[str]], Any] = {}
+_SDK_CLIENTS_LOCK = threading.Lock()
 
-ProviderFn = Callable[[Dict[str, Any]], Dict[str, Any]]
-StreamProviderFn = Callable[[Dict[str, Any]], Iterator[Any]]
 
+def _usage_tokens(usage: Any) -> Dict[str, int]:
+    """usage(dict 또는 SDK 객체)에서 prompt/completion/cached 토큰 수.
 
-_PRICE_PER_1K_TOKENS_USD: Dict[str, Dict[str, float]] = {
-    # 샘플 단가(임의 값; 테스트 용). 실제 운영 시 최신 단가를 설정/설정값으로 분리 권장
-    "gpt-4o-mini": {"prompt": 0.0005, "completion": 0.0015},
-    "gpt-4.1": {"prompt": 0.0030, "completion": 0.0100},
-}
+    cached는 `prompt_tokens_details.cached_tokens` (평탄화된 `cached_tokens`도 허용).
+    """
+    if not usage:
+        return {"prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0}
 
+    def _get(obj: Any, key: str) -> Any:
+        return obj.get(key) if isinstance(obj, dict) else getattr(obj, key, None)
 
-def _estimate_cost_usd(model: str, prompt_tokens: int, completion_tokens: int) -> float:
-    price = _PRICE_PER_1K_TOKENS_USD.get(model, _PRICE_PER_1K_TOKENS_USD["gpt-4o-mini"])
-    return (
-        (prompt_tokens / 1000.0) * price["prompt"]
-        + (completion_tokens / 1000.0) * price["completion"]
-    )
+    details = _get(usage, "prompt_tokens_details")
+    cached = _get(details, "cached_tokens") if details else _get(usage, "cached_tokens")
+    return {
+        "prompt_tokens": int(_get(usage, "prompt_tokens") or 0),
+        "completion_tokens": int(_get(usage, "completion_tokens") or 0),
+        "cached_tokens": int(cached or 0),
+    }
 
 
-def _estimate_tokens_from_messages(messages: List[dict]) -> int:
-    """길이 기반 보수적 토큰 추정."""
-    total_chars = 0
-    for message in messages:
-        content = message.get("content", "") if isinstance(message, dict) else ""
-        total_chars += len(str(content))
-    return max(1, math.ceil(total_chars / 4))
+def _usage_cost_usd(prices: PriceTable, model: str, usage: Any, *, batch: bool = False) -> float:
+    tokens = _usage_tokens(usage)
+    return prices.cost(model, tokens["prompt_tokens"], tokens["completion_tokens"], tokens["cached_tokens"], batch=batch)
 
 
-def _load_structured_content(content: str, attempts_left: int) -> Dict[str, Any]:
+def _get_sdk_client(api_key: str, base_url: Optional[str] = None) -> Any:
+    with _SDK_CLIENTS_LOCK:
+        client = _SDK_CLIENTS.get((api_key, base_url))
+        if client is None:
+            # 지연 import: 라이브러리가 없으면 명확한 에러
+            try:
+                from openai import OpenAI  # type: ignore
+            except Exception as exc:  # pragma: no cover - 테스트에선 provider 주입
+                raise PermanentLLMError("openai 라이브러리를 찾을 수 없습니다.") from exc
+            # 재시도는 RetryPolicy가 담당하므로 SDK 자체 재시도는 끈다
+            client = OpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+            _SDK_CLIENTS[(api_key, base_url)] = client
+        return client
+
+
+def _normalize_response(resp: Any) -> Dict[str, Any]:  # pragma: no cover - 네트워크 미사용
+    """SDK 응답 객체를 provider 공통 dict 형태로 변환."""
+    return {
+        "choices": [
+            {
+                "message": {"content": resp.choices[0].message.content},
+            }
+        ],
+        "usage": _usage_dict(resp.usage),
+        "model": resp.model,
+    }
+
+
+def _usage_dict(usage: Any) -> Dict[str, Any]:
+    """provider 공통 usage dict (OpenAI 형태: 캐시 토큰은 prompt_tokens_details 아래)."""
+    tokens = _usage_tokens(usage)
+    return {
+        "prompt_tokens": tokens["prompt_tokens"],
+        "completion_tokens": tokens["completion_tokens"],
+        "prompt_tokens_details": {"cached_tokens": tokens["cached_tokens"]},
+    }
+
+
+def _apportion(total: int, weights: Sequence[float]) -> List[int]:
+    """정수 `total`을 가중치 비율로 나눈다 (최대 잉여 방식; 합계 보존)."""
+    weight_sum = float(sum(weights))
+    if total <= 0 or weight_sum <= 0:
+        return [0] * len(weights)
+    exact = [total * w / weight_sum for w in weights]
+    parts = [math.floor(x) for x in exact]
+    by_remainder = sorted(range(len(weights)), key=lambda i: exact[i] - parts[i], reverse=True)
+    for i in by_remainder[: total - sum(parts)]:
+        parts[i] += 1
+    return parts
+
+
+def _load_structured_content(content: str, attempts_left: int, **usage: Any) -> Dict[str, Any]:
+    """응답 본문 JSON. 실패 시 `usage`(model/tokens/cost)를 InvalidResponseError에 싣는다."""
     try:
         return json.loads(content)
     except json.JSONDecodeError as exc:
         if attempts_left > 0:
             raise TransientLLMError("LLM 응답 JSON 파싱 실패") from exc
-        raise PermanentLLMError("LLM 응답 JSON 파싱 실패") from exc
+        raise InvalidResponseError("LLM 응답 JSON 파싱 실패", **usage) from exc
+
+
+def _close_stream(stream: Any) -> None:
+    """provider 스트림을 닫아 생성 중인 요청을 끊는다 (SDK Stream/제너레이터 모두 close 지원)."""
+    close = getattr(stream, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception:  # pragma: no cover - 이미 끊긴 연결
+            pass
+
+
+@dataclass(frozen=True)
+class StreamedAnalysis:
+    result: AnalysisResult
+    # 무효 확정으로 중간에 끊은 시도 (재시도 후 성공한 경우 포함)
+    aborted: List[StreamAbortedError] = field(default_factory=list)
+
+    @property
+    def saved_completion_tokens(self) -> int:
+        return sum(e.saved_completion_tokens for e in self.aborted)
 
 
 @dataclass(frozen=True)
@@ -73,46 +171,94 @@ class OpenAIClient:
     settings: AnalysisSettings
     provider: Optional[ProviderFn] = None
     stream_provider: Optional[StreamProviderFn] = None
+    async_provider: Optional[AsyncProviderFn] = None
+    # 지출 장부와 장부에 기록할 단계 이름 (None이면 예산 판정/기록 생략)
+    ledger: Optional[SpendLedger] = None
+    stage: str = "analyze"
+    # 추정/실제 usage 대조 저장소 (None이면 기록 생략)
+    reconciler: Optional[UsageReconciler] = None
+    # 요청/응답 감사 싱크와 기록 키 (None이면 기록 생략)
+    audit: Optional[AuditSink] = None
+    trace_id: Optional[str] = None
+    tickers: Tuple[str, ...] = ()
+    # Batch API 결과 (배치 할인 단가로 과금)
+    batch_pricing: bool = False
 
     @classmethod
     def from_env(
         cls,
         provider: Optional[ProviderFn] = None,
         stream_provider: Optional[StreamProviderFn] = None,
+        async_provider: Optional[AsyncProviderFn] = None,
+        *,
+        stage: str = "analyze",
     ) -> "OpenAIClient":
-        return cls(get_analysis_settings(), provider=provider, stream_provider=stream_provider)
+        return cls(
+            get_analysis_settings(),
+            provider=provider,
+            stream_provider=stream_provider,
+            async_provider=async_provider,
+            ledger=get_spend_ledger(),
+            stage=stage,
+            reconciler=get_usage_reconciler(),
+        )
+
+    @property
+    def prices(self) -> PriceTable:
+        return get_price_table(self.settings)
+
+    def tokenizer(self, model: Optional[str] = None) -> Tokenizer:
+        """호출 전 토큰 추정기 (`LLM_TOKENIZER`, 모델별 인코딩)."""
+        return get_tokenizer(self.settings.llm_tokenizer, model or self.settings.analysis_model)
+
+    def estimate_prompt_tokens(self, messages: List[dict], model: Optional[str] = None) -> int:
+        return self.tokenizer(model).count_messages(messages)
 
     def _get_provider(self) -> ProviderFn:
         if self.provider is not None:
             return self.provider
-        # 지연 import: 라이브러리가 없으면 명확한 에러
+        client = _get_sdk_client(self.settings.openai_api_key, self.settings.openai_base_url)
+
+        def _call(payload: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - 네트워크 미사용
+            return _normalize_response(client.chat.completions.create(**payload))
+
+        return _call
+
+    def _get_async_provider(self) -> tuple[AsyncProviderFn, Optional[Callable[[], Awaitable[None]]]]:
+        """(provider, close) 반환. 주입된 동기 provider는 스레드로 위임한다."""
+        if self.async_provider is not None:
+            return self.async_provider, None
+        if self.provider is not None:
+            sync_provider = self.provider
+
+            async def _to_thread(payload: Dict[str, Any]) -> Dict[str, Any]:
+                return await asyncio.to_thread(sync_provider, payload)
+
+            return _to_thread, None
         try:
-            from openai import OpenAI  # type: ignore
+            from openai import AsyncOpenAI  # type: ignore
         except Exception as exc:  # pragma: no cover - 테스트에선 provider 주입
             raise PermanentLLMError("openai 라이브러리를 찾을 수 없습니다.") from exc
 
-        client = OpenAI(api_key=self.settings.openai_api_key)
+        # async 클라이언트는 이벤트 루프에 묶이므로 배치(루프) 단위로 하나만 만들어 공유한다.
+        client = AsyncOpenAI(
+            api_key=self.settings.openai_api_key, base_url=self.settings.openai_base_url, max_retries=0
+        )
 
-        def _call(payload: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - 네트워크 미사용
-            resp = client.chat.completions.create(**payload)
-            # 통일된 dict 형태로 변환
-            return {
-                "choices": [
-                    {
-                        "message": {"content": resp.choices[0].message.content},
-                    }
-                ],
-                "usage": {
-                    "prompt_tokens": getattr(resp.usage, "prompt_tokens", 0),
-                    "completion_tokens": getattr(resp.usage, "completion_tokens", 0),
-                },
-                "model": resp.model,
-            }
+        async def _call(payload: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - 네트워크 미사용
+            return _normalize_response(await client.chat.completions.create(**payload))
 
-        return _call
+        return _call, client.close
 
-    def _build_payload(self, inp: AnalysisInput) -> Dict[str, Any]:
-        msgs = build_analysis_messages(inp)
+    def build_payload(self, inp: AnalysisInput) -> Dict[str, Any]:
+        builder = build_delta_messages if inp.delta else build_analysis_messages
+        msgs = builder(
+            inp,
+            token_budget=self.settings.analysis_prompt_token_budget,
+            top_k=int(self.settings.analysis_packer_top_k),
+            source_weights=self.settings.analysis_source_weights,
+            token_counter=self.tokenizer().count,
+        )
         return {
             "model": self.settings.analysis_model,
             "messages": msgs,
@@ -122,51 +268,425 @@ class OpenAIClient:
             # 타임아웃은 provider 구현/transport 레벨에서 사용
         }
 
-    def analyze(self, inp: AnalysisInput) -> AnalysisResult:
-        payload = self._build_payload(inp)
-        provider = self._get_provider()
+    def parse_response(self, inp: AnalysisInput, resp: Dict[str, Any], *, attempts_left: int = 0) -> AnalysisResult:
+        """provider 응답(dict)을 비용 상한/스키마 검증을 거쳐 AnalysisResult로 변환한다.
+
+        JSON 파싱 실패는 `attempts_left > 0`이면 TransientLLMError, 아니면 InvalidResponseError.
+        스키마 검증 실패는 InvalidResponseError(PermanentLLMError).
+        """
+        model = resp.get("model") or self.settings.analysis_model
+        tokens = _usage_tokens(resp.get("usage"))
+        cost = self.usage_cost(model, resp.get("usage"))
+        if cost > float(self.settings.analysis_cost_limit_usd):
+            raise PermanentLLMError("LLM 비용 상한 초과")
+
+        content = resp.get("choices", [{}])[0].get("message", {}).get("content", "")
+        data = _load_structured_content(content, attempts_left, model=model, tokens=tokens, cost=cost)
+        return _result_from_data(inp, data, model=model, tokens=tokens, cost=cost)
+
+    def build_grouped_payload(self, inputs: Sequence[AnalysisInput]) -> Dict[str, Any]:
+        """여러 종목을 한 요청으로 묶은 payload (completion 한도는 종목 수만큼 늘린다)."""
+        msgs = build_grouped_messages(
+            list(inputs),
+            token_budget=self.settings.analysis_prompt_token_budget,
+            top_k=int(self.settings.analysis_packer_top_k),
+            token_counter=self.tokenizer().count,
+            source_weights=self.settings.analysis_source_weights,
+        )
+        return {
+            "model": self.settings.analysis_model,
+            "messages": msgs,
+            "temperature": float(self.settings.analysis_temperature),
+            "max_tokens": int(self.settings.analysis_max_tokens) * len(inputs),
+            "response_format": {"type": "json_object"},
+        }
+
+    def input_shares(self, inputs: Sequence[AnalysisInput]) -> List[int]:
+        """종목별 입력 비중: 단독 요청이었을 때 user 메시지의 추정 토큰 수."""
+        tokenizer = self.tokenizer()
+        return [max(1, tokenizer.count(self.build_payload(inp)["messages"][-1]["content"])) for inp in inputs]
 
-        attempts = 0
-        last_exc: Optional[Exception] = None
-        start = time.monotonic()
-        while attempts <= int(self.settings.analysis_retry_max_attempts):
-            attempts += 1
+    def parse_grouped_response(
+        self,
+        inputs: Sequence[AnalysisInput],
+        resp: Dict[str, Any],
+        *,
+        shares: Sequence[int],
+        attempts_left: int = 0,
+    ) -> List[Union[AnalysisResult, LLMError]]:
+        """묶음 응답을 입력 순서대로 종목별 AnalysisResult로 검증한다.
+
+        토큰/비용은 `shares`(입력 비중)로 배분한다. 응답 전체가 무효면 예외(JSON 파싱 실패는
+        `parse_response`와 같은 규칙), 일부 종목만 누락/검증 실패면 그 자리에 InvalidResponseError.
+        비용 상한은 요청당 상한 × 종목 수.
+        """
+        model = resp.get("model") or self.settings.analysis_model
+        tokens = _usage_tokens(resp.get("usage"))
+        cost = self.usage_cost(model, resp.get("usage"))
+        if cost > float(self.settings.analysis_cost_limit_usd) * len(inputs):
+            raise PermanentLLMError("LLM 비용 상한 초과")
+
+        content = resp.get("choices", [{}])[0].get("message", {}).get("content", "")
+        data = _load_structured_content(content, attempts_left)
+        items = data.get("results") if isinstance(data, dict) else None
+        if not isinstance(items, list):
+            raise InvalidResponseError("묶음 응답에 results 배열이 없습니다.")
+        by_ticker: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            if isinstance(item, dict) and item.get("ticker"):
+                by_ticker.setdefault(str(item["ticker"]).strip().upper(), item)
+
+        split = {key: _apportion(total, shares) for key, total in tokens.items()}
+        weight_sum = float(sum(shares))
+        out: List[Union[AnalysisResult, LLMError]] = []
+        for i, inp in enumerate(inputs):
+            item = by_ticker.get(inp.ticker.upper())
+            if item is None:
+                out.append(InvalidResponseError(f"묶음 응답에 {inp.ticker} 결과가 없습니다."))
+                continue
             try:
-                resp = provider(payload)
-                model = resp.get("model") or self.settings.analysis_model
-                usage = resp.get("usage") or {}
-                prompt_tokens = int(usage.get("prompt_tokens", 0))
-                completion_tokens = int(usage.get("completion_tokens", 0))
-                cost = _estimate_cost_usd(model, prompt_tokens, completion_tokens)
-                if cost > float(self.settings.analysis_cost_limit_usd):
-                    raise PermanentLLMError("LLM 비용 상한 초과")
-
-                content = resp.get("choices", [{}])[0].get("message", {}).get("content", "")
-                data = _load_structured_content(
-                    content, int(self.settings.analysis_retry_max_attempts) - attempts
+                out.append(
+                    _result_from_data(
+                        inp,
+                        item,
+                        model=model,
+                        tokens={key: parts[i] for key, parts in split.items()},
+                        cost=cost * shares[i] / weight_sum,
+                    )
                 )
-                return AnalysisResult(
-                    ticker=inp.ticker,
-                    summary_text=data.get("summary_text", "").strip(),
-                    keywords=list(data.get("keywords", []) or []),
-                    sentiment_score=float(data.get("sentiment_score", 0.0)),
-                    anomalies=list(data.get("anomalies", []) or []),
-                    llm_model=model,
-                    llm_tokens_prompt=prompt_tokens,
-                    llm_tokens_completion=completion_tokens,
-                    llm_cost=cost,
+            except InvalidResponseError as exc:
+                out.append(exc)
+        return out
+
+    def analyze_grouped(self, inputs: Sequence[AnalysisInput]) -> List[Union[AnalysisResult, LLMError]]:
+        """여러 종목을 한 번의 호출로 분석한다 (결과는 입력 순서 유지).
+
+        호출 자체가 실패하면 예외를 던지고, 일부 종목만 무효면 그 자리에 LLMError를 담는다.
+        재시도/예산 판정/장부 기록은 `analyze`와 같다.
+        """
+        payload = self._apply_budget(self.build_grouped_payload(inputs))
+        provider = self._get_provider()
+        shares = self.input_shares(inputs)
+
+        def _attempt(remaining: float, attempts_left: int) -> List[Union[AnalysisResult, LLMError]]:
+            resp = provider({**payload, "timeout": remaining})
+            self._record_response(resp, payload)
+            return self.parse_grouped_response(inputs, resp, shares=shares, attempts_left=attempts_left)
+
+        return self.retry_policy().call(_attempt)
+
+    def estimate_cost(self, inp: AnalysisInput) -> float:
+        """요청 전 비용 추정 (프롬프트 길이 기반 토큰 + 최대 completion 토큰)."""
+        payload = self.build_payload(inp)
+        prompt_tokens = self.estimate_prompt_tokens(payload["messages"], payload["model"])
+        return self.prices.cost(payload["model"], prompt_tokens, int(payload["max_tokens"]))
+
+    def with_overrides(self, **overrides: Any) -> "OpenAIClient":
+        """설정 일부(모델/비용 상한 등)를 바꾼 클라이언트 사본 (provider 주입/장부는 유지)."""
+        return replace(self, settings=self.settings.model_copy(update=overrides))
+
+    def with_stage(self, stage: str) -> "OpenAIClient":
+        """지출을 다른 단계 이름(map/reduce/chat 등)으로 기록하는 사본."""
+        return replace(self, stage=stage)
+
+    def for_batch(self) -> "OpenAIClient":
+        """Batch API 결과를 배치 단가로 검증/기록하는 사본 (단계 `batch`)."""
+        return replace(self, stage="batch", batch_pricing=True)
+
+    def usage_cost(self, model: str, usage: Any) -> float:
+        """응답 usage의 USD 비용 (캐시 단가, 배치 할인 반영)."""
+        return _usage_cost_usd(self.prices, model, usage, batch=self.batch_pricing)
+
+    def with_audit(
+        self,
+        audit: Optional[AuditSink],
+        *,
+        trace_id: str,
+        ticker: Optional[str] = None,
+        tickers: Sequence[str] = (),
+    ) -> "OpenAIClient":
+        """요청/응답 쌍을 `trace_id`(와 종목)로 감사 싱크에 남기는 사본.
+
+        묶음 요청은 `tickers`를 넘기면 종목마다 색인이 남아 종목으로도 찾을 수 있다.
+        """
+        keys = tuple(t.upper() for t in tickers) or ((ticker.upper(),) if ticker else ())
+        return replace(self, audit=audit, trace_id=trace_id, tickers=keys)
+
+    def record_spend(self, model: str, cost_usd: float) -> None:
+        if self.ledger is None:
+            return
+        try:
+            self.ledger.add(cost_usd, model=model, stage=self.stage)
+        except Exception as exc:  # 장부 장애가 이미 받은 응답을 실패로 만들지 않도록 로그만 남긴다
+            logger.warning(
+                "llm.ledger_unavailable",
+                extra={"stage": self.stage, "model": model, "cost_usd": cost_usd, "error": str(exc)},
+            )
+
+    def _record_response(self, resp: Dict[str, Any], payload: Dict[str, Any], *, reconcile: bool = True) -> None:
+        """응답 usage 기준 비용을 장부에 기록 (파싱/검증 실패 응답도 과금되므로 먼저 기록).
+
+        `reconcile`이면 호출 전 추정치와 provider usage를 대조 저장소에 함께 누적한다
+        (usage가 없어 추정치로 채운 응답은 대조 대상이 아니다).
+        감사 싱크가 있으면 요청/응답 쌍을 넘긴다 (큐에 넣기만 하므로 지연 없음).
+        """
+        if self.audit is not None and self.trace_id is not None:
+            # 묶음 요청은 종목마다 색인을 남긴다 (본문 blob은 같은 해시라 한 번만 저장된다)
+            for ticker in self.tickers or (None,):
+                self.audit.submit(
+                    AuditEntry(
+                        trace_id=self.trace_id,
+                        ticker=ticker,
+                        stage=self.stage,
+                        model=resp.get("model") or payload["model"],
+                        request=payload,
+                        response=resp,
+                    )
                 )
-            except TransientLLMError as exc:
-                last_exc = exc
-                continue
-            finally:
-                elapsed = time.monotonic() - start
-                if elapsed > float(self.settings.analysis_request_timeout_seconds):
-                    # 타임아웃은 재시도 대신 종료
-                    raise TransientLLMError("LLM 요청 타임아웃 초과")
+        if self.ledger is None and self.reconciler is None:
+            return
+        model = resp.get("model") or payload["model"]
+        cost = self.usage_cost(model, resp.get("usage"))
+        self.record_spend(model, cost)
+        if not reconcile or self.reconciler is None:
+            return
+        tokens = _usage_tokens(resp.get("usage"))
+        if tokens["prompt_tokens"] <= 0:
+            return
+        estimated_prompt = self.estimate_prompt_tokens(payload["messages"], payload["model"])
+        max_tokens = int(payload["max_tokens"])
+        sample = UsageSample(
+            estimated_prompt_tokens=estimated_prompt,
+            prompt_tokens=tokens["prompt_tokens"],
+            completion_tokens=tokens["completion_tokens"],
+            cached_tokens=tokens["cached_tokens"],
+            max_tokens=max_tokens,
+            estimated_cost_usd=self.prices.cost(payload["model"], estimated_prompt, max_tokens),
+            cost_usd=cost,
+        )
+        try:
+            self.reconciler.record(
+                sample,
+                model=model,
+                stage=self.stage,
+            )
+        except Exception as exc:  # 대조 통계는 부가 정보이므로 저장소 장애 시 건너뛴다
+            logger.warning(
+                "llm.reconcile_unavailable", extra={"stage": self.stage, "model": model, "error": str(exc)}
+            )
+
+    def _apply_budget(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """일/시간 예산 판정. 강등 시 모델을 바꾼 payload, 연기/거절 시 예외."""
+        if self.ledger is None:
+            return payload
+        policy = BudgetPolicy.from_settings(self.settings)
+        if not policy.enabled:
+            return payload
+        prompt_tokens = self.estimate_prompt_tokens(payload["messages"], payload["model"])
+        completion_tokens = int(payload["max_tokens"])
+        prices = self.prices
+        try:
+            decision = check_budget(
+                self.ledger,
+                policy,
+                model=payload["model"],
+                estimate=lambda m: prices.cost(m, prompt_tokens, completion_tokens),
+            )
+        except Exception as exc:
+            # 장부를 읽을 수 없으면 예산 판정 없이 진행 (요청당 비용 상한은 그대로 적용된다)
+            logger.warning(
+                "llm.ledger_unavailable", extra={"stage": self.stage, "model": payload["model"], "error": str(exc)}
+            )
+            return payload
+        if decision.action == "allow":
+            return payload
+        if decision.action == "downgrade":
+            return {**payload, "model": decision.model}
+        message = f"LLM {decision.window} 예산 소진 (잔여 ${max(decision.remaining_usd, 0.0):.4f}, 단계 {self.stage})"
+        if decision.action == "defer":
+            raise BudgetDeferredError(message, retry_after_seconds=decision.retry_after_seconds)
+        raise BudgetExceededError(message)
+
+    def retry_policy(self, **overrides: Any) -> RetryPolicy:
+        return RetryPolicy.from_settings(self.settings, **overrides)
+
+    def sdk_client(self) -> Any:
+        """설정(`OPENAI_API_KEY`/`OPENAI_BASE_URL`)의 공용 동기 SDK 클라이언트 (SDK 자체 재시도 없음)."""
+        return _get_sdk_client(self.settings.openai_api_key, self.settings.openai_base_url)
+
+    @property
+    def streams_analysis(self) -> bool:
+        """`ANALYSIS_STREAM_PARSE`가 켜져 있고 스트림 provider를 쓸 수 있는지 (주입된 동기 provider가 우선)."""
+        return bool(self.settings.analysis_stream_parse) and (
+            self.stream_provider is not None or self.provider is None
+        )
+
+    def analyze(self, inp: AnalysisInput) -> AnalysisResult:
+        """분석 1건. 재시도는 `RetryPolicy`(지수 백오프+jitter, 전체 기한)를 따른다.
+
+        매 시도에 남은 기한을 `timeout`으로 transport에 전달한다.
+        `streams_analysis`이면 `analyze_streaming`으로 받는다.
+        """
+        if self.streams_analysis:
+            return self.analyze_streaming(inp).result
+        payload = self._apply_budget(self.build_payload(inp))
+        provider = self._get_provider()
+
+        def _attempt(remaining: float, attempts_left: int) -> AnalysisResult:
+            resp = provider({**payload, "timeout": remaining})
+            self._record_response(resp, payload)
+            return self.parse_response(inp, resp, attempts_left=attempts_left)
 
-        assert last_exc is not None
-        raise TransientLLMError(f"LLM 호출 재시도 한도 초과: {last_exc}")
+        return self.retry_policy().call(_attempt)
+
+    def analyze_streaming(self, inp: AnalysisInput) -> StreamedAnalysis:
+        """분석 1건을 스트리밍으로 받으며 필드가 완성될 때마다 `AnalysisResult` 제약으로 검증한다.
+
+        무효가 확정되는 즉시(JSON 문법 오류, 필드 검증 실패, 필드 길이 초과) 스트림을 닫고
+        `StreamAbortedError`를 던진다. 문법 오류는 재시도 여유가 있으면 일시 오류로 재시도한다.
+        끊긴 시도와 아낀 completion 토큰은 반환값에 남는다.
+        """
+        payload = self._apply_budget(
+            {**self.build_payload(inp), "stream": True, "stream_options": {"include_usage": True}}
+        )
+        stream_provider = self._get_stream_provider()
+        aborted: List[StreamAbortedError] = []
+
+        def _attempt(remaining: float, attempts_left: int) -> AnalysisResult:
+            try:
+                resp = self._consume_analysis_stream(stream_provider({**payload, "timeout": remaining}), payload)
+            except StreamAbortedError as exc:
+                aborted.append(exc)
+                if exc.reason == "syntax" and attempts_left > 0:
+                    raise TransientLLMError(f"LLM 응답 JSON 파싱 실패: {exc}") from exc
+                raise
+            return self.parse_response(inp, resp, attempts_left=attempts_left)
+
+        return StreamedAnalysis(result=self.retry_policy().call(_attempt), aborted=aborted)
+
+    def _consume_analysis_stream(self, stream: Iterator[Any], payload: Dict[str, Any]) -> Dict[str, Any]:
+        """분석 스트림을 증분 파서로 소비해 provider 공통 응답 dict로 만든다 (장부 기록 포함)."""
+        parser = AnalysisStreamParser()
+        parts: List[str] = []
+        usage: Optional[Dict[str, Any]] = None
+        model = payload["model"]
+        try:
+            for chunk in stream:
+                usage = _extract_usage(chunk) or usage
+                model = _extract_model(chunk) or model
+                content = _extract_delta_content(chunk)
+                if content:
+                    parts.append(content)
+                    parser.feed(content)
+            parser.finish()
+        except Exception as exc:
+            # 끊은 요청도 받은 만큼은 과금되므로 받은 부분 응답을 장부/감사에 남긴다
+            _close_stream(stream)
+            partial, reported = self._streamed_response(payload, "".join(parts), usage=usage, model=model)
+            self._record_response(partial, payload, reconcile=reported)
+            if not isinstance(exc, IncrementalParseError):
+                raise
+            tokens = _usage_tokens(partial["usage"])
+            completion_tokens = tokens["completion_tokens"]
+            raise StreamAbortedError(
+                f"스트리밍 분석 응답 중단 ({exc.reason}): {exc}",
+                reason=exc.reason,
+                completion_tokens=completion_tokens,
+                saved_completion_tokens=max(0, int(payload["max_tokens"]) - completion_tokens),
+                model=model,
+                tokens=tokens,
+                cost=self.usage_cost(model, partial["usage"]),
+            ) from exc
+        resp, reported = self._streamed_response(payload, "".join(parts), usage=usage, model=model)
+        self._record_response(resp, payload, reconcile=reported)
+        return resp
+
+    def _streamed_response(
+        self, payload: Dict[str, Any], content: str, *, usage: Optional[Dict[str, Any]], model: str
+    ) -> tuple[Dict[str, Any], bool]:
+        """스트림으로 받은 내용을 provider 공통 응답 dict로 만든다.
+
+        provider usage(`stream_options.include_usage`)가 없으면 토크나이저 추정치로 채우고,
+        두 번째 값(대조 여부)을 False로 돌려준다.
+        """
+        reported = usage is not None
+        if usage is None:
+            tokenizer = self.tokenizer(payload["model"])
+            usage = {
+                "prompt_tokens": tokenizer.count_messages(payload["messages"]),
+                "completion_tokens": tokenizer.count(content),
+            }
+        return {"choices": [{"message": {"content": content}}], "usage": usage, "model": model}, reported
+
+    async def analyze_async(
+        self,
+        inp: AnalysisInput,
+        *,
+        provider: Optional[AsyncProviderFn] = None,
+    ) -> AnalysisResult:
+        """`analyze`의 비동기 버전 (재시도/비용 상한/스키마 검증 동일)."""
+        close = None
+        if provider is None:
+            provider, close = self._get_async_provider()
+        try:
+            payload = self._apply_budget(self.build_payload(inp))
+
+            async def _attempt(remaining: float, attempts_left: int) -> AnalysisResult:
+                resp = await provider({**payload, "timeout": remaining})
+                self._record_response(resp, payload)
+                return self.parse_response(inp, resp, attempts_left=attempts_left)
+
+            return await self.retry_policy().call_async(_attempt)
+        finally:
+            if close is not None:
+                await close()
+
+    async def analyze_many_async(
+        self,
+        inputs: Sequence[AnalysisInput],
+        *,
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[AnalysisResult, LLMError]]:
+        """여러 입력을 하나의 클라이언트로 동시 분석한다 (결과는 입력 순서 유지).
+
+        `return_exceptions=True`면 실패한 항목 자리에 LLMError를 담아 반환하고,
+        아니면 첫 오류를 그대로 전파한다.
+        """
+        limit = int(max_concurrency or self.settings.analysis_max_concurrency)
+        semaphore = asyncio.Semaphore(limit)
+        provider, close = self._get_async_provider()
+
+        async def _one(inp: AnalysisInput) -> AnalysisResult:
+            async with semaphore:
+                return await self.analyze_async(inp, provider=provider)
+
+        try:
+            results = await asyncio.gather(*(_one(i) for i in inputs), return_exceptions=True)
+        finally:
+            if close is not None:
+                await close()
+
+        out: List[Union[AnalysisResult, LLMError]] = []
+        for res in results:
+            if isinstance(res, BaseException) and not isinstance(res, LLMError):
+                raise res
+            if isinstance(res, LLMError) and not return_exceptions:
+                raise res
+            out.append(res)
+        return out
+
+    def analyze_many(
+        self,
+        inputs: Sequence[AnalysisInput],
+        *,
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[AnalysisResult, LLMError]]:
+        """동기 진입점: 새 이벤트 루프에서 `analyze_many_async`를 실행한다."""
+        return asyncio.run(
+            self.analyze_many_async(inputs, max_concurrency=max_concurrency, return_exceptions=return_exceptions)
+        )
 
     def stream_chat(
         self,
@@ -186,33 +706,41 @@ class OpenAIClient:
             max_cost_usd=max_cost_usd, request_timeout_seconds=request_timeout_seconds,
         )
         provider = stream_provider or self.stream_provider
-        max_attempts = int(retry_max_attempts) if retry_max_attempts is not None else int(
-            self.settings.analysis_retry_max_attempts
-        )
-        attempts = 0
-        last_exc: Optional[Exception] = None
+        overrides: Dict[str, Any] = {"deadline_seconds": timeout}
+        if retry_max_attempts is not None:
+            overrides["max_retries"] = int(retry_max_attempts)
 
-        while attempts <= max_attempts:
-            attempts += 1
+        def _attempt(remaining: float, attempts_left: int) -> Iterator[str]:
+            received: Dict[str, Any] = {"opened": False, "usage": None, "model": payload["model"]}
+            parts: List[str] = []
             try:
-                yield from self._stream_with_provider(
+                for chunk in self._stream_with_provider(
                     provider=provider,
                     payload=payload,
-                    timeout=timeout,
+                    timeout=remaining,
                     started_at=time.monotonic(),
-                )
-                return
-            except PermanentLLMError:
+                    received=received,
+                ):
+                    parts.append(chunk)
+                    yield chunk
+            except LLMError:
                 raise
             except Exception as exc:
-                last_exc = exc
-                if attempts > max_attempts:
-                    break
+                # 분류되지 않는 스트림 오류(연결 끊김 등)는 일시 오류로 본다
+                if classify_error(exc) is None:
+                    raise TransientLLMError(f"스트리밍 실패: {exc}") from exc
+                raise
+            finally:
+                # 연결이 열린 시도는 받은 만큼 과금되므로 시도마다 한 번 기록한다
+                # (provider usage가 오면 그 값, 끊겨서 못 받았으면 토크나이저 추정치)
+                if received["opened"]:
+                    resp, reported = self._streamed_response(
+                        payload, "".join(parts), usage=received["usage"], model=received["model"]
+                    )
+                    self._record_response(resp, payload, reconcile=reported)
 
-        assert last_exc is not None
-        if isinstance(last_exc, TransientLLMError):
-            raise last_exc
-        raise TransientLLMError(f"스트리밍 실패: {last_exc}") from last_exc
+        # 이미 내보낸 조각이 있으면 재시도하지 않는다 (사용자에게 같은 글이 두 번 보이지 않도록)
+        yield from self.retry_policy(**overrides).stream(_attempt)
 
     def _prepare_stream_payload(
         self,
@@ -230,21 +758,20 @@ class OpenAIClient:
         max_cost = float(max_cost_usd or self.settings.analysis_cost_limit_usd)
         timeout = float(request_timeout_seconds or self.settings.analysis_request_timeout_seconds)
 
-        prompt_tokens = _estimate_tokens_from_messages(messages)
-        estimated_cost = _estimate_cost_usd(model_name, prompt_tokens, completion_tokens)
+        prompt_tokens = self.estimate_prompt_tokens(messages, model_name)
+        estimated_cost = self.prices.cost(model_name, prompt_tokens, completion_tokens)
         if estimated_cost > max_cost:
             raise PermanentLLMError("예상 비용 상한 초과")
 
-        return (
-            {
-                "model": model_name,
-                "messages": messages,
-                "max_tokens": completion_tokens,
-                "temperature": temp,
-                "stream": True,
-            },
-            timeout,
-        )
+        payload = {
+            "model": model_name,
+            "messages": messages,
+            "max_tokens": completion_tokens,
+            "temperature": temp,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        }
+        return self._apply_budget(payload), timeout
 
     def _stream_with_provider(
         self,
@@ -253,7 +780,9 @@ class OpenAIClient:
         payload: Dict[str, Any],
         timeout: float,
         started_at: float,
+        received: Dict[str, Any],
     ) -> Iterator[str]:
+        """delta 내용만 내보내고, 연결 여부와 마지막 chunk의 usage/모델은 `received`에 남긴다."""
         stream_provider = provider or self._get_stream_provider()
         try:
             stream = stream_provider(payload)
@@ -261,12 +790,16 @@ class OpenAIClient:
             raise
         except Exception as exc:
             raise TransientLLMError(f"스트리밍 provider 생성 실패: {exc}") from exc
+        received["opened"] = True
 
         for raw_chunk in stream:
             elapsed = time.monotonic() - started_at
             if elapsed > timeout:
+                _close_stream(stream)
                 raise TransientLLMError("LLM 요청 타임아웃 초과")
 
+            received["usage"] = _extract_usage(raw_chunk) or received["usage"]
+            received["model"] = _extract_model(raw_chunk) or received["model"]
             content = _extract_delta_content(raw_chunk)
             if content:
                 yield content
@@ -275,12 +808,7 @@ class OpenAIClient:
         if self.stream_provider is not None:
             return self.stream_provider
 
-        try:
-            from openai import OpenAI  # type: ignore
-        except Exception as exc:
-            raise PermanentLLMError("openai 라이브러리를 찾을 수 없습니다.") from exc
-
-        client = OpenAI(api_key=self.settings.openai_api_key)
+        client = _get_sdk_client(self.settings.openai_api_key, self.settings.openai_base_url)
 
         def _call(payload: Dict[str, Any]) -> Iterator[Any]:  # pragma: no cover - 네트워크 미사용
             return client.chat.completions.create(**payload)
@@ -288,6 +816,42 @@ class OpenAIClient:
         return _call
 
 
+def _result_from_data(
+    inp: AnalysisInput, data: Dict[str, Any], *, model: str, tokens: Dict[str, int], cost: float
+) -> AnalysisResult:
+    try:
+        return AnalysisResult(
+            ticker=inp.ticker,
+            summary_text=data.get("summary_text", "").strip(),
+            keywords=list(data.get("keywords", []) or []),
+            sentiment_score=float(data.get("sentiment_score", 0.0)),
+            anomalies=list(data.get("anomalies", []) or []),
+            confidence=data.get("confidence"),
+            llm_model=model,
+            llm_tokens_prompt=tokens["prompt_tokens"],
+            llm_tokens_completion=tokens["completion_tokens"],
+            llm_tokens_cached=tokens["cached_tokens"],
+            llm_cost=cost,
+        )
+    except (ValidationError, TypeError, ValueError, AttributeError) as exc:
+        raise InvalidResponseError(
+            f"LLM 응답 스키마 검증 실패: {exc}", model=model, tokens=tokens, cost=cost
+        ) from exc
+
+
+def _extract_usage(chunk: Any) -> Optional[Dict[str, Any]]:
+    """`stream_options.include_usage` 마지막 chunk의 usage (없으면 None)."""
+    usage = chunk.get("usage") if isinstance(chunk, dict) else getattr(chunk, "usage", None)
+    if not usage:
+        return None
+    return _usage_dict(usage)
+
+
+def _extract_model(chunk: Any) -> Optional[str]:
+    model = chunk.get("model") if isinstance(chunk, dict) else getattr(chunk, "model", None)
+    return model if isinstance(model, str) and model else None
+
+
 def _extract_delta_content(chunk: Any) -> str:
     """OpenAI/테스트 chunk 객체에서 delta.content를 추출."""
     if isinstance(chunk, dict):
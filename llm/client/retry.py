@@ -0,0 +1,174 @@
+"""LLM 호출 재시도 정책.
+
+- provider 예외 분류: HTTP 408/409/425/429/5xx, 타임아웃/연결 오류 → 일시 오류,
+  그 외 4xx → 영구 오류, 알 수 없는 예외 → 그대로 전파
+- 지수 백오프 + full jitter (`Retry-After`가 있으면 그 값을 우선)
+- 전체 기한(deadline): 매 시도에 남은 시간을 transport 타임아웃으로 넘기고,
+  다음 대기 시간이 남은 기한을 넘거나 기한이 지난 뒤에는 새 시도를 시작하지 않는다
+  (이미 받은 응답은 기한을 넘겨 도착했더라도 과금되었으므로 그대로 반환)
+- 스트림(`stream`): 아직 아무 조각도 내보내지 않은 시도만 재시도 (받은 글자를 다시 보내지 않도록)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from llm.client.errors import LLMError, PermanentLLMError, TransientLLMError
+from llm.settings import AnalysisSettings
+
+T = TypeVar("T")
+
+# (남은 기한 초, 남은 재시도 횟수) → 결과
+Attempt = Callable[[float, int], T]
+
+_TRANSIENT_STATUS = frozenset({408, 409, 425, 429})
+# openai/httpx 예외 클래스 이름 (라이브러리를 import하지 않고 분류)
+_TRANSIENT_NAMES = frozenset(
+    {
+        "APITimeoutError",
+        "APIConnectionError",
+        "RateLimitError",
+        "InternalServerError",
+        "TimeoutException",
+        "ConnectError",
+        "ReadTimeout",
+        "RemoteProtocolError",
+    }
+)
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_error(exc: BaseException) -> Optional[LLMError]:
+    """provider 예외를 LLMError로 분류한다. 분류할 수 없으면 None (원 예외를 그대로 전파)."""
+    if isinstance(exc, LLMError):
+        return exc
+    status = _status_code(exc)
+    if status is not None:
+        if status in _TRANSIENT_STATUS or status >= 500:
+            return TransientLLMError(f"LLM provider HTTP {status}: {exc}", retry_after_seconds=_retry_after(exc))
+        return PermanentLLMError(f"LLM provider HTTP {status}: {exc}")
+    if isinstance(exc, (TimeoutError, ConnectionError)) or type(exc).__name__ in _TRANSIENT_NAMES:
+        return TransientLLMError(f"LLM provider 연결 오류: {exc}")
+    return None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_retries: int = 2
+    deadline_seconds: float = 15.0
+    base_delay_seconds: float = 0.5
+    max_delay_seconds: float = 8.0
+    sleep: Callable[[float], None] = field(default=time.sleep, compare=False)
+    clock: Callable[[], float] = field(default=time.monotonic, compare=False)
+    jitter: Callable[[], float] = field(default=random.random, compare=False)
+
+    @classmethod
+    def from_settings(cls, settings: AnalysisSettings, **overrides: Any) -> "RetryPolicy":
+        values = {
+            "max_retries": int(settings.analysis_retry_max_attempts),
+            "deadline_seconds": float(settings.analysis_request_timeout_seconds),
+            "base_delay_seconds": float(settings.analysis_retry_base_delay_seconds),
+            "max_delay_seconds": float(settings.analysis_retry_max_delay_seconds),
+        }
+        values.update(overrides)
+        return cls(**values)
+
+    def delay_for(self, retry: int, error: TransientLLMError) -> float:
+        """`retry`번째 재시도 전 대기 시간 (Retry-After 우선, 아니면 full jitter 지수 백오프)."""
+        if error.retry_after_seconds is not None:
+            return max(0.0, float(error.retry_after_seconds))
+        cap = min(self.max_delay_seconds, self.base_delay_seconds * (2 ** (retry - 1)))
+        return self.jitter() * cap
+
+    def _remaining(self, start: float) -> float:
+        return self.deadline_seconds - (self.clock() - start)
+
+    def _check_deadline(self, start: float) -> None:
+        # 새 시도를 시작하기 전에만 확인한다 (받은 응답을 기한 초과로 버리면 다시 과금되므로)
+        if self._remaining(start) <= 0:
+            raise TransientLLMError("LLM 요청 타임아웃 초과")
+
+    def _next_delay(self, exc: BaseException, retry: int, start: float) -> float:
+        """실패한 시도를 분류해 다음 대기 시간을 반환하거나, 재시도하지 않을 오류를 던진다."""
+        error = classify_error(exc)
+        if error is None:
+            raise exc
+        if not isinstance(error, TransientLLMError):
+            if error is exc:
+                raise error
+            raise error from exc
+        if retry > self.max_retries:
+            raise TransientLLMError(
+                f"LLM 호출 재시도 한도 초과: {error}", retry_after_seconds=error.retry_after_seconds
+            ) from exc
+        delay = self.delay_for(retry, error)
+        if delay >= self._remaining(start):
+            raise TransientLLMError(
+                f"LLM 호출 기한 내 재시도 불가: {error}", retry_after_seconds=error.retry_after_seconds
+            ) from exc
+        return delay
+
+    def call(self, attempt: Attempt[T]) -> T:
+        start = self.clock()
+        retry = 0
+        while True:
+            self._check_deadline(start)
+            try:
+                return attempt(self._remaining(start), self.max_retries - retry)
+            except Exception as exc:
+                retry += 1
+                self.sleep(self._next_delay(exc, retry, start))
+
+    async def call_async(self, attempt: Callable[[float, int], Awaitable[T]]) -> T:
+        start = self.clock()
+        retry = 0
+        while True:
+            self._check_deadline(start)
+            try:
+                return await attempt(self._remaining(start), self.max_retries - retry)
+            except Exception as exc:
+                retry += 1
+                await asyncio.sleep(self._next_delay(exc, retry, start))
+
+    def stream(self, attempt: Callable[[float, int], Iterator[T]]) -> Iterator[T]:
+        """스트림 시도를 재시도하며 조각을 내보낸다.
+
+        조각을 하나라도 내보낸 뒤의 오류는 재시도하면 같은 글자가 중복되므로 분류만 해서 전파한다.
+        """
+        start = self.clock()
+        retry = 0
+        while True:
+            self._check_deadline(start)
+            emitted = False
+            try:
+                for item in attempt(self._remaining(start), self.max_retries - retry):
+                    emitted = True
+                    yield item
+                return
+            except Exception as exc:
+                if emitted:
+                    error = classify_error(exc)
+                    if error is None or error is exc:
+                        raise
+                    raise error from exc
+                retry += 1
+                self.sleep(self._next_delay(exc, retry, start))
@@ -37,7 +37,8 @@ def _default_provider(texts: List[str], model: str) -> List[List[float]]:
     if not api_key:
         raise EmbeddingError("OPENAI_API_KEY가 설정되지 않았습니다.")
 
-    url = "https://api.openai.com/v1/embeddings"
+    base_url = os.getenv("OPENAI_BASE_URL", "").strip().rstrip("/") or "https://api.openai.com/v1"
+    url = f"{base_url}/embeddings"
     headers = {"Authorization": f"Bearer {api_key}"}
     payload = {"input": texts, "model": model}
     try:
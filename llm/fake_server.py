@@ -0,0 +1,455 @@
+"""OpenAI 호환 로컬 가짜 LLM 서버 (부하 테스트/벤치마크용).
+
+- `POST /v1/chat/completions`: 비스트리밍/스트리밍(SSE) 응답.
+  `response_format=json_object`이면 AnalysisResult 스키마 JSON, 아니면 한국어 대화 텍스트
+- `POST /v1/embeddings`: 입력 텍스트 해시 기반 결정적 단위 벡터
+- 같은 입력 → 같은 출력 (프롬프트 해시 기반). 토큰 수는 글자 수/4 근사
+- 지연(`latency_ms`, 첫 바이트까지), 생성 속도(`tokens_per_second`),
+  오류 주입(`error_rate`, 429/5xx + Retry-After), 잘못된 JSON 주입(`invalid_json_rate`)
+- 자동 프롬프트 캐시 흉내(`prompt_cache`): 1024토큰 이상 프롬프트에서 이전에 본 가장 긴 접두어를
+  128토큰 단위로 `usage.prompt_tokens_details.cached_tokens`에 보고
+- `GET /_fake/stats`: 서버가 실제로 응답한 토큰 수 (비용 집계 정확도 비교용), `POST /_fake/reset`
+
+실행:
+  python -m llm.fake_server --port 8089 --latency-ms 300 --tokens-per-second 80 --error-rate 0.05
+  OPENAI_BASE_URL=http://127.0.0.1:8089/v1 로 분석/채팅 경로를 이 서버에 연결한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+
+_TOKENS_PER_CHUNK = 4
+# OpenAI 자동 프롬프트 캐시 규칙: 1024토큰 이상부터 128토큰 단위 (토큰 = 글자 수/4 근사)
+_CACHE_MIN_CHARS = 1024 * 4
+_CACHE_BLOCK_CHARS = 128 * 4
+_STOPWORDS = frozenset(
+    {
+        "that", "this", "with", "from", "have", "will", "were", "their", "about", "after",
+        "json", "summary", "keywords", "sentiment", "score", "anomalies", "label", "description",
+        "confidence", "text", "title", "body", "published", "source", "http", "https",
+    }
+)
+_CHAT_SENTENCES = (
+    "리포트 기준으로 보면 최근 실적 발표 이후 투자 심리가 다소 개선되었습니다.",
+    "다만 가이던스 변화와 거시 지표 발표 일정은 계속 확인할 필요가 있습니다.",
+    "관련 기사들은 공급망 안정화와 수요 회복을 주요 요인으로 언급합니다.",
+    "단기 변동성은 남아 있으므로 분할 접근과 손절 기준을 함께 고려하세요.",
+    "경쟁사 대비 밸류에이션 부담이 있다는 지적도 함께 나오고 있습니다.",
+    "이 답변은 투자 권유가 아니며 참고용 요약입니다.",
+)
+
+
+def count_tokens(text: str) -> int:
+    """클라이언트의 길이 기반 추정과 같은 규칙(글자 수/4, 올림)."""
+    return max(1, math.ceil(len(text) / 4)) if text else 0
+
+
+@dataclass(frozen=True)
+class FakeLLMConfig:
+    latency_ms: float = 50.0
+    # 0이면 생성 지연 없이 즉시 응답
+    tokens_per_second: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 429
+    retry_after_seconds: Optional[float] = 1.0
+    invalid_json_rate: float = 0.0
+    chat_reply_tokens: int = 120
+    embedding_dim: int = 1536
+    seed: int = 0
+    prompt_cache: bool = True
+
+    @classmethod
+    def from_env(cls) -> "FakeLLMConfig":
+        retry_after = os.getenv("FAKE_LLM_RETRY_AFTER_SECONDS", "1")
+        return cls(
+            latency_ms=float(os.getenv("FAKE_LLM_LATENCY_MS", "50")),
+            tokens_per_second=float(os.getenv("FAKE_LLM_TOKENS_PER_SECOND", "0")),
+            error_rate=float(os.getenv("FAKE_LLM_ERROR_RATE", "0")),
+            error_status=int(os.getenv("FAKE_LLM_ERROR_STATUS", "429")),
+            retry_after_seconds=float(retry_after) if retry_after.strip() else None,
+            invalid_json_rate=float(os.getenv("FAKE_LLM_INVALID_JSON_RATE", "0")),
+            chat_reply_tokens=int(os.getenv("FAKE_LLM_CHAT_REPLY_TOKENS", "120")),
+            embedding_dim=int(os.getenv("FAKE_LLM_EMBEDDING_DIM", "1536")),
+            seed=int(os.getenv("FAKE_LLM_SEED", "0")),
+            prompt_cache=os.getenv("FAKE_LLM_PROMPT_CACHE", "true").strip().lower() not in ("0", "false", "no"),
+        )
+
+
+@dataclass
+class FakeLLMStats:
+    """서버 측 집계. 키는 (endpoint, model)."""
+
+    requests: Dict[str, int] = field(default_factory=dict)
+    errors: Dict[str, int] = field(default_factory=dict)
+    prompt_tokens: Dict[str, int] = field(default_factory=dict)
+    completion_tokens: Dict[str, int] = field(default_factory=dict)
+    cached_tokens: Dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @staticmethod
+    def _key(endpoint: str, model: str) -> str:
+        return f"{endpoint}|{model}"
+
+    def record(
+        self, endpoint: str, model: str, *, prompt: int = 0, completion: int = 0, cached: int = 0, error: bool = False
+    ) -> None:
+        key = self._key(endpoint, model)
+        with self._lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+            if error:
+                self.errors[key] = self.errors.get(key, 0) + 1
+            self.prompt_tokens[key] = self.prompt_tokens.get(key, 0) + prompt
+            self.completion_tokens[key] = self.completion_tokens.get(key, 0) + completion
+            self.cached_tokens[key] = self.cached_tokens.get(key, 0) + cached
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            out = []
+            for key in sorted(self.requests):
+                endpoint, model = key.split("|", 1)
+                out.append(
+                    {
+                        "endpoint": endpoint,
+                        "model": model,
+                        "requests": self.requests[key],
+                        "errors": self.errors.get(key, 0),
+                        "prompt_tokens": self.prompt_tokens.get(key, 0),
+                        "completion_tokens": self.completion_tokens.get(key, 0),
+                        "cached_tokens": self.cached_tokens.get(key, 0),
+                    }
+                )
+            return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests.clear()
+            self.errors.clear()
+            self.prompt_tokens.clear()
+            self.completion_tokens.clear()
+            self.cached_tokens.clear()
+
+
+class PromptCache:
+    """접두어 해시 LRU로 provider 자동 프롬프트 캐시를 흉내 낸다."""
+
+    def __init__(self, max_entries: int = 50_000) -> None:
+        self._prefixes: "OrderedDict[str, None]" = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def lookup(self, prompt: str) -> int:
+        """이전에 본 가장 긴 블록 경계 접두어의 토큰 수를 돌려주고, 이번 접두어들을 기록한다."""
+        if len(prompt) < _CACHE_MIN_CHARS:
+            return 0
+        h = hashlib.sha256()
+        digests: List[tuple[int, str]] = []
+        pos = 0
+        for end in range(_CACHE_MIN_CHARS, len(prompt) + 1, _CACHE_BLOCK_CHARS):
+            h.update(prompt[pos:end].encode("utf-8"))
+            pos = end
+            digests.append((end, h.copy().hexdigest()))
+        cached = 0
+        with self._lock:
+            for end, digest in digests:
+                if digest in self._prefixes:
+                    cached = end
+                    self._prefixes.move_to_end(digest)
+                else:
+                    self._prefixes[digest] = None
+            while len(self._prefixes) > self._max_entries:
+                self._prefixes.popitem(last=False)
+        return cached // 4
+
+    def clear(self) -> None:
+        with self._lock:
+            self._prefixes.clear()
+
+
+def _message_text(messages: List[Dict[str, Any]]) -> str:
+    return "\n".join(str(m.get("content") or "") for m in messages if isinstance(m, dict))
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _unit(digest: str, start: int) -> float:
+    """해시의 일부를 [0, 1) 실수로."""
+    return int(digest[start : start + 8], 16) / float(0x100000000)
+
+
+def _analysis_data(prompt: str) -> Dict[str, Any]:
+    digest = _digest(prompt)
+    # 기사 제목에서 키워드를 뽑는다 (제목 형식이 아니면 프롬프트 전체)
+    titles = "\n".join(re.findall(r"Title:\s*(.+)", prompt)) or prompt
+    keywords: List[str] = []
+    for word in re.findall(r"[A-Za-z][A-Za-z\-]{3,}", titles):
+        lowered = word.lower()
+        if lowered not in _STOPWORDS and lowered not in keywords:
+            keywords.append(lowered)
+        if len(keywords) == 5:
+            break
+    sentiment = round(_unit(digest, 0) * 2 - 1, 2)
+    anomalies = []
+    if _unit(digest, 8) > 0.8:
+        anomalies.append({"label": "volume_spike", "description": "기사량 급증", "score": round(_unit(digest, 16), 2)})
+    return {
+        "summary_text": f"{', '.join(keywords[:3]) or '기사'} 관련 요약 ({digest[:8]})",
+        "keywords": keywords or ["news"],
+        "sentiment_score": sentiment,
+        "anomalies": anomalies,
+        "confidence": round(0.5 + _unit(digest, 24) / 2, 2),
+    }
+
+
+def analysis_content(messages: List[Dict[str, Any]]) -> str:
+    """프롬프트에서 결정적으로 만든 AnalysisResult JSON.
+
+    묶음 요청(`[Group]`)이면 `[Ticker]` 블록마다 하나씩 `{"results": [...]}`로 돌려준다.
+    """
+    prompt = _message_text([m for m in messages if m.get("role") != "system"]) or _message_text(messages)
+    if prompt.startswith("[Group]"):
+        blocks = re.split(r"^\[Ticker\] ", prompt, flags=re.MULTILINE)[1:]
+        results = [
+            {"ticker": block.split("\n", 1)[0].strip(), **_analysis_data(block)} for block in blocks
+        ]
+        return json.dumps({"results": results}, ensure_ascii=False)
+    return json.dumps(_analysis_data(prompt), ensure_ascii=False)
+
+
+def chat_content(messages: List[Dict[str, Any]], max_tokens: int) -> str:
+    """마지막 사용자 메시지 해시로 문장 순서를 정한 한국어 답변 (max_tokens 이하)."""
+    users = [m for m in messages if m.get("role") == "user"]
+    digest = _digest(_message_text(users[-1:] or messages))
+    offset = int(digest[:4], 16)
+    limit = max_tokens * 4
+    parts: List[str] = []
+    length = 0
+    for i in range(len(_CHAT_SENTENCES) * 4):
+        sentence = _CHAT_SENTENCES[(offset + i) % len(_CHAT_SENTENCES)]
+        if length + len(sentence) + 1 > limit:
+            break
+        parts.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(parts) or _CHAT_SENTENCES[offset % len(_CHAT_SENTENCES)][:limit]
+
+
+def embedding_vector(text: str, dim: int) -> List[float]:
+    rng = random.Random(_digest(text))
+    values = [rng.gauss(0.0, 1.0) for _ in range(dim)]
+    norm = math.sqrt(sum(v * v for v in values)) or 1.0
+    return [v / norm for v in values]
+
+
+def create_app(config: Optional[FakeLLMConfig] = None) -> FastAPI:
+    config = config or FakeLLMConfig.from_env()
+    stats = FakeLLMStats()
+    prompt_cache = PromptCache()
+    rng = random.Random(config.seed)
+    rng_lock = threading.Lock()
+    app = FastAPI(title="Fake OpenAI-compatible LLM", version="0.1.0")
+    app.state.config = config
+    app.state.stats = stats
+
+    def _draw() -> float:
+        # 요청 순서가 같으면 오류 주입 위치도 같다
+        with rng_lock:
+            return rng.random()
+
+    def _injected_error(endpoint: str, model: str) -> Optional[JSONResponse]:
+        if config.error_rate <= 0 or _draw() >= config.error_rate:
+            return None
+        stats.record(endpoint, model, error=True)
+        headers = {}
+        if config.retry_after_seconds is not None and config.error_status in (429, 503):
+            headers["retry-after"] = f"{config.retry_after_seconds:g}"
+        kind = "rate_limit_error" if config.error_status == 429 else "server_error"
+        body = {"error": {"message": f"injected {config.error_status}", "type": kind, "code": kind}}
+        return JSONResponse(body, status_code=config.error_status, headers=headers)
+
+    async def _generation_delay(tokens: int) -> None:
+        if config.tokens_per_second > 0 and tokens:
+            await asyncio.sleep(tokens / config.tokens_per_second)
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = str(body.get("model") or "gpt-4o-mini")
+        messages = body.get("messages") or []
+        max_tokens = int(body.get("max_tokens") or body.get("max_completion_tokens") or 512)
+        stream = bool(body.get("stream"))
+        endpoint = "chat.completions.stream" if stream else "chat.completions"
+
+        await asyncio.sleep(config.latency_ms / 1000.0)
+        error = _injected_error(endpoint, model)
+        if error is not None:
+            return error
+
+        if (body.get("response_format") or {}).get("type") == "json_object":
+            content = analysis_content(messages)
+            if config.invalid_json_rate > 0 and _draw() < config.invalid_json_rate:
+                content = content[: len(content) // 2]
+        else:
+            content = chat_content(messages, min(max_tokens, config.chat_reply_tokens))
+        finish_reason = "stop"
+        if count_tokens(content) > max_tokens:
+            content, finish_reason = content[: max_tokens * 4], "length"
+
+        prompt_tokens = sum(count_tokens(str(m.get("content") or "")) for m in messages if isinstance(m, dict))
+        cached_tokens = min(prompt_tokens, prompt_cache.lookup(_message_text(messages))) if config.prompt_cache else 0
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+
+        if not stream:
+            completion_tokens = count_tokens(content)
+            await _generation_delay(completion_tokens)
+            stats.record(endpoint, model, prompt=prompt_tokens, completion=completion_tokens, cached=cached_tokens)
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": finish_reason,
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                    "prompt_tokens_details": {"cached_tokens": cached_tokens},
+                },
+            }
+
+        include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+
+        def _chunk(delta: Dict[str, Any], finish: Optional[str] = None, usage: Any = None) -> str:
+            payload: Dict[str, Any] = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [] if usage else [{"index": 0, "delta": delta, "finish_reason": finish}],
+            }
+            if usage:
+                payload["usage"] = usage
+            return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+        async def _events() -> AsyncIterator[str]:
+            sent = ""
+            step = _TOKENS_PER_CHUNK * 4
+            try:
+                yield _chunk({"role": "assistant", "content": ""})
+                for start in range(0, len(content), step):
+                    piece = content[start : start + step]
+                    await _generation_delay(count_tokens(piece))
+                    sent += piece
+                    yield _chunk({"content": piece})
+                yield _chunk({}, finish_reason)
+                if include_usage:
+                    completion_tokens = count_tokens(sent)
+                    usage = {
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": completion_tokens,
+                        "total_tokens": prompt_tokens + completion_tokens,
+                        "prompt_tokens_details": {"cached_tokens": cached_tokens},
+                    }
+                    yield _chunk({}, usage=usage)
+                yield "data: [DONE]\n\n"
+            finally:
+                # 클라이언트가 중간에 끊어도 실제로 보낸 만큼만 집계
+                stats.record(
+                    endpoint, model, prompt=prompt_tokens, completion=count_tokens(sent), cached=cached_tokens
+                )
+
+        return StreamingResponse(_events(), media_type="text/event-stream")
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        model = str(body.get("model") or "text-embedding-3-small")
+        raw = body.get("input") or []
+        texts = [raw] if isinstance(raw, str) else [str(t) for t in raw]
+        dim = int(body.get("dimensions") or config.embedding_dim)
+
+        await asyncio.sleep(config.latency_ms / 1000.0)
+        error = _injected_error("embeddings", model)
+        if error is not None:
+            return error
+        prompt_tokens = sum(count_tokens(t) for t in texts)
+        stats.record("embeddings", model, prompt=prompt_tokens)
+        return {
+            "object": "list",
+            "data": [
+                {"object": "embedding", "index": i, "embedding": embedding_vector(text, dim)}
+                for i, text in enumerate(texts)
+            ],
+            "model": model,
+            "usage": {"prompt_tokens": prompt_tokens, "total_tokens": prompt_tokens},
+        }
+
+    @app.get("/_fake/stats")
+    async def fake_stats() -> Dict[str, Any]:
+        return {"usage": stats.snapshot()}
+
+    @app.post("/_fake/reset", status_code=204, response_model=None)
+    async def fake_reset() -> Response:
+        stats.reset()
+        prompt_cache.clear()
+        return Response(status_code=204)
+
+    return app
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    defaults = FakeLLMConfig.from_env()
+    parser = argparse.ArgumentParser(description="OpenAI 호환 가짜 LLM 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--tokens-per-second", type=float, default=defaults.tokens_per_second)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--error-status", type=int, default=defaults.error_status)
+    parser.add_argument("--invalid-json-rate", type=float, default=defaults.invalid_json_rate)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    config = FakeLLMConfig(
+        latency_ms=args.latency_ms,
+        tokens_per_second=args.tokens_per_second,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        retry_after_seconds=defaults.retry_after_seconds,
+        invalid_json_rate=args.invalid_json_rate,
+        chat_reply_tokens=defaults.chat_reply_tokens,
+        embedding_dim=defaults.embedding_dim,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
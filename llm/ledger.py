@@ -0,0 +1,232 @@
+"""클러스터 공용 LLM 지출 장부(spend ledger)와 일/시간 예산 판정.
+
+`analysis_cost_limit_usd`는 요청 1건만 제한하므로, 백필/재시도 폭주가 하루 예산을
+한 시간에 소진하는 것을 막기 위해
+- 장부: 일(UTC) × 모델 × 단계별 `llm_cost`를 원자적으로 누적 (Redis `HINCRBYFLOAT`/`INCRBYFLOAT`,
+  Redis가 없으면 프로세스 로컬 메모리)
+- 판정: 호출 전 추정 비용이 일/시간 잔여 예산을 넘으면 저렴한 모델로 강등, 그래도 넘치면
+  다음 윈도까지 연기(defer) 또는 거절(reject)
+을 제공한다.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, Literal, Optional, Protocol
+
+from llm.redis_client import RedisConnector
+from llm.settings import AnalysisSettings, get_analysis_settings
+
+BudgetAction = Literal["allow", "downgrade", "defer", "reject"]
+
+# 일별 버킷 보존 기간 (조회 API가 과거 한 달 정도를 볼 수 있도록)
+DAY_TTL_SECONDS = 35 * 86_400
+_HOUR_TTL_SECONDS = 2 * 3_600
+
+
+def as_utc(at: Optional[datetime]) -> datetime:
+    """UTC 시각 (None이면 현재, naive면 UTC로 간주)."""
+    at = at or datetime.now(timezone.utc)
+    return at.replace(tzinfo=timezone.utc) if at.tzinfo is None else at.astimezone(timezone.utc)
+
+
+def day_key(at: datetime) -> str:
+    """일별 버킷 키 (YYYYMMDD)."""
+    return at.strftime("%Y%m%d")
+
+
+def _hour_key(at: datetime) -> str:
+    return at.strftime("%Y%m%d%H")
+
+
+class SpendLedger(Protocol):
+    """단계/모델별 지출 누적 저장소."""
+
+    def add(self, cost_usd: float, *, model: str, stage: str, at: Optional[datetime] = None) -> None: ...
+
+    def day_total(self, at: Optional[datetime] = None) -> float: ...
+
+    def hour_total(self, at: Optional[datetime] = None) -> float: ...
+
+    def breakdown(self, day: date) -> Dict[str, Dict[str, float]]:
+        """{stage: {model: usd}}"""
+        ...
+
+
+class InMemorySpendLedger:
+    """프로세스 로컬 장부 (테스트/단일 프로세스용)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._days: Dict[str, Dict[tuple[str, str], float]] = defaultdict(lambda: defaultdict(float))
+        self._hours: Dict[str, float] = defaultdict(float)
+
+    def add(self, cost_usd: float, *, model: str, stage: str, at: Optional[datetime] = None) -> None:
+        if cost_usd <= 0:
+            return
+        at = as_utc(at)
+        with self._lock:
+            self._days[day_key(at)][(stage, model)] += float(cost_usd)
+            self._hours[_hour_key(at)] += float(cost_usd)
+
+    def day_total(self, at: Optional[datetime] = None) -> float:
+        with self._lock:
+            return sum(self._days.get(day_key(as_utc(at)), {}).values())
+
+    def hour_total(self, at: Optional[datetime] = None) -> float:
+        with self._lock:
+            return self._hours.get(_hour_key(as_utc(at)), 0.0)
+
+    def breakdown(self, day: date) -> Dict[str, Dict[str, float]]:
+        out: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            for (stage, model), usd in self._days.get(day.strftime("%Y%m%d"), {}).items():
+                out.setdefault(stage, {})[model] = usd
+        return out
+
+
+class RedisSpendLedger:
+    """Redis 기반 장부 (워커/API 프로세스 간 공유).
+
+    - `{prefix}:day:{YYYYMMDD}` 해시: 필드 `{stage}|{model}` → 누적 USD (`HINCRBYFLOAT`)
+    - `{prefix}:day:{YYYYMMDD}:total`, `{prefix}:hour:{YYYYMMDDHH}`: 합계 (`INCRBYFLOAT`)
+    한 번의 MULTI/EXEC 파이프라인으로 세 키를 함께 갱신한다.
+    """
+
+    def __init__(self, client: Any, *, prefix: str = "llm:spend") -> None:
+        self._client = client
+        self._prefix = prefix
+
+    def _day(self, key: str) -> str:
+        return f"{self._prefix}:day:{key}"
+
+    def _hour(self, key: str) -> str:
+        return f"{self._prefix}:hour:{key}"
+
+    def add(self, cost_usd: float, *, model: str, stage: str, at: Optional[datetime] = None) -> None:
+        if cost_usd <= 0:
+            return
+        at = as_utc(at)
+        day, hour = self._day(day_key(at)), self._hour(_hour_key(at))
+        pipe = self._client.pipeline(transaction=True)
+        pipe.hincrbyfloat(day, f"{stage}|{model}", float(cost_usd))
+        pipe.incrbyfloat(f"{day}:total", float(cost_usd))
+        pipe.incrbyfloat(hour, float(cost_usd))
+        pipe.expire(day, DAY_TTL_SECONDS)
+        pipe.expire(f"{day}:total", DAY_TTL_SECONDS)
+        pipe.expire(hour, _HOUR_TTL_SECONDS)
+        pipe.execute()
+
+    def day_total(self, at: Optional[datetime] = None) -> float:
+        return float(self._client.get(f"{self._day(day_key(as_utc(at)))}:total") or 0.0)
+
+    def hour_total(self, at: Optional[datetime] = None) -> float:
+        return float(self._client.get(self._hour(_hour_key(as_utc(at)))) or 0.0)
+
+    def breakdown(self, day: date) -> Dict[str, Dict[str, float]]:
+        out: Dict[str, Dict[str, float]] = {}
+        for field, value in self._client.hgetall(self._day(day.strftime("%Y%m%d"))).items():
+            field = field.decode() if isinstance(field, bytes) else field
+            stage, _, model = field.partition("|")
+            out.setdefault(stage, {})[model] = float(value)
+        return out
+
+
+@dataclass(frozen=True)
+class BudgetPolicy:
+    daily_limit_usd: Optional[float] = None
+    hourly_limit_usd: Optional[float] = None
+    fallback_model: Optional[str] = None
+    on_exhausted: Literal["defer", "reject"] = "defer"
+
+    @property
+    def enabled(self) -> bool:
+        return self.daily_limit_usd is not None or self.hourly_limit_usd is not None
+
+    @classmethod
+    def from_settings(cls, settings: AnalysisSettings) -> "BudgetPolicy":
+        return cls(
+            daily_limit_usd=settings.llm_daily_budget_usd,
+            hourly_limit_usd=settings.llm_hourly_budget_usd,
+            fallback_model=settings.llm_budget_fallback_model,
+            on_exhausted=settings.llm_budget_exhausted_action,
+        )
+
+
+@dataclass(frozen=True)
+class BudgetDecision:
+    action: BudgetAction
+    model: str
+    remaining_usd: float
+    window: Optional[Literal["day", "hour"]] = None
+    retry_after_seconds: int = 0
+
+
+def check_budget(
+    ledger: SpendLedger,
+    policy: BudgetPolicy,
+    *,
+    model: str,
+    estimate: Callable[[str], float],
+    at: Optional[datetime] = None,
+) -> BudgetDecision:
+    """`estimate(model)`(USD)이 남은 일/시간 예산 안에 드는지 판정한다.
+
+    넘치면 `fallback_model`로 다시 추정해 들어가면 강등, 아니면 정책에 따라 연기/거절.
+    연기 시 `retry_after_seconds`는 가장 먼저 막힌 윈도가 끝날 때까지의 시간이다.
+
+    판정은 예약 없이 현재 누적액만 읽는다(기록은 응답 후 `add`). 동시에 판정한 요청들은 같은 잔여액을
+    보고 함께 통과할 수 있으므로, 예산 초과 폭은 최대 (동시 요청 수 × 요청당 상한
+    `analysis_cost_limit_usd`)이다. 예산은 이 여유분을 감안한 soft limit으로 잡는다.
+    """
+    at = as_utc(at)
+    remaining: Dict[str, float] = {}
+    if policy.daily_limit_usd is not None:
+        remaining["day"] = float(policy.daily_limit_usd) - ledger.day_total(at)
+    if policy.hourly_limit_usd is not None:
+        remaining["hour"] = float(policy.hourly_limit_usd) - ledger.hour_total(at)
+    if not remaining:
+        return BudgetDecision("allow", model, math.inf)
+
+    window = min(remaining, key=lambda w: remaining[w])
+    left = remaining[window]
+    if estimate(model) <= left:
+        return BudgetDecision("allow", model, left)
+    fallback = policy.fallback_model
+    if fallback and fallback != model and estimate(fallback) <= left:
+        return BudgetDecision("downgrade", fallback, left, window)
+
+    if window == "hour":
+        reset = at.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    else:
+        reset = at.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    retry_after = max(1, math.ceil((reset - at).total_seconds()))
+    return BudgetDecision(policy.on_exhausted, model, left, window, retry_after)  # type: ignore[arg-type]
+
+
+_REDIS = RedisConnector("llm.ledger")
+
+
+@lru_cache()
+def _local_ledger() -> InMemorySpendLedger:
+    return InMemorySpendLedger()
+
+
+def get_spend_ledger() -> SpendLedger:
+    """`LLM_LEDGER_REDIS_URL`이 설정되어 있고 연결되면 Redis 장부, 아니면 메모리 장부.
+
+    연결 실패는 잠시만 기억하므로 Redis가 돌아오면 다음 호출부터 다시 공유 장부로 예산을 검사한다.
+    """
+    url = get_analysis_settings().llm_ledger_redis_url
+    client = _REDIS.get(url) if url else None
+    return RedisSpendLedger(client) if client is not None else _local_ledger()
+
+
+def reset_spend_ledger_cache() -> None:
+    _REDIS.reset()
+    _local_ledger.cache_clear()  # type: ignore[attr-defined]
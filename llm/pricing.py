@@ -0,0 +1,139 @@
+"""모델별 토큰 단가 레지스트리.
+
+기본 단가표에 설정(`LLM_PRICES_FILE` JSON 파일 → `LLM_PRICES` JSON 순으로 덮어씀)을 합쳐
+모델별 비용을 계산한다. 단가는 1K 토큰당 USD이며 `cached_prompt`는 provider 프롬프트 캐시에서
+읽은 입력 토큰 단가(없으면 `prompt` 단가)이다. `batch_ratio`는 Batch API 결과에 곱하는 할인율
+(없으면 `DEFAULT_BATCH_RATIO`)이다.
+
+모델 조회 순서: 정확한 이름 → 날짜 스냅샷 접미사(`-YYYY-MM-DD`)를 뗀 이름 → 미등록.
+미등록 모델은 등록된 단가 중 가장 비싼 것으로 계산하고(예산/비용 상한이 과소 추정되지 않도록)
+모델별로 한 번 경고를 남긴다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from llm.settings import AnalysisSettings, get_analysis_settings
+
+logger = logging.getLogger(__name__)
+
+_SNAPSHOT_SUFFIX = re.compile(r"-\d{4}-\d{2}-\d{2}$")
+
+# Batch API 기본 할인율 (온라인 단가 대비)
+DEFAULT_BATCH_RATIO = 0.5
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    prompt: float
+    completion: float
+    cached_prompt: Optional[float] = None
+    batch_ratio: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ModelPrice":
+        try:
+            prompt, completion = float(data["prompt"]), float(data["completion"])
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"단가에는 prompt/completion 숫자가 필요합니다: {data!r}") from exc
+        cached = data.get("cached_prompt")
+        ratio = data.get("batch_ratio")
+        price = cls(
+            prompt=prompt,
+            completion=completion,
+            cached_prompt=float(cached) if cached is not None else None,
+            batch_ratio=float(ratio) if ratio is not None else None,
+        )
+        if min(price.prompt, price.completion, price.cached_prompt or 0.0) < 0:
+            raise ValueError(f"단가는 음수일 수 없습니다: {data!r}")
+        if price.batch_ratio is not None and not 0 < price.batch_ratio <= 1:
+            raise ValueError(f"batch_ratio는 0 초과 1 이하여야 합니다: {data!r}")
+        return price
+
+    def cost(self, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0, *, batch: bool = False) -> float:
+        """USD 비용. `cached_tokens`는 `prompt_tokens` 중 캐시 단가로 과금되는 부분, `batch`면 배치 할인 적용."""
+        cached = min(max(cached_tokens, 0), prompt_tokens)
+        cached_price = self.cached_prompt if self.cached_prompt is not None else self.prompt
+        cost = (
+            ((prompt_tokens - cached) / 1000.0) * self.prompt
+            + (cached / 1000.0) * cached_price
+            + (completion_tokens / 1000.0) * self.completion
+        )
+        if batch:
+            cost *= self.batch_ratio if self.batch_ratio is not None else DEFAULT_BATCH_RATIO
+        return cost
+
+
+# 샘플 단가(임의 값; 테스트 용). 운영에서는 LLM_PRICES / LLM_PRICES_FILE로 실제 단가를 설정한다.
+DEFAULT_PRICES: Dict[str, ModelPrice] = {
+    "gpt-4o-mini": ModelPrice(prompt=0.0005, completion=0.0015, cached_prompt=0.00025),
+    "gpt-4.1": ModelPrice(prompt=0.0030, completion=0.0100, cached_prompt=0.00075),
+}
+
+
+class PriceTable:
+    """모델 → 단가 조회 (스냅샷 이름 정규화, 미등록 모델은 최고 단가)."""
+
+    def __init__(self, prices: Mapping[str, ModelPrice]) -> None:
+        if not prices:
+            raise ValueError("단가표가 비어 있습니다.")
+        self._prices = dict(prices)
+        self._fallback = max(self._prices.values(), key=lambda p: (p.prompt + p.completion, p.completion))
+        self._warned: set[str] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def models(self) -> Tuple[str, ...]:
+        return tuple(sorted(self._prices))
+
+    def lookup(self, model: str) -> Optional[ModelPrice]:
+        """등록된 단가 (정확한 이름 또는 날짜 스냅샷의 기본 이름). 없으면 None."""
+        price = self._prices.get(model)
+        if price is None:
+            price = self._prices.get(_SNAPSHOT_SUFFIX.sub("", model))
+        return price
+
+    def price(self, model: str) -> ModelPrice:
+        price = self.lookup(model)
+        if price is not None:
+            return price
+        with self._lock:
+            first = model not in self._warned
+            self._warned.add(model)
+        if first:
+            logger.warning("llm.unknown_model_price", extra={"model": model, "known_models": list(self.models)})
+        return self._fallback
+
+    def cost(
+        self, model: str, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0, *, batch: bool = False
+    ) -> float:
+        return self.price(model).cost(prompt_tokens, completion_tokens, cached_tokens, batch=batch)
+
+
+def get_price_table(settings: Optional[AnalysisSettings] = None) -> PriceTable:
+    """설정의 단가표 (같은 설정값이면 같은 인스턴스를 재사용)."""
+    settings = settings or get_analysis_settings()
+    return _price_table(settings.llm_prices_file, json.dumps(settings.llm_prices, sort_keys=True))
+
+
+@lru_cache(maxsize=8)
+def _price_table(prices_file: Optional[str], prices_json: str) -> PriceTable:
+    prices = dict(DEFAULT_PRICES)
+    if prices_file:
+        raw = json.loads(Path(prices_file).read_text(encoding="utf-8"))
+        prices.update({model: ModelPrice.from_dict(data) for model, data in raw.items()})
+    prices.update({model: ModelPrice.from_dict(data) for model, data in json.loads(prices_json).items()})
+    return PriceTable(prices)
+
+
+def reset_price_table_cache() -> None:
+    """단가 파일 내용을 다시 읽게 한다."""
+    _price_table.cache_clear()  # type: ignore[attr-defined]
@@ -0,0 +1,193 @@
+"""호출 전 추정치와 provider가 보고한 usage의 대조(reconciliation).
+
+예산 판정/비용 상한은 로컬 토크나이저의 프롬프트 토큰 추정 + `max_tokens`로 비용을 미리 잡는다.
+응답마다 (추정 프롬프트 토큰, 실제 프롬프트/completion/캐시 토큰, 사전 추정 비용, 실제 비용)을
+일(UTC) × 단계 × 모델별로 누적해 추정이 얼마나 빗나가는지 보여준다.
+- 저장: Redis `{prefix}:day:{YYYYMMDD}` 해시, 필드 `{stage}|{model}|{metric}` (`HINCRBYFLOAT`),
+  Redis가 없으면 프로세스 로컬 메모리 (지출 장부와 같은 `LLM_LEDGER_REDIS_URL` 사용)
+- 보고: `reconciliation_report` → `GET /api/llm/usage-reconciliation`
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+from llm.ledger import DAY_TTL_SECONDS, as_utc, day_key
+from llm.redis_client import RedisConnector
+from llm.settings import get_analysis_settings
+
+METRICS = (
+    "calls",
+    "estimated_prompt_tokens",
+    "prompt_tokens",
+    "prompt_abs_error",
+    "completion_tokens",
+    "max_tokens",
+    "cached_tokens",
+    "estimated_cost_usd",
+    "cost_usd",
+)
+
+
+@dataclass(frozen=True)
+class UsageSample:
+    """응답 1건의 추정/실제 usage."""
+
+    estimated_prompt_tokens: int
+    prompt_tokens: int
+    completion_tokens: int
+    cached_tokens: int
+    max_tokens: int
+    # 호출 전 추정 비용 (추정 프롬프트 토큰 + max_tokens; 예산 판정에 쓰인 값)
+    estimated_cost_usd: float
+    # provider usage 기준 실제 비용
+    cost_usd: float
+
+    def metrics(self) -> Dict[str, float]:
+        return {
+            "calls": 1.0,
+            "estimated_prompt_tokens": float(self.estimated_prompt_tokens),
+            "prompt_tokens": float(self.prompt_tokens),
+            "prompt_abs_error": float(abs(self.estimated_prompt_tokens - self.prompt_tokens)),
+            "completion_tokens": float(self.completion_tokens),
+            "max_tokens": float(self.max_tokens),
+            "cached_tokens": float(self.cached_tokens),
+            "estimated_cost_usd": float(self.estimated_cost_usd),
+            "cost_usd": float(self.cost_usd),
+        }
+
+
+class UsageReconciler(Protocol):
+    """단계/모델별 추정·실제 usage 누적 저장소."""
+
+    def record(self, sample: UsageSample, *, model: str, stage: str, at: Optional[datetime] = None) -> None: ...
+
+    def totals(self, day: date) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """{(stage, model): {metric: 합계}}"""
+        ...
+
+
+class InMemoryUsageReconciler:
+    """프로세스 로컬 저장소 (테스트/단일 프로세스용)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._days: Dict[str, Dict[Tuple[str, str], Dict[str, float]]] = defaultdict(
+            lambda: defaultdict(lambda: defaultdict(float))
+        )
+
+    def record(self, sample: UsageSample, *, model: str, stage: str, at: Optional[datetime] = None) -> None:
+        key = day_key(as_utc(at))
+        with self._lock:
+            bucket = self._days[key][(stage, model)]
+            for metric, value in sample.metrics().items():
+                bucket[metric] += value
+
+    def totals(self, day: date) -> Dict[Tuple[str, str], Dict[str, float]]:
+        with self._lock:
+            return {k: dict(v) for k, v in self._days.get(day.strftime("%Y%m%d"), {}).items()}
+
+
+class RedisUsageReconciler:
+    """Redis 기반 저장소 (워커/API 프로세스 간 공유)."""
+
+    def __init__(self, client: Any, *, prefix: str = "llm:usage") -> None:
+        self._client = client
+        self._prefix = prefix
+
+    def _day(self, key: str) -> str:
+        return f"{self._prefix}:day:{key}"
+
+    def record(self, sample: UsageSample, *, model: str, stage: str, at: Optional[datetime] = None) -> None:
+        day = self._day(day_key(as_utc(at)))
+        pipe = self._client.pipeline(transaction=True)
+        for metric, value in sample.metrics().items():
+            if value:
+                pipe.hincrbyfloat(day, f"{stage}|{model}|{metric}", value)
+        pipe.expire(day, DAY_TTL_SECONDS)
+        pipe.execute()
+
+    def totals(self, day: date) -> Dict[Tuple[str, str], Dict[str, float]]:
+        out: Dict[Tuple[str, str], Dict[str, float]] = {}
+        for field, value in self._client.hgetall(self._day(day.strftime("%Y%m%d"))).items():
+            field = field.decode() if isinstance(field, bytes) else field
+            rest, _, metric = field.rpartition("|")
+            stage, _, model = rest.partition("|")
+            if metric in METRICS:
+                out.setdefault((stage, model), {m: 0.0 for m in METRICS})[metric] = float(value)
+        return out
+
+
+@dataclass(frozen=True)
+class ReconciliationRow:
+    stage: str
+    model: str
+    calls: int
+    estimated_prompt_tokens: int
+    prompt_tokens: int
+    # (추정 - 실제) / 실제: 양수면 과대 추정
+    prompt_error_ratio: Optional[float]
+    # Σ|추정 - 실제| / Σ실제: 호출별 오차 크기
+    prompt_abs_error_ratio: Optional[float]
+    completion_tokens: int
+    # 실제 completion / max_tokens: 낮을수록 예산 판정이 completion을 과하게 잡는다
+    completion_fill_ratio: Optional[float]
+    cached_tokens: int
+    estimated_cost_usd: float
+    cost_usd: float
+    # 사전 추정 비용 / 실제 비용: 1보다 크면 예산 여유분
+    cost_headroom_ratio: Optional[float]
+
+
+def _ratio(num: float, den: float) -> Optional[float]:
+    return round(num / den, 4) if den else None
+
+
+def reconciliation_report(reconciler: UsageReconciler, day: date) -> List[ReconciliationRow]:
+    """하루치 단계/모델별 대조 결과 (단계, 모델 순 정렬)."""
+    rows: List[ReconciliationRow] = []
+    for (stage, model), t in sorted(reconciler.totals(day).items()):
+        get = lambda m: t.get(m, 0.0)  # noqa: E731
+        rows.append(
+            ReconciliationRow(
+                stage=stage,
+                model=model,
+                calls=int(get("calls")),
+                estimated_prompt_tokens=int(get("estimated_prompt_tokens")),
+                prompt_tokens=int(get("prompt_tokens")),
+                prompt_error_ratio=_ratio(get("estimated_prompt_tokens") - get("prompt_tokens"), get("prompt_tokens")),
+                prompt_abs_error_ratio=_ratio(get("prompt_abs_error"), get("prompt_tokens")),
+                completion_tokens=int(get("completion_tokens")),
+                completion_fill_ratio=_ratio(get("completion_tokens"), get("max_tokens")),
+                cached_tokens=int(get("cached_tokens")),
+                estimated_cost_usd=round(get("estimated_cost_usd"), 6),
+                cost_usd=round(get("cost_usd"), 6),
+                cost_headroom_ratio=_ratio(get("estimated_cost_usd"), get("cost_usd")),
+            )
+        )
+    return rows
+
+
+_REDIS = RedisConnector("llm.reconcile")
+
+
+@lru_cache()
+def _local_reconciler() -> InMemoryUsageReconciler:
+    return InMemoryUsageReconciler()
+
+
+def get_usage_reconciler() -> UsageReconciler:
+    """`LLM_LEDGER_REDIS_URL`이 설정되어 있고 연결되면 Redis 저장소, 아니면 메모리 저장소 (장부와 같은 재연결 규칙)."""
+    url = get_analysis_settings().llm_ledger_redis_url
+    client = _REDIS.get(url) if url else None
+    return RedisUsageReconciler(client) if client is not None else _local_reconciler()
+
+
+def reset_usage_reconciler_cache() -> None:
+    _REDIS.reset()
+    _local_reconciler.cache_clear()  # type: ignore[attr-defined]
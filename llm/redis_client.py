@@ -0,0 +1,77 @@
+"""Redis 연결 공용 헬퍼.
+
+지출 장부, usage 대조, 임베딩 캐시, 수집량 모니터는 모두 "설정된 Redis에 연결되면 공유 저장소,
+아니면 프로세스 로컬 저장소"로 동작한다. 연결 확인과 폴백 경고를 한곳에서 처리한다.
+`RedisConnector`는 연결된 클라이언트만 캐시하고, 실패는 `RECONNECT_INTERVAL_SECONDS` 동안만 기억한다
+(기동 시 한 번의 장애로 프로세스 수명 내내 로컬 저장소에 머무르지 않도록).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 태스크/요청 경로가 Redis 장애로 오래 멈추지 않도록 연결 대기는 짧게
+_CONNECT_TIMEOUT_SECONDS = 0.2
+# 연결 실패 후 다시 시도하기까지의 간격 (그동안은 폴백 저장소 사용)
+RECONNECT_INTERVAL_SECONDS = 30.0
+
+
+def connect_redis(url: str, *, component: str) -> Optional[Any]:
+    """`url`에 연결해 ping까지 성공한 클라이언트를 반환한다.
+
+    라이브러리 부재/연결 실패 시 `redis.fallback` 경고를 남기고 None (호출자는 메모리 저장소로 폴백).
+    """
+    try:
+        import redis as redislib  # type: ignore
+
+        client = redislib.Redis.from_url(url, socket_connect_timeout=_CONNECT_TIMEOUT_SECONDS)
+        client.ping()
+        return client
+    except Exception as exc:
+        logger.warning("redis.fallback", extra={"component": component, "error": str(exc)})
+        return None
+
+
+class RedisConnector:
+    """URL별 Redis 클라이언트 캐시 (연결된 클라이언트만 캐시, 실패하면 `retry_seconds` 뒤 다시 연결)."""
+
+    def __init__(
+        self,
+        component: str,
+        *,
+        retry_seconds: float = RECONNECT_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.component = component
+        self.retry_seconds = float(retry_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._clients: Dict[str, Any] = {}
+        self._retry_at: Dict[str, float] = {}
+
+    def get(self, url: str) -> Optional[Any]:
+        """연결된 클라이언트, 연결할 수 없으면 None (폴백 중에는 주기마다 `redis.fallback` 경고)."""
+        with self._lock:
+            client = self._clients.get(url)
+            if client is not None:
+                return client
+            if self._clock() < self._retry_at.get(url, 0.0):
+                return None
+        client = connect_redis(url, component=self.component)
+        with self._lock:
+            if client is None:
+                self._retry_at[url] = self._clock() + self.retry_seconds
+                return None
+            if self._retry_at.pop(url, None) is not None:
+                logger.info("redis.reconnected", extra={"component": self.component})
+            return self._clients.setdefault(url, client)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._clients.clear()
+            self._retry_at.clear()
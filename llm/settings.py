@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Optional
+from typing import Dict, List, Literal, Optional
 
-from pydantic import Field, PositiveFloat, PositiveInt, ValidationError, field_validator
+from pydantic import Field, NonNegativeInt, PositiveFloat, PositiveInt, ValidationError, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -22,6 +22,11 @@ class AnalysisSettings(BaseSettings):
     )
 
     openai_api_key: str = Field(..., alias="OPENAI_API_KEY", description="OpenAI API key")
+    openai_base_url: Optional[str] = Field(
+        None,
+        alias="OPENAI_BASE_URL",
+        description="OpenAI-compatible endpoint (e.g. the local fake server); unset uses api.openai.com",
+    )
     analysis_model: str = Field("gpt-4o-mini", alias="ANALYSIS_MODEL", description="OpenAI model name")
     analysis_max_tokens: PositiveInt = Field(512, alias="ANALYSIS_MAX_TOKENS", description="Max completion tokens")
     analysis_temperature: PositiveFloat = Field(0.2, alias="ANALYSIS_TEMPERATURE", description="Sampling temperature")
@@ -29,10 +34,247 @@ class AnalysisSettings(BaseSettings):
     analysis_request_timeout_seconds: PositiveInt = Field(
         15,
         alias="ANALYSIS_REQUEST_TIMEOUT_SECONDS",
-        description="HTTP request timeout in seconds",
+        description="Total deadline per analyze call in seconds, across retries; the remainder is the transport timeout",
     )
     analysis_retry_max_attempts: PositiveInt = Field(2, alias="ANALYSIS_RETRY_MAX_ATTEMPTS", description="Max retry attempts")
+    analysis_retry_base_delay_seconds: PositiveFloat = Field(
+        0.5,
+        alias="ANALYSIS_RETRY_BASE_DELAY_SECONDS",
+        description="Base for exponential backoff between retries (full jitter)",
+    )
+    analysis_retry_max_delay_seconds: PositiveFloat = Field(
+        8.0,
+        alias="ANALYSIS_RETRY_MAX_DELAY_SECONDS",
+        description="Upper bound for a single backoff delay",
+    )
+    analysis_stream_parse: bool = Field(
+        False,
+        alias="ANALYSIS_STREAM_PARSE",
+        description="Stream analysis completions through an incremental parser and cancel provably invalid output early",
+    )
+    analysis_max_concurrency: PositiveInt = Field(
+        8,
+        alias="ANALYSIS_MAX_CONCURRENCY",
+        description="Max in-flight LLM requests for bulk (analyze_many) analysis",
+    )
     default_locale: str = Field("ko_KR", alias="DEFAULT_LOCALE", description="Default locale for prompts")
+    analysis_prompt_token_budget: Optional[PositiveInt] = Field(
+        None,
+        alias="ANALYSIS_PROMPT_TOKEN_BUDGET",
+        description="Token budget for packed articles; unset keeps the legacy max_chars trimming",
+    )
+    analysis_packer_top_k: PositiveInt = Field(5, alias="ANALYSIS_PACKER_TOP_K", description="Articles kept by the packer")
+    analysis_candidate_articles: PositiveInt = Field(
+        5,
+        alias="ANALYSIS_CANDIDATE_ARTICLES",
+        description="Recent articles considered per analysis run",
+    )
+    analysis_diversity_enabled: bool = Field(
+        False,
+        alias="ANALYSIS_DIVERSITY_ENABLED",
+        description="Pick semantically distinct articles with embeddings + MMR instead of the newest N",
+    )
+    analysis_diversity_pool: PositiveInt = Field(
+        20,
+        alias="ANALYSIS_DIVERSITY_POOL",
+        description="Recent articles embedded as MMR candidates (reaches further back than the slot count)",
+    )
+    analysis_diversity_lambda: float = Field(
+        0.7,
+        ge=0.0,
+        le=1.0,
+        alias="ANALYSIS_DIVERSITY_LAMBDA",
+        description="MMR trade-off: 1 favours recency, 0 favours diversity",
+    )
+    analysis_diversity_duplicate_threshold: float = Field(
+        0.9,
+        gt=0.0,
+        le=1.0,
+        alias="ANALYSIS_DIVERSITY_DUPLICATE_THRESHOLD",
+        description="Cosine similarity at or above which a candidate is treated as the same story and dropped",
+    )
+    analysis_embedding_cache_redis_url: Optional[str] = Field(
+        None,
+        alias="ANALYSIS_EMBEDDING_CACHE_REDIS_URL",
+        description="Redis DSN for the shared article embedding cache; unset keeps a process-local cache",
+    )
+    analysis_delta_enabled: bool = Field(
+        False,
+        alias="ANALYSIS_DELTA_ENABLED",
+        description="Update the previous insight with only new articles instead of a full rebuild",
+    )
+    analysis_delta_max_depth: PositiveInt = Field(
+        4,
+        alias="ANALYSIS_DELTA_MAX_DEPTH",
+        description="Consecutive delta updates before a full rebuild",
+    )
+    analysis_delta_drift_threshold: PositiveFloat = Field(
+        0.5,
+        alias="ANALYSIS_DELTA_DRIFT_THRESHOLD",
+        description="Sentiment change in a delta update that triggers an immediate full rebuild",
+    )
+    analysis_mapreduce_threshold: NonNegativeInt = Field(
+        0,
+        alias="ANALYSIS_MAPREDUCE_THRESHOLD",
+        description="Switch to map-reduce when a ticker has more recent articles than this (0 disables)",
+    )
+    analysis_mapreduce_max_articles: PositiveInt = Field(
+        60,
+        alias="ANALYSIS_MAPREDUCE_MAX_ARTICLES",
+        description="Recent articles covered by a map-reduce run",
+    )
+    analysis_map_cluster_size: PositiveInt = Field(5, alias="ANALYSIS_MAP_CLUSTER_SIZE", description="Articles per map call")
+    analysis_map_model: str = Field("gpt-4o-mini", alias="ANALYSIS_MAP_MODEL", description="Cheap model for map calls")
+    analysis_map_max_tokens: PositiveInt = Field(256, alias="ANALYSIS_MAP_MAX_TOKENS", description="Max tokens per map call")
+    analysis_map_concurrency: PositiveInt = Field(4, alias="ANALYSIS_MAP_CONCURRENCY", description="Parallel map calls")
+    analysis_map_cost_limit_usd: PositiveFloat = Field(
+        0.005,
+        alias="ANALYSIS_MAP_COST_LIMIT_USD",
+        description="Per-call cost cap for map calls (USD)",
+    )
+    analysis_map_stage_cost_limit_usd: PositiveFloat = Field(
+        0.05,
+        alias="ANALYSIS_MAP_STAGE_COST_LIMIT_USD",
+        description="Estimated cost cap for the whole map stage (USD); oldest clusters are dropped to fit",
+    )
+    analysis_reduce_cost_limit_usd: PositiveFloat = Field(
+        0.02,
+        alias="ANALYSIS_REDUCE_COST_LIMIT_USD",
+        description="Cost cap for the reduce call (USD)",
+    )
+    analysis_group_max_tickers: PositiveInt = Field(
+        5,
+        alias="ANALYSIS_GROUP_MAX_TICKERS",
+        description="Tickers packed into one grouped (multi-ticker) analysis request",
+    )
+    analysis_group_max_articles: PositiveInt = Field(
+        2,
+        alias="ANALYSIS_GROUP_MAX_ARTICLES",
+        description="Only tickers with at most this many recent articles are grouped; others run alone",
+    )
+    analysis_schedule_top_n: PositiveInt = Field(
+        20,
+        alias="ANALYSIS_SCHEDULE_TOP_N",
+        description="Tickers dispatched per scheduler cycle (highest demand first, within the LLM budget)",
+    )
+    analysis_schedule_stale_hours: PositiveFloat = Field(
+        24.0,
+        alias="ANALYSIS_SCHEDULE_STALE_HOURS",
+        description="Hours since the last insight at which the staleness score saturates",
+    )
+    analysis_schedule_min_subscribers: PositiveInt = Field(
+        1,
+        alias="ANALYSIS_SCHEDULE_MIN_SUBSCRIBERS",
+        description="Tickers with fewer active subscriptions are never scheduled",
+    )
+    analysis_schedule_lookback_hours: PositiveFloat = Field(
+        48.0,
+        alias="ANALYSIS_SCHEDULE_LOOKBACK_HOURS",
+        description="Only articles collected within this window count as unanalysed backlog",
+    )
+    analysis_extractive_ratio: Optional[float] = Field(
+        None,
+        gt=0.0,
+        le=1.0,
+        alias="ANALYSIS_EXTRACTIVE_RATIO",
+        description="Compress article bodies to about this fraction with extractive summarisation (unset disables)",
+    )
+    analysis_prescreen_threshold: Optional[float] = Field(
+        None,
+        gt=0.0,
+        le=1.0,
+        alias="ANALYSIS_PRESCREEN_THRESHOLD",
+        description="Skip the LLM when the local lexicon/event/novelty signal is below this (unset disables)",
+    )
+    analysis_prescreen_action: Literal["skip", "template"] = Field(
+        "skip",
+        alias="ANALYSIS_PRESCREEN_ACTION",
+        description="Below the pre-screen threshold: skip (no insight) or template (low-cost templated insight)",
+    )
+    analysis_extractive_min_chars: PositiveInt = Field(
+        400,
+        alias="ANALYSIS_EXTRACTIVE_MIN_CHARS",
+        description="Only bodies longer than this are pre-summarised",
+    )
+    analysis_cascade_models: List[str] = Field(
+        default_factory=list,
+        alias="ANALYSIS_CASCADE_MODELS",
+        description='Cheap-first model cascade, JSON array (e.g. ["gpt-4o-mini", "gpt-4.1"]); fewer than 2 disables',
+    )
+    analysis_cascade_min_confidence: float = Field(
+        0.6,
+        ge=0.0,
+        le=1.0,
+        alias="ANALYSIS_CASCADE_MIN_CONFIDENCE",
+        description="Escalate to the next model when the reported confidence is below this",
+    )
+    analysis_cascade_anomaly_threshold: float = Field(
+        0.7,
+        ge=0.0,
+        le=1.0,
+        alias="ANALYSIS_CASCADE_ANOMALY_THRESHOLD",
+        description="Escalate to the next model when any anomaly scores at least this",
+    )
+    llm_daily_budget_usd: Optional[PositiveFloat] = Field(
+        None,
+        alias="LLM_DAILY_BUDGET_USD",
+        description="Cluster-wide LLM spend cap per UTC day (USD); unset disables",
+    )
+    llm_hourly_budget_usd: Optional[PositiveFloat] = Field(
+        None,
+        alias="LLM_HOURLY_BUDGET_USD",
+        description="Cluster-wide LLM spend cap per hour (USD); unset disables",
+    )
+    llm_budget_fallback_model: Optional[str] = Field(
+        "gpt-4o-mini",
+        alias="LLM_BUDGET_FALLBACK_MODEL",
+        description="Cheaper model used when the requested one no longer fits the remaining budget",
+    )
+    llm_budget_exhausted_action: Literal["defer", "reject"] = Field(
+        "defer",
+        alias="LLM_BUDGET_EXHAUSTED_ACTION",
+        description="What to do when even the fallback model exceeds the budget",
+    )
+    llm_ledger_redis_url: Optional[str] = Field(
+        None,
+        alias="LLM_LEDGER_REDIS_URL",
+        description="Redis DSN for the shared spend ledger; unset keeps a process-local ledger",
+    )
+    llm_prices: Dict[str, Dict[str, float]] = Field(
+        default_factory=dict,
+        alias="LLM_PRICES",
+        description='USD per 1K tokens by model, JSON object (e.g. {"gpt-4o": {"prompt": 0.0025, "completion": 0.01}})',
+    )
+    llm_prices_file: Optional[str] = Field(
+        None,
+        alias="LLM_PRICES_FILE",
+        description="JSON file with the same shape as LLM_PRICES; LLM_PRICES entries override it",
+    )
+    llm_tokenizer: Literal["auto", "tiktoken", "heuristic"] = Field(
+        "auto",
+        alias="LLM_TOKENIZER",
+        description="Pre-flight token counter: tiktoken, the chars/4 heuristic, or auto (tiktoken when available)",
+    )
+    llm_audit_enabled: bool = Field(
+        False,
+        alias="LLM_AUDIT_ENABLED",
+        description="Store every LLM request/response pair (compressed, deduplicated) under LOCAL_STORAGE_ROOT",
+    )
+    llm_audit_max_bytes: PositiveInt = Field(
+        512 * 1024 * 1024,
+        alias="LLM_AUDIT_MAX_BYTES",
+        description="Size cap for stored audit blobs; the oldest records are pruned beyond it",
+    )
+    llm_audit_queue_size: PositiveInt = Field(
+        1000,
+        alias="LLM_AUDIT_QUEUE_SIZE",
+        description="Pending audit writes held for the background writer; entries beyond it are dropped",
+    )
+    analysis_source_weights: Dict[str, float] = Field(
+        default_factory=dict,
+        alias="ANALYSIS_SOURCE_WEIGHTS",
+        description='Source quality by domain, JSON object (e.g. {"reuters.com": 1.0})',
+    )
 
     @field_validator("openai_api_key")
     @classmethod
@@ -42,6 +284,28 @@ class AnalysisSettings(BaseSettings):
             raise ValueError("OPENAI_API_KEY는 공백일 수 없습니다.")
         return s
 
+    @field_validator("analysis_source_weights")
+    @classmethod
+    def _weights_in_range(cls, v: Dict[str, float]) -> Dict[str, float]:
+        out: Dict[str, float] = {}
+        for domain, weight in v.items():
+            if not 0.0 <= float(weight) <= 1.0:
+                raise ValueError("ANALYSIS_SOURCE_WEIGHTS 값은 0~1 사이여야 합니다.")
+            out[domain.strip().lower()] = float(weight)
+        return out
+
+    @field_validator("llm_prices")
+    @classmethod
+    def _prices_complete(cls, v: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+        for model, price in v.items():
+            if "prompt" not in price or "completion" not in price:
+                raise ValueError(f"LLM_PRICES[{model}]에는 prompt/completion 단가가 필요합니다.")
+            if any(float(value) < 0 for value in price.values()):
+                raise ValueError(f"LLM_PRICES[{model}] 단가는 음수일 수 없습니다.")
+            if "batch_ratio" in price and not 0 < float(price["batch_ratio"]) <= 1:
+                raise ValueError(f"LLM_PRICES[{model}] batch_ratio는 0 초과 1 이하여야 합니다.")
+        return v
+
 
 @lru_cache()
 def get_analysis_settings() -> AnalysisSettings:
@@ -0,0 +1,87 @@
+"""호출 전 토큰 수 추정용 토크나이저 (교체 가능).
+
+- `HeuristicTokenizer`: 글자 수/4 (올림). 외부 의존성 없음, 가짜 서버와 같은 규칙
+- `TiktokenTokenizer`: `tiktoken`이 설치되어 있으면 모델 인코딩으로 정확히 센다
+  (채팅 메시지는 OpenAI 형식의 메시지당/응답 프라이밍 오버헤드 포함)
+
+`LLM_TOKENIZER=auto`(기본)는 tiktoken을 쓸 수 있으면 tiktoken, 아니면 휴리스틱이다.
+예산 판정/비용 상한/스트리밍 사전 검사와 프롬프트 패킹이 이 추정치를 쓴다.
+"""
+
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import Any, Dict, List, Protocol
+
+# tiktoken이 모델을 모를 때 쓰는 인코딩 (gpt-4o/4.1 계열)
+_DEFAULT_ENCODING = "o200k_base"
+# OpenAI 채팅 형식: 메시지마다 역할/구분 토큰, 응답 시작에 프라이밍 토큰
+_TOKENS_PER_MESSAGE = 3
+_REPLY_PRIMING_TOKENS = 3
+
+
+class Tokenizer(Protocol):
+    name: str
+
+    def count(self, text: str) -> int: ...
+
+    def count_messages(self, messages: List[Dict[str, Any]]) -> int: ...
+
+
+def _content(message: Any) -> str:
+    return str(message.get("content", "") or "") if isinstance(message, dict) else ""
+
+
+class HeuristicTokenizer:
+    """길이 기반 보수적 추정 (약 4자당 1토큰)."""
+
+    name = "heuristic"
+
+    def count(self, text: str) -> int:
+        return max(1, math.ceil(len(text) / 4)) if text else 0
+
+    def count_messages(self, messages: List[Dict[str, Any]]) -> int:
+        return max(1, math.ceil(sum(len(_content(m)) for m in messages) / 4))
+
+
+class TiktokenTokenizer:
+    """tiktoken 인코딩 기반 정확한 토큰 수."""
+
+    name = "tiktoken"
+
+    def __init__(self, model: str) -> None:
+        import tiktoken  # type: ignore
+
+        try:
+            self._encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            self._encoding = tiktoken.get_encoding(_DEFAULT_ENCODING)
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=())) if text else 0
+
+    def count_messages(self, messages: List[Dict[str, Any]]) -> int:
+        total = _REPLY_PRIMING_TOKENS
+        for message in messages:
+            total += _TOKENS_PER_MESSAGE + self.count(_content(message))
+            if isinstance(message, dict) and message.get("name"):
+                total += self.count(str(message["name"])) + 1
+        return total
+
+
+@lru_cache(maxsize=32)
+def get_tokenizer(kind: str = "auto", model: str = "") -> Tokenizer:
+    """`kind`: auto | tiktoken | heuristic. auto는 tiktoken을 못 쓰면 휴리스틱으로 폴백.
+
+    tiktoken은 첫 사용 시 인코딩 파일을 내려받으므로, auto에서는 설치되지 않은 경우뿐 아니라
+    로드 실패(오프라인 등)도 폴백한다.
+    """
+    if kind == "heuristic":
+        return HeuristicTokenizer()
+    try:
+        return TiktokenTokenizer(model)
+    except Exception:
+        if kind == "tiktoken":
+            raise
+        return HeuristicTokenizer()
@@ -0,0 +1,126 @@
+"""사전 선별(analysis.prescreen) 백테스트: 과거 LLM 인사이트와 비교.
+
+저장된 ProcessedInsight마다 그 입력 기사(source_refs)와 직전 인사이트로 사전 선별 점수를 다시 계산하고,
+임계값별로 "LLM 호출/생략" 결정을 실제 LLM 결과의 게시 여부(`publish.materializer._infer_status`)와 비교한다.
+- skip_draft: 생략했고 실제로도 draft → 절약 (좋음)
+- skip_published: 생략했지만 실제로는 게시됨 → 놓친 신호
+- llm_draft / llm_published: 호출 유지
+생략 비율, 게시 인사이트 재현율(published_recall), 절약 비용(생략된 인사이트의 llm_cost 합)을 JSON으로 출력한다.
+
+Usage:
+  uv run -- python -m scripts.backtest_prescreen --thresholds 0.2,0.3,0.4 --days 30 [--ticker AAPL]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import select
+
+from analysis.prescreen import previous_text, score_articles
+from ingestion.db.models import ProcessedInsight, RawArticle
+from ingestion.db.session import session_scope
+from publish.materializer import _infer_status
+
+# LLM 없이 만들어진 인사이트는 비교 대상이 아니다
+_EXCLUDED_MODES = ("template",)
+_MAX_MISSED = 20
+
+
+@dataclass(frozen=True)
+class Sample:
+    insight_id: str
+    ticker: str
+    signal: float
+    published: bool
+    cost: float
+
+
+def load_samples(*, ticker: Optional[str] = None, days: Optional[int] = None) -> List[Sample]:
+    samples: List[Sample] = []
+    with session_scope() as session:
+        stmt = select(ProcessedInsight).where(ProcessedInsight.analysis_mode.not_in(_EXCLUDED_MODES))
+        if ticker:
+            stmt = stmt.where(ProcessedInsight.ticker == ticker.upper())
+        if days:
+            stmt = stmt.where(ProcessedInsight.generated_at >= datetime.now(timezone.utc) - timedelta(days=days))
+        stmt = stmt.order_by(ProcessedInsight.ticker, ProcessedInsight.generated_at)
+        previous: Dict[str, ProcessedInsight] = {}
+        for insight in session.execute(stmt).scalars():
+            urls = [ref.get("url") for ref in insight.source_refs or [] if ref.get("url")]
+            rows = (
+                list(
+                    session.execute(
+                        select(RawArticle).where(RawArticle.ticker == insight.ticker, RawArticle.url.in_(urls))
+                    ).scalars()
+                )
+                if urls
+                else []
+            )
+            if rows:
+                score = score_articles(rows, previous=previous_text(previous.get(insight.ticker)))
+                samples.append(
+                    Sample(
+                        insight_id=str(insight.id),
+                        ticker=insight.ticker,
+                        signal=score.signal,
+                        published=_infer_status(insight) == "published",
+                        cost=float(insight.llm_cost or 0.0),
+                    )
+                )
+            previous[insight.ticker] = insight
+    return samples
+
+
+def evaluate(samples: Sequence[Sample], thresholds: Sequence[float]) -> List[dict]:
+    report: List[dict] = []
+    published_total = sum(1 for s in samples if s.published)
+    for threshold in thresholds:
+        confusion: Dict[str, int] = defaultdict(int)
+        saved = 0.0
+        missed: List[str] = []
+        for s in samples:
+            decision = "llm" if s.signal >= threshold else "skip"
+            confusion[f"{decision}_{'published' if s.published else 'draft'}"] += 1
+            if decision == "skip":
+                saved += s.cost
+                if s.published and len(missed) < _MAX_MISSED:
+                    missed.append(s.insight_id)
+        skipped = confusion["skip_draft"] + confusion["skip_published"]
+        report.append(
+            {
+                "threshold": threshold,
+                "samples": len(samples),
+                "confusion": {k: confusion[k] for k in ("skip_draft", "skip_published", "llm_draft", "llm_published")},
+                "skip_rate": round(skipped / len(samples), 4) if samples else None,
+                "published_recall": (
+                    round(confusion["llm_published"] / published_total, 4) if published_total else None
+                ),
+                "saved_cost_usd": round(saved, 6),
+                "missed_insight_ids": missed,
+            }
+        )
+    return report
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="사전 선별 결정과 과거 LLM 결과 비교")
+    parser.add_argument("--thresholds", default="0.2,0.3,0.4,0.5", help="쉼표로 구분한 임계값 (default: 0.2,0.3,0.4,0.5)")
+    parser.add_argument("--ticker", help="특정 티커만 평가")
+    parser.add_argument("--days", type=int, help="최근 N일 인사이트만 평가")
+    args = parser.parse_args(argv)
+
+    thresholds = [float(t) for t in args.thresholds.split(",") if t.strip()]
+    samples = load_samples(ticker=args.ticker, days=args.days)
+    print(json.dumps({"thresholds": evaluate(samples, thresholds)}, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
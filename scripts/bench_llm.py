@@ -0,0 +1,299 @@
+"""분석/채팅 경로 처리량 벤치마크 (가짜 LLM 서버 대상).
+
+가짜 OpenAI 호환 서버(`llm.fake_server`)를 띄우고(또는 `--base-url`로 기존 서버 사용)
+1. 임시 SQLite에 티커별 기사를 적재한 뒤 `analyze_core`를 동시에 실행
+2. API 서버(`api.main`)를 띄워 채팅 세션을 만들고 WebSocket으로 대화를 주고받음
+처리량(req/s), p50/p95 지연, 채팅 첫 청크 지연, 비용 집계 정확도
+(지출 장부 기록액 ÷ 서버가 실제 응답한 토큰으로 계산한 비용)를 출력한다.
+
+Usage:
+  uv run -- python -m scripts.bench_llm --tickers 20 --concurrency 8 \\
+      --chat-sessions 10 --chat-turns 3 --latency-ms 300 --tokens-per-second 80 --error-rate 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _serve_in_thread(app: Any, port: int) -> Any:
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"서버 기동 실패 (port {port})")
+        time.sleep(0.05)
+    return server
+
+
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    """nearest-rank 백분위수."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _phase_report(latencies: List[float], errors: Dict[str, int], wall: float) -> Dict[str, Any]:
+    done = len(latencies)
+    return {
+        "requests": done + sum(errors.values()),
+        "ok": done,
+        "errors": errors,
+        "wall_seconds": round(wall, 3),
+        "throughput_rps": round(done / wall, 3) if wall > 0 else None,
+        "p50_seconds": _percentile(latencies, 50),
+        "p95_seconds": _percentile(latencies, 95),
+    }
+
+
+def _configure_env(args: argparse.Namespace, workdir: str, base_url: str) -> None:
+    os.environ["OPENAI_BASE_URL"] = base_url
+    os.environ.setdefault("OPENAI_API_KEY", "sk-fake")
+    os.environ["POSTGRES_DSN"] = f"sqlite:///{workdir}/bench_ingestion.db"
+    os.environ["DATABASE_URL"] = f"sqlite:///{workdir}/bench_portal.db"
+    os.environ.setdefault("INGESTION_REDIS_URL", "redis://localhost:6379/0")
+    if args.model:
+        os.environ["ANALYSIS_MODEL"] = args.model
+
+    from ingestion.settings import reset_settings_cache
+    from llm.ledger import reset_spend_ledger_cache
+    from llm.settings import reset_analysis_settings_cache
+
+    reset_settings_cache()
+    reset_analysis_settings_cache()
+    reset_spend_ledger_cache()
+
+
+def _seed_articles(tickers: List[str], per_ticker: int) -> None:
+    from ingestion.db.models import Base, RawArticle
+    from ingestion.db.session import get_engine, session_scope
+
+    Base.metadata.create_all(bind=get_engine())
+    now = datetime.now(timezone.utc)
+    with session_scope() as session:
+        for ticker in tickers:
+            for i in range(per_ticker):
+                session.add(
+                    RawArticle(
+                        ticker=ticker,
+                        source="bench",
+                        source_type="news",
+                        title=f"{ticker} quarterly update {i}: revenue guidance and supply outlook",
+                        body=(
+                            f"{ticker} reported results for segment {i}. Analysts discussed margins, "
+                            "demand recovery, inventory levels and pricing pressure. " * 4
+                        ),
+                        url=f"https://bench.example.com/{ticker.lower()}/{i}",
+                        fingerprint=f"bench-{ticker}-{i}",
+                        collected_at=now,
+                        language="en",
+                    )
+                )
+
+
+def _run_analyze(tickers: List[str], concurrency: int) -> Dict[str, Any]:
+    from analysis.tasks.analyze import analyze_core
+
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    lock = threading.Lock()
+
+    def _one(ticker: str) -> None:
+        started = time.perf_counter()
+        try:
+            analyze_core(ticker, force=True)
+        except Exception as exc:
+            with lock:
+                errors[type(exc).__name__] = errors.get(type(exc).__name__, 0) + 1
+            return
+        with lock:
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(_one, tickers))
+    return _phase_report(latencies, errors, time.perf_counter() - started)
+
+
+async def _chat_session(
+    api_base: str, insight_id: str, turns: int, results: Dict[str, Any]
+) -> None:
+    import websockets
+
+    async with httpx.AsyncClient(base_url=api_base, timeout=30.0) as http:
+        resp = await http.post("/api/chat/sessions", json={"insight_id": insight_id})
+        resp.raise_for_status()
+        session_id = resp.json()["session_id"]
+
+    ws_url = api_base.replace("http://", "ws://", 1) + f"/api/chat/ws/{session_id}"
+    async with websockets.connect(ws_url) as ws:
+        for turn in range(turns):
+            started = time.perf_counter()
+            first_chunk: Optional[float] = None
+            await ws.send(json.dumps({"type": "message", "content": f"이 리포트의 리스크 요인은? ({turn})"}))
+            while True:
+                data = json.loads(await ws.recv())
+                if data["type"] == "chunk":
+                    if first_chunk is None:
+                        first_chunk = time.perf_counter() - started
+                    continue
+                if data["type"] == "done":
+                    results["latencies"].append(time.perf_counter() - started)
+                    if first_chunk is not None:
+                        results["ttft"].append(first_chunk)
+                else:
+                    code = data.get("code") or "error"
+                    results["errors"][code] = results["errors"].get(code, 0) + 1
+                break
+
+
+def _run_chat(api_base: str, insight_ids: List[str], sessions: int, turns: int) -> Dict[str, Any]:
+    results: Dict[str, Any] = {"latencies": [], "ttft": [], "errors": {}}
+
+    async def _all() -> None:
+        await asyncio.gather(
+            *(
+                _chat_session(api_base, insight_ids[i % len(insight_ids)], turns, results)
+                for i in range(sessions)
+            )
+        )
+
+    started = time.perf_counter()
+    asyncio.run(_all())
+    report = _phase_report(results["latencies"], results["errors"], time.perf_counter() - started)
+    report["ttft_p50_seconds"] = _percentile(results["ttft"], 50)
+    report["ttft_p95_seconds"] = _percentile(results["ttft"], 95)
+    return report
+
+
+def _cost_accuracy(base_url: str) -> Dict[str, Any]:
+    """서버가 실제 응답한 토큰 기준 비용과 지출 장부/인사이트 기록액을 비교."""
+    from sqlalchemy import func, select
+
+    from ingestion.db.models import ProcessedInsight
+    from ingestion.db.session import session_scope
+    from llm.ledger import get_spend_ledger
+    from llm.pricing import get_price_table
+
+    usage = httpx.get(base_url.rsplit("/v1", 1)[0] + "/_fake/stats", timeout=10.0).json()["usage"]
+    actual: Dict[str, float] = {"analysis": 0.0, "chat": 0.0}
+    prices = get_price_table()
+    for row in usage:
+        if row["endpoint"] == "embeddings":
+            continue
+        kind = "chat" if row["endpoint"].endswith(".stream") else "analysis"
+        actual[kind] += prices.cost(
+            row["model"], row["prompt_tokens"], row["completion_tokens"], row.get("cached_tokens", 0)
+        )
+
+    breakdown = get_spend_ledger().breakdown(datetime.now(timezone.utc).date())
+    recorded = {"analysis": 0.0, "chat": 0.0}
+    for stage, models in breakdown.items():
+        recorded["chat" if stage == "chat" else "analysis"] += sum(models.values())
+    with session_scope() as session:
+        insight_cost = float(session.scalar(select(func.coalesce(func.sum(ProcessedInsight.llm_cost), 0.0))) or 0.0)
+
+    def _ratio(a: float, b: float) -> Optional[float]:
+        return round(a / b, 4) if b else None
+
+    return {
+        "server_usage": usage,
+        "actual_usd": {k: round(v, 6) for k, v in actual.items()},
+        "ledger_usd": {k: round(v, 6) for k, v in recorded.items()},
+        "insight_usd": round(insight_cost, 6),
+        # 1.0이면 정확; 채팅은 스트림 usage 대신 글자 수 추정이므로 오차가 생길 수 있다
+        "ledger_accuracy": {k: _ratio(recorded[k], actual[k]) for k in actual},
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="LLM 분석/채팅 처리량 벤치마크")
+    parser.add_argument("--base-url", help="기존 OpenAI 호환 서버 (예: http://127.0.0.1:8089/v1); 없으면 가짜 서버를 띄움")
+    parser.add_argument("--tickers", type=int, default=10, help="분석할 티커 수 (default: 10)")
+    parser.add_argument("--articles", type=int, default=5, help="티커당 기사 수 (default: 5)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 analyze_core 수 (default: 4)")
+    parser.add_argument("--chat-sessions", type=int, default=5, help="동시 채팅 세션 수, 0이면 생략 (default: 5)")
+    parser.add_argument("--chat-turns", type=int, default=2, help="세션당 메시지 수 (default: 2)")
+    parser.add_argument("--model", help="ANALYSIS_MODEL 덮어쓰기")
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--tokens-per-second", type=float, default=100.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--invalid-json-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    base_url = args.base_url
+    if not base_url:
+        from llm.fake_server import FakeLLMConfig, create_app
+
+        config = FakeLLMConfig(
+            latency_ms=args.latency_ms,
+            tokens_per_second=args.tokens_per_second,
+            error_rate=args.error_rate,
+            invalid_json_rate=args.invalid_json_rate,
+            seed=args.seed,
+        )
+        port = _free_port()
+        _serve_in_thread(create_app(config), port)
+        base_url = f"http://127.0.0.1:{port}/v1"
+
+    with tempfile.TemporaryDirectory(prefix="bench_llm_") as workdir:
+        _configure_env(args, workdir, base_url)
+        tickers = [f"BT{i:03d}" for i in range(args.tickers)]
+        _seed_articles(tickers, args.articles)
+
+        report: Dict[str, Any] = {"base_url": base_url, "analyze": _run_analyze(tickers, args.concurrency)}
+
+        if args.chat_sessions > 0:
+            from sqlalchemy import select
+
+            from ingestion.db.models import ProcessedInsight
+            from ingestion.db.session import session_scope
+
+            with session_scope() as session:
+                insight_ids = [str(i) for i in session.scalars(select(ProcessedInsight.id)).all()]
+            if insight_ids:
+                import api.main as api_main
+
+                api_port = _free_port()
+                _serve_in_thread(api_main.app, api_port)
+                report["chat"] = _run_chat(
+                    f"http://127.0.0.1:{api_port}", insight_ids, args.chat_sessions, args.chat_turns
+                )
+            else:
+                report["chat"] = {"skipped": "저장된 인사이트 없음"}
+
+        report["cost"] = _cost_accuracy(base_url)
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0 if report["analyze"]["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
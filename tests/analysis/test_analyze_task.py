@@ -13,6 +13,7 @@ from llm.client.openai_client import PermanentLLMError
 from analysis.tasks import analyze as analyze_mod
 from ingestion.db.models import Base, RawArticle, ProcessedInsight, JobRun, JobStatus
 from ingestion.db.session import get_engine
+from llm.settings import reset_analysis_settings_cache
 
 
 @pytest.fixture(autouse=True)
@@ -32,6 +33,8 @@ def _setup_articles(tmp_path: Path):
     with SessionLocal() as session:
         # Cleanup any existing rows for idempotent setup
         session.query(RawArticle).delete()
+        session.query(ProcessedInsight).delete()
+        session.query(JobRun).delete()
         session.commit()
         now = datetime.now(timezone.utc)
         rows = [
@@ -142,3 +145,215 @@ def test_analyze_core_cost_limit_marks_jobrun(tmp_path: Path, monkeypatch):
         assert jr is not None
         assert jr.status == JobStatus.FAILED
         assert jr.error_message == "LLM 비용 상한 초과"
+
+
+def test_analyze_core_skips_unchanged_input(tmp_path: Path):
+    _setup_articles(tmp_path)
+    calls = []
+
+    def _provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append(payload)
+        return _provider_ok(payload)
+
+    analyze_mod.PROVIDER_FACTORY = lambda: _provider
+
+    assert analyze_mod.analyze_core("AAPL") == 1
+    assert analyze_mod.analyze_core("AAPL") == 0
+    assert len(calls) == 1
+
+    engine = get_engine()
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
+    with SessionLocal() as session:
+        statuses = [jr.status for jr in session.execute(select(JobRun).order_by(JobRun.started_at)).scalars()]
+        assert statuses == [JobStatus.SUCCEEDED, JobStatus.CACHED]
+        pi = session.execute(select(ProcessedInsight)).scalars().one()
+        assert pi.input_digest is not None and len(pi.input_digest) == 64
+
+    # a forced run or a different article set invokes the model again
+    assert analyze_mod.analyze_core("AAPL", force=True) == 1
+    assert analyze_mod.analyze_core("AAPL", max_chars=800) == 1
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize(
+    "env",
+    [
+        {"ANALYSIS_EXTRACTIVE_RATIO": "0.5"},
+        {"ANALYSIS_PROMPT_TOKEN_BUDGET": "2000"},
+        {"ANALYSIS_DIVERSITY_ENABLED": "true"},
+    ],
+)
+def test_analyze_core_reanalyzes_when_prompt_settings_change(tmp_path: Path, monkeypatch, env):
+    _setup_articles(tmp_path)
+    calls = []
+
+    def _provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append(payload)
+        return _provider_ok(payload)
+
+    analyze_mod.PROVIDER_FACTORY = lambda: _provider
+    analyze_mod.EMBEDDER_FACTORY = lambda: (lambda texts: [[1.0, float(i)] for i, _ in enumerate(texts)])
+    try:
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        reset_analysis_settings_cache()
+        assert analyze_mod.analyze_core("AAPL") == 1
+        assert analyze_mod.analyze_core("AAPL") == 0
+
+        knob = {
+            "ANALYSIS_EXTRACTIVE_RATIO": ("ANALYSIS_EXTRACTIVE_RATIO", "0.3"),
+            "ANALYSIS_PROMPT_TOKEN_BUDGET": ("ANALYSIS_PACKER_TOP_K", "2"),
+            "ANALYSIS_DIVERSITY_ENABLED": ("ANALYSIS_DIVERSITY_LAMBDA", "0.2"),
+        }[next(iter(env))]
+        monkeypatch.setenv(*knob)
+        reset_analysis_settings_cache()
+        assert analyze_mod.analyze_core("AAPL") == 1
+        assert len(calls) == 2
+    finally:
+        analyze_mod.EMBEDDER_FACTORY = None
+
+
+def _add_article(idx: int) -> None:
+    engine = get_engine()
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
+    with SessionLocal() as session:
+        session.add(
+            RawArticle(
+                ticker="AAPL",
+                source="news_api",
+                source_type="news",
+                title=f"Apple follow-up {idx}",
+                body=f"Follow-up body {idx}.",
+                url=f"https://example.com/n{idx}",
+                fingerprint=f"fp-n{idx}",
+                collected_at=datetime.now(timezone.utc),
+                language="en",
+            )
+        )
+        session.commit()
+
+
+def test_analyze_core_delta_updates_previous_insight(tmp_path: Path, monkeypatch):
+    _setup_articles(tmp_path)
+    monkeypatch.setenv("ANALYSIS_DELTA_ENABLED", "true")
+    monkeypatch.setenv("ANALYSIS_DELTA_MAX_DEPTH", "1")
+    reset_analysis_settings_cache()
+    payloads = []
+
+    def _provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        payloads.append(payload["messages"][1]["content"])
+        return _provider_ok(payload)
+
+    analyze_mod.PROVIDER_FACTORY = lambda: _provider
+    try:
+        assert analyze_mod.analyze_core("AAPL") == 1
+        _add_article(1)
+        assert analyze_mod.analyze_core("AAPL") == 1
+        _add_article(2)
+        assert analyze_mod.analyze_core("AAPL") == 1  # max depth reached -> full rebuild
+    finally:
+        reset_analysis_settings_cache()
+
+    assert "[Previous Insight]" not in payloads[0]
+    assert "[Previous Insight]" in payloads[1]
+    assert "Apple follow-up 1" in payloads[1] and "Apple beats expectations" not in payloads[1]
+    assert "[Previous Insight]" not in payloads[2]
+
+    engine = get_engine()
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
+    with SessionLocal() as session:
+        rows = session.execute(select(ProcessedInsight).order_by(ProcessedInsight.delta_depth)).scalars().all()
+        assert sorted((r.analysis_mode, r.delta_depth) for r in rows) == [("delta", 1), ("full", 0), ("full", 0)]
+
+
+def test_analyze_core_delta_drift_triggers_full_rebuild(tmp_path: Path, monkeypatch):
+    _setup_articles(tmp_path)
+    monkeypatch.setenv("ANALYSIS_DELTA_ENABLED", "true")
+    reset_analysis_settings_cache()
+    payloads = []
+
+    def _provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        content = payload["messages"][1]["content"]
+        payloads.append(content)
+        resp = _provider_ok(payload)
+        if "[Previous Insight]" in content:
+            data = json.loads(resp["choices"][0]["message"]["content"])
+            data["sentiment_score"] = -0.6  # previous was 0.6
+            resp["choices"][0]["message"]["content"] = json.dumps(data)
+        return resp
+
+    analyze_mod.PROVIDER_FACTORY = lambda: _provider
+    try:
+        analyze_mod.analyze_core("AAPL")
+        _add_article(1)
+        assert analyze_mod.analyze_core("AAPL") == 1
+    finally:
+        reset_analysis_settings_cache()
+
+    assert len(payloads) == 3  # full, drifted delta, full rebuild
+    engine = get_engine()
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
+    with SessionLocal() as session:
+        first, rebuilt = session.execute(select(ProcessedInsight).order_by(ProcessedInsight.generated_at)).scalars()
+        assert {first.analysis_mode, rebuilt.analysis_mode} == {"full"}
+        # 폐기한 델타 호출의 토큰/비용도 재분석 인사이트에 남는다
+        assert (rebuilt.llm_tokens_prompt, rebuilt.llm_tokens_completion) == (800, 400)
+        assert rebuilt.llm_cost == pytest.approx(2 * first.llm_cost)
+
+
+def test_analyze_core_uses_map_reduce_for_high_volume(tmp_path: Path, monkeypatch):
+    _setup_articles(tmp_path)
+    for idx in range(4):
+        _add_article(idx)
+    monkeypatch.setenv("ANALYSIS_MAPREDUCE_THRESHOLD", "5")
+    monkeypatch.setenv("ANALYSIS_MAP_CLUSTER_SIZE", "2")
+    reset_analysis_settings_cache()
+    payloads = []
+
+    def _provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        payloads.append(payload["messages"][1]["content"])
+        return _provider_ok(payload)
+
+    analyze_mod.PROVIDER_FACTORY = lambda: _provider
+    try:
+        assert analyze_mod.analyze_core("AAPL") == 1
+    finally:
+        reset_analysis_settings_cache()
+
+    assert len(payloads) == 4  # 3 map calls over 6 articles + reduce
+    engine = get_engine()
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
+    with SessionLocal() as session:
+        pi = session.execute(select(ProcessedInsight)).scalars().one()
+        assert pi.analysis_mode == "mapred"
+        assert len(pi.source_refs) == 6
+        assert pi.llm_tokens_prompt == 4 * 400
+
+
+def test_analyze_core_persists_cascade_route(tmp_path: Path, monkeypatch):
+    _setup_articles(tmp_path)
+    monkeypatch.setenv("ANALYSIS_CASCADE_MODELS", '["gpt-4o-mini", "gpt-4.1"]')
+    reset_analysis_settings_cache()
+
+    def _provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        resp = _provider_ok(payload)
+        data = json.loads(resp["choices"][0]["message"]["content"])
+        data["confidence"] = 0.3 if payload["model"] == "gpt-4o-mini" else 0.9
+        resp["choices"][0]["message"]["content"] = json.dumps(data)
+        return {**resp, "model": payload["model"]}
+
+    analyze_mod.PROVIDER_FACTORY = lambda: _provider
+    try:
+        assert analyze_mod.analyze_core("AAPL") == 1
+    finally:
+        reset_analysis_settings_cache()
+
+    engine = get_engine()
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
+    with SessionLocal() as session:
+        pi = session.execute(select(ProcessedInsight)).scalars().one()
+        assert pi.llm_model == "gpt-4.1"
+        assert pi.llm_route["escalated"] is True
+        assert [a["model"] for a in pi.llm_route["attempts"]] == ["gpt-4o-mini", "gpt-4.1"]
+        assert pi.llm_route["attempts"][0]["escalation"] == "low_confidence"
+        assert pi.llm_tokens_prompt == 2 * 400
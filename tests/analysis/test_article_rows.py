@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from analysis.repositories.articles import ArticleRow, body_prefix_chars, iter_article_rows
+from analysis.tasks import analyze as analyze_mod
+from ingestion.db.models import Base, JobRun, ProcessedInsight, RawArticle
+from ingestion.db.session import get_engine, session_scope
+from llm.settings import get_analysis_settings, reset_analysis_settings_cache
+
+HUGE_BODY = "Apple expands services revenue. " * 40_000
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("POSTGRES_DSN", f"sqlite:///{tmp_path / 'article_rows.db'}")
+    monkeypatch.setenv("INGESTION_REDIS_URL", "redis://localhost:6379/0")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-123")
+    reset_analysis_settings_cache()
+    Base.metadata.create_all(bind=get_engine())
+    now = datetime.now(timezone.utc)
+    with session_scope() as session:
+        # 엔진이 프로세스 전역이라 다른 테스트가 남긴 행을 지운다
+        session.query(RawArticle).delete()
+        session.query(ProcessedInsight).delete()
+        session.query(JobRun).delete()
+        session.add_all(
+            [
+                RawArticle(
+                    ticker="AAPL",
+                    source="news_api",
+                    source_type="news",
+                    title=f"Apple headline {i}",
+                    body=HUGE_BODY if i == 0 else f"Short body {i}.",
+                    url=f"https://example.com/aapl/{i}",
+                    fingerprint=f"fp{i}",
+                    collected_at=now - timedelta(minutes=i),
+                    language="en",
+                    sentiment_raw="positive",
+                )
+                for i in range(3)
+            ]
+        )
+    yield
+    reset_analysis_settings_cache()
+
+
+def test_rows_are_projected_with_body_prefix_in_sql():
+    with session_scope() as session:
+        rows = list(iter_article_rows(session, "aapl", limit=2, body_chars=600))
+
+    assert [r.fingerprint for r in rows] == ["fp0", "fp1"]
+    assert all(isinstance(r, ArticleRow) for r in rows)
+    assert rows[0].body == HUGE_BODY[:600] and rows[0].body_length == len(HUGE_BODY) and rows[0].truncated
+    assert rows[1].body == "Short body 1." and not rows[1].truncated
+    assert not hasattr(rows[0], "sentiment_raw")
+
+
+def test_body_prefix_widens_for_token_budget_and_extractive_compression(monkeypatch: pytest.MonkeyPatch):
+    assert body_prefix_chars(get_analysis_settings(), max_chars=2000) == 2000
+
+    monkeypatch.setenv("ANALYSIS_PROMPT_TOKEN_BUDGET", "1000")
+    monkeypatch.setenv("ANALYSIS_EXTRACTIVE_RATIO", "0.5")
+    reset_analysis_settings_cache()
+
+    assert body_prefix_chars(get_analysis_settings(), max_chars=2000) == 8000
+
+
+def test_analyze_core_prompts_from_prefixes_only(monkeypatch: pytest.MonkeyPatch):
+    prompts: List[str] = []
+
+    def _provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        prompts.append(payload["messages"][-1]["content"])
+        data = {"summary_text": "ok", "keywords": ["apple"], "sentiment_score": 0.2, "anomalies": []}
+        return {
+            "choices": [{"message": {"content": json.dumps(data)}}],
+            "usage": {"prompt_tokens": 400, "completion_tokens": 80},
+            "model": "gpt-4o-mini",
+        }
+
+    monkeypatch.setattr(analyze_mod, "PROVIDER_FACTORY", lambda: _provider)
+
+    assert analyze_mod.analyze_core("AAPL", max_chars=1000) == 1
+    [prompt] = prompts
+    assert HUGE_BODY[:200] in prompt and len(prompt) < 3000
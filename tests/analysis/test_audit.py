@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from sqlalchemy import select
+
+from analysis import audit as audit_mod
+from analysis.audit import AuditStore, BackgroundAuditWriter, find_records, get_audit_writer, reset_audit_writer_cache
+from analysis.tasks import analyze as analyze_mod
+from ingestion.db.models import Base, JobRun, LlmAuditRecord, ProcessedInsight, RawArticle
+from ingestion.db.session import get_engine, session_scope
+from ingestion.settings import reset_settings_cache
+from llm.audit import AuditEntry
+from llm.settings import reset_analysis_settings_cache
+
+T0 = datetime(2025, 6, 1, 9, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("POSTGRES_DSN", f"sqlite:///{tmp_path / 'audit.db'}")
+    monkeypatch.setenv("INGESTION_REDIS_URL", "redis://localhost:6379/0")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-123")
+    monkeypatch.setenv("LOCAL_STORAGE_ROOT", str(tmp_path / "storage"))
+    reset_settings_cache()
+    reset_analysis_settings_cache()
+    reset_audit_writer_cache()
+    Base.metadata.create_all(bind=get_engine())
+    with session_scope() as session:
+        # 엔진이 프로세스 전역이라 다른 테스트가 남긴 행을 지운다
+        session.query(LlmAuditRecord).delete()
+        session.query(RawArticle).delete()
+        session.query(ProcessedInsight).delete()
+        session.query(JobRun).delete()
+    yield
+    reset_settings_cache()
+    reset_analysis_settings_cache()
+    reset_audit_writer_cache()
+
+
+def _entry(trace_id: str, prompt: str, *, minutes: int = 0) -> AuditEntry:
+    return AuditEntry(
+        trace_id=trace_id,
+        ticker="AAPL",
+        stage="analyze",
+        model="gpt-4o-mini",
+        request={"model": "gpt-4o-mini", "messages": [{"role": "user", "content": prompt}], "max_tokens": 512},
+        response={"choices": [{"message": {"content": f"answer to {prompt}"}}], "usage": {"prompt_tokens": 10}},
+        created_at=T0 + timedelta(minutes=minutes),
+    )
+
+
+def test_store_deduplicates_blobs_and_prunes_oldest_beyond_cap(tmp_path: Path):
+    store = AuditStore(tmp_path / "audit", max_bytes=10_000_000)
+    first = store.write(_entry("t1", "same prompt " * 200))
+    second = store.write(_entry("t2", "same prompt " * 200, minutes=1))
+
+    assert first.request_hash == second.request_hash
+    assert len(list((tmp_path / "audit").rglob("*.json.gz"))) == 2
+    # 반복 많은 프롬프트는 압축된다
+    assert first.request_bytes < len("same prompt " * 200)
+    assert store.load(first.request_hash)["messages"][0]["content"].startswith("same prompt")
+
+    other = store.write(_entry("t3", "different prompt", minutes=2))
+    with session_scope() as session:
+        total = store.stored_bytes(session)
+    store.max_bytes = total - 1
+
+    assert store.enforce_retention() == 2
+    with session_scope() as session:
+        assert [r.trace_id for r in find_records(session)] == ["t3"]
+    # 지운 기록만 참조하던 blob은 삭제, 남은 기록의 blob은 유지
+    assert not store.blob_path(first.request_hash).exists()
+    assert store.load(other.request_hash)["messages"][0]["content"] == "different prompt"
+
+
+def test_retention_keeps_blob_that_a_concurrent_write_references(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    store = AuditStore(tmp_path / "audit", max_bytes=10_000_000)
+    old = store.write(_entry("t1", "shared prompt"))
+    store.write(_entry("t2", "other prompt", minutes=1))
+    with session_scope() as session:
+        store.max_bytes = store.stored_bytes(session) - 1
+
+    recheck = store._still_referenced
+
+    def _racing(digests):
+        # 정리가 색인을 커밋한 직후 다른 writer가 같은 요청 blob을 참조하는 기록을 커밋한다
+        with session_scope() as session:
+            session.add(
+                LlmAuditRecord(
+                    trace_id="t3",
+                    stage="analyze",
+                    model="gpt-4o-mini",
+                    request_hash=old.request_hash,
+                    request_bytes=old.request_bytes,
+                    response_hash=old.request_hash,
+                    response_bytes=old.request_bytes,
+                    created_at=T0 + timedelta(minutes=2),
+                )
+            )
+        return recheck(digests)
+
+    monkeypatch.setattr(store, "_still_referenced", _racing)
+
+    assert store.enforce_retention() == 1
+    assert store.load(old.request_hash)["messages"][0]["content"] == "shared prompt"
+    assert not store.blob_path(old.response_hash).exists()
+    assert not list((tmp_path / "audit").rglob("*.del"))
+
+
+def test_write_restores_blob_removed_before_index_commit(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    store = AuditStore(tmp_path / "audit", max_bytes=10_000_000)
+    first = store.write(_entry("t1", "shared prompt"))
+    scope = audit_mod.session_scope
+
+    def _pruned_meanwhile():
+        # 기록이 blob 존재를 확인한 뒤, 색인을 커밋하기 전에 정리가 blob을 지운 상황
+        store.blob_path(first.request_hash).unlink()
+        return scope()
+
+    monkeypatch.setattr(audit_mod, "session_scope", _pruned_meanwhile)
+    second = store.write(_entry("t2", "shared prompt", minutes=1))
+
+    assert second.request_hash == first.request_hash
+    assert store.load(second.request_hash)["messages"][0]["content"] == "shared prompt"
+
+
+class _BlockingStore:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.written: List[str] = []
+
+    def write(self, entry: AuditEntry) -> None:
+        self.release.wait(5)
+        self.written.append(entry.trace_id)
+
+
+def test_background_writer_never_blocks_and_drops_when_full():
+    store = _BlockingStore()
+    writer = BackgroundAuditWriter(store, max_queue=2)  # type: ignore[arg-type]
+
+    for i in range(5):
+        writer.submit(_entry(f"t{i}", "p"))
+
+    # 스레드가 1건을 쥐고 막혀 있고 큐에 2건, 나머지는 버림
+    assert writer.dropped in (2, 3)
+    assert not writer.flush(timeout=0.05)
+    store.release.set()
+    assert writer.flush(timeout=5)
+    assert store.written[0] == "t0" and len(store.written) == 5 - writer.dropped
+
+
+def test_analyze_core_audits_prompt_and_response_by_trace_id(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("LLM_AUDIT_ENABLED", "true")
+    reset_analysis_settings_cache()
+    with session_scope() as session:
+        session.add(
+            RawArticle(
+                ticker="AAPL",
+                source="news_api",
+                source_type="news",
+                title="Apple opens store",
+                body="Apple opened a new store.",
+                url="https://example.com/aapl/1",
+                fingerprint="fp1",
+                collected_at=datetime.now(timezone.utc),
+            )
+        )
+
+    def _provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        data = {"summary_text": "ok", "keywords": ["apple"], "sentiment_score": 0.2, "anomalies": []}
+        return {
+            "choices": [{"message": {"content": json.dumps(data)}}],
+            "usage": {"prompt_tokens": 300, "completion_tokens": 60},
+            "model": "gpt-4o-mini",
+        }
+
+    monkeypatch.setattr(analyze_mod, "PROVIDER_FACTORY", lambda: _provider)
+
+    assert analyze_mod.analyze_core("AAPL", trace_id="trace-audit-1") == 1
+    writer = get_audit_writer()
+    assert writer is not None and writer.flush(timeout=5)
+
+    with session_scope() as session:
+        [record] = session.scalars(select(LlmAuditRecord)).all()
+        assert (record.trace_id, record.ticker, record.stage) == ("trace-audit-1", "AAPL", "analyze")
+        request = writer.store.load(record.request_hash)
+        response = writer.store.load(record.response_hash)
+    assert "Apple opens store" in request["messages"][-1]["content"]
+    assert json.loads(response["choices"][0]["message"]["content"])["summary_text"] == "ok"
+    assert audit_mod.main(["show", "trace-audit-1"]) == 0
+    with session_scope() as session:
+        [insight] = session.scalars(select(ProcessedInsight)).all()
+        assert insight.trace_id == "trace-audit-1"
+        insight_id = str(insight.id)
+    assert audit_mod.main(["show", "--insight-id", insight_id]) == 0
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from sqlalchemy import select
+
+from analysis.batch import (
+    MANIFEST_FILE,
+    REQUESTS_FILE,
+    RESULTS_FILE,
+    LocalFileBatchProvider,
+    ingest_batch_results,
+    prepare_batch,
+    submit_batch,
+)
+from ingestion.db.models import Base, ProcessedInsight, RawArticle
+from ingestion.db.session import get_engine, session_scope
+from ingestion.settings import reset_settings_cache
+from llm.client.openai_client import OpenAIClient
+from llm.ledger import InMemorySpendLedger
+from llm.settings import reset_analysis_settings_cache
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv("POSTGRES_DSN", f"sqlite:///{tmp_path / 'batch.db'}")
+    monkeypatch.setenv("INGESTION_REDIS_URL", "redis://localhost:6379/0")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-123")
+    reset_settings_cache()
+    reset_analysis_settings_cache()
+    Base.metadata.create_all(bind=get_engine())
+    with session_scope() as session:
+        now = datetime.now(timezone.utc)
+        for ticker in ("AAPL", "MSFT", "TSLA"):
+            session.add(
+                RawArticle(
+                    ticker=ticker,
+                    source="news_api",
+                    source_type="news",
+                    title=f"{ticker} news",
+                    body=f"{ticker} body text.",
+                    url=f"https://example.com/{ticker.lower()}",
+                    fingerprint=f"fp-{ticker}",
+                    collected_at=now,
+                    language="en",
+                )
+            )
+    yield
+    reset_settings_cache()
+    reset_analysis_settings_cache()
+
+
+def _ticker_of(payload: Dict[str, Any]) -> str:
+    return payload["messages"][1]["content"].split("\n")[0].split()[-1]
+
+
+def _respond(payload: Dict[str, Any]) -> Dict[str, Any]:
+    ticker = _ticker_of(payload)
+    if ticker == "TSLA":
+        raise RuntimeError("batch item failed")
+    content = "not-json" if ticker == "MSFT" else json.dumps(
+        {"summary_text": f"{ticker} batch", "keywords": ["a", "b", "c"], "sentiment_score": 0.1, "anomalies": []}
+    )
+    return {
+        "choices": [{"message": {"content": content}}],
+        "usage": {"prompt_tokens": 100, "completion_tokens": 50},
+        "model": "gpt-4o-mini",
+    }
+
+
+def _online(payload: Dict[str, Any]) -> Dict[str, Any]:
+    ticker = _ticker_of(payload)
+    return {
+        "choices": [
+            {
+                "message": {
+                    "content": json.dumps(
+                        {"summary_text": f"{ticker} online", "keywords": ["x", "y", "z"], "sentiment_score": 0.0}
+                    )
+                }
+            }
+        ],
+        "usage": {"prompt_tokens": 100, "completion_tokens": 50},
+        "model": "gpt-4o-mini",
+    }
+
+
+def test_batch_roundtrip_with_online_fallback(tmp_path: Path):
+    out_dir = tmp_path / "batch"
+    online_calls: List[str] = []
+
+    def online(payload: Dict[str, Any]) -> Dict[str, Any]:
+        online_calls.append(_ticker_of(payload))
+        return _online(payload)
+
+    client = OpenAIClient.from_env(provider=online)
+    with session_scope() as session:
+        manifest = prepare_batch(session, ["aapl", "MSFT", "TSLA", "NONE"], out_dir, client=client)
+
+    requests = [json.loads(line) for line in (out_dir / REQUESTS_FILE).read_text().splitlines()]
+    assert sorted(m["ticker"] for m in manifest.values()) == ["AAPL", "MSFT", "TSLA"]
+    assert {r["custom_id"] for r in requests} == set(manifest)
+    assert all(r["url"] == "/v1/chat/completions" and r["body"]["model"] == "gpt-4o-mini" for r in requests)
+    assert (out_dir / MANIFEST_FILE).exists()
+
+    assert submit_batch(out_dir, LocalFileBatchProvider(_respond)) == out_dir / RESULTS_FILE
+
+    with session_scope() as session:
+        report = ingest_batch_results(session, out_dir, client=client)
+
+    assert report.saved == 1
+    assert report.fallback_saved == 2
+    assert report.failed == []
+    assert sorted(online_calls) == ["MSFT", "TSLA"]
+    with session_scope() as session:
+        summaries = {p.ticker: p.summary_text for p in session.execute(select(ProcessedInsight)).scalars()}
+        assert summaries == {"AAPL": "AAPL batch", "MSFT": "MSFT online", "TSLA": "TSLA online"}
+
+        # unchanged inputs are not re-requested on the next run
+        assert prepare_batch(session, ["AAPL", "MSFT", "TSLA"], tmp_path / "next", client=client) == {}
+
+
+def test_ingest_without_fallback_reports_failures(tmp_path: Path):
+    out_dir = tmp_path / "batch"
+    client = OpenAIClient.from_env(provider=_online)
+    with session_scope() as session:
+        prepare_batch(session, ["AAPL", "TSLA"], out_dir, client=client)
+    submit_batch(out_dir, LocalFileBatchProvider(_respond))
+
+    with session_scope() as session:
+        report = ingest_batch_results(session, out_dir, client=client, online_fallback=False)
+
+    assert report.saved == 1
+    assert [cid.split("-")[0] for cid in report.failed] == ["TSLA"]
+
+
+def test_ingest_is_idempotent_and_charges_invalid_rows_at_batch_rates(tmp_path: Path):
+    out_dir = tmp_path / "batch"
+    ledger = InMemorySpendLedger()
+    client = replace(OpenAIClient.from_env(provider=_online), ledger=ledger)
+    with session_scope() as session:
+        prepare_batch(session, ["AAPL", "MSFT"], out_dir, client=client)
+    submit_batch(out_dir, LocalFileBatchProvider(_respond))
+
+    with session_scope() as session:
+        report = ingest_batch_results(session, out_dir, client=client, online_fallback=False)
+    assert report.saved == 1 and len(report.failed) == 1
+
+    online_cost = client.prices.cost("gpt-4o-mini", 100, 50)
+    today = datetime.now(timezone.utc).date()
+    # AAPL(저장)과 MSFT(검증 실패) 응답 모두 배치 단가로 기록
+    assert ledger.breakdown(today)["batch"]["gpt-4o-mini"] == pytest.approx(2 * 0.5 * online_cost)
+    with session_scope() as session:
+        [insight] = session.execute(select(ProcessedInsight)).scalars().all()
+        assert insight.llm_cost == pytest.approx(0.5 * online_cost)
+
+    # 같은 결과 파일을 다시 ingest해도 저장된 종목은 건너뛴다
+    with session_scope() as session:
+        again = ingest_batch_results(session, out_dir, client=client, online_fallback=False)
+    assert (again.saved, again.skipped, len(again.failed)) == (0, 1, 1)
+    assert ledger.breakdown(today)["batch"]["gpt-4o-mini"] == pytest.approx(3 * 0.5 * online_cost)
+    with session_scope() as session:
+        assert len(session.execute(select(ProcessedInsight)).scalars().all()) == 1
+
+
+def test_openai_batch_provider_uses_shared_sdk_client(monkeypatch):
+    from analysis.batch import OpenAIBatchProvider
+
+    monkeypatch.setenv("OPENAI_BASE_URL", "http://llm-gateway.internal/v1")
+    reset_analysis_settings_cache()
+    client = OpenAIClient.from_env()
+    provider = OpenAIBatchProvider(client)
+
+    assert provider._client is client.sdk_client()
+    assert str(provider._client.base_url).startswith("http://llm-gateway.internal/v1")
+    assert provider._client.max_retries == 0
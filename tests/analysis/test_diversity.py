@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import re
+import zlib
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from sqlalchemy import select
+
+from analysis.diversity import (
+    DiversityPolicy,
+    InMemoryEmbeddingCache,
+    RedisEmbeddingCache,
+    mmr_select,
+    reset_embedding_cache,
+    select_diverse_articles,
+)
+from analysis.tasks import analyze as analyze_mod
+from ingestion.db.models import Base, ProcessedInsight, RawArticle
+from ingestion.db.session import get_engine, session_scope
+from llm.settings import reset_analysis_settings_cache
+
+_STORIES = {
+    "buyback": "Apple announces record stock buyback",
+    "vision": "Apple Vision Pro sales slow in Europe",
+    "antitrust": "EU opens antitrust probe into App Store fees",
+}
+
+
+def _bag_of_words(texts: List[str]) -> List[List[float]]:
+    """오프라인 임베더: 제목 단어 해시 bag-of-words."""
+    out = []
+    for text in texts:
+        vec = [0.0] * 256
+        for word in re.findall(r"[a-z]+", text.split("\n")[0].lower()):
+            vec[zlib.crc32(word.encode()) % 256] += 1.0
+        out.append(vec)
+    return out
+
+
+def _rows(titles: List[str]) -> List[RawArticle]:
+    now = datetime.now(timezone.utc)
+    return [
+        RawArticle(
+            ticker="AAPL",
+            source="news_api",
+            source_type="news",
+            title=title,
+            body="body",
+            url=f"https://example.com/{i}",
+            fingerprint=f"fp{i}",
+            collected_at=now - timedelta(minutes=i),
+        )
+        for i, title in enumerate(titles)
+    ]
+
+
+def test_mmr_drops_rewrites_and_reaches_back():
+    titles = [
+        _STORIES["buyback"],
+        _STORIES["buyback"] + " today",
+        "Apple announces record stock buyback plan",
+        _STORIES["buyback"] + " again",
+        _STORIES["buyback"] + " update",
+        _STORIES["vision"],
+        _STORIES["antitrust"],
+    ]
+    rows = _rows(titles)
+    chosen = select_diverse_articles(rows, _bag_of_words, DiversityPolicy(k=5, duplicate_threshold=0.8))
+
+    # 같은 기사 재작성본은 하나만, 6·7번째(더 과거) 기사까지 내려가 채운다
+    assert [r.title for r in chosen] == [_STORIES["buyback"], _STORIES["vision"], _STORIES["antitrust"]]
+
+
+def test_mmr_prefers_recency_when_all_distinct():
+    vectors = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    assert mmr_select(vectors, DiversityPolicy(k=2)) == [0, 1]
+
+
+class _FakePipeline:
+    def __init__(self, store: Dict[str, bytes]) -> None:
+        self._store = store
+        self._ops: List[tuple] = []
+
+    def setex(self, key: str, ttl: int, value: bytes) -> None:
+        self._ops.append((key, value))
+
+    def execute(self) -> None:
+        for key, value in self._ops:
+            self._store[key] = value
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: Dict[str, bytes] = {}
+
+    def mget(self, keys: List[str]) -> List[Any]:
+        return [self.store.get(k) for k in keys]
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self.store)
+
+
+@pytest.mark.parametrize("factory", [InMemoryEmbeddingCache, lambda: RedisEmbeddingCache(_FakeRedis())])
+def test_vectors_are_cached_by_fingerprint(factory):
+    cache = factory()
+    calls: List[int] = []
+
+    def _embedder(texts: List[str]) -> List[List[float]]:
+        calls.append(len(texts))
+        return _bag_of_words(texts)
+
+    policy = DiversityPolicy(k=2)
+    first = select_diverse_articles(_rows(list(_STORIES.values())[:2]), _embedder, policy, cache=cache, model="m")
+    # fp0/fp1은 캐시에서, 새 기사 fp2만 임베딩
+    second = select_diverse_articles(_rows(list(_STORIES.values())), _embedder, policy, cache=cache, model="m")
+
+    assert calls == [2, 1]
+    assert [r.fingerprint for r in first] == ["fp0", "fp1"]
+    assert len(second) == 2
+
+
+@pytest.fixture()
+def _analysis_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("POSTGRES_DSN", f"sqlite:///{tmp_path / 'diversity.db'}")
+    monkeypatch.setenv("INGESTION_REDIS_URL", "redis://localhost:6379/0")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-123")
+    monkeypatch.setenv("ANALYSIS_DIVERSITY_ENABLED", "true")
+    monkeypatch.setenv("ANALYSIS_DIVERSITY_DUPLICATE_THRESHOLD", "0.8")
+    monkeypatch.setenv("ANALYSIS_CANDIDATE_ARTICLES", "3")
+    reset_analysis_settings_cache()
+    reset_embedding_cache()
+    yield
+    reset_analysis_settings_cache()
+    reset_embedding_cache()
+
+
+def test_analyze_core_prompts_with_distinct_stories(_analysis_env, monkeypatch: pytest.MonkeyPatch):
+    Base.metadata.create_all(bind=get_engine())
+    titles = [_STORIES["buyback"] + s for s in ("", " today", " again")] + [_STORIES["vision"], _STORIES["antitrust"]]
+    with session_scope() as session:
+        session.add_all(_rows(titles))
+
+    prompts: List[str] = []
+
+    def _provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        prompts.append(payload["messages"][-1]["content"])
+        data = {"summary_text": "ok", "keywords": ["apple"], "sentiment_score": 0.1, "anomalies": []}
+        return {
+            "choices": [{"message": {"content": json.dumps(data)}}],
+            "usage": {"prompt_tokens": 100, "completion_tokens": 20},
+            "model": "gpt-4o-mini",
+        }
+
+    monkeypatch.setattr(analyze_mod, "PROVIDER_FACTORY", lambda: _provider)
+    monkeypatch.setattr(analyze_mod, "EMBEDDER_FACTORY", lambda: _bag_of_words)
+
+    assert analyze_mod.analyze_core("AAPL") == 1
+    for story in _STORIES.values():
+        assert story in prompts[0]
+    assert "today" not in prompts[0]
+
+    with session_scope() as session:
+        insight = session.scalars(select(ProcessedInsight)).one()
+        assert {ref["url"] for ref in insight.source_refs} == {
+            "https://example.com/0",
+            "https://example.com/3",
+            "https://example.com/4",
+        }
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from analysis.extractive import compress_articles, compression_stats, split_sentences, summarize, term_coverage
+from analysis.models.domain import InputArticle
+
+FIXTURES = Path(__file__).parent / "fixtures" / "articles.json"
+
+
+def _fixture_articles() -> list[InputArticle]:
+    data = json.loads(FIXTURES.read_text(encoding="utf-8"))
+    return [InputArticle(url=f"https://example.com/{i}", **item) for i, item in enumerate(data)]
+
+
+def test_summarize_keeps_sentence_order_and_lead():
+    text = "Lead sentence about Apple earnings. Filler text here. Apple earnings beat estimates again. More filler."
+    summary = summarize(text, ratio=0.6)
+
+    sentences = split_sentences(summary)
+    assert sentences[0] == "Lead sentence about Apple earnings."
+    assert all(s in text for s in sentences)
+    assert len(summary) < len(text)
+
+
+def test_short_bodies_are_left_untouched():
+    article = InputArticle(title="Short", body="One. Two.", url="https://example.com/s")
+    assert compress_articles([article], ratio=0.5, min_chars=10)[0].body == "One. Two."
+    assert compress_articles([article], ratio=0.5, min_chars=400)[0] is article
+
+
+def test_fixture_set_halves_input_with_high_term_coverage():
+    articles = _fixture_articles()
+    compressed = compress_articles(articles, ratio=0.5, min_chars=200)
+
+    stats = compression_stats([a.body for a in articles], [a.body for a in compressed])
+
+    assert stats["compression_ratio"] <= 0.55
+    assert stats["term_coverage"] >= 0.8
+    # key facts survive compression
+    assert "$94.9 billion" in compressed[0].body
+    assert "Digital Markets Act" in compressed[1].body
+
+
+def test_term_coverage_bounds():
+    assert term_coverage("apple earnings apple", "apple earnings") == 1.0
+    assert term_coverage("apple earnings apple", "") == 0.0
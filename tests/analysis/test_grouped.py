@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from sqlalchemy import select
+
+from analysis.models.domain import AnalysisInput, AnalysisResult, InputArticle
+from analysis.prompts.templates import build_analysis_messages, build_grouped_messages
+from analysis.tasks import analyze as analyze_mod
+from ingestion.db.models import Base, JobRun, ProcessedInsight, RawArticle
+from ingestion.db.session import get_engine, session_scope
+from llm.client.openai_client import InvalidResponseError, OpenAIClient
+from llm.settings import get_analysis_settings, reset_analysis_settings_cache
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("POSTGRES_DSN", f"sqlite:///{tmp_path / 'grouped.db'}")
+    monkeypatch.setenv("INGESTION_REDIS_URL", "redis://localhost:6379/0")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-123")
+    monkeypatch.setenv("ANALYSIS_RETRY_MAX_ATTEMPTS", "1")
+    monkeypatch.setenv("ANALYSIS_GROUP_MAX_TICKERS", "3")
+    monkeypatch.setenv("LLM_TOKENIZER", "heuristic")
+    reset_analysis_settings_cache()
+    yield
+    reset_analysis_settings_cache()
+
+
+def _inp(ticker: str, title: str, body: str = "Shares moved.") -> AnalysisInput:
+    item = InputArticle(title=title, body=body, url=f"https://example.com/{ticker.lower()}")
+    return AnalysisInput(ticker=ticker, locale="ko_KR", items=[item], max_chars=2000)
+
+
+def _entry(ticker: str, sentiment: float = 0.1) -> Dict[str, Any]:
+    return {"ticker": ticker, "summary_text": f"{ticker} ok", "keywords": ["news"], "sentiment_score": sentiment, "anomalies": []}
+
+
+def _grouped_resp(entries: List[Dict[str, Any]], usage: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "choices": [{"message": {"content": json.dumps({"results": entries})}}],
+        "usage": usage,
+        "model": "gpt-4o-mini",
+    }
+
+
+def test_grouped_messages_share_system_prefix_and_keep_ticker_blocks():
+    inputs = [_inp("AAPL", "Apple opens store"), _inp("MSFT", "Microsoft updates Teams")]
+
+    [system, user] = build_grouped_messages(inputs)
+    single_system = build_analysis_messages(inputs[0])[0]["content"]
+
+    assert system["content"].startswith(single_system) and '"results"' in system["content"]
+    lines = user["content"].splitlines()
+    assert lines[0] == "[Group] AAPL, MSFT"
+    assert lines.index("[Ticker] AAPL") < lines.index("[Ticker] MSFT")
+    assert "1. Title: Microsoft updates Teams" in lines
+
+
+def test_analyze_grouped_apportions_usage_and_flags_missing_tickers():
+    inputs = [
+        _inp("AAPL", "Apple opens store", body="Long body. " * 60),
+        _inp("MSFT", "Microsoft updates Teams"),
+        _inp("TSLA", "Tesla recalls cars"),
+    ]
+    usage = {"prompt_tokens": 1001, "completion_tokens": 300, "prompt_tokens_details": {"cached_tokens": 500}}
+    seen: List[Dict[str, Any]] = []
+
+    def _provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        seen.append(payload)
+        # TSLA 누락, MSFT는 스키마 위반
+        return _grouped_resp([_entry("aapl"), _entry("MSFT", sentiment=3.0)], usage)
+
+    audited: List[Any] = []
+    sink = type("Sink", (), {"submit": lambda self, entry: audited.append(entry)})()
+    client = OpenAIClient(get_analysis_settings(), provider=_provider).with_audit(
+        sink, trace_id="trace-group", tickers=[i.ticker for i in inputs]
+    )
+    results = client.analyze_grouped(inputs)
+
+    # 묶음 요청 하나가 종목마다 감사 색인을 남긴다 (종목으로 조회 가능)
+    assert [(e.trace_id, e.ticker) for e in audited] == [
+        ("trace-group", "AAPL"),
+        ("trace-group", "MSFT"),
+        ("trace-group", "TSLA"),
+    ]
+
+    assert len(seen) == 1 and seen[0]["max_tokens"] == 3 * get_analysis_settings().analysis_max_tokens
+    aapl, msft, tsla = results
+    assert isinstance(aapl, AnalysisResult) and aapl.ticker == "AAPL"
+    assert isinstance(msft, InvalidResponseError) and isinstance(tsla, InvalidResponseError)
+    shares = client.input_shares(inputs)
+    # 긴 입력을 가진 종목이 토큰/비용을 더 많이 부담한다
+    assert shares[0] > shares[1]
+    assert aapl.llm_tokens_prompt == pytest.approx(1001 * shares[0] / sum(shares), abs=1)
+    assert aapl.llm_tokens_cached == pytest.approx(500 * shares[0] / sum(shares), abs=1)
+    total_cost = client.prices.cost("gpt-4o-mini", 1001, 300, 500)
+    assert aapl.llm_cost == pytest.approx(total_cost * shares[0] / sum(shares))
+
+
+def _rows(ticker: str, count: int) -> List[RawArticle]:
+    now = datetime.now(timezone.utc)
+    return [
+        RawArticle(
+            ticker=ticker,
+            source="news_api",
+            source_type="news",
+            title=f"{ticker} headline {i}",
+            body=f"{ticker} body {i}",
+            url=f"https://example.com/{ticker.lower()}/{i}",
+            fingerprint=f"{ticker}-fp{i}",
+            collected_at=now - timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture()
+def _db():
+    Base.metadata.create_all(bind=get_engine())
+    with session_scope() as session:
+        # 엔진이 프로세스 전역이라 다른 테스트가 남긴 행을 지운다
+        session.query(RawArticle).delete()
+        session.query(ProcessedInsight).delete()
+        session.query(JobRun).delete()
+
+
+def test_analyze_group_core_groups_thin_tickers_and_falls_back(_db, monkeypatch: pytest.MonkeyPatch):
+    with session_scope() as session:
+        for ticker, count in (("AAPL", 1), ("MSFT", 2), ("TSLA", 1), ("NVDA", 4)):
+            session.add_all(_rows(ticker, count))
+    calls: List[str] = []
+
+    def _provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        user = payload["messages"][-1]["content"]
+        usage = {"prompt_tokens": 300, "completion_tokens": 90}
+        if user.startswith("[Group]"):
+            calls.append(user.splitlines()[0])
+            # TSLA 결과가 빠진 부분 실패
+            return _grouped_resp([_entry("AAPL"), _entry("MSFT")], usage)
+        ticker = user.splitlines()[0].split()[-1]
+        calls.append(ticker)
+        data = {k: v for k, v in _entry(ticker).items() if k != "ticker"}
+        return {"choices": [{"message": {"content": json.dumps(data)}}], "usage": usage, "model": "gpt-4o-mini"}
+
+    monkeypatch.setattr(analyze_mod, "PROVIDER_FACTORY", lambda: _provider)
+
+    assert analyze_mod.analyze_group_core(["aapl", "MSFT", "TSLA", "NVDA"]) == 4
+    assert calls == ["[Group] AAPL, MSFT, TSLA", "NVDA", "TSLA"]
+    with session_scope() as session:
+        modes = {i.ticker: i.analysis_mode for i in session.scalars(select(ProcessedInsight))}
+    assert modes == {"AAPL": "grouped", "MSFT": "grouped", "TSLA": "full", "NVDA": "full"}
+
+    # 입력이 그대로면 묶음 분석도 캐시된다
+    calls.clear()
+    assert analyze_mod.analyze_group_core(["AAPL", "MSFT", "TSLA", "NVDA"]) == 0
+    assert calls == []
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from analysis.mapreduce import cluster_articles, run_map_reduce
+from analysis.models.domain import AnalysisInput, InputArticle
+from llm.client.openai_client import OpenAIClient
+from llm.settings import reset_analysis_settings_cache
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch):
+    reset_analysis_settings_cache()
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-123")
+    monkeypatch.setenv("ANALYSIS_MODEL", "gpt-4.1")
+    monkeypatch.setenv("ANALYSIS_MAP_MODEL", "gpt-4o-mini")
+    monkeypatch.setenv("ANALYSIS_MAP_CLUSTER_SIZE", "3")
+    monkeypatch.setenv("ANALYSIS_MAP_CONCURRENCY", "2")
+    yield
+    reset_analysis_settings_cache()
+
+
+def _article(i: int, title: str) -> InputArticle:
+    return InputArticle(title=title, body=f"Body {i}.", url=f"https://example.com/{i}", language="en")
+
+
+def _response(payload: Dict[str, Any], summary: str, sentiment: float = 0.2) -> Dict[str, Any]:
+    data = {"summary_text": summary, "keywords": ["a", "b", "c"], "sentiment_score": sentiment, "anomalies": []}
+    return {
+        "choices": [{"message": {"content": json.dumps(data)}}],
+        "usage": {"prompt_tokens": 100, "completion_tokens": 20},
+        "model": payload["model"],
+    }
+
+
+def test_cluster_articles_groups_similar_titles_with_size_cap():
+    items = [
+        _article(1, "Apple earnings beat estimates"),
+        _article(2, "Tesla recall announced"),
+        _article(3, "Apple earnings beat forecasts"),
+        _article(4, "Apple earnings beat again"),
+        _article(5, "Apple earnings beat once more"),
+    ]
+    clusters = cluster_articles(items, max_size=3)
+
+    assert [[a.body for a in c] for c in clusters] == [
+        ["Body 1.", "Body 3.", "Body 4."],
+        ["Body 2.", "Body 5."],  # leftovers packed together
+    ]
+
+
+def test_run_map_reduce_maps_in_parallel_and_merges():
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0}
+    models: List[str] = []
+
+    def provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        user = payload["messages"][1]["content"]
+        models.append(payload["model"])
+        if "[부분 요약" in user:
+            return _response(payload, "merged summary", 0.4)
+        with lock:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+        time.sleep(0.02)
+        with lock:
+            state["in_flight"] -= 1
+        return _response(payload, "partial")
+
+    items = [_article(i, f"Topic {i} headline") for i in range(9)]
+    inp = AnalysisInput(ticker="AAPL", items=items, max_chars=5000)
+    outcome = run_map_reduce(OpenAIClient.from_env(provider=provider), inp)
+
+    assert outcome.clusters == 3 and outcome.mapped == 3 and outcome.dropped == 0
+    assert models.count("gpt-4o-mini") == 3 and models[-1] == "gpt-4.1"
+    assert state["peak"] == 2
+    assert outcome.result.summary_text == "merged summary"
+    assert outcome.result.llm_tokens_prompt == 400
+    assert outcome.result.llm_model == "gpt-4.1"
+
+
+def test_run_map_reduce_respects_map_stage_budget(monkeypatch):
+    monkeypatch.setenv("ANALYSIS_MAP_STAGE_COST_LIMIT_USD", "0.0002")
+    reset_analysis_settings_cache()
+    calls: List[str] = []
+
+    def provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append(payload["messages"][1]["content"])
+        return _response(payload, "ok")
+
+    items = [_article(i, f"Topic {i} headline") for i in range(9)]
+    outcome = run_map_reduce(OpenAIClient.from_env(provider=provider), AnalysisInput(ticker="AAPL", items=items))
+
+    assert outcome.dropped == 2
+    assert outcome.mapped == 1
+    assert len(calls) == 2  # one map + reduce
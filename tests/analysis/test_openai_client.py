@@ -97,11 +97,11 @@ def test_analyze_cost_limit_exceeded():
 
 
 def test_timeout_raises_transient(monkeypatch):
-    def slow_provider(_: Dict[str, Any]) -> Dict[str, Any]:
-        import time as _t
-
-        _t.sleep(2)
-        return _make_provider_ok({})
+    def slow_provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        # transport는 남은 기한(`timeout`)을 넘기면 타임아웃 예외를 던진다
+        if payload["timeout"] < 2:
+            raise TimeoutError("read timed out")
+        return _make_provider_ok(payload)
 
     # 짧은 타임아웃으로 유도
     monkeypatch.setenv("ANALYSIS_REQUEST_TIMEOUT_SECONDS", "1")
@@ -109,3 +109,78 @@ def test_timeout_raises_transient(monkeypatch):
     client = OpenAIClient.from_env(provider=slow_provider)
     with pytest.raises(TransientLLMError):
         client.analyze(_ai())
+
+
+def test_cached_prompt_tokens_are_recorded_and_priced():
+    def _provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        resp = _make_provider_ok(payload)
+        resp["usage"]["prompt_tokens_details"] = {"cached_tokens": 200}
+        return resp
+
+    cached = OpenAIClient.from_env(provider=_provider).analyze(_ai())
+    plain = OpenAIClient.from_env(provider=_make_provider_ok).analyze(_ai())
+
+    assert cached.llm_tokens_cached == 200 and plain.llm_tokens_cached == 0
+    # gpt-4o-mini 샘플 단가: 캐시 적중 입력은 절반 가격
+    assert cached.llm_cost == pytest.approx(plain.llm_cost - 0.2 * 0.00025)
+
+
+def _ai_for(ticker: str) -> AnalysisInput:
+    item = InputArticle(
+        title=f"{ticker} update",
+        body="Earnings beat expectations.",
+        url="https://example.com/x",
+        language="en",
+    )
+    return AnalysisInput(ticker=ticker, locale="ko_KR", items=[item], max_chars=2000)
+
+
+def test_analyze_many_bounds_concurrency_and_preserves_order(monkeypatch):
+    import asyncio
+
+    monkeypatch.setenv("ANALYSIS_MAX_CONCURRENCY", "3")
+    reset_analysis_settings_cache()
+    state = {"in_flight": 0, "peak": 0}
+
+    async def provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        return _make_provider_ok(payload)
+
+    client = OpenAIClient.from_env(async_provider=provider)
+    tickers = [f"T{i}" for i in range(10)]
+    results = client.analyze_many([_ai_for(t) for t in tickers])
+
+    assert [r.ticker for r in results] == tickers
+    assert state["peak"] == 3
+
+
+def test_analyze_many_keeps_retry_and_cost_semantics():
+    calls: Dict[str, int] = {}
+
+    async def provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        ticker = payload["messages"][1]["content"].split("\n")[0].split()[-1]
+        calls[ticker] = calls.get(ticker, 0) + 1
+        if ticker == "RETRY" and calls[ticker] == 1:
+            return {"choices": [{"message": {"content": "not-json"}}], "usage": {}, "model": "gpt-4o-mini"}
+        if ticker == "COSTLY":
+            return {**_make_provider_ok(payload), "usage": {"prompt_tokens": 1000, "completion_tokens": 100000}}
+        return _make_provider_ok(payload)
+
+    client = OpenAIClient.from_env(async_provider=provider)
+    results = client.analyze_many([_ai_for("RETRY"), _ai_for("COSTLY"), _ai_for("OK")], return_exceptions=True)
+
+    assert results[0].ticker == "RETRY" and calls["RETRY"] == 2
+    assert isinstance(results[1], PermanentLLMError) and calls["COSTLY"] == 1
+    assert results[2].ticker == "OK"
+
+    with pytest.raises(PermanentLLMError):
+        client.analyze_many([_ai_for("OK"), _ai_for("COSTLY")])
+
+
+def test_analyze_many_falls_back_to_sync_provider():
+    client = OpenAIClient.from_env(provider=_make_provider_ok)
+    results = client.analyze_many([_ai_for("AAPL"), _ai_for("MSFT")], max_concurrency=2)
+    assert [r.ticker for r in results] == ["AAPL", "MSFT"]
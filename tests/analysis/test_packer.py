@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from analysis.models.domain import AnalysisInput, InputArticle
+from analysis.prompts.packer import (
+    estimate_tokens,
+    fair_allocation,
+    pack_articles,
+    score_articles,
+    truncate_to_tokens,
+)
+from analysis.prompts.templates import build_analysis_messages
+
+NOW = datetime(2025, 11, 20, 12, tzinfo=timezone.utc)
+
+
+def _article(title: str, body: str, *, url: str = "https://example.com/a", hours_ago: float = 1.0) -> InputArticle:
+    return InputArticle(title=title, body=body, url=url, language="en", published_at=NOW - timedelta(hours=hours_ago))
+
+
+def _word_counter(text: str) -> int:
+    return len(text.split())
+
+
+def test_fair_allocation_redistributes_unused_share():
+    assert fair_allocation([10, 500, 500], 300) == [10, 145, 145]
+    assert fair_allocation([10, 20], 300) == [10, 20]
+    assert fair_allocation([100, 100, 100], 10) == [4, 3, 3]
+
+
+def test_truncate_keeps_sentence_boundaries():
+    text = "First sentence here. Second one follows! Third is long and will not fit."
+    assert truncate_to_tokens(text, 7, _word_counter) == "First sentence here. Second one follows!"
+    # a single oversized sentence falls back to a prefix cut
+    assert _word_counter(truncate_to_tokens("one two three four five", 3, _word_counter)) <= 3
+
+
+def test_long_first_article_does_not_starve_the_rest():
+    long_body = " ".join(f"Long sentence number {i}." for i in range(400))
+    items = [
+        _article("Long", long_body, hours_ago=0.5),
+        _article("Short A", "Revenue grew. Margins expanded.", hours_ago=1),
+        _article("Short B", "Guidance was raised for next year.", hours_ago=2),
+    ]
+
+    packed = pack_articles(items, budget_tokens=200, counter=estimate_tokens, now=NOW)
+
+    titles = {p.title: p for p in packed}
+    assert set(titles) == {"Long", "Short A", "Short B"}
+    assert titles["Short A"].excerpt == "Revenue grew. Margins expanded."
+    assert titles["Long"].excerpt.endswith(".")
+    assert sum(p.tokens for p in packed) <= 200
+
+
+def test_scores_prefer_fresh_novel_and_trusted_sources():
+    items = [
+        _article("Old", "Apple earnings beat", hours_ago=72),
+        _article("Fresh", "Apple earnings beat", hours_ago=1),
+        _article("Novel", "Antitrust probe opened in EU", hours_ago=1),
+        _article("Trusted", "Apple earnings beat", url="https://www.reuters.com/x", hours_ago=1),
+    ]
+    scores = score_articles(
+        items,
+        previous_text="apple earnings beat expectations",
+        source_weights={"reuters.com": 1.0},
+        now=NOW,
+    )
+    old, fresh, novel, trusted = scores
+    assert fresh > old
+    assert novel > fresh
+    assert trusted > fresh
+
+    packed = pack_articles(items, budget_tokens=500, top_k=2, previous_text="apple earnings beat", now=NOW)
+    assert [p.title for p in packed][0] == "Novel"
+    assert len(packed) == 2
+
+
+def test_build_messages_uses_packer_when_budget_given():
+    inp = AnalysisInput(
+        ticker="AAPL",
+        items=[_article("A", "x" * 4000), _article("B", "Short body.")],
+        max_chars=5000,
+    )
+    legacy = build_analysis_messages(inp)[1]["content"]
+    packed = build_analysis_messages(inp, token_budget=120, token_counter=estimate_tokens)[1]["content"]
+
+    assert "Short body." in packed
+    assert len(packed) < len(legacy)
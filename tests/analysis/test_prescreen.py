@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from sqlalchemy import select
+
+from analysis.prescreen import prescreen, score_articles, template_result
+from analysis.tasks import analyze as analyze_mod
+from ingestion.db.models import Base, JobRun, JobStatus, ProcessedInsight, RawArticle
+from ingestion.db.session import get_engine, session_scope
+from llm.settings import reset_analysis_settings_cache
+
+_QUIET = [
+    ("Apple to host developer sessions in Seoul", "The company will hold sessions for app makers next month."),
+    ("Apple Store in Berlin extends opening hours", "The store will open an hour earlier on weekends."),
+]
+_LOUD = [
+    ("Apple shares plunge after earnings miss and weak guidance", "Revenue fell short as iPhone sales declined."),
+    ("EU opens antitrust probe into Apple", "Regulators said the investigation covers App Store fees."),
+]
+
+
+def _rows(pairs: List[tuple]) -> List[RawArticle]:
+    now = datetime.now(timezone.utc)
+    return [
+        RawArticle(
+            ticker="AAPL",
+            source="news_api",
+            source_type="news",
+            title=title,
+            body=body,
+            url=f"https://example.com/{i}",
+            fingerprint=f"fp{i}",
+            collected_at=now - timedelta(minutes=i),
+        )
+        for i, (title, body) in enumerate(pairs)
+    ]
+
+
+def test_score_separates_quiet_and_eventful_days():
+    quiet = score_articles(_rows(_QUIET))
+    loud = score_articles(_rows(_LOUD))
+
+    assert quiet.events == {} and quiet.tone == 0.0
+    assert quiet.signal < 0.1
+    assert {"earnings", "guidance", "legal"} <= set(loud.events)
+    assert loud.tone < -0.5
+    assert loud.signal > 0.7
+
+
+def test_repeated_story_loses_novelty():
+    rows = _rows(_LOUD)
+    previous = ProcessedInsight(
+        summary_text=" ".join(f"{t} {b}" for t, b in _LOUD),
+        keywords=["apple", "antitrust"],
+    )
+
+    decision = prescreen(rows, threshold=0.5, previous=previous)
+
+    assert decision.score.novelty < 0.2
+    assert decision.action == "skip"
+    assert prescreen(rows, threshold=0.5).action == "llm"
+
+
+def test_template_result_is_free_and_neutral():
+    decision = prescreen(_rows(_QUIET), threshold=0.3, action="template")
+    result = template_result("aapl", decision)
+
+    assert decision.action == "template"
+    assert result.llm_cost == 0.0 and result.llm_tokens_prompt == 0
+    assert result.anomalies == [] and "apple" in result.keywords
+    assert result.summary_text.startswith("AAPL:")
+
+
+@pytest.fixture()
+def _analysis_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("POSTGRES_DSN", f"sqlite:///{tmp_path / 'prescreen.db'}")
+    monkeypatch.setenv("INGESTION_REDIS_URL", "redis://localhost:6379/0")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-123")
+    monkeypatch.setenv("ANALYSIS_PRESCREEN_THRESHOLD", "0.3")
+    reset_analysis_settings_cache()
+    Base.metadata.create_all(bind=get_engine())
+    with session_scope() as session:
+        # 엔진이 프로세스 전역이라 다른 테스트가 남긴 행을 지운다
+        session.query(RawArticle).delete()
+        session.query(ProcessedInsight).delete()
+        session.query(JobRun).delete()
+    calls: List[Dict[str, Any]] = []
+
+    def _provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append(payload)
+        data = {"summary_text": "ok", "keywords": ["apple"], "sentiment_score": -0.6, "anomalies": []}
+        return {
+            "choices": [{"message": {"content": json.dumps(data)}}],
+            "usage": {"prompt_tokens": 100, "completion_tokens": 20},
+            "model": "gpt-4o-mini",
+        }
+
+    monkeypatch.setattr(analyze_mod, "PROVIDER_FACTORY", lambda: _provider)
+    yield calls
+    reset_analysis_settings_cache()
+
+
+def test_analyze_core_skips_llm_on_quiet_day(_analysis_env):
+    with session_scope() as session:
+        session.add_all(_rows(_QUIET))
+
+    assert analyze_mod.analyze_core("AAPL") == 0
+    assert _analysis_env == []
+    with session_scope() as session:
+        assert session.scalars(select(ProcessedInsight)).first() is None
+        assert session.scalars(select(JobRun)).one().status == JobStatus.CACHED
+
+
+def test_analyze_core_saves_template_insight(_analysis_env, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("ANALYSIS_PRESCREEN_ACTION", "template")
+    reset_analysis_settings_cache()
+    with session_scope() as session:
+        session.add_all(_rows(_QUIET))
+
+    assert analyze_mod.analyze_core("AAPL") == 1
+    # 같은 입력이면 템플릿 인사이트의 다이제스트로 캐시된다
+    assert analyze_mod.analyze_core("AAPL") == 0
+    assert _analysis_env == []
+    with session_scope() as session:
+        insight = session.scalars(select(ProcessedInsight)).one()
+        assert insight.analysis_mode == "template"
+        assert insight.llm_model == "prescreen" and insight.llm_cost == 0.0
+
+
+def test_analyze_core_calls_llm_on_eventful_day(_analysis_env):
+    with session_scope() as session:
+        session.add_all(_rows(_LOUD))
+
+    assert analyze_mod.analyze_core("AAPL") == 1
+    assert len(_analysis_env) == 1
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from analysis.models.domain import AnalysisInput, InputArticle
-from analysis.prompts.templates import build_analysis_messages
+from analysis.prompts.templates import build_analysis_messages, build_delta_messages, compute_input_digest
 
 
 def _ai(max_chars: int = 600):
@@ -32,6 +32,19 @@ def test_build_messages_contains_system_and_user_and_schema():
     assert "[Articles]" in msgs[1]["content"]
 
 
+def test_system_prompt_is_byte_identical_across_calls():
+    first = build_analysis_messages(_ai(500), tone="neutral")
+    other = AnalysisInput(ticker="msft", locale="en_US", items=_ai().items, max_chars=2000)
+    second = build_analysis_messages(other, tone="formal")
+    delta = build_delta_messages(other.model_copy(update={"delta": True}))
+
+    # 캐시 접두어: 종목/로케일/톤이 달라도 시스템 메시지는 같고, 증분 프롬프트도 같은 접두어로 시작
+    assert first[0]["content"] == second[0]["content"]
+    assert delta[0]["content"].startswith(first[0]["content"])
+    assert "MSFT" not in second[0]["content"] and "en_US" not in second[0]["content"]
+    assert second[1]["content"].splitlines()[:3] == ["[Ticker] MSFT", "[Locale] en_US", "[Tone] formal"]
+
+
 def test_trimming_respects_max_chars():
     # With 500 chars, only part of first (1000) should appear, second likely excluded
     ai = _ai(500)
@@ -41,3 +54,28 @@ def test_trimming_respects_max_chars():
     assert user.count("Title:") == 1
     # Body length should be trimmed well below original 1000
     assert "A" * 600 not in user
+
+
+def test_compute_input_digest_is_stable_and_sensitive():
+    base = dict(model="gpt-4o-mini", locale="ko_KR", max_chars=5000)
+    digest = compute_input_digest(["fp1", "fp2"], **base)
+
+    assert digest == compute_input_digest(iter(["fp1", "fp2"]), **base)
+    assert digest != compute_input_digest(["fp2", "fp1"], **base)
+    assert digest != compute_input_digest(["fp1", "fp2"], **{**base, "model": "gpt-4o"})
+    assert digest != compute_input_digest(["fp1", "fp2"], prompt_version="other", **base)
+
+
+def test_compute_input_digest_covers_prompt_options():
+    base = dict(model="gpt-4o-mini", locale="ko_KR", max_chars=5000)
+    digest = compute_input_digest(["fp1"], **base)
+    opts = {"packer_top_k": 5, "extractive": [0.5, 400]}
+
+    assert digest == compute_input_digest(["fp1"], options={}, **base)
+    assert digest != compute_input_digest(["fp1"], options=opts, **base)
+    assert compute_input_digest(["fp1"], options=opts, **base) == compute_input_digest(
+        ["fp1"], options=dict(reversed(list(opts.items()))), **base
+    )
+    assert compute_input_digest(["fp1"], options=opts, **base) != compute_input_digest(
+        ["fp1"], options={**opts, "packer_top_k": 3}, **base
+    )
@@ -27,6 +27,7 @@ def test_save_insight_roundtrip(tmp_path: Path):
         llm_model="gpt-4o-mini",
         llm_tokens_prompt=100,
         llm_tokens_completion=50,
+        llm_tokens_cached=40,
         llm_cost=0.001,
     )
 
@@ -40,4 +41,5 @@ def test_save_insight_roundtrip(tmp_path: Path):
         assert fetched.ticker == "AAPL"
         assert fetched.llm_model == "gpt-4o-mini"
         assert fetched.sentiment_score == 0.5
+        assert fetched.llm_tokens_cached == 40
 
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import importlib
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+from sqlalchemy import delete
+
+from analysis.scheduler import TickerDemand, group_thin_tickers, plan_dispatch
+from ingestion.db.models import Base, JobRun, ProcessedInsight, RawArticle
+from ingestion.db.session import get_engine, session_scope
+from ingestion.settings import reset_settings_cache
+from llm.ledger import InMemorySpendLedger
+from llm.settings import reset_analysis_settings_cache
+
+NOW = datetime(2025, 6, 2, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("POSTGRES_DSN", f"sqlite:///{tmp_path / 'ingestion.db'}")
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'portal.db'}")
+    monkeypatch.setenv("INGESTION_REDIS_URL", "redis://localhost:6379/0")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-123")
+    reset_settings_cache()
+    reset_analysis_settings_cache()
+    yield
+    reset_settings_cache()
+    reset_analysis_settings_cache()
+
+
+def _demand(ticker: str, subscribers: int, unanalysed: int, hours: float | None, urgent: bool = False) -> TickerDemand:
+    return TickerDemand(ticker=ticker, subscribers=subscribers, unanalysed=unanalysed, hours_since_insight=hours, urgent=urgent)
+
+
+def test_plan_ranks_by_demand_and_stops_at_budget():
+    demands = [
+        _demand("AAPL", 50, 3, 2.0),
+        _demand("MSFT", 2, 1, 1.0),
+        _demand("TSLA", 2, 10, 30.0),
+        _demand("NVDA", 1, 1, 0.5, urgent=True),
+    ]
+
+    plan = plan_dispatch(demands, top_n=3, stale_hours=24.0, cost_per_run=0.01, budget_usd=0.025)
+
+    # 긴급 > 구독 많은 종목 > 오래되고 적체된 종목, 상위 3개 중 예산(2회분)까지만
+    assert [d.ticker for d in plan.dispatch] == ["NVDA", "AAPL"]
+    assert [d.ticker for d in plan.deferred] == ["TSLA"]
+    assert plan.estimated_cost_usd == pytest.approx(0.02)
+    assert plan_dispatch(demands, top_n=3, stale_hours=24.0, cost_per_run=0.01, budget_usd=-1.0).dispatch == []
+
+
+def test_thin_tickers_are_batched_into_groups():
+    demands = [
+        _demand("NVDA", 1, 1, 0.5, urgent=True),
+        _demand("AAPL", 50, 9, 2.0),
+        _demand("MSFT", 2, 1, 1.0),
+        _demand("TSLA", 2, 2, 30.0),
+        _demand("AMD", 1, 1, 5.0),
+        _demand("INTC", 1, 2, 5.0),
+    ]
+
+    groups, singles = group_thin_tickers(demands, max_articles=2, max_tickers=3)
+
+    # 긴급/적체 많은 종목은 단독, 나머지는 3개씩; 하나 남은 묶음은 단독으로 (원래 순서 유지)
+    assert [[d.ticker for d in g] for g in groups] == [["MSFT", "TSLA", "AMD"]]
+    assert [d.ticker for d in singles] == ["NVDA", "AAPL", "INTC"]
+
+
+def _article(ticker: str, i: int, at: datetime) -> RawArticle:
+    return RawArticle(
+        ticker=ticker,
+        source="news_api",
+        source_type="news",
+        title=f"{ticker} headline {i}",
+        body=f"{ticker} body {i}",
+        url=f"https://example.com/{ticker.lower()}/{i}",
+        fingerprint=f"{ticker}-fp{i}",
+        collected_at=at,
+    )
+
+
+def _insight(ticker: str, at: datetime, *, sentiment: float = 0.1, anomaly: float = 0.1) -> ProcessedInsight:
+    return ProcessedInsight(
+        ticker=ticker,
+        summary_text=f"{ticker} summary",
+        keywords=["news"],
+        sentiment_score=sentiment,
+        anomalies=[{"label": "move", "score": anomaly}],
+        generated_at=at,
+        llm_model="gpt-4o-mini",
+        llm_tokens_prompt=400,
+        llm_tokens_completion=100,
+        llm_cost=0.01,
+    )
+
+
+def test_schedule_dispatches_subscribed_tickers_with_backlog(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("LLM_DAILY_BUDGET_USD", "1")
+    api_database = importlib.reload(importlib.import_module("api.database"))
+    api_database.init_db()
+    scheduler = importlib.reload(importlib.import_module("analysis.scheduler"))
+    from api.db_models import StockSubscription
+
+    Base.metadata.create_all(bind=get_engine())
+    with session_scope() as session:
+        # 엔진이 프로세스 전역이라 다른 테스트가 남긴 행을 지운다
+        session.execute(delete(RawArticle))
+        session.execute(delete(ProcessedInsight))
+        session.execute(delete(JobRun))
+        session.add_all(
+            [
+                _insight("AAPL", NOW - timedelta(hours=30)),
+                _article("AAPL", 0, NOW - timedelta(hours=1)),
+                _article("AAPL", 1, NOW - timedelta(hours=2)),
+                # 직전 인사이트가 긴급 기준을 넘은 종목
+                _insight("MSFT", NOW - timedelta(hours=1), sentiment=-0.8),
+                _article("MSFT", 0, NOW - timedelta(minutes=10)),
+                # 구독자 없음
+                _article("TSLA", 0, NOW - timedelta(minutes=5)),
+                # 새 기사 없음
+                _article("NVDA", 0, NOW - timedelta(hours=3)),
+                _insight("NVDA", NOW - timedelta(hours=2)),
+            ]
+        )
+    with api_database.get_session() as api_session:
+        api_session.execute(delete(StockSubscription))
+        api_session.add_all(
+            [
+                StockSubscription(user_id=f"u{i}", ticker=ticker, alert_window="1d", status=status)
+                for i, (ticker, status) in enumerate(
+                    [
+                        ("AAPL", "Active"),
+                        ("AAPL", "Active"),
+                        ("MSFT", "Active"),
+                        ("NVDA", "Active"),
+                        ("TSLA", "Suspended"),
+                    ]
+                )
+            ]
+        )
+
+    sent: List[Tuple[str, int]] = []
+    ledger = InMemorySpendLedger()
+    monkeypatch.setattr(scheduler, "DISPATCHER", lambda ticker, priority: sent.append((ticker, priority)))
+    monkeypatch.setattr(scheduler, "get_spend_ledger", lambda: ledger)
+
+    assert scheduler.schedule_analysis(now=NOW) == ["MSFT", "AAPL"]
+    assert sent == [("MSFT", 0), ("AAPL", 6)]
+
+    # 남은 일 예산이 1회분(최근 평균 비용 0.01)뿐이면 최우선 종목만
+    ledger.add(0.985, model="gpt-4o-mini", stage="analyze", at=NOW)
+    sent.clear()
+    assert scheduler.schedule_analysis(now=NOW) == ["MSFT"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib
+from dataclasses import replace
 from pathlib import Path
 from typing import Any, Dict, Iterator, List
 import sys
@@ -13,6 +14,7 @@ if sys.version_info < (3, 10):
 from api.chat_service import ChatService, ChatServiceError
 from api.repositories import add_chat_message, create_chat_session, list_chat_messages
 from llm.client.openai_client import OpenAIClient
+from llm.ledger import InMemorySpendLedger
 from llm.settings import reset_analysis_settings_cache
 
 
@@ -111,6 +113,29 @@ async def test_handle_message_cost_limit(api_database, monkeypatch: pytest.Monke
         assert excinfo.value.code == "cost_limit"
 
 
+@pytest.mark.asyncio
+async def test_handle_message_budget_reject_is_not_reported_as_cost_limit(
+    api_database, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("LLM_DAILY_BUDGET_USD", "0.5")
+    monkeypatch.setenv("LLM_BUDGET_EXHAUSTED_ACTION", "reject")
+    reset_analysis_settings_cache()
+    ledger = InMemorySpendLedger()
+    ledger.add(1.0, model="gpt-4o-mini", stage="chat")
+
+    client = replace(OpenAIClient.from_env(stream_provider=_stream_provider), ledger=ledger)
+    service = ChatService(client, InMemoryCache(), rag_enabled=False)
+
+    with api_database.get_session() as session:
+        chat = create_chat_session(session, "demo-user", "insight_a")
+        session.commit()
+        with pytest.raises(ChatServiceError) as excinfo:
+            async for _ in service.handle_message(session, chat.session_id, "안녕?"):
+                pass
+        # 메시지를 줄여도 소용없으므로 비용 상한이 아닌 사용 한도 안내
+        assert excinfo.value.code == "budget_exhausted"
+
+
 def test_build_context_limits_history_and_caches(api_database):
     cache = InMemoryCache()
     client = OpenAIClient.from_env(stream_provider=_stream_provider)
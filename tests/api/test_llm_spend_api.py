@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import importlib
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from llm.ledger import InMemorySpendLedger, get_spend_ledger
+from llm.reconcile import InMemoryUsageReconciler, UsageSample, get_usage_reconciler
+from llm.settings import reset_analysis_settings_cache
+
+
+def _prepare_api(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, ledger: InMemorySpendLedger) -> TestClient:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path}/spend.db")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-123")
+    monkeypatch.setenv("LLM_DAILY_BUDGET_USD", "5")
+    reset_analysis_settings_cache()
+
+    api_database = importlib.reload(importlib.import_module("api.database"))
+    api_database.init_db()
+
+    api_main = importlib.reload(importlib.import_module("api.main"))
+    api_main.app.dependency_overrides[get_spend_ledger] = lambda: ledger
+    return TestClient(api_main.app)
+
+
+def test_llm_spend_reports_by_stage(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    ledger = InMemorySpendLedger()
+    ledger.add(0.25, model="gpt-4.1", stage="analyze")
+    ledger.add(0.05, model="gpt-4o-mini", stage="analyze")
+    ledger.add(0.1, model="gpt-4o-mini", stage="map")
+    client = _prepare_api(tmp_path, monkeypatch, ledger)
+
+    resp = client.get("/api/llm/spend")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["day"] == datetime.now(timezone.utc).date().isoformat()
+    assert data["total_usd"] == pytest.approx(0.4)
+    assert data["daily_budget_usd"] == pytest.approx(5.0)
+    stages = {s["stage"]: s for s in data["stages"]}
+    assert stages["analyze"]["total_usd"] == pytest.approx(0.3)
+    assert stages["analyze"]["models"] == {"gpt-4.1": pytest.approx(0.25), "gpt-4o-mini": pytest.approx(0.05)}
+    assert stages["map"]["total_usd"] == pytest.approx(0.1)
+
+    past = client.get("/api/llm/spend", params={"day": "2020-01-01"}).json()
+    assert past["total_usd"] == 0 and past["stages"] == [] and past["daily_budget_usd"] is None
+
+
+def test_llm_usage_reconciliation_report(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    reconciler = InMemoryUsageReconciler()
+    sample = UsageSample(
+        estimated_prompt_tokens=110,
+        prompt_tokens=100,
+        completion_tokens=50,
+        cached_tokens=20,
+        max_tokens=200,
+        estimated_cost_usd=0.004,
+        cost_usd=0.001,
+    )
+    reconciler.record(sample, model="gpt-4o-mini", stage="analyze")
+    reconciler.record(sample, model="gpt-4o-mini", stage="analyze")
+    client = _prepare_api(tmp_path, monkeypatch, InMemorySpendLedger())
+    client.app.dependency_overrides[get_usage_reconciler] = lambda: reconciler
+
+    data = client.get("/api/llm/usage-reconciliation").json()
+    [row] = data["rows"]
+    assert (row["stage"], row["model"], row["calls"]) == ("analyze", "gpt-4o-mini", 2)
+    assert row["prompt_tokens"] == 200 and row["cached_tokens"] == 40
+    assert row["prompt_error_ratio"] == pytest.approx(0.1)
+    assert row["completion_fill_ratio"] == pytest.approx(0.25)
+    assert row["cost_headroom_ratio"] == pytest.approx(4.0)
+
+    assert client.get("/api/llm/usage-reconciliation", params={"day": "2020-01-01"}).json()["rows"] == []
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from sqlalchemy import select
+
+from ingestion import dlq
+from ingestion.db.models import Base, DeadLetter, DeadLetterStatus
+from ingestion.db.session import get_engine, session_scope
+from ingestion.repositories.dead_letters import list_dead_letters, replay_dead_letters
+from ingestion.settings import reset_settings_cache
+from ingestion.tasks import collect as collect_mod
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv("INGESTION_REDIS_URL", "redis://127.0.0.1:1/0")
+    monkeypatch.setenv("POSTGRES_DSN", f"sqlite:///{tmp_path / 'dlq.db'}")
+    reset_settings_cache()
+    Base.metadata.create_all(bind=get_engine())
+    yield
+    reset_settings_cache()
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _seed(count: int, task_name: str = "ingestion.tasks.collect.collect_articles_for_ticker") -> None:
+    for i in range(count):
+        dlq.record_task_failure(
+            task_name,
+            task_id=f"task-{i}",
+            args=[f"T{i}", "news_api"],
+            kwargs={},
+            exception=RuntimeError(f"boom {i}"),
+            retries=3,
+        )
+
+
+def test_failed_collect_is_recorded_with_attempt_history():
+    class _FailConnector:
+        def fetch(self, ticker: str):
+            raise RuntimeError("upstream down")
+
+    collect_mod.CONNECTOR_FACTORY = lambda source: _FailConnector()
+    exc: BaseException | None = None
+    for _ in range(2):  # two attempts under the same Celery task id
+        with pytest.raises(RuntimeError) as info:
+            collect_mod.collect_core("AAPL", "news_api", trace_id="celery-task-1")
+        exc = info.value
+
+    dlq.record_task_failure(
+        "ingestion.tasks.collect.collect_articles_for_ticker",
+        task_id="celery-task-1",
+        args=("AAPL", "news_api"),
+        kwargs={},
+        exception=exc,
+        retries=1,
+    )
+
+    with session_scope() as session:
+        [entry] = list_dead_letters(session)
+        assert entry.ticker == "AAPL"
+        assert entry.args == ["AAPL", "news_api"]
+        assert entry.exception_class == "builtins.RuntimeError"
+        assert entry.error_message == "upstream down"
+        assert [a["attempt"] for a in entry.attempts] == [1, 2]
+        assert all(a["status"] == "failed" for a in entry.attempts)
+
+
+def test_replay_is_rate_limited_and_marks_entries():
+    _seed(5)
+    clock = _Clock()
+    sent: List[Tuple[str, List[Any], Dict[str, Any]]] = []
+
+    with session_scope() as session:
+        replayed = replay_dead_letters(
+            session,
+            lambda name, args, kwargs: sent.append((name, args, kwargs)),
+            rate_per_second=2.0,
+            sleep=clock.sleep,
+            clock=clock,
+        )
+
+    assert replayed == 5
+    assert sorted(args[0] for _, args, _ in sent) == ["T0", "T1", "T2", "T3", "T4"]
+    assert clock.sleeps == [0.5, 0.5, 0.5, 0.5]
+    with session_scope() as session:
+        rows = session.execute(select(DeadLetter)).scalars().all()
+        assert {r.status for r in rows} == {DeadLetterStatus.REPLAYED}
+        assert all(r.replay_count == 1 for r in rows)
+        assert list_dead_letters(session) == []
+
+
+def test_replay_failure_keeps_already_dispatched_entries_replayed():
+    _seed(5)
+    sent: List[str] = []
+
+    def dispatcher(name: str, args: List[Any], kwargs: Dict[str, Any]) -> None:
+        if len(sent) == 3:
+            raise ConnectionError("broker down")
+        sent.append(args[0])
+
+    with pytest.raises(ConnectionError):
+        with session_scope() as session:
+            replay_dead_letters(session, dispatcher, rate_per_second=0)
+
+    # 실패 전에 보낸 항목은 REPLAYED로 남아 다음 실행에서 다시 보내지 않는다
+    with session_scope() as session:
+        rows = {r.args[0]: r.status for r in session.execute(select(DeadLetter)).scalars()}
+        assert {t for t, s in rows.items() if s == DeadLetterStatus.REPLAYED} == set(sent)
+        assert len(sent) == 3 and {e.args[0] for e in list_dead_letters(session)} == set(rows) - set(sent)
+
+
+def test_cli_list_replay_and_discard(capsys):
+    _seed(3)
+    _seed(1, task_name="analysis.tasks.analyze.analyze_articles_for_ticker")
+
+    assert dlq.main(["list", "--task", "analysis.tasks.analyze.analyze_articles_for_ticker"]) == 0
+    [line] = capsys.readouterr().out.strip().splitlines()
+    analyze_entry = json.loads(line)
+    assert analyze_entry["status"] == "pending"
+
+    assert dlq.main(["discard", "--id", analyze_entry["id"]]) == 0
+    sent: List[str] = []
+    assert dlq.main(["replay", "--limit", "2", "--rate", "0"], dispatcher=lambda n, a, k: sent.append(a[0])) == 0
+    assert len(sent) == 2
+
+    capsys.readouterr()
+    dlq.main(["list"])
+    remaining = [json.loads(line) for line in capsys.readouterr().out.strip().splitlines()]
+    assert [r["args"][0] for r in remaining] == sorted({"T0", "T1", "T2"} - set(sent))
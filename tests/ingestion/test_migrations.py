@@ -40,7 +40,13 @@ def test_migrations_create_expected_tables(sqlite_url: str) -> None:
     assert {"stage", "status", "retry_count"}.issubset(job_columns)
 
     pi_columns = {column["name"] for column in inspector.get_columns("processed_insights")}
-    assert {"ticker", "summary_text", "llm_model", "llm_cost"}.issubset(pi_columns)
+    assert {"ticker", "summary_text", "llm_model", "llm_cost", "llm_route", "trace_id"}.issubset(pi_columns)
+
+    dl_columns = {column["name"] for column in inspector.get_columns("dead_letters")}
+    assert {"task_name", "args", "kwargs", "trace_id", "exception_class", "attempts", "status"}.issubset(dl_columns)
+
+    audit_columns = {column["name"] for column in inspector.get_columns("llm_audit_records")}
+    assert {"trace_id", "ticker", "request_hash", "response_hash", "request_bytes", "created_at"}.issubset(audit_columns)
 
 
 def test_models_roundtrip(sqlite_url: str) -> None:
@@ -58,3 +58,64 @@ def test_newsapi_rate_limit_raises_transient(httpx_mock):
     connector = NewsAPIConnector()
     with pytest.raises(Exception):
         connector.fetch("AAPL", max_attempts=1)
+
+
+def _page(page: int) -> str:
+    return f"https://newsapi.org/v2/everything?q=AAPL&language=ko&pageSize=20&sortBy=publishedAt&page={page}"
+
+
+def _articles(page: int, day: int, n: int = 20) -> list[dict[str, Any]]:
+    return [
+        {"title": f"p{page}-{i}", "description": "d", "url": f"https://ex.com/{page}/{i}", "publishedAt": f"2025-01-{day:02d}T00:00:00Z"}
+        for i in range(n)
+    ]
+
+
+def test_newsapi_fetches_remaining_pages_from_total_results(httpx_mock, monkeypatch):
+    monkeypatch.setenv("NEWS_API_MAX_PAGES", "5")
+    reset_settings_cache()
+    httpx_mock.add_response(url=_page(1), json={"status": "ok", "totalResults": 45, "articles": _articles(1, 20)})
+    httpx_mock.add_response(url=_page(2), json={"status": "ok", "totalResults": 45, "articles": _articles(2, 19)})
+    httpx_mock.add_response(url=_page(3), json={"status": "ok", "totalResults": 45, "articles": _articles(3, 18, 5)})
+
+    items = NewsAPIConnector()._fetch_raw("AAPL", None)
+
+    assert len(items) == 45
+    assert [it["title"] for it in items][::20] == ["p1-0", "p2-0", "p3-0"]
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_newsapi_respects_max_pages(httpx_mock, monkeypatch):
+    monkeypatch.setenv("NEWS_API_MAX_PAGES", "1")
+    reset_settings_cache()
+    httpx_mock.add_response(url=_page(1), json={"status": "ok", "totalResults": 500, "articles": _articles(1, 20)})
+
+    items = NewsAPIConnector()._fetch_raw("AAPL", None)
+
+    assert len(items) == 20
+
+
+def test_newsapi_stops_at_watermark(httpx_mock, monkeypatch):
+    monkeypatch.setenv("NEWS_API_MAX_PAGES", "5")
+    reset_settings_cache()
+    page1 = _articles(1, 20, 19) + _articles(1, 5, 1)
+    httpx_mock.add_response(url=_page(1), json={"status": "ok", "totalResults": 100, "articles": page1})
+
+    since = datetime(2025, 1, 10, tzinfo=timezone.utc)
+    items = NewsAPIConnector()._fetch_raw("AAPL", since)
+
+    assert len(items) == 20
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_newsapi_drops_page_entirely_past_watermark(httpx_mock, monkeypatch):
+    monkeypatch.setenv("NEWS_API_MAX_PAGES", "2")
+    monkeypatch.setenv("NEWS_API_SORT_BY", "relevancy")
+    reset_settings_cache()
+    base = "https://newsapi.org/v2/everything?q=AAPL&language=ko&pageSize=20&sortBy=relevancy"
+    httpx_mock.add_response(url=f"{base}&page=1", json={"status": "ok", "totalResults": 40, "articles": _articles(1, 20)})
+    httpx_mock.add_response(url=f"{base}&page=2", json={"status": "ok", "totalResults": 40, "articles": _articles(2, 3)})
+
+    items = NewsAPIConnector()._fetch_raw("AAPL", datetime(2025, 1, 10, tzinfo=timezone.utc))
+
+    assert {it["title"][:2] for it in items} == {"p1"}
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+import pytest
+
+from ingestion.connectors.base import PermanentError, TransientError
+from ingestion.connectors.rss import RSSConnector, iter_feed_items
+
+FIXTURES = Path(__file__).parent / "fixtures"
+RSS_URL = "https://news.example.com/aapl.rss"
+ATOM_URL = "https://news.example.kr/005930.atom"
+
+
+def _client(routes: Dict[str, bytes], seen: List[httpx.Request] | None = None, etag: str = '"v1"') -> httpx.Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if seen is not None:
+            seen.append(request)
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        body = routes.get(str(request.url))
+        if body is None:
+            return httpx.Response(404)
+        return httpx.Response(200, content=body, headers={"ETag": etag})
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_rss_feed_is_normalized():
+    client = _client({RSS_URL: (FIXTURES / "sample_feed.rss").read_bytes()})
+    connector = RSSConnector({"aapl": [RSS_URL]}, client=client, validators={})
+
+    items = connector.fetch("AAPL")
+
+    assert len(items) == 3
+    first = items[0]
+    assert first.title == "Apple unveils new chip"
+    assert first.source == "rss"
+    assert first.body == "Apple introduced a new chip."
+    assert first.language == "en"
+    assert first.published_at == datetime(2025, 1, 2, 9, 0, tzinfo=timezone.utc)
+
+
+def test_atom_feed_uses_alternate_link_and_feed_language():
+    client = _client({ATOM_URL: (FIXTURES / "sample_feed.atom").read_bytes()})
+    connector = RSSConnector({"005930": [ATOM_URL]}, client=client, validators={})
+
+    items = connector.fetch("005930")
+
+    assert len(items) == 2
+    assert str(items[0].url) == "https://news.example.kr/005930/earnings"
+    assert items[0].language == "ko"
+    assert items[1].body == "반도체 설비 투자 확대"
+    assert items[1].published_at == datetime(2024, 12, 31, 23, 30, tzinfo=timezone.utc)
+
+
+def test_stops_at_watermark():
+    client = _client({RSS_URL: (FIXTURES / "sample_feed.rss").read_bytes()})
+    connector = RSSConnector({"AAPL": [RSS_URL]}, client=client, validators={})
+
+    items = connector.fetch("AAPL", since=datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc))
+
+    assert [i.title for i in items] == ["Apple unveils new chip", "Apple supplier expands capacity"]
+
+
+def test_early_stop_does_not_read_rest_of_stream():
+    entries = (
+        "<item><title>t0</title><link>https://ex.com/0</link><pubDate>Tue, 28 Jan 2025 10:00:00 GMT</pubDate></item>"
+        "<item><title>t1</title><link>https://ex.com/1</link><pubDate>Mon, 27 Jan 2025 10:00:00 GMT</pubDate></item>"
+    )
+    old = "<item><title>old</title><link>https://ex.com/old</link><pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate></item>"
+    filler = "<item><title>x</title><link>https://ex.com/x</link></item>" * 50
+    chunks = [b"<rss><channel>", entries.encode(), old.encode()] + [filler.encode()] * 1000 + [b"</channel></rss>"]
+    consumed = {"n": 0}
+
+    def stream():
+        for chunk in chunks:
+            consumed["n"] += 1
+            yield chunk
+
+    items = list(iter_feed_items(stream(), since=datetime(2025, 1, 1, tzinfo=timezone.utc)))
+
+    assert [i["title"] for i in items] == ["t0", "t1"]
+    assert consumed["n"] < 10
+
+
+def test_conditional_get_skips_unchanged_feed():
+    seen: List[httpx.Request] = []
+    client = _client({RSS_URL: (FIXTURES / "sample_feed.rss").read_bytes()}, seen)
+    connector = RSSConnector({"AAPL": [RSS_URL]}, client=client, validators={})
+
+    assert len(connector.fetch("AAPL")) == 3
+    assert connector.fetch("AAPL") == []
+    assert "If-None-Match" not in seen[0].headers
+    assert seen[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_status_codes_map_to_connector_errors():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503 if "busy" in str(request.url) else 404)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    busy = RSSConnector({"AAPL": ["https://ex.com/busy.rss"]}, client=client, validators={})
+    missing = RSSConnector({"AAPL": ["https://ex.com/missing.rss"]}, client=client, validators={})
+
+    with pytest.raises(TransientError):
+        busy.fetch("AAPL", max_attempts=1)
+    with pytest.raises(PermanentError):
+        missing.fetch("AAPL")
+
+
+def test_malformed_feed_raises_permanent():
+    client = _client({RSS_URL: b"<rss><channel><item><title>broken"})
+    connector = RSSConnector({"AAPL": [RSS_URL]}, client=client, validators={})
+
+    with pytest.raises(PermanentError):
+        connector.fetch("AAPL")
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+from ingestion.connectors.news_api import NewsAPIConnector
+from ingestion.services.volume_monitor import (
+    ROUTINE,
+    URGENT,
+    InMemoryVolumeStore,
+    RedisVolumeStore,
+    VolumeMonitor,
+)
+from ingestion.settings import reset_settings_cache
+from ingestion.tasks import collect as collect_mod
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class WatchError(Exception):
+    pass
+
+
+class _FakePipeline:
+    def __init__(self, client: "FakeRedisHash") -> None:
+        self._client = client
+        self._watched: Dict[str, int] = {}
+        self._ops: List[Tuple[str, Dict[str, str]]] = []
+
+    def __enter__(self) -> "_FakePipeline":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def watch(self, name: str) -> None:
+        self._watched[name] = self._client.versions.get(name, 0)
+
+    def hgetall(self, name: str) -> Dict[bytes, bytes]:
+        return self._client.hgetall(name)
+
+    def multi(self) -> None:
+        if self._client.before_exec is not None:
+            hook, self._client.before_exec = self._client.before_exec, None
+            hook()
+
+    def hset(self, name: str, mapping: Dict[str, str]) -> None:
+        self._ops.append((name, mapping))
+
+    def execute(self) -> None:
+        if any(self._client.versions.get(n, 0) != v for n, v in self._watched.items()):
+            raise WatchError(next(iter(self._watched)))
+        for name, mapping in self._ops:
+            self._client.hset(name, mapping)
+
+
+class FakeRedisHash:
+    def __init__(self) -> None:
+        self._store: Dict[str, Dict[bytes, bytes]] = {}
+        self.versions: Dict[str, int] = {}
+        # MULTI 직후 한 번 실행 (다른 워커의 동시 갱신 흉내)
+        self.before_exec = None
+
+    def hgetall(self, name: str) -> Dict[bytes, bytes]:
+        return dict(self._store.get(name, {}))
+
+    def hset(self, name: str, mapping: Dict[str, str]) -> int:
+        self._store.setdefault(name, {}).update({k.encode(): v.encode() for k, v in mapping.items()})
+        self.versions[name] = self.versions.get(name, 0) + 1
+        return len(mapping)
+
+    def pipeline(self) -> _FakePipeline:
+        return _FakePipeline(self)
+
+
+def _monitor(store, clock, **kwargs) -> VolumeMonitor:
+    params = dict(alpha=0.3, z_threshold=3.0, min_count=3, warmup_samples=5, quiet_interval_seconds=3600)
+    params.update(kwargs)
+    return VolumeMonitor(store, clock=clock, **params)
+
+
+def test_spike_after_warmup_triggers_urgent():
+    clock = _Clock()
+    monitor = _monitor(InMemoryVolumeStore(), clock)
+    for count in (1, 2, 1, 2, 1, 2):
+        monitor.observe("aapl", count)
+
+    signal = monitor.observe("AAPL", 12)
+
+    assert signal.spike is True
+    assert signal.dispatch == URGENT
+    assert signal.zscore > 3.0
+
+
+def test_no_spike_during_warmup_or_below_min_count():
+    clock = _Clock()
+    monitor = _monitor(InMemoryVolumeStore(), clock, quiet_interval_seconds=10**9)
+    monitor.observe("AAPL", 0)
+    assert monitor.observe("AAPL", 50).spike is False  # warm-up
+
+    quiet = _monitor(InMemoryVolumeStore(), clock, warmup_samples=1, quiet_interval_seconds=10**9)
+    for _ in range(5):
+        quiet.observe("TSLA", 0)
+    assert quiet.observe("TSLA", 2).spike is False  # below min_count
+
+
+def test_quiet_ticker_gets_routine_dispatch_on_slow_cadence():
+    clock = _Clock()
+    monitor = _monitor(InMemoryVolumeStore(), clock)
+
+    assert monitor.observe("AAPL", 1).dispatch == ROUTINE
+    clock.now += 600
+    assert monitor.observe("AAPL", 1).dispatch is None
+    clock.now += 3600
+    assert monitor.observe("AAPL", 0).dispatch == ROUTINE  # pending article from previous tick
+    clock.now += 3600
+    assert monitor.observe("AAPL", 0).dispatch is None  # nothing new to analyse
+
+
+def test_redis_store_roundtrip():
+    client = FakeRedisHash()
+    clock = _Clock()
+    first = _monitor(RedisVolumeStore(client), clock)
+    for count in (2, 2, 2, 2, 2):
+        first.observe("AAPL", count)
+
+    # a fresh monitor (another worker) sees the same state
+    second = _monitor(RedisVolumeStore(client), clock)
+    signal = second.observe("AAPL", 9)
+
+    assert signal.spike is True
+    assert b"mean" in client.hgetall("volume:AAPL")
+
+
+def test_redis_store_reapplies_observation_on_concurrent_update():
+    client = FakeRedisHash()
+    clock = _Clock()
+    first = _monitor(RedisVolumeStore(client), clock, quiet_interval_seconds=10**9)
+    other = _monitor(RedisVolumeStore(client), clock, quiet_interval_seconds=10**9)
+    first.observe("AAPL", 1)
+
+    # 두 워커가 같은 상태를 읽은 뒤 다른 워커가 먼저 저장하면, 늦은 쪽은 다시 읽어 반영한다
+    client.before_exec = lambda: other.observe("AAPL", 2)
+    first.observe("AAPL", 3)
+
+    state = RedisVolumeStore(client).load("AAPL")
+    assert state is not None and state.samples == 3 and state.pending == 6
+
+
+def test_release_restores_claim_after_failed_dispatch():
+    clock = _Clock()
+    monitor = _monitor(InMemoryVolumeStore(), clock)
+    signal = monitor.observe("AAPL", 2)
+    assert signal.dispatch == ROUTINE and signal.claimed == 2
+
+    monitor.release(signal)
+    clock.now += 60
+    retried = monitor.observe("AAPL", 0)
+
+    # 예약했던 기사가 다시 대기 상태가 되어 정기 주기를 기다리지 않고 재디스패치된다
+    assert retried.dispatch == ROUTINE and retried.claimed == 2
+
+
+@pytest.fixture()
+def _collect_env(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv("INGESTION_REDIS_URL", "redis://127.0.0.1:1/0")
+    monkeypatch.setenv("POSTGRES_DSN", f"sqlite:///{tmp_path / 'volume.db'}")
+    monkeypatch.setenv("VOLUME_MONITOR_ENABLED", "true")
+    monkeypatch.setenv("ANALYSIS_QUIET_INTERVAL_MINUTES", "60")
+    reset_settings_cache()
+    monkeypatch.setattr(collect_mod, "_LOCAL_VOLUME_STORE", InMemoryVolumeStore())
+    dispatched: List[Tuple[str, int]] = []
+    monkeypatch.setattr(collect_mod, "ANALYSIS_DISPATCHER", lambda t, p: dispatched.append((t, p)))
+    yield dispatched
+    reset_settings_cache()
+
+
+def test_collect_core_dispatches_analysis_for_new_articles(_collect_env):
+    def provider(_ticker, _since):
+        return [
+            {
+                "title": "AAPL jumps",
+                "description": "good earnings",
+                "url": "https://ex.com/v1",
+                "publishedAt": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            }
+        ]
+
+    collect_mod.CONNECTOR_FACTORY = lambda source: NewsAPIConnector(provider=provider)
+
+    assert collect_mod.collect_core("AAPL", "news_api") == 1
+    assert collect_mod.collect_core("AAPL", "news_api") == 0
+
+    # first observation dispatches a routine run; the second tick is inside the quiet interval
+    assert _collect_env == [("AAPL", 6)]
+
+
+def test_collect_core_keeps_pending_when_dispatch_fails(_collect_env, monkeypatch):
+    def provider(_ticker, _since):
+        return [
+            {
+                "title": "AAPL jumps",
+                "description": "good earnings",
+                "url": "https://ex.com/v2",
+                "publishedAt": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            }
+        ]
+
+    def broken(ticker: str, priority: int) -> None:
+        raise ConnectionError("broker down")
+
+    collect_mod.CONNECTOR_FACTORY = lambda source: NewsAPIConnector(provider=provider)
+    monkeypatch.setattr(collect_mod, "ANALYSIS_DISPATCHER", broken)
+
+    # 디스패치 실패가 수집을 실패시키지 않고, 대기 기사는 다음 관측을 위해 남는다
+    assert collect_mod.collect_core("AAPL", "news_api") == 1
+    state = collect_mod._LOCAL_VOLUME_STORE.load("AAPL")
+    assert state is not None and state.pending == 1 and state.last_dispatched_at == 0.0
+
+
+def test_collect_redis_client_is_retried_after_outage(monkeypatch):
+    from llm import redis_client
+
+    now = {"t": 0.0}
+    live = object()
+    monkeypatch.setattr(
+        redis_client, "connect_redis", lambda url, *, component: live if now["t"] >= 30 else None
+    )
+    monkeypatch.setattr(collect_mod, "_REDIS", redis_client.RedisConnector("ingestion.collect", clock=lambda: now["t"]))
+
+    # 한 번의 연결 실패를 캐시하지 않고, 재연결 간격 뒤에는 공유 저장소로 돌아간다
+    assert collect_mod._redis_client("redis://cache:6379/0") is None
+    now["t"] = 30.0
+    assert collect_mod._redis_client("redis://cache:6379/0") is live
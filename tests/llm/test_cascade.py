@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict
+
+import pytest
+
+from analysis.models.domain import AnalysisInput, InputArticle
+from llm.client.cascade import ModelCascade
+from llm.client.openai_client import InvalidResponseError, OpenAIClient, TransientLLMError
+from llm.settings import get_analysis_settings, reset_analysis_settings_cache
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch: pytest.MonkeyPatch):
+    reset_analysis_settings_cache()
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-123")
+    monkeypatch.setenv("ANALYSIS_CASCADE_MODELS", '["gpt-4o-mini", "gpt-4.1"]')
+    monkeypatch.setenv("ANALYSIS_RETRY_MAX_ATTEMPTS", "1")
+    monkeypatch.setenv("ANALYSIS_COST_LIMIT_USD", "0.05")
+    yield
+    reset_analysis_settings_cache()
+
+
+def _ai() -> AnalysisInput:
+    item = InputArticle(title="Apple hits new high", body="Earnings beat.", url="https://example.com/aapl")
+    return AnalysisInput(ticker="AAPL", locale="ko_KR", items=[item], max_chars=2000)
+
+
+def _provider(responses: Dict[str, Any], seen: list):
+    def _call(payload: Dict[str, Any]) -> Dict[str, Any]:
+        model = payload["model"]
+        seen.append(model)
+        content = responses[model]
+        return {
+            "choices": [{"message": {"content": content if isinstance(content, str) else json.dumps(content)}}],
+            "usage": {"prompt_tokens": 500, "completion_tokens": 100},
+            "model": model,
+        }
+
+    return _call
+
+
+def _data(confidence=0.9, anomaly_score=None) -> Dict[str, Any]:
+    anomalies = [] if anomaly_score is None else [{"label": "guidance", "description": "cut", "score": anomaly_score}]
+    return {
+        "summary_text": "ok",
+        "keywords": ["apple"],
+        "sentiment_score": 0.2,
+        "anomalies": anomalies,
+        "confidence": confidence,
+    }
+
+
+def _cascade(responses: Dict[str, Any], seen: list) -> ModelCascade:
+    cascade = ModelCascade.from_client(OpenAIClient(get_analysis_settings(), provider=_provider(responses, seen)))
+    assert cascade is not None
+    return cascade
+
+
+def test_cascade_keeps_cheap_result_on_boring_day():
+    seen: list = []
+    outcome = _cascade({"gpt-4o-mini": _data()}, seen).analyze(_ai())
+
+    assert seen == ["gpt-4o-mini"]
+    assert not outcome.escalated
+    assert outcome.result.llm_model == "gpt-4o-mini"
+    assert outcome.route()["attempts"][0]["escalation"] is None
+
+
+@pytest.mark.parametrize(
+    "cheap, reason",
+    [
+        (_data(confidence=0.3), "low_confidence"),
+        (_data(anomaly_score=0.9), "anomaly"),
+        ("not json", "invalid"),
+    ],
+)
+def test_cascade_escalates_and_sums_usage(cheap, reason):
+    seen: list = []
+    outcome = _cascade({"gpt-4o-mini": cheap, "gpt-4.1": _data(confidence=0.2)}, seen).analyze(_ai())
+
+    assert seen[-1] == "gpt-4.1"
+    assert outcome.escalated
+    route = outcome.route()
+    assert route["final_model"] == "gpt-4.1"
+    assert [a["escalation"] for a in route["attempts"]] == [reason, None]
+    # 마지막 모델 결과는 확신도와 무관하게 채택, 토큰/비용은 무효 응답을 포함한 모든 시도 합계
+    assert all(a["cost"] > 0 and a["tokens_prompt"] == 500 for a in route["attempts"])
+    assert outcome.result.llm_cost == pytest.approx(sum(a["cost"] for a in route["attempts"]))
+    assert outcome.result.llm_tokens_prompt == 1000
+
+
+def test_cascade_propagates_non_validation_errors():
+    def _fail(_: Dict[str, Any]) -> Dict[str, Any]:
+        raise TransientLLMError("rate limited")
+
+    cascade = ModelCascade.from_client(OpenAIClient(get_analysis_settings(), provider=_fail))
+    with pytest.raises(TransientLLMError):
+        cascade.analyze(_ai())
+
+
+def test_cascade_raises_when_last_model_invalid():
+    seen: list = []
+    with pytest.raises(InvalidResponseError):
+        _cascade({"gpt-4o-mini": "nope", "gpt-4.1": "still nope"}, seen).analyze(_ai())
+    assert seen[0] == "gpt-4o-mini" and seen[-1] == "gpt-4.1"
+
+
+def test_cascade_disabled_with_single_model(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("ANALYSIS_CASCADE_MODELS", '["gpt-4o-mini"]')
+    reset_analysis_settings_cache()
+    assert ModelCascade.from_client(OpenAIClient(get_analysis_settings())) is None
+
+
+def test_cascade_records_spend_of_stream_aborted_attempt(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("ANALYSIS_STREAM_PARSE", "true")
+    reset_analysis_settings_cache()
+    bodies = {
+        "gpt-4o-mini": json.dumps({"summary_text": "ok", "sentiment_score": 7}),
+        "gpt-4.1": json.dumps(_data()),
+    }
+
+    def _stream(payload: Dict[str, Any]):
+        body = bodies[payload["model"]]
+        for start in range(0, len(body), 8):
+            yield {"choices": [{"delta": {"content": body[start : start + 8]}}], "model": payload["model"]}
+        yield {"choices": [], "usage": {"prompt_tokens": 500, "completion_tokens": 100}, "model": payload["model"]}
+
+    cascade = ModelCascade.from_client(OpenAIClient(get_analysis_settings(), stream_provider=_stream))
+    assert cascade is not None
+    outcome = cascade.analyze(_ai())
+
+    # 스키마 위반으로 끊은 저가 모델 시도도 받은 만큼(추정 토큰)의 비용으로 남는다
+    aborted, final = outcome.attempts
+    assert (aborted.model, aborted.escalation) == ("gpt-4o-mini", "invalid")
+    assert aborted.tokens_prompt > 0 and aborted.tokens_completion > 0 and aborted.cost > 0
+    assert outcome.result.llm_cost == pytest.approx(aborted.cost + final.cost)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+
+from analysis.models.domain import AnalysisInput, InputArticle
+from llm.client.openai_client import OpenAIClient
+from llm.fake_server import FakeLLMConfig, create_app
+from llm.settings import get_analysis_settings, reset_analysis_settings_cache
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch: pytest.MonkeyPatch):
+    reset_analysis_settings_cache()
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-123")
+    monkeypatch.setenv("ANALYSIS_RETRY_BASE_DELAY_SECONDS", "0.01")
+    yield
+    reset_analysis_settings_cache()
+
+
+def _client(**kw: Any) -> TestClient:
+    return TestClient(create_app(FakeLLMConfig(latency_ms=0, **kw)))
+
+
+def _provider(http: TestClient):
+    def _call(payload: Dict[str, Any]) -> Dict[str, Any]:
+        body = {k: v for k, v in payload.items() if k != "timeout"}
+        resp = http.post("/v1/chat/completions", json=body)
+        resp.raise_for_status()
+        return resp.json()
+
+    return _call
+
+
+def _stream_provider(http: TestClient):
+    def _call(payload: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        resp = http.post("/v1/chat/completions", json=payload)
+        resp.raise_for_status()
+        for line in resp.text.splitlines():
+            if line.startswith("data: ") and line != "data: [DONE]":
+                yield json.loads(line[len("data: ") :])
+
+    return _call
+
+
+def _ai() -> AnalysisInput:
+    item = InputArticle(title="Apple expands buyback program", body="Earnings beat.", url="https://example.com/a")
+    return AnalysisInput(ticker="AAPL", items=[item])
+
+
+def _usage(http: TestClient) -> List[Dict[str, Any]]:
+    return http.get("/_fake/stats").json()["usage"]
+
+
+def test_analysis_completion_is_deterministic_and_parses():
+    http = _client()
+    client = OpenAIClient(get_analysis_settings(), provider=_provider(http))
+
+    first = client.analyze(_ai())
+    second = client.analyze(_ai())
+
+    assert first.summary_text == second.summary_text
+    assert first.sentiment_score == second.sentiment_score
+    assert "apple" in first.keywords
+    assert first.confidence is not None
+    usage = _usage(http)
+    assert usage[0]["endpoint"] == "chat.completions" and usage[0]["requests"] == 2
+    assert first.llm_tokens_prompt + second.llm_tokens_prompt == usage[0]["prompt_tokens"]
+
+
+def test_grouped_completion_returns_one_result_per_ticker():
+    http = _client()
+    client = OpenAIClient(get_analysis_settings(), provider=_provider(http))
+    msft = InputArticle(title="Microsoft launches Copilot update", body="New features.", url="https://example.com/m")
+
+    results = client.analyze_grouped([_ai(), AnalysisInput(ticker="MSFT", items=[msft])])
+
+    assert [r.ticker for r in results] == ["AAPL", "MSFT"]
+    assert "apple" in results[0].keywords and "microsoft" in results[1].keywords
+    assert sum(r.llm_tokens_prompt for r in results) == _usage(http)[0]["prompt_tokens"]
+
+
+def test_prompt_cache_reports_repeated_prefix():
+    http = _client()
+    client = OpenAIClient(get_analysis_settings(), provider=_provider(http))
+    item = InputArticle(title="Apple expands buyback program", body="Earnings beat. " * 400, url="https://example.com/a")
+    inp = AnalysisInput(ticker="AAPL", items=[item], max_chars=8000)
+
+    first = client.analyze(inp)
+    second = client.analyze(inp)
+
+    assert first.llm_tokens_cached == 0
+    # 1024토큰 이상, 128토큰 단위
+    assert second.llm_tokens_cached >= 1024 and second.llm_tokens_cached % 128 == 0
+    assert second.llm_cost < first.llm_cost
+    assert _usage(http)[0]["cached_tokens"] == second.llm_tokens_cached
+
+
+def test_stream_chat_matches_server_usage():
+    http = _client(chat_reply_tokens=40)
+    client = OpenAIClient(get_analysis_settings(), stream_provider=_stream_provider(http))
+    messages = [{"role": "user", "content": "리스크 요인은?"}]
+
+    text = "".join(client.stream_chat(messages))
+
+    assert text and len(text) <= 40 * 4
+    usage = _usage(http)[0]
+    assert usage["endpoint"] == "chat.completions.stream"
+    assert usage["completion_tokens"] == math.ceil(len(text) / 4)
+
+
+def test_injected_rate_limit_is_retried():
+    http = _client(error_rate=0.5, retry_after_seconds=0, seed=3)
+    client = OpenAIClient(get_analysis_settings(), provider=_provider(http))
+
+    statuses = [http.post("/v1/chat/completions", json={"messages": []}).status_code for _ in range(8)]
+    assert 429 in statuses and 200 in statuses
+    resp = next(
+        r for r in (http.post("/v1/chat/completions", json={"messages": []}) for _ in range(20)) if r.status_code == 429
+    )
+    assert resp.headers["retry-after"] == "0"
+
+    result = client.analyze(_ai())
+    assert result.summary_text
+
+
+def test_invalid_json_injection_and_length_cap():
+    http = _client(invalid_json_rate=1.0)
+    body = {"messages": [{"role": "user", "content": "Apple"}], "response_format": {"type": "json_object"}}
+    content = http.post("/v1/chat/completions", json=body).json()["choices"][0]["message"]["content"]
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(content)
+
+    capped = _client().post("/v1/chat/completions", json={**body, "max_tokens": 3}).json()
+    assert capped["choices"][0]["finish_reason"] == "length"
+    assert capped["usage"]["completion_tokens"] == 3
+
+
+def test_embeddings_are_deterministic_unit_vectors():
+    http = _client(embedding_dim=16)
+    data = http.post("/v1/embeddings", json={"input": ["a", "b", "a"], "model": "text-embedding-3-small"}).json()
+    vectors = [item["embedding"] for item in data["data"]]
+
+    assert len(vectors) == 3 and len(vectors[0]) == 16
+    assert vectors[0] == vectors[2] and vectors[0] != vectors[1]
+    assert sum(v * v for v in vectors[0]) == pytest.approx(1.0)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from analysis.models.domain import AnalysisInput, InputArticle
+from llm.client.incremental import AnalysisStreamParser, IncrementalJSONParser, IncrementalParseError
+from llm.client.openai_client import OpenAIClient, StreamAbortedError
+from llm.ledger import InMemorySpendLedger
+from llm.settings import get_analysis_settings, reset_analysis_settings_cache
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch: pytest.MonkeyPatch):
+    reset_analysis_settings_cache()
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-123")
+    monkeypatch.setenv("ANALYSIS_STREAM_PARSE", "true")
+    monkeypatch.setenv("ANALYSIS_RETRY_MAX_ATTEMPTS", "1")
+    monkeypatch.setenv("ANALYSIS_RETRY_BASE_DELAY_SECONDS", "0.01")
+    yield
+    reset_analysis_settings_cache()
+
+
+_VALID = {
+    "summary_text": 'Apple "beat" \\ estimates\né한',
+    "keywords": ["apple", "earnings"],
+    "sentiment_score": -0.25e0,
+    "anomalies": [{"label": "guidance", "description": "raised", "score": 0.5}],
+    "confidence": None,
+    "extra": {"nested": [1, 2.5, True, False, {"a": []}]},
+}
+
+
+def _feed_in_pieces(text: str, size: int) -> List[tuple]:
+    parser = IncrementalJSONParser()
+    fields: List[tuple] = []
+    for start in range(0, len(text), size):
+        fields.extend(parser.feed(text[start : start + size]))
+    parser.finish()
+    return fields
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1000])
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_parser_emits_top_level_fields_in_order(size: int, ensure_ascii: bool):
+    text = json.dumps(_VALID, ensure_ascii=ensure_ascii, indent=1)
+    assert _feed_in_pieces(text, size) == list(_VALID.items())
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Sure! Here is the JSON",
+        '```json\n{"summary_text": "x"}',
+        '{"summary_text": "x" "keywords": []}',
+        '{"sentiment_score": 01}',
+        '{"keywords": [1, 2}',
+        '{"confidence": nul!',
+        '{"summary_text": "bad \\q escape"}',
+        '{"summary_text": "x"} trailing',
+    ],
+)
+def test_parser_rejects_invalid_json_early(text: str):
+    parser = IncrementalJSONParser()
+    with pytest.raises(IncrementalParseError) as info:
+        parser.feed(text)
+    assert info.value.reason == "syntax"
+
+
+def test_parser_requires_closed_object():
+    parser = IncrementalJSONParser()
+    parser.feed('{"summary_text": "cut off')
+    with pytest.raises(IncrementalParseError):
+        parser.finish()
+
+
+def test_analysis_parser_validates_fields_as_they_complete():
+    parser = AnalysisStreamParser()
+    parser.feed('{"summary_text": "ok", "sentiment_score": ')
+    assert parser.fields == {"summary_text": "ok"}
+    with pytest.raises(IncrementalParseError) as info:
+        parser.feed("3.5,")
+    assert info.value.reason == "schema"
+
+    anomalies = AnalysisStreamParser()
+    with pytest.raises(IncrementalParseError):
+        anomalies.feed('{"anomalies": [{"label": "x"}]')
+
+
+def test_analysis_parser_stops_overlong_summary_before_it_closes():
+    parser = AnalysisStreamParser()
+    parser.feed('{"summary_text": "' + "a" * 4000)
+    with pytest.raises(IncrementalParseError) as info:
+        parser.feed("a")
+    assert info.value.reason == "length"
+
+
+def _ai() -> AnalysisInput:
+    item = InputArticle(title="Apple", body="Earnings beat.", url="https://example.com/a")
+    return AnalysisInput(ticker="AAPL", items=[item])
+
+
+def _stream(contents: List[str], consumed: List[int], *, usage: Dict[str, int] | None = None):
+    calls = {"n": 0}
+
+    def _call(payload: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        content = contents[min(calls["n"], len(contents) - 1)]
+        calls["n"] += 1
+
+        def _gen() -> Iterator[Dict[str, Any]]:
+            for start in range(0, len(content), 4):
+                consumed.append(1)
+                yield {"choices": [{"delta": {"content": content[start : start + 4]}}], "model": payload["model"]}
+            if usage:
+                yield {"choices": [], "usage": usage, "model": payload["model"]}
+
+        return _gen()
+
+    return _call
+
+
+class _ListAudit:
+    def __init__(self, entries: List[Any]) -> None:
+        self.entries = entries
+
+    def submit(self, entry: Any) -> None:
+        self.entries.append(entry)
+
+
+def test_analyze_streaming_aborts_derailed_output_and_reports_savings():
+    consumed: List[int] = []
+    derailed = "I cannot produce JSON for this request, but here is a long explanation... " * 10
+    ledger = InMemorySpendLedger()
+    audited: List[Any] = []
+    client = OpenAIClient(
+        get_analysis_settings(), stream_provider=_stream([derailed], consumed), ledger=ledger
+    ).with_audit(_ListAudit(audited), trace_id="trace-abort", ticker="AAPL")
+
+    with pytest.raises(StreamAbortedError) as info:
+        client.analyze(_ai())
+
+    # 첫 chunk에서 중단 (재시도 1회 포함 2번 시도)
+    assert len(consumed) == 2
+    assert info.value.reason == "syntax"
+    assert info.value.saved_completion_tokens == get_analysis_settings().analysis_max_tokens - 1
+    assert ledger.day_total() > 0
+    # 중단된 시도마다 받은 부분 응답이 감사 기록으로 남는다
+    assert [e.trace_id for e in audited] == ["trace-abort", "trace-abort"]
+    assert audited[0].response["choices"][0]["message"]["content"] == derailed[:4]
+
+
+def test_analyze_streaming_retries_syntax_abort_then_succeeds():
+    consumed: List[int] = []
+    good = json.dumps({"summary_text": "ok", "keywords": ["a"], "sentiment_score": 0.1, "anomalies": []})
+    usage = {"prompt_tokens": 40, "completion_tokens": 20}
+    client = OpenAIClient(get_analysis_settings(), stream_provider=_stream(["oops", good], consumed, usage=usage))
+
+    streamed = client.analyze_streaming(_ai())
+
+    assert streamed.result.summary_text == "ok"
+    assert streamed.result.llm_tokens_prompt == 40 and streamed.result.llm_tokens_completion == 20
+    assert [e.reason for e in streamed.aborted] == ["syntax"]
+    assert streamed.saved_completion_tokens > 0
+
+
+def test_analyze_streaming_does_not_retry_schema_abort():
+    consumed: List[int] = []
+    bad = json.dumps({"summary_text": "ok", "sentiment_score": 7, "keywords": ["x"] * 50})
+    client = OpenAIClient(get_analysis_settings(), stream_provider=_stream([bad], consumed))
+
+    with pytest.raises(StreamAbortedError) as info:
+        client.analyze(_ai())
+    assert info.value.reason == "schema"
+    # sentiment_score가 완성되는 시점에 중단해 뒤쪽 keywords는 받지 않는다
+    assert len(consumed) < len(bad) // 4
@@ -76,3 +76,28 @@ def test_stream_chat_timeout(monkeypatch: pytest.MonkeyPatch):
                 retry_max_attempts=0,
             )
         )
+
+
+def test_stream_chat_retries_only_before_first_chunk(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("ANALYSIS_RETRY_BASE_DELAY_SECONDS", "0.01")
+    reset_analysis_settings_cache()
+    calls = {"n": 0}
+
+    def flaky_provider(_: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise ConnectionError("reset before first chunk")
+        yield {"choices": [{"delta": {"content": "hello"}}]}
+        if calls["n"] == 2:
+            raise ConnectionError("reset mid-stream")
+        yield {"choices": [{"delta": {"content": " world"}}]}
+
+    client = OpenAIClient.from_env(stream_provider=flaky_provider)
+    received = []
+    with pytest.raises(TransientLLMError):
+        for chunk in client.stream_chat(messages=[{"role": "user", "content": "hi"}], retry_max_attempts=2):
+            received.append(chunk)
+
+    # 첫 조각 전 실패만 재시도되고, 조각을 보낸 뒤 끊기면 중복 없이 오류로 끝난다
+    assert calls["n"] == 2
+    assert received == ["hello"]
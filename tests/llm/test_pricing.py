@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from analysis.models.domain import AnalysisInput, InputArticle
+from analysis.prompts.packer import estimate_tokens
+from llm import pricing
+from llm.client.openai_client import OpenAIClient
+from llm.pricing import PriceTable, get_price_table, reset_price_table_cache
+from llm.reconcile import InMemoryUsageReconciler, reconciliation_report
+from llm.settings import get_analysis_settings, reset_analysis_settings_cache
+from llm.tokenizer import HeuristicTokenizer, get_tokenizer
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch: pytest.MonkeyPatch):
+    reset_analysis_settings_cache()
+    reset_price_table_cache()
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-123")
+    monkeypatch.setenv("LLM_TOKENIZER", "heuristic")
+    yield
+    reset_analysis_settings_cache()
+    reset_price_table_cache()
+
+
+def test_prices_are_overridden_from_file_then_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    path = tmp_path / "prices.json"
+    path.write_text(
+        json.dumps(
+            {
+                "gpt-4o": {"prompt": 0.0025, "completion": 0.01},
+                "gpt-4o-mini": {"prompt": 0.001, "completion": 0.002},
+            }
+        )
+    )
+    monkeypatch.setenv("LLM_PRICES_FILE", str(path))
+    monkeypatch.setenv(
+        "LLM_PRICES", json.dumps({"gpt-4o-mini": {"prompt": 0.0002, "completion": 0.0006, "batch_ratio": 0.25}})
+    )
+    reset_analysis_settings_cache()
+
+    prices = get_price_table()
+
+    assert {"gpt-4o", "gpt-4o-mini", "gpt-4.1"} <= set(prices.models)
+    assert prices.cost("gpt-4o", 1000, 1000) == pytest.approx(0.0125)
+    assert prices.cost("gpt-4o-mini", 1000, 1000) == pytest.approx(0.0008)
+    # 캐시 단가가 없으면 일반 입력 단가로 과금
+    assert prices.cost("gpt-4o", 1000, 0, cached_tokens=1000) == pytest.approx(0.0025)
+    # 배치 결과는 batch_ratio(없으면 기본 0.5)를 곱한다
+    assert prices.cost("gpt-4o", 1000, 1000, batch=True) == pytest.approx(0.00625)
+    assert prices.cost("gpt-4o-mini", 1000, 1000, batch=True) == pytest.approx(0.0002)
+
+
+@pytest.mark.parametrize(
+    "entry", [{"prompt": 0.0025}, {"prompt": 0.0025, "completion": 0.01, "batch_ratio": 1.5}]
+)
+def test_invalid_price_entry_is_rejected(monkeypatch: pytest.MonkeyPatch, entry: Dict[str, Any]):
+    monkeypatch.setenv("LLM_PRICES", json.dumps({"gpt-4o": entry}))
+    reset_analysis_settings_cache()
+
+    with pytest.raises(RuntimeError):
+        get_analysis_settings()
+
+
+def test_snapshot_names_resolve_and_unknown_models_warn_once(monkeypatch: pytest.MonkeyPatch):
+    warnings: list = []
+    monkeypatch.setattr(pricing.logger, "warning", lambda msg, *args, **kwargs: warnings.append(msg))
+    prices = get_price_table()
+
+    assert prices.price("gpt-4.1-2025-04-14") == prices.price("gpt-4.1")
+    first = prices.cost("o3-pro", 1000, 1000)
+    prices.cost("o3-pro", 1000, 1000)
+
+    # 미등록 모델은 가장 비싼 단가로 계산 (예전의 gpt-4o-mini 조용한 폴백 대신)
+    assert first == pytest.approx(prices.cost("gpt-4.1", 1000, 1000))
+    assert warnings == ["llm.unknown_model_price"]
+
+
+def test_empty_price_table_is_rejected():
+    with pytest.raises(ValueError):
+        PriceTable({})
+
+
+def test_heuristic_tokenizer_matches_packer_estimate():
+    tokenizer = get_tokenizer("heuristic")
+
+    assert isinstance(tokenizer, HeuristicTokenizer)
+    for text in ("", "a", "Apple hits new high", "가" * 17):
+        assert tokenizer.count(text) == estimate_tokens(text)
+    messages = [{"role": "system", "content": "x" * 10}, {"role": "user", "content": "y" * 7}]
+    assert tokenizer.count_messages(messages) == 5
+
+
+def test_auto_tokenizer_falls_back_without_tiktoken(monkeypatch: pytest.MonkeyPatch):
+    import builtins
+
+    real_import = builtins.__import__
+
+    def _no_tiktoken(name, *args, **kwargs):
+        if name == "tiktoken":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    get_tokenizer.cache_clear()
+    monkeypatch.setattr(builtins, "__import__", _no_tiktoken)
+    try:
+        assert get_tokenizer("auto", "gpt-4o-mini").name == "heuristic"
+        with pytest.raises(ImportError):
+            get_tokenizer("tiktoken", "gpt-4o-mini")
+    finally:
+        get_tokenizer.cache_clear()
+
+
+def _provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+    content = {"summary_text": "ok", "keywords": [], "sentiment_score": 0.1, "anomalies": []}
+    return {
+        "choices": [{"message": {"content": json.dumps(content)}}],
+        "usage": {"prompt_tokens": 400, "completion_tokens": 64, "prompt_tokens_details": {"cached_tokens": 100}},
+        "model": payload["model"],
+    }
+
+
+def test_client_records_estimated_vs_reported_usage():
+    reconciler = InMemoryUsageReconciler()
+    client = OpenAIClient(get_analysis_settings(), provider=_provider, reconciler=reconciler, stage="map")
+    item = InputArticle(title="Apple hits new high", body="Earnings beat.", url="https://example.com/aapl")
+    inp = AnalysisInput(ticker="AAPL", locale="ko_KR", items=[item], max_chars=2000)
+
+    estimated = client.estimate_prompt_tokens(client.build_payload(inp)["messages"])
+    result = client.analyze(inp)
+    client.analyze(inp)
+
+    [row] = reconciliation_report(reconciler, datetime.now(timezone.utc).date())
+    assert (row.stage, row.model, row.calls) == ("map", "gpt-4o-mini", 2)
+    assert row.estimated_prompt_tokens == 2 * estimated
+    assert row.prompt_tokens == 800 and row.cached_tokens == 200
+    assert row.prompt_error_ratio == pytest.approx(round((estimated - 400) / 400, 4))
+    assert row.completion_fill_ratio == pytest.approx(64 / 512)
+    assert row.cost_usd == pytest.approx(round(2 * result.llm_cost, 6))
+    assert row.cost_headroom_ratio is not None and row.cost_headroom_ratio > 0
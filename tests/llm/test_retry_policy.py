@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from analysis.models.domain import AnalysisInput, InputArticle
+from llm.client.openai_client import OpenAIClient, PermanentLLMError, TransientLLMError
+from llm.client.retry import RetryPolicy, classify_error
+from llm.settings import get_analysis_settings, reset_analysis_settings_cache
+
+
+class _HTTPError(Exception):
+    def __init__(self, status_code: int, headers: Dict[str, str] | None = None) -> None:
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = type("Resp", (), {"status_code": status_code, "headers": headers or {}})()
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch: pytest.MonkeyPatch):
+    reset_analysis_settings_cache()
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-123")
+    monkeypatch.setenv("ANALYSIS_RETRY_MAX_ATTEMPTS", "2")
+    monkeypatch.setenv("ANALYSIS_RETRY_BASE_DELAY_SECONDS", "0.01")
+    yield
+    reset_analysis_settings_cache()
+
+
+def _policy(clock: _FakeClock, **kw) -> RetryPolicy:
+    values = {"max_retries": 3, "deadline_seconds": 10.0, "base_delay_seconds": 0.5, "max_delay_seconds": 1.5}
+    values.update(kw)
+    return RetryPolicy(sleep=clock.sleep, clock=clock, jitter=lambda: 1.0, **values)
+
+
+def test_classify_provider_errors():
+    rate_limited = classify_error(_HTTPError(429, {"retry-after": "3"}))
+    assert isinstance(rate_limited, TransientLLMError) and rate_limited.retry_after_seconds == 3.0
+    assert isinstance(classify_error(_HTTPError(503)), TransientLLMError)
+    assert isinstance(classify_error(_HTTPError(401)), PermanentLLMError)
+    assert isinstance(classify_error(TimeoutError("read timed out")), TransientLLMError)
+    assert classify_error(ValueError("bug")) is None
+
+
+def test_policy_backs_off_exponentially_with_cap():
+    clock = _FakeClock()
+    calls: List[float] = []
+
+    def attempt(remaining: float, attempts_left: int) -> str:
+        calls.append(remaining)
+        if len(calls) < 4:
+            raise _HTTPError(500)
+        return "ok"
+
+    assert _policy(clock).call(attempt) == "ok"
+    assert clock.sleeps == [0.5, 1.0, 1.5]
+    # 매 시도에 남은 기한이 전달된다
+    assert calls == [10.0, 9.5, 8.5, 7.0]
+
+
+def test_policy_stops_when_backoff_exceeds_deadline():
+    clock = _FakeClock()
+
+    def attempt(remaining: float, attempts_left: int) -> str:
+        raise _HTTPError(429, {"retry-after": "30"})
+
+    with pytest.raises(TransientLLMError) as info:
+        _policy(clock).call(attempt)
+    assert clock.sleeps == []
+    assert info.value.retry_after_seconds == 30.0
+    assert isinstance(info.value.__cause__, _HTTPError)
+
+
+def test_policy_keeps_late_result_but_starts_no_attempt_after_deadline():
+    clock = _FakeClock()
+    calls: List[float] = []
+
+    def slow(remaining: float, attempts_left: int) -> str:
+        calls.append(remaining)
+        clock.now += 12.0
+        return "paid"
+
+    # 기한을 넘겨 도착했어도 이미 받은(과금된) 응답은 버리지 않는다
+    assert _policy(clock).call(slow) == "paid"
+    assert calls == [10.0]
+
+    clock = _FakeClock()
+
+    def slow_failure(remaining: float, attempts_left: int) -> str:
+        calls.append(remaining)
+        clock.now += 9.8
+        raise _HTTPError(500)
+
+    calls.clear()
+    with pytest.raises(TransientLLMError):
+        _policy(clock).call(slow_failure)
+    # 남은 0.2초로는 0.5초 백오프를 기다릴 수 없으므로 두 번째 시도는 시작하지 않는다
+    assert calls == [10.0] and clock.sleeps == []
+
+
+def test_policy_does_not_retry_permanent_or_unknown_errors():
+    clock = _FakeClock()
+    calls = {"n": 0}
+
+    def forbidden(remaining: float, attempts_left: int) -> str:
+        calls["n"] += 1
+        raise _HTTPError(403)
+
+    with pytest.raises(PermanentLLMError):
+        _policy(clock).call(forbidden)
+
+    def bug(remaining: float, attempts_left: int) -> str:
+        calls["n"] += 1
+        raise KeyError("choices")
+
+    with pytest.raises(KeyError):
+        _policy(clock).call(bug)
+    assert calls["n"] == 2 and clock.sleeps == []
+
+
+def test_analyze_retries_rate_limit_and_passes_timeout():
+    seen: List[Dict[str, Any]] = []
+
+    def provider(payload: Dict[str, Any]) -> Dict[str, Any]:
+        seen.append(payload)
+        if len(seen) == 1:
+            raise _HTTPError(429)
+        data = {"summary_text": "ok", "keywords": ["a"], "sentiment_score": 0.1, "anomalies": []}
+        return {
+            "choices": [{"message": {"content": json.dumps(data)}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5},
+            "model": "gpt-4o-mini",
+        }
+
+    item = InputArticle(title="Apple", body="Earnings beat.", url="https://example.com/a")
+    inp = AnalysisInput(ticker="AAPL", items=[item])
+    result = OpenAIClient(get_analysis_settings(), provider=provider).analyze(inp)
+
+    assert result.summary_text == "ok"
+    assert len(seen) == 2
+    assert 0 < seen[1]["timeout"] <= seen[0]["timeout"] <= 15
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterator
+
+import pytest
+
+from analysis.models.domain import AnalysisInput, InputArticle
+from llm.client.openai_client import BudgetDeferredError, BudgetExceededError, OpenAIClient
+from llm.client import openai_client as client_mod
+from llm.ledger import BudgetPolicy, InMemorySpendLedger, RedisSpendLedger, check_budget
+from llm.pricing import get_price_table
+from llm.reconcile import InMemoryUsageReconciler
+from llm.settings import get_analysis_settings, reset_analysis_settings_cache
+
+NOW = datetime(2025, 11, 21, 10, 30, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch: pytest.MonkeyPatch):
+    reset_analysis_settings_cache()
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-123")
+    monkeypatch.setenv("ANALYSIS_MODEL", "gpt-4.1")
+    monkeypatch.setenv("ANALYSIS_MAX_TOKENS", "256")
+    monkeypatch.setenv("ANALYSIS_COST_LIMIT_USD", "0.05")
+    monkeypatch.setenv("ANALYSIS_RETRY_MAX_ATTEMPTS", "1")
+    yield
+    reset_analysis_settings_cache()
+
+
+def _ai() -> AnalysisInput:
+    item = InputArticle(title="Apple hits new high", body="Earnings beat.", url="https://example.com/aapl")
+    return AnalysisInput(ticker="AAPL", locale="ko_KR", items=[item], max_chars=2000)
+
+
+def _provider(seen: list):
+    def _call(payload: Dict[str, Any]) -> Dict[str, Any]:
+        seen.append(payload["model"])
+        content = {"summary_text": "ok", "keywords": [], "sentiment_score": 0.1, "anomalies": []}
+        return {
+            "choices": [{"message": {"content": json.dumps(content)}}],
+            "usage": {"prompt_tokens": 1000, "completion_tokens": 100},
+            "model": payload["model"],
+        }
+
+    return _call
+
+
+def _client(ledger, seen: list, **overrides) -> OpenAIClient:
+    settings = get_analysis_settings().model_copy(update=overrides)
+    return OpenAIClient(settings, provider=_provider(seen), ledger=ledger)
+
+
+class _FakePipeline:
+    def __init__(self, store: Dict[str, Any]) -> None:
+        self._store = store
+        self._ops: list = []
+
+    def hincrbyfloat(self, key, field, amount):
+        self._ops.append(lambda: self._store.setdefault(key, {}).__setitem__(
+            field, self._store.get(key, {}).get(field, 0.0) + amount
+        ))
+
+    def incrbyfloat(self, key, amount):
+        self._ops.append(lambda: self._store.__setitem__(key, self._store.get(key, 0.0) + amount))
+
+    def expire(self, key, seconds):
+        self._ops.append(lambda: None)
+
+    def execute(self):
+        for op in self._ops:
+            op()
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: Dict[str, Any] = {}
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self.store)
+
+    def get(self, key):
+        value = self.store.get(key)
+        return None if value is None else str(value).encode()
+
+    def hgetall(self, key):
+        return {f.encode(): str(v).encode() for f, v in self.store.get(key, {}).items()}
+
+
+@pytest.mark.parametrize("factory", [InMemorySpendLedger, lambda: RedisSpendLedger(_FakeRedis())])
+def test_ledger_accumulates_by_day_stage_and_model(factory):
+    ledger = factory()
+    ledger.add(0.01, model="gpt-4.1", stage="analyze", at=NOW)
+    ledger.add(0.02, model="gpt-4.1", stage="analyze", at=NOW)
+    ledger.add(0.005, model="gpt-4o-mini", stage="map", at=NOW)
+    ledger.add(0.5, model="gpt-4.1", stage="analyze", at=datetime(2025, 11, 20, 23, 0, tzinfo=timezone.utc))
+
+    assert ledger.day_total(NOW) == pytest.approx(0.035)
+    assert ledger.hour_total(NOW) == pytest.approx(0.035)
+    breakdown = ledger.breakdown(date(2025, 11, 21))
+    assert breakdown["analyze"]["gpt-4.1"] == pytest.approx(0.03)
+    assert breakdown["map"] == {"gpt-4o-mini": pytest.approx(0.005)}
+
+
+def test_check_budget_downgrades_then_defers_until_window_reset():
+    ledger = InMemorySpendLedger()
+    ledger.add(0.095, model="gpt-4.1", stage="analyze", at=NOW)
+    policy = BudgetPolicy(hourly_limit_usd=0.1, fallback_model="gpt-4o-mini")
+    costs = {"gpt-4.1": 0.01, "gpt-4o-mini": 0.002}
+
+    decision = check_budget(ledger, policy, model="gpt-4.1", estimate=costs.__getitem__, at=NOW)
+    assert (decision.action, decision.model, decision.window) == ("downgrade", "gpt-4o-mini", "hour")
+
+    ledger.add(0.004, model="gpt-4o-mini", stage="analyze", at=NOW)
+    decision = check_budget(ledger, policy, model="gpt-4.1", estimate=costs.__getitem__, at=NOW)
+    assert decision.action == "defer"
+    assert decision.retry_after_seconds == 30 * 60
+
+    reject = BudgetPolicy(daily_limit_usd=0.05, on_exhausted="reject")
+    assert check_budget(ledger, reject, model="gpt-4.1", estimate=costs.__getitem__, at=NOW).action == "reject"
+    assert check_budget(ledger, BudgetPolicy(), model="gpt-4.1", estimate=costs.__getitem__).action == "allow"
+
+
+def test_analyze_records_spend_and_degrades_on_budget():
+    ledger = InMemorySpendLedger()
+    seen: list = []
+    client = _client(ledger, seen, llm_daily_budget_usd=0.006, llm_budget_fallback_model="gpt-4o-mini")
+
+    first = client.analyze(_ai())
+    assert seen == ["gpt-4.1"]
+    assert ledger.day_total() == pytest.approx(first.llm_cost)
+
+    # 누적 지출이 예산에 가까워지면 저렴한 모델로 강등
+    second = client.analyze(_ai())
+    assert seen[-1] == "gpt-4o-mini"
+    assert second.llm_model == "gpt-4o-mini"
+    assert set(ledger.breakdown(datetime.now(timezone.utc).date())["analyze"]) == {"gpt-4.1", "gpt-4o-mini"}
+
+
+def test_analyze_defers_or_rejects_when_budget_exhausted():
+    ledger = InMemorySpendLedger()
+    ledger.add(1.0, model="gpt-4.1", stage="backfill")
+    seen: list = []
+
+    with pytest.raises(BudgetDeferredError) as info:
+        _client(ledger, seen, llm_hourly_budget_usd=0.5).analyze(_ai())
+    assert 0 < info.value.retry_after_seconds <= 3600
+
+    with pytest.raises(BudgetExceededError):
+        _client(ledger, seen, llm_daily_budget_usd=0.5, llm_budget_exhausted_action="reject").analyze(_ai())
+    assert seen == []
+
+
+def test_stream_chat_records_estimated_spend_under_stage():
+    ledger = InMemorySpendLedger()
+
+    def stream(_: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        yield {"choices": [{"delta": {"content": "hello world"}}]}
+
+    client = OpenAIClient(get_analysis_settings(), stream_provider=stream, ledger=ledger, stage="chat")
+    assert list(client.stream_chat(messages=[{"role": "user", "content": "hi"}], retry_max_attempts=0)) == [
+        "hello world"
+    ]
+    assert ledger.breakdown(datetime.now(timezone.utc).date())["chat"]["gpt-4.1"] > 0
+
+
+def test_stream_chat_records_provider_usage_once_and_reconciles():
+    ledger = InMemorySpendLedger()
+    reconciler = InMemoryUsageReconciler()
+    payloads: list = []
+
+    def stream(payload: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        payloads.append(payload)
+        yield {"choices": [{"delta": {"content": "hello world"}}], "model": "gpt-4.1-2025"}
+        yield {"choices": [], "usage": {"prompt_tokens": 900, "completion_tokens": 30}, "model": "gpt-4.1-2025"}
+
+    client = OpenAIClient(
+        get_analysis_settings(), stream_provider=stream, ledger=ledger, stage="chat", reconciler=reconciler
+    )
+    assert "".join(client.stream_chat(messages=[{"role": "user", "content": "hi"}])) == "hello world"
+
+    assert payloads[0]["stream_options"] == {"include_usage": True}
+    today = datetime.now(timezone.utc).date()
+    expected = get_price_table(get_analysis_settings()).cost("gpt-4.1-2025", 900, 30)
+    assert ledger.breakdown(today)["chat"]["gpt-4.1-2025"] == pytest.approx(expected)
+    [(key, totals)] = reconciler.totals(today).items()
+    assert key == ("chat", "gpt-4.1-2025") and totals["prompt_tokens"] == 900
+
+
+class _DownRedis:
+    def pipeline(self, transaction: bool = True):
+        raise ConnectionError("redis down")
+
+    def get(self, key):
+        raise ConnectionError("redis down")
+
+
+def test_ledger_outage_after_startup_degrades_instead_of_failing(monkeypatch: pytest.MonkeyPatch):
+    warnings: list = []
+    monkeypatch.setattr(client_mod.logger, "warning", lambda event, **kw: warnings.append(event))
+    seen: list = []
+
+    result = _client(RedisSpendLedger(_DownRedis()), seen, llm_daily_budget_usd=1.0).analyze(_ai())
+
+    assert result.summary_text == "ok" and seen == ["gpt-4.1"]
+    # 예산 판정(읽기)과 비용 기록(쓰기) 모두 경고만 남기고 진행
+    assert warnings == ["llm.ledger_unavailable", "llm.ledger_unavailable"]
+
+
+def test_ledger_getter_reconnects_after_startup_outage(monkeypatch: pytest.MonkeyPatch):
+    from llm import ledger as ledger_mod
+    from llm import redis_client
+
+    monkeypatch.setenv("LLM_LEDGER_REDIS_URL", "redis://ledger:6379/0")
+    reset_analysis_settings_cache()
+    now = {"t": 0.0}
+    attempts: list = []
+    live = _FakeRedis()
+
+    def _connect(url: str, *, component: str):
+        attempts.append(now["t"])
+        return live if now["t"] >= 60 else None
+
+    monkeypatch.setattr(redis_client, "connect_redis", _connect)
+    monkeypatch.setattr(ledger_mod, "_REDIS", redis_client.RedisConnector("llm.ledger", clock=lambda: now["t"]))
+
+    # 기동 시 장애: 메모리 장부로 폴백하되 같은 장부를 계속 쓴다
+    first = ledger_mod.get_spend_ledger()
+    assert isinstance(first, InMemorySpendLedger) and ledger_mod.get_spend_ledger() is first
+    assert attempts == [0.0]
+
+    # 재연결 간격이 지나면 다시 연결해 공유 장부로 돌아가고, 이후에는 연결을 캐시한다
+    now["t"] = 60.0
+    assert isinstance(ledger_mod.get_spend_ledger(), RedisSpendLedger)
+    now["t"] = 120.0
+    assert isinstance(ledger_mod.get_spend_ledger(), RedisSpendLedger)
+    assert attempts == [0.0, 60.0]
+    ledger_mod.reset_spend_ledger_cache()